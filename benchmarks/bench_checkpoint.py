@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of saving and loading the checkpoints.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class TimeCheckpoint:
+  """``bp.checkpoints.save_pytree`` / ``load_pytree`` of the state dict of a network."""
+  params = [[1, 16]]
+  param_names = ['megabytes']
+  repeat = 3
+
+  def setup(self, megabytes):
+    num = megabytes * 2 ** 20 // 4 // 4
+    self.states = {f'layer{i}': {'W': bm.random.rand(num), 'b': bm.zeros(16)} for i in range(4)}
+    self.directory = tempfile.mkdtemp()
+    self.filename = os.path.join(self.directory, 'states.bp')
+    bp.checkpoints.save_pytree(self.filename, self.states, verbose=False)
+
+  def teardown(self, megabytes):
+    shutil.rmtree(self.directory, ignore_errors=True)
+
+  def time_save(self, megabytes):
+    bp.checkpoints.save_pytree(self.filename, self.states, overwrite=True, verbose=False)
+
+  def time_load(self, megabytes):
+    with contextlib.redirect_stdout(io.StringIO()):
+      bp.checkpoints.load_pytree(self.filename)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the connectivity generation.
+"""
+
+import brainpy as bp
+
+
+class TimeConnect:
+  """Building the connectivity structures of the random connectors."""
+  params = [['FixedProb', 'FixedPreNum', 'FixedPostNum', 'GaussianProb'],
+            [1000, 10000],
+            ['csr', 'coo']]
+  param_names = ['connector', 'num', 'structure']
+
+  def setup(self, connector, num, structure):
+    if connector == 'GaussianProb' and num > 1000:
+      # it computes the dense probability matrix
+      raise NotImplementedError
+    self.connector = connector
+    self.num = num
+
+  def _connector(self):
+    if self.connector == 'FixedProb':
+      return bp.conn.FixedProb(0.02, seed=0)
+    elif self.connector == 'FixedPreNum':
+      return bp.conn.FixedPreNum(int(self.num * 0.02), seed=0)
+    elif self.connector == 'FixedPostNum':
+      return bp.conn.FixedPostNum(int(self.num * 0.02), seed=0)
+    else:
+      return bp.conn.GaussianProb(sigma=2., seed=0)
+
+  def time_build(self, connector, num, structure):
+    size = (num,) if self.connector != 'GaussianProb' else (int(num ** 0.5),) * 2
+    self._connector()(size, size).require(structure)
+
+
+class TimeGrid:
+  """Building the lattice connectivity."""
+  params = [[32, 128]]
+  param_names = ['side']
+
+  def time_grid_eight_csr(self, side):
+    bp.conn.GridEight(periodic_boundary=True)((side, side), (side, side)).require('csr')
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the sparse, event-driven and just-in-time connectivity operators.
+"""
+
+import jax
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+def _csr(num_pre, num_post, prob):
+  conn = bp.conn.FixedProb(prob, seed=0)(num_pre, num_post)
+  indices, indptr = conn.require('csr')
+  return bm.as_jax(indices), bm.as_jax(indptr)
+
+
+class TimeCSRMV:
+  """``bm.event.csrmv`` and ``bm.sparse.csrmv`` with 2% connectivity and 5% active events."""
+  params = [[1000, 10000], [True, False]]
+  param_names = ['num', 'transpose']
+
+  def setup(self, num, transpose):
+    bm.random.seed(0)
+    self.shape = (num, num)
+    self.indices, self.indptr = _csr(num, num, 0.02)
+    self.events = bm.as_jax(bm.random.rand(num) < 0.05)
+    self.vector = bm.as_jax(bm.random.rand(num))
+    self.event_csrmv = jax.jit(lambda e: bm.event.csrmv(1.5, self.indices, self.indptr, e,
+                                                        shape=self.shape, transpose=transpose))
+    self.csrmv = jax.jit(lambda v: bm.sparse.csrmv(1.5, self.indices, self.indptr, v,
+                                                   shape=self.shape, transpose=transpose))
+
+  def time_event_csrmv(self, num, transpose):
+    jax.block_until_ready(self.event_csrmv(self.events))
+
+  def time_csrmv(self, num, transpose):
+    jax.block_until_ready(self.csrmv(self.vector))
+
+
+class TimeJitConn:
+  """The just-in-time connectivity operators with 2% connectivity."""
+  params = [[1000, 10000]]
+  param_names = ['num']
+
+  def setup(self, num):
+    bm.random.seed(0)
+    shape = (num, num)
+    self.events = bm.as_jax(bm.random.rand(num) < 0.05)
+    self.vector = bm.as_jax(bm.random.rand(num))
+    self.event_mv = jax.jit(lambda e: bm.jitconn.event_mv_prob_homo(e, 1.5, 0.02, seed=123, shape=shape))
+    self.mv = jax.jit(lambda v: bm.jitconn.mv_prob_homo(v, 1.5, 0.02, seed=123, shape=shape))
+
+  def time_event_mv_prob_homo(self, num):
+    jax.block_until_ready(self.event_mv(self.events))
+
+  def time_mv_prob_homo(self, num):
+    jax.block_until_ready(self.mv(self.vector))
+
+
+class TimeForLoop:
+  """``bm.for_loop`` over 1000 steps, including the tracing of a new function at each call."""
+  params = [[10, 1000]]
+  param_names = ['num_var']
+
+  def setup(self, num_var):
+    self.variables = [bm.Variable(bm.zeros(100)) for _ in range(num_var)]
+    self.indices = np.arange(1000)
+
+  def body(self, i):
+    for v in self.variables:
+      v.value = v.value * 0.9 + 1.
+    return self.variables[0].value
+
+  def time_for_loop(self, num_var):
+    # a new body function, so that the loop is traced and compiled at every call
+    body = lambda i: self.body(i)
+    jax.block_until_ready(bm.for_loop(body, self.indices))
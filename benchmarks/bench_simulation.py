@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the network simulation with ``DSRunner``.
+"""
+
+import jax
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+
+neu_pars = dict(V_rest=-60., V_th=-50., V_reset=-60., tau=20., tau_ref=5.,
+                V_initializer=bp.init.Normal(-55., 2.))
+
+
+class EINet(bp.DynSysGroup):
+  """The E/I network of ``examples/dynamics_simulation/COBA.py`` (``EICOBA_PostAlign``)
+  with the conductance-based (``'COBA'``) or current-based (``'CUBA'``) synapses."""
+
+  def __init__(self, num, synapse='COBA'):
+    super().__init__()
+    num_exc, num_inh = int(num * 0.8), int(num * 0.2)
+    scale = num / 4000
+    self.E = bp.dyn.LifRef(num_exc, **neu_pars)
+    self.I = bp.dyn.LifRef(num_inh, **neu_pars)
+    if synapse == 'COBA':
+      we, wi, exc_out, inh_out = 0.6 / scale, 6.7 / scale, bp.dyn.COBA.desc(E=0.), bp.dyn.COBA.desc(E=-80.)
+    elif synapse == 'CUBA':
+      we, wi, exc_out, inh_out = 1.62 / scale, -9. / scale, bp.dyn.CUBA.desc(), bp.dyn.CUBA.desc()
+    else:
+      raise ValueError(f'Unknown synapse {synapse}.')
+
+    def proj(pre, post, w, tau, out):
+      return bp.dyn.FullProjAlignPostMg(
+        pre=pre,
+        delay=None,
+        comm=bp.dnn.EventCSRLinear(bp.conn.FixedProb(0.02, pre=pre.num, post=post.num, seed=0), w),
+        syn=bp.dyn.Expon.desc(post.varshape, tau=tau),
+        out=out,
+        post=post,
+      )
+
+    self.E2E = proj(self.E, self.E, we, 5., exc_out)
+    self.E2I = proj(self.E, self.I, we, 5., exc_out)
+    self.I2E = proj(self.I, self.E, wi, 10., inh_out)
+    self.I2I = proj(self.I, self.I, wi, 10., inh_out)
+
+  def update(self, inp=20.):
+    self.E2E()
+    self.E2I()
+    self.I2E()
+    self.I2I()
+    self.E(inp)
+    self.I(inp)
+    return self.E.spike.value
+
+
+class HHNet(bp.DynSysGroup):
+  """The network of Hodgkin-Huxley neurons with the exponential synapses."""
+
+  def __init__(self, num):
+    super().__init__()
+    self.N = bp.dyn.HHLTC(num, V_initializer=bp.init.Uniform(-70., -50.))
+    self.syn = bp.dyn.FullProjAlignPostMg(
+      pre=self.N,
+      delay=None,
+      comm=bp.dnn.EventCSRLinear(bp.conn.FixedProb(0.02, pre=num, post=num, seed=0), 0.1),
+      syn=bp.dyn.Expon.desc(num, tau=5.),
+      out=bp.dyn.COBA.desc(E=0.),
+      post=self.N,
+    )
+
+  def update(self, inp=5.):
+    self.syn()
+    self.N(inp)
+    return self.N.spike.value
+
+
+class TimeEINet:
+  """``DSRunner.run()`` of 100 ms E/I networks (1000 steps)."""
+  params = [['COBA', 'CUBA'], [4000, 16000]]
+  param_names = ['synapse', 'num']
+  number = 1
+  repeat = 3
+
+  def setup(self, synapse, num):
+    bm.random.seed(0)
+    self.net = EINet(num, synapse)
+    self.runner = bp.DSRunner(self.net, monitors={'E.spike': self.net.E.spike}, progress_bar=False)
+
+  def time_run(self, synapse, num):
+    jax.block_until_ready(self.runner.run(100.))
+
+
+class TimeHHNet:
+  """``DSRunner.run()`` of a 100 ms Hodgkin-Huxley network (10000 steps)."""
+  params = [1000, 4000]
+  param_names = ['num']
+  number = 1
+  repeat = 3
+
+  def setup(self, num):
+    bm.random.seed(0)
+    with bm.environment(dt=0.01):
+      self.net = HHNet(num)
+      self.runner = bp.DSRunner(self.net, monitors={'V': self.net.N.V}, progress_bar=False)
+
+  def time_run(self, num):
+    with bm.environment(dt=0.01):
+      jax.block_until_ready(self.runner.run(100.))
+
+
+class TimeTrace:
+  """Python tracing of one network step in ``bm.for_loop``, without the XLA compilation."""
+  params = [4000]
+  param_names = ['num']
+
+  def setup(self, num):
+    bm.random.seed(0)
+    self.net = EINet(num, 'COBA')
+    self.indices = np.arange(100)
+    self.variables = tuple(self.net.vars().unique().values())
+
+  def _loop(self, values):
+    # the variables are the explicit inputs and outputs, so that no tracer leaks
+    old = [v.value for v in self.variables]
+    for v, x in zip(self.variables, values):
+      v.value = x
+    bm.for_loop(lambda i: self.net.step_run(i), self.indices)
+    new = [v.value for v in self.variables]
+    for v, x in zip(self.variables, old):
+      v.value = x
+    return new
+
+  def time_for_loop_trace(self, num):
+    jax.make_jaxpr(self._loop)([v.value for v in self.variables])
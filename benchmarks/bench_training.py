@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the reservoir training and the back-propagation through time.
+"""
+
+import jax
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class ESN(bp.DynamicalSystem):
+  def __init__(self, num_in, num_hidden, num_out, comp_type='dense'):
+    super().__init__()
+    self.r = bp.dyn.Reservoir(num_in,
+                              num_hidden,
+                              Win_initializer=bp.init.Uniform(-0.1, 0.1),
+                              Wrec_initializer=bp.init.Normal(scale=0.1),
+                              in_connectivity=0.02,
+                              rec_connectivity=0.02,
+                              comp_type=comp_type)
+    self.o = bp.dnn.Dense(num_hidden, num_out, W_initializer=bp.init.Normal(), mode=bm.training_mode)
+
+  def update(self, x):
+    return x >> self.r >> self.o
+
+
+class RNN(bp.DynamicalSystem):
+  def __init__(self, num_in, num_hidden):
+    super().__init__()
+    self.rnn = bp.dnn.GRUCell(num_in, num_hidden)
+    self.out = bp.dnn.Dense(num_hidden, 1)
+
+  def update(self, x):
+    return self.out(self.rnn(x))
+
+
+class TimeReservoir:
+  """``RidgeTrainer.fit()`` and ``ForceTrainer.fit()`` of an echo state network on 1000 steps."""
+  params = [['dense', 'sparse'], [500, 2000]]
+  param_names = ['comp_type', 'num_hidden']
+  number = 1
+  repeat = 3
+
+  def setup(self, comp_type, num_hidden):
+    bm.random.seed(0)
+    with bm.batching_environment():
+      self.model = ESN(100, num_hidden, 30, comp_type=comp_type)
+    self.X = bm.random.random((1, 1000, 100))
+    self.Y = bm.random.random((1, 1000, 30))
+    self.ridge = bp.RidgeTrainer(self.model, alpha=1e-6, progress_bar=False)
+    self.force = bp.ForceTrainer(self.model, alpha=0.1, progress_bar=False)
+
+  def time_ridge_fit(self, comp_type, num_hidden):
+    self.ridge.fit([self.X, self.Y])
+    jax.block_until_ready(self.model.o.W.value)
+
+  def time_force_fit(self, comp_type, num_hidden):
+    self.force.fit([self.X, self.Y])
+    jax.block_until_ready(self.model.o.W.value)
+
+
+class TimeBPTT:
+  """One training step of ``BPTT`` on a GRU with 50 time steps."""
+  params = [[32, 128], [256]]
+  param_names = ['num_batch', 'num_hidden']
+
+  def setup(self, num_batch, num_hidden):
+    bm.random.seed(0)
+    inputs = bm.random.normal(size=(num_batch, 50, 10))
+    targets = bm.cumsum(inputs.sum(-1, keepdims=True), axis=1)
+    self.data = [(inputs, targets)]
+    with bm.training_environment():
+      self.model = RNN(10, num_hidden)
+    self.trainer = bp.BPTT(self.model,
+                           loss_fun=bp.losses.mean_squared_error,
+                           optimizer=bp.optim.Adam(lr=1e-3),
+                           progress_bar=False)
+
+  def time_train_step(self, num_batch, num_hidden):
+    self.trainer.fit(self.data, num_epoch=1)
+    jax.block_until_ready(self.model.out.W.value)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+"""
+Run the BrainPy benchmarks and compare the results across commits.
+
+The benchmarks follow the conventions of `asv <https://asv.readthedocs.io>`_:
+each ``bench_*.py`` module defines classes with the optional ``params`` /
+``param_names`` attributes, a ``setup(*params)`` method (which raises
+``NotImplementedError`` to skip a setting), and the ``time_*`` methods to be
+timed. Each ``time_*`` method blocks until its outputs are ready, and its first
+call (which includes tracing and compilation) is not timed.
+
+Usage::
+
+  # run all benchmarks, and save the results to ``results/<commit>.json``
+  python benchmarks/run.py run
+
+  # run the benchmarks matching a regular expression with the smallest sizes
+  python benchmarks/run.py run -b "csrmv|jitconn" --quick -o head.json
+
+  # compare two results, and exit with 1 if any benchmark slows down by 10%
+  python benchmarks/run.py compare base.json head.json --threshold 1.1
+
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+
+# the results should be comparable across the machines, so that only CPU is used
+os.environ.setdefault('JAX_PLATFORMS', 'cpu')
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULT_VERSION = 1
+
+
+def _git_commit():
+  try:
+    return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=HERE,
+                                   stderr=subprocess.DEVNULL).decode().strip()
+  except (OSError, subprocess.CalledProcessError):
+    return 'unknown'
+
+
+def _versions():
+  versions = {'python': platform.python_version()}
+  for name in ['brainpy', 'jax', 'jaxlib', 'numpy', 'taichi']:
+    try:
+      versions[name] = importlib.import_module(name).__version__
+    except Exception:
+      versions[name] = None
+  return versions
+
+
+def _machine():
+  return {'system': platform.system(),
+          'machine': platform.machine(),
+          'processor': platform.processor(),
+          'cpu_count': os.cpu_count()}
+
+
+def discover(pattern=None):
+  """Yield ``(name, class, method_name)`` of all benchmarks matching ``pattern``."""
+  sys.path.insert(0, HERE)
+  regex = re.compile(pattern) if pattern else None
+  for filename in sorted(os.listdir(HERE)):
+    if not (filename.startswith('bench_') and filename.endswith('.py')):
+      continue
+    module = importlib.import_module(filename[:-3])
+    for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+      if cls.__module__ != module.__name__:
+        continue
+      for method in sorted(m for m in dir(cls) if m.startswith('time_')):
+        name = f'{module.__name__}.{cls_name}.{method}'
+        if regex is None or regex.search(name):
+          yield name, cls, method
+
+
+def _param_combinations(cls, quick=False):
+  params = getattr(cls, 'params', [])
+  if len(params) and not isinstance(params[0], (list, tuple)):
+    params = [params]
+  names = list(getattr(cls, 'param_names', [f'param{i}' for i in range(len(params))]))
+  if quick:
+    params = [p[:1] for p in params]
+  for combination in itertools.product(*params):
+    yield dict(zip(names, combination)), combination
+
+
+def time_benchmark(cls, method, args, repeat, min_time):
+  """Time one benchmark with one setting of parameters."""
+  bench = cls()
+  if hasattr(bench, 'setup'):
+    bench.setup(*args)
+  try:
+    fun = getattr(bench, method)
+    # warm up, which includes the compilation
+    t0 = time.perf_counter()
+    fun(*args)
+    first = time.perf_counter() - t0
+
+    # the number of calls in each sample, so that each sample lasts >= "min_time"
+    number = getattr(cls, 'number', 0)
+    if number <= 0:
+      t0 = time.perf_counter()
+      fun(*args)
+      number = max(1, int(min_time / max(time.perf_counter() - t0, 1e-9)))
+
+    samples = []
+    for _ in range(getattr(cls, 'repeat', repeat)):
+      t0 = time.perf_counter()
+      for _ in range(number):
+        fun(*args)
+      samples.append((time.perf_counter() - t0) / number)
+  finally:
+    if hasattr(bench, 'teardown'):
+      bench.teardown(*args)
+  return {'min': min(samples),
+          'median': statistics.median(samples),
+          'mean': statistics.mean(samples),
+          'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.,
+          'number': number,
+          'repeat': len(samples),
+          'first_call': first}
+
+
+def run(args):
+  import brainpy.math as bm
+  bm.set_platform('cpu')
+
+  results = {}
+  for name, cls, method in discover(args.bench):
+    results[name] = []
+    for params, combination in _param_combinations(cls, quick=args.quick):
+      label = ', '.join(f'{k}={v}' for k, v in params.items())
+      try:
+        stats = time_benchmark(cls, method, combination, repeat=args.repeat, min_time=args.min_time)
+        print(f'{name} [{label}]: {stats["median"] * 1e3:.3f} ms '
+              f'(first call {stats["first_call"] * 1e3:.1f} ms)', flush=True)
+      except NotImplementedError:
+        # the same as asv, "setup()" raises NotImplementedError to skip a setting
+        stats = {'skipped': True}
+        print(f'{name} [{label}]: skipped', flush=True)
+      except Exception as e:
+        stats = {'error': f'{type(e).__name__}: {e}'}
+        print(f'{name} [{label}]: FAILED {stats["error"]}', flush=True)
+        if args.verbose:
+          traceback.print_exc()
+      results[name].append({'params': params, **stats})
+
+  commit = _git_commit()
+  output = {'version': RESULT_VERSION,
+            'commit': commit,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'machine': _machine(),
+            'versions': _versions(),
+            'results': results}
+  filename = args.output or os.path.join(HERE, 'results', f'{commit[:12]}.json')
+  os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+  with open(filename, 'w') as f:
+    json.dump(output, f, indent=2, default=str)
+  print(f'Results are saved to {filename}')
+
+
+def _flatten(results):
+  flat = {}
+  for name, records in results['results'].items():
+    for record in records:
+      key = name + ' [' + ', '.join(f'{k}={v}' for k, v in record['params'].items()) + ']'
+      flat[key] = record.get('median')
+  return flat
+
+
+def compare(args):
+  with open(args.base) as f:
+    base = json.load(f)
+  with open(args.head) as f:
+    head = json.load(f)
+  base, head = _flatten(base), _flatten(head)
+
+  regressions = 0
+  print(f'{"base (ms)":>12s} {"head (ms)":>12s} {"ratio":>8s}  benchmark')
+  for key in sorted(set(base) | set(head)):
+    t0, t1 = base.get(key), head.get(key)
+    if t0 is None or t1 is None:
+      ratio, mark = float('nan'), '?'
+    else:
+      ratio = t1 / t0
+      mark = '+' if ratio > args.threshold else ('-' if ratio < 1. / args.threshold else ' ')
+      regressions += mark == '+'
+    fmt = lambda t: f'{t * 1e3:12.3f}' if t is not None else f'{"n/a":>12s}'
+    print(f'{fmt(t0)} {fmt(t1)} {ratio:8.3f} {mark} {key}')
+  if regressions:
+    print(f'{regressions} benchmark(s) slowed down by more than {args.threshold}x.')
+  return 1 if regressions else 0
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  sub = parser.add_subparsers(dest='command', required=True)
+
+  p_run = sub.add_parser('run', help='Run the benchmarks.')
+  p_run.add_argument('-b', '--bench', default=None, help='The regular expression to select benchmarks.')
+  p_run.add_argument('-o', '--output', default=None, help='The JSON file to save the results.')
+  p_run.add_argument('--quick', action='store_true', help='Only run the first value of each parameter.')
+  p_run.add_argument('--repeat', type=int, default=5, help='The number of timing samples.')
+  p_run.add_argument('--min-time', type=float, default=0.1, help='The minimal time (s) of each sample.')
+  p_run.add_argument('-v', '--verbose', action='store_true', help='Print the traceback of failures.')
+
+  p_cmp = sub.add_parser('compare', help='Compare two results.')
+  p_cmp.add_argument('base')
+  p_cmp.add_argument('head')
+  p_cmp.add_argument('--threshold', type=float, default=1.1,
+                     help='The ratio of head/base to report as a regression.')
+
+  args = parser.parse_args()
+  if args.command == 'run':
+    run(args)
+  else:
+    sys.exit(compare(args))
+
+
+if __name__ == '__main__':
+  main()
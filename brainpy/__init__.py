@@ -108,7 +108,9 @@ from brainpy._src.train.offline import (OfflineTrainer as OfflineTrainer,
 
 #  Part: Analysis  #
 # ---------------- #
-from brainpy import (analysis as analysis)
+# "brainpy.analysis" imports scipy.optimize, so it is
+# imported at its first access (see ``__getattr__`` below)
+_lazy_submodules = ('analysis',)
 
 
 #  Part: Others    #
@@ -149,7 +151,16 @@ __deprecations = {
   'TwoEndConn': ('brainpy.TwoEndConn', 'brainpy.synapses.TwoEndConn', synapses.TwoEndConn),
   'CondNeuGroup': ('brainpy.CondNeuGroup', 'brainpy.dyn.CondNeuGroup', dyn.CondNeuGroup),
 }
-__getattr__ = deprecation_getattr2('brainpy', __deprecations)
+
+
+def _lazy_import(name):
+  if name in _lazy_submodules:
+    import importlib
+    return importlib.import_module(f'{__name__}.{name}')
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__getattr__ = deprecation_getattr2('brainpy', __deprecations, default=_lazy_import)
 
 del deprecation_getattr2
 
@@ -17,7 +17,7 @@ tools.__deprecations = {
   'clear_name_cache': ('brainpy.tools.clear_name_cache', 'brainpy.math.clear_name_cache', math.clear_name_cache),
   'checking': ('brainpy.tools.checking', 'brainpy.checking', checking),
 }
-tools.__getattr__ = deprecation_getattr2('brainpy.tools', tools.__deprecations)
+tools.__getattr__ = deprecation_getattr2('brainpy.tools', tools.__deprecations, default=tools.__getattr__)
 
 integrators.__deprecations = {
   'Integrator': ('brainpy.integrators.Integrator', 'brainpy.Integrator', Integrator),
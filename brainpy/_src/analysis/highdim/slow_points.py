@@ -9,7 +9,9 @@ from typing import Callable, Union, Dict, Sequence, Tuple
 import jax.numpy as jnp
 import numpy as np
 import jax
+from jax import lax
 from jax.scipy.optimize import minimize
+from jax.scipy.sparse.linalg import cg
 from jax.tree_util import tree_flatten, tree_map
 
 import brainpy._src.math as bm
@@ -450,6 +452,136 @@ class SlowPointFinder(base.DSAnalyzer):
       print(f'    '
             f'Found {len(valid_ids)} fixed points from {num_candidate} initial points.')
 
+  def find_fps_with_newton_method(
+      self,
+      candidates: Union[ArrayType, Dict[str, ArrayType]],
+      tolerance: float = 1e-10,
+      num_opt: int = 100,
+      num_cg: int = 20,
+      damping: float = 1e-2,
+      batch_size: int = None,
+  ):
+    r"""Optimize fixed points with the damped Gauss-Newton (Levenberg-Marquardt) method.
+
+    Each candidate minimizes the squared speed :math:`\frac{1}{n}\|r(h)\|^2`,
+    where :math:`r(h) = F(h) - h` for a discrete system and :math:`r(h) = f(h)`
+    for a continuous system. At every iteration, the step :math:`\delta` solves
+
+    .. math::
+
+       (J^\top J + \lambda I) \delta = - J^\top r
+
+    with conjugate gradients, in which :math:`J` is only accessed through
+    Jacobian-vector products, so that the Jacobian matrix is never built.
+    The damping :math:`\lambda` is halved after an accepted step and
+    quadrupled after a rejected one. All candidates are solved in parallel
+    with ``vmap``.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    candidates: ArrayType, dict
+      The candidate (initial) fixed points.
+    tolerance: float
+      Stop the optimization of a candidate once its squared speed is below this value.
+    num_opt: int
+      The maximum number of Newton iterations.
+    num_cg: int
+      The maximum number of conjugate gradient iterations for each linear solve.
+    damping: float
+      The initial damping factor :math:`\lambda`.
+    batch_size: int
+      The number of candidates optimized at once. Default is all candidates.
+    """
+    num_candidate = self._check_candidates(candidates)
+    if not (isinstance(candidates, (bm.ndarray, jnp.ndarray, np.ndarray)) or isinstance(candidates, dict)):
+      raise ValueError('Candidates must be instance of ArrayType or dict of ArrayType.')
+    if num_opt <= 0:
+      raise ValueError(f'"num_opt" must be a positive integer, but we got {num_opt}.')
+    if batch_size is None:
+      batch_size = num_candidate
+    batch_size = min(int(batch_size), num_candidate)
+    if batch_size <= 0:
+      raise ValueError(f'"batch_size" must be a positive integer, but we got {batch_size}.')
+    candidates = tree_map(lambda a: bm.as_jax(a), candidates, is_leaf=lambda a: isinstance(a, bm.Array))
+    f_res, flatten, unflatten = self._generate_f_residual(candidates)
+
+    def f_speed(x):
+      return jnp.mean(f_res(x) ** 2)
+
+    def body(carry):
+      i, x, lam, loss, losses = carry
+      r, f_jvp = jax.linearize(f_res, x)
+      f_vjp = jax.linear_transpose(f_jvp, x)
+      grad = f_vjp(r)[0]
+      delta, _ = cg(lambda v: f_vjp(f_jvp(v))[0] + lam * v, -grad, maxiter=num_cg)
+      new_x = x + delta
+      new_loss = f_speed(new_x)
+      accept = new_loss < loss
+      x = jnp.where(accept, new_x, x)
+      loss = jnp.where(accept, new_loss, loss)
+      lam = jnp.clip(jnp.where(accept, lam * 0.5, lam * 4.), 1e-12, 1e12)
+      return i + 1, x, lam, loss, losses.at[i].set(loss)
+
+    def solve(x0):
+      loss = f_speed(x0)
+      init = (0, x0, jnp.asarray(damping, dtype=x0.dtype), loss, jnp.zeros(num_opt, dtype=loss.dtype))
+      i, x, _, loss, losses = lax.while_loop(lambda c: jnp.logical_and(c[0] < num_opt, c[3] >= tolerance),
+                                             body, init)
+      # converged candidates keep their final loss
+      return x, jnp.where(jnp.arange(num_opt) < i, losses, loss), i
+
+    if isinstance(self.target, DynamicalSystem):
+      @jax.jit
+      def f_opt(xs):
+        r = jax.vmap(solve)(xs)
+        for k, v in self.excluded_vars.items():
+          v.value = self.excluded_data[k]
+        for k, v in self.target_vars.items():
+          v.value = self.target_data[k]
+        return r
+    else:
+      f_opt = jax.jit(jax.vmap(solve))
+
+    if self.verbose:
+      print("Optimizing with the Newton method to find fixed points:")
+    xs = jax.vmap(flatten)(candidates)
+    fixed_points, opt_losses, num_iters = [], [], []
+    for start in range(0, num_candidate, batch_size):
+      end = min(start + batch_size, num_candidate)
+      batch = xs[start: end]
+      if end - start < batch_size:
+        # pad the last batch to avoid re-compilation
+        batch = jnp.concatenate([batch, jnp.repeat(batch[:1], batch_size - (end - start), axis=0)])
+      start_time = time.time()
+      x, losses, iters = f_opt(batch)
+      losses = losses[:end - start]
+      batch_time = time.time() - start_time
+      fixed_points.append(x[:end - start])
+      opt_losses.append(losses)
+      num_iters.append(iters[:end - start])
+      if self.verbose:
+        print(f"    "
+              f"Candidates {start + 1}-{end} in {batch_time:0.2f} sec, "
+              f"{int(jnp.max(num_iters[-1]))} iterations, Training loss {jnp.mean(losses[:, -1]):0.10f}")
+
+    num_iter = int(jnp.max(jnp.concatenate(num_iters)))
+    self._opt_losses = jnp.concatenate(opt_losses).mean(axis=0)[:max(num_iter, 1)]
+    self._fixed_points = jax.vmap(unflatten)(jnp.concatenate(fixed_points))
+    self._losses = self._get_f_eval_loss()(self._fixed_points)
+    self._selected_ids = jnp.arange(num_candidate)
+    if self.verbose:
+      print(f'    '
+            f'Optimized {num_candidate} candidates, '
+            f'{int(jnp.sum(self._losses < tolerance))} of them have the loss below tolerance {tolerance}.')
+
+    if isinstance(self.target, DynamicalSystem):
+      for k, v in self.excluded_vars.items():
+        v.value = self.excluded_data[k]
+      for k, v in self.target_vars.items():
+        v.value = self.target_data[k]
+
   def filter_loss(self, tolerance: float = 1e-5):
     """Filter fixed points whose speed larger than a given tolerance.
 
@@ -516,12 +648,9 @@ class SlowPointFinder(base.DSAnalyzer):
     if num_fps <= 1:
       return
 
-    # Compute pairwise distances between all fixed points.
-    distances = np.asarray(utils.euclidean_distance_jax(self.fixed_points, num_fps))
-
-    # Find the second smallest element in each column of the pairwise distance matrix.
-    # This corresponds to the closest neighbor for each fixed point.
-    closest_neighbor = np.partition(distances, kth=1, axis=0)[1]
+    # Compute the closest neighbor distance for each fixed point
+    # without building the pairwise distance matrix.
+    closest_neighbor = utils.closest_neighbor_distance(self.fixed_points, num_fps)
 
     # Return data with outliers removed and indices of kept datapoints.
     keep_ids = np.where(closest_neighbor < tolerance)[0]
@@ -641,6 +770,115 @@ class SlowPointFinder(base.DSAnalyzer):
                              'L': L})
     return decompositions
 
+  def compute_eigenmodes(
+      self,
+      points: Union[ArrayType, Dict[str, ArrayType]],
+      num_modes: int = 10,
+      num_krylov: int = None,
+      sort_by: str = 'magnitude',
+  ):
+    """Compute the leading eigenmodes of the Jacobian matrices at the points.
+
+    Different from :py:meth:`compute_jacobians` and :py:meth:`decompose_eigenvalues`,
+    the Jacobian matrix is never built. Instead, an Arnoldi iteration (the
+    non-symmetric counterpart of the Lanczos iteration) with ``num_krylov``
+    Jacobian-vector products approximates the ``num_modes`` leading eigenvalues
+    and right eigenvectors at each point.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    points: np.ndarray, bm.ArrayType, jax.ndarray, dict
+      The fixed points with the shape of (num_point, num_dim).
+    num_modes: int
+      The number of the eigenmodes to return.
+    num_krylov: int
+      The dimension of the Krylov subspace. Larger values give more accurate
+      eigenmodes. Default is ``min(num_dim, max(2 * num_modes, num_modes + 20))``.
+    sort_by: str
+      The method of sorting, "magnitude" or "real".
+
+    Returns
+    -------
+    decompositions : list
+      A list of dictionaries with sorted eigenvalues components:
+      (eigenvalues, right eigenvectors, and the residual norms of eigenvectors),
+      in which the right eigenvectors are stacked along the feature dimension
+      of the flattened points.
+    """
+    if sort_by == 'magnitude':
+      sort_fun = np.abs
+    elif sort_by == 'real':
+      sort_fun = np.real
+    else:
+      raise ValueError("Not implemented yet.")
+    points = tree_map(lambda a: bm.as_jax(a), points, is_leaf=lambda a: isinstance(a, bm.Array))
+    if tree_flatten(points)[0][0].ndim == 1:
+      points = tree_map(lambda a: jnp.expand_dims(a, 0), points)
+    self._check_candidates(points)
+    f_res, flatten, unflatten = self._generate_f_residual(points)
+    xs = jax.vmap(flatten)(points)
+    num_dim = xs.shape[1]
+    if num_krylov is None:
+      num_krylov = max(2 * num_modes, num_modes + 20)
+    num_krylov = min(int(num_krylov), num_dim)
+    num_modes = min(int(num_modes), num_krylov)
+    if num_modes <= 0:
+      raise ValueError(f'"num_modes" must be a positive integer, but we got {num_modes}.')
+    v0 = np.random.RandomState(0).uniform(-1., 1., num_dim)
+    v0 = jnp.asarray(v0 / np.linalg.norm(v0), dtype=xs.dtype)
+
+    if self.f_type == constants.DISCRETE:
+      f_map = lambda x: f_res(x) + x
+    else:
+      f_map = f_res
+
+    def arnoldi(x):
+      _, f_jvp = jax.linearize(f_map, x)
+      mask = jnp.arange(num_krylov + 1)
+
+      def body(j, carry):
+        V, H = carry
+        w = f_jvp(V[j])
+        # classical Gram-Schmidt with re-orthogonalization
+        h = jnp.where(mask <= j, V @ w, 0.)
+        w = w - h @ V
+        h2 = jnp.where(mask <= j, V @ w, 0.)
+        w = w - h2 @ V
+        beta = jnp.linalg.norm(w)
+        V = V.at[j + 1].set(jnp.where(beta > 1e-12, w / beta, 0.))
+        H = H.at[:, j].set((h + h2).at[j + 1].set(beta))
+        return V, H
+
+      V = jnp.zeros((num_krylov + 1, num_dim), dtype=x.dtype).at[0].set(v0)
+      H = jnp.zeros((num_krylov + 1, num_krylov), dtype=x.dtype)
+      return lax.fori_loop(0, num_krylov, body, (V, H))
+
+    if isinstance(self.target, DynamicalSystem):
+      @jax.jit
+      def f_arnoldi(x):
+        r = jax.vmap(arnoldi)(x)
+        for k, v in self.excluded_vars.items():
+          v.value = self.excluded_data[k]
+        for k, v in self.target_vars.items():
+          v.value = self.target_data[k]
+        return r
+    else:
+      f_arnoldi = jax.jit(jax.vmap(arnoldi))
+
+    Vs, Hs = f_arnoldi(xs)
+    Vs, Hs = np.asarray(Vs), np.asarray(Hs)
+    decompositions = []
+    for V, H in zip(Vs, Hs):
+      # Ritz values and vectors of the Krylov subspace
+      eig_values, eig_vectors = np.linalg.eig(H[:num_krylov])
+      indices = np.flipud(np.argsort(sort_fun(eig_values)))[:num_modes]
+      decompositions.append({'eig_values': eig_values[indices],
+                             'R': V[:num_krylov].T @ eig_vectors[:, indices],
+                             'residuals': np.abs(H[num_krylov, num_krylov - 1] * eig_vectors[-1, indices])})
+    return decompositions
+
   def _step_func_input(self):
     if self._inputs is None:
       return
@@ -658,6 +896,9 @@ class SlowPointFinder(base.DSAnalyzer):
       for ops, values in self._inputs['array'].items():
         if len(values) > 0:
           raise UnsupportedError
+      for ops, values in self._inputs['generator'].items():
+        if len(values) > 0:
+          raise UnsupportedError
       for ops, values in self._inputs['functional'].items():
         for var, data in values:
           _f_ops(ops, var, data(share.get_shargs()))
@@ -692,6 +933,34 @@ class SlowPointFinder(base.DSAnalyzer):
     else:
       return jax.jit(f_eval_loss)
 
+  def _generate_f_residual(self, candidates):
+    # the residual function "r(x)" of the flattened states "x", and the
+    # functions to convert one point between its flattened and original forms
+    if isinstance(candidates, dict):
+      keys = tuple(candidates.keys())
+      shapes = [tuple(candidates[k].shape[1:]) for k in keys]
+      indices = np.cumsum([0] + [int(np.prod(s)) for s in shapes])
+
+      def flatten(h):
+        return jnp.concatenate([jnp.reshape(bm.as_jax(h[k]), (-1,)) for k in keys])
+
+      def unflatten(x):
+        return {k: jnp.reshape(x[indices[i]: indices[i + 1]], shapes[i]) for i, k in enumerate(keys)}
+    else:
+      shape = tuple(candidates.shape[1:])
+
+      def flatten(h):
+        return jnp.reshape(bm.as_jax(h), (-1,))
+
+      def unflatten(x):
+        return jnp.reshape(x, shape)
+
+    def f_res(x):
+      r = flatten(self.f_cell(unflatten(x))).astype(x.dtype)
+      return r - x if self.f_type == constants.DISCRETE else r
+
+    return f_res, flatten, unflatten
+
   def _get_f_for_opt_solver(self, candidates, opt_method):
     # loss function
     if self.f_type == constants.DISCRETE:
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
-import brainpy as bp
 import unittest
+
+import jax.numpy as jnp
+import numpy as np
+
+import brainpy as bp
 import brainpy.math as bm
 
 
@@ -171,3 +175,68 @@ class TestFixedPointsFinding(unittest.TestCase):
                                    num_opt=100)
     bm.clear_buffer_memory()
 
+
+class TestNewtonMethod(unittest.TestCase):
+  def test_newton_method_for_rnn(self):
+    rng = np.random.RandomState(0)
+    w = jnp.asarray(rng.randn(20, 20) * 1.5 / np.sqrt(20), dtype=bm.float_)
+
+    def step(h):
+      return jnp.tanh(w @ h)
+
+    finder = bp.analysis.SlowPointFinder(f_cell=step, f_type=bp.analysis.DISCRETE)
+    finder.find_fps_with_newton_method(rng.randn(10, 20) * 0.5, num_opt=50, num_cg=40, batch_size=4)
+    self.assertEqual(finder.fixed_points.shape, (10, 20))
+    self.assertEqual(finder.losses.shape, (10,))
+    self.assertLess(np.median(finder.losses), 1e-8)
+    self.assertTrue(finder.opt_losses[-1] <= finder.opt_losses[0])
+    bm.clear_buffer_memory()
+
+  def test_newton_method_for_ds(self):
+    hh = HH(1)
+    finder = bp.analysis.SlowPointFinder(f_cell=hh, excluded_vars=[hh.input, hh.spike])
+    rng = bm.random.RandomState(123)
+
+    with self.assertRaises(ValueError):
+      finder.find_fps_with_newton_method(rng.random((10, 4)))
+
+    finder.find_fps_with_newton_method({'V': rng.random((10, 1)) * 10. - 70.,
+                                        'm': rng.random((10, 1)),
+                                        'h': rng.random((10, 1)),
+                                        'n': rng.random((10, 1))},
+                                       num_opt=50)
+    self.assertEqual(finder.fixed_points['V'].shape, (10, 1))
+    self.assertTrue(np.allclose(bm.as_numpy(hh.V), -65.))
+    bm.clear_buffer_memory()
+
+
+class TestEigenmodes(unittest.TestCase):
+  def test_eigenmodes_of_rnn(self):
+    rng = np.random.RandomState(1)
+    w = jnp.asarray(rng.randn(30, 30) / np.sqrt(30), dtype=bm.float_)
+
+    def step(h):
+      return jnp.tanh(w @ h)
+
+    finder = bp.analysis.SlowPointFinder(f_cell=step, f_type=bp.analysis.DISCRETE)
+    points = jnp.asarray(rng.randn(3, 30) * 0.1, dtype=bm.float_)
+    dense = finder.decompose_eigenvalues(finder.compute_jacobians(points))
+    modes = finder.compute_eigenmodes(points, num_modes=4, num_krylov=30)
+    self.assertEqual(len(modes), 3)
+    for d, m in zip(dense, modes):
+      self.assertEqual(m['R'].shape, (30, 4))
+      self.assertTrue(np.allclose(np.sort(np.abs(m['eig_values'])),
+                                  np.sort(np.abs(d['eig_values'][:4])), atol=1e-4))
+    bm.clear_buffer_memory()
+
+  def test_eigenmodes_of_ds(self):
+    hh = HH(1)
+    finder = bp.analysis.SlowPointFinder(f_cell=hh, excluded_vars=[hh.input, hh.spike])
+    point = {'V': jnp.asarray([[-65.]]), 'm': jnp.asarray([[0.05]]),
+             'h': jnp.asarray([[0.6]]), 'n': jnp.asarray([[0.32]])}
+    jacobian = finder.compute_jacobians(point)
+    modes = finder.compute_eigenmodes(point, num_modes=4)
+    self.assertTrue(np.allclose(np.sort(np.abs(modes[0]['eig_values'])),
+                                np.sort(np.abs(np.linalg.eigvals(jacobian[0]))), atol=1e-4))
+    self.assertTrue(np.allclose(bm.as_numpy(hh.V), -65.))
+    bm.clear_buffer_memory()
@@ -666,9 +666,12 @@ class Num2DAnalyzer(Num1DAnalyzer):
       par_values = tuple(p[ids] for p in par_values)
     return x_values, y_values, par_values
 
-  def _get_fx_nullcline_points(self, coords=None, tol=1e-7, num_segments=1, fp_aux_filter=0.):
+  def _get_fx_nullcline_points(self, coords=None, tol=1e-7, num_segments=1, fp_aux_filter=0.,
+                               refine_level=0, tol_refine=0.):
     coords = (self.x_var + '-' + self.y_var) if coords is None else coords
     key = C.fx_nullcline_points + ',' + coords
+    if refine_level > 0:
+      key += f',refine={refine_level}'
     if key not in self.analyzed_results:
       all_losses = []
       all_x_values_in_fx = []
@@ -713,6 +716,21 @@ class Num2DAnalyzer(Num1DAnalyzer):
           for i, arg in enumerate(p_values_in_fx):
             all_p_values_in_fx[i].append(arg)
 
+      elif refine_level > 0:
+        utils.output("I am evaluating fx-nullcline by quadtree refinement ...")
+        for j, Ps in enumerate(par_seg):
+          if len(par_seg.arg_id_segments[0]) > 1: utils.output(f"{C.prefix}segment {j} ...")
+          x_values_in_fx, y_values_in_fx, p_values_in_fx = \
+            self._get_nullcline_points_by_quadtree(self.F_fx, self.F_vmap_fx, Ps, refine_level, tol_refine)
+          x_values_in_fx, y_values_in_fx, p_values_in_fx = \
+            self._fp_filter(x_values_in_fx, y_values_in_fx, p_values_in_fx, fp_aux_filter)
+          losses = self.F_vmap_fx(x_values_in_fx, y_values_in_fx, *p_values_in_fx)
+          all_losses.append(losses)
+          all_x_values_in_fx.append(x_values_in_fx)
+          all_y_values_in_fx.append(y_values_in_fx)
+          for i, arg in enumerate(p_values_in_fx):
+            all_p_values_in_fx[i].append(arg)
+
       else:
         utils.output("I am evaluating fx-nullcline by optimization ...")
         # auxiliary functions
@@ -760,9 +778,12 @@ class Num2DAnalyzer(Num1DAnalyzer):
       self.analyzed_results[key] = (all_xy_values,) + all_p_values_in_fx
     return self.analyzed_results[key]
 
-  def _get_fy_nullcline_points(self, coords=None, tol=1e-7, num_segments=1, fp_aux_filter=0.):
+  def _get_fy_nullcline_points(self, coords=None, tol=1e-7, num_segments=1, fp_aux_filter=0.,
+                               refine_level=0, tol_refine=0.):
     coords = (self.x_var + '-' + self.y_var) if coords is None else coords
     key = C.fy_nullcline_points + ',' + coords
+    if refine_level > 0:
+      key += f',refine={refine_level}'
     if key not in self.analyzed_results:
       all_losses = []
       all_x_values_in_fy = []
@@ -806,6 +827,21 @@ class Num2DAnalyzer(Num1DAnalyzer):
           for i, arg in enumerate(p_values_in_fy):
             all_p_values_in_fy[i].append(arg)
 
+      elif refine_level > 0:
+        utils.output("I am evaluating fy-nullcline by quadtree refinement ...")
+        for j, Ps in enumerate(par_seg):
+          if len(par_seg.arg_id_segments[0]) > 1: utils.output(f"{C.prefix}segment {j} ...")
+          x_values_in_fy, y_values_in_fy, p_values_in_fy = \
+            self._get_nullcline_points_by_quadtree(self.F_fy, self.F_vmap_fy, Ps, refine_level, tol_refine)
+          x_values_in_fy, y_values_in_fy, p_values_in_fy = \
+            self._fp_filter(x_values_in_fy, y_values_in_fy, p_values_in_fy, fp_aux_filter)
+          losses = self.F_vmap_fy(x_values_in_fy, y_values_in_fy, *p_values_in_fy)
+          all_losses.append(losses)
+          all_x_values_in_fy.append(x_values_in_fy)
+          all_y_values_in_fy.append(y_values_in_fy)
+          for i, arg in enumerate(p_values_in_fy):
+            all_p_values_in_fy[i].append(arg)
+
       else:
         utils.output("I am evaluating fy-nullcline by optimization ...")
 
@@ -851,6 +887,70 @@ class Num2DAnalyzer(Num1DAnalyzer):
       self.analyzed_results[key] = (all_xy_values,) + all_p_values_in_fy
     return self.analyzed_results[key]
 
+  def _get_nullcline_points_by_quadtree(self, f, vmap_f, pars, num_level, tol_refine=0.):
+    """Get the nullcline points of ``f`` by the quadtree refinement.
+
+    The cells of the ``resolutions`` grid are refined ``num_level`` times where
+    ``f`` changes its sign, and the roots are searched along the edges of the
+    finest cells in both the ``x`` and ``y`` directions.
+    """
+    cells, (values,) = utils.quadtree_cells(vmap_f,
+                                            self.resolutions[self.x_var],
+                                            self.resolutions[self.y_var],
+                                            *pars,
+                                            num_level=num_level,
+                                            tol=tol_refine)
+    (x_starts, x_ends, x_args), (y_starts, y_ends, y_args) = utils.cell_edge_candidates(cells, values)
+    points = []
+    if len(x_starts):
+      # roots along "x", the arguments are "(y, *pars)"
+      x_roots, x_args = utils.brentq_roots(f, jnp.asarray(x_starts), jnp.asarray(x_ends),
+                                           *tuple(jnp.asarray(a) for a in x_args))
+      points.append(np.stack((np.asarray(x_roots),) + tuple(np.asarray(a) for a in x_args), axis=1))
+    if len(y_starts):
+      # roots along "y", the arguments are "(x, *pars)"
+      f2 = lambda y, x, *args: f(x, y, *args)
+      y_roots, y_args = utils.brentq_roots(f2, jnp.asarray(y_starts), jnp.asarray(y_ends),
+                                           *tuple(jnp.asarray(a) for a in y_args))
+      points.append(np.stack((np.asarray(y_args[0]), np.asarray(y_roots)) +
+                             tuple(np.asarray(a) for a in y_args[1:]), axis=1))
+    if len(points) == 0:
+      points = np.zeros((0, 2 + len(pars)))
+    else:
+      # the edges shared by the neighboring cells give the same roots
+      points = np.unique(np.concatenate(points), axis=0)
+    points = jnp.asarray(points)
+    return points[:, 0], points[:, 1], tuple(points[:, 2 + i] for i in range(len(pars)))
+
+  def _get_fp_candidates_by_quadtree(self, num_segments=1, num_level=0, tol_refine=0.):
+    """Get the fixed point candidates by the quadtree refinement.
+
+    The cells of the ``resolutions`` grid are refined ``num_level`` times where
+    both ``fx`` and ``fy`` change their signs, and the centers of the finest
+    cells are used as the candidates.
+    """
+    utils.output(f"I am filtering out fixed point candidates with quadtree refinement ...")
+    all_xys = []
+    all_ps = tuple([] for _ in range(len(self.target_par_names)))
+    par_seg = utils.Segment(targets=tuple(self.resolutions[p] for p in self.target_par_names),
+                            num_segments=num_segments)
+    for j, Ps in enumerate(par_seg):
+      if len(par_seg.arg_id_segments[0]) > 1: utils.output(f"{C.prefix}segment {j} ...")
+      cells, _ = utils.quadtree_cells((self.F_vmap_fx, self.F_vmap_fy),
+                                      self.resolutions[self.x_var],
+                                      self.resolutions[self.y_var],
+                                      *Ps,
+                                      num_level=num_level,
+                                      tol=tol_refine)
+      x0, x1, y0, y1 = cells[:4]
+      all_xys.append(np.stack([(x0 + x1) / 2, (y0 + y1) / 2], axis=1))
+      for i, p in enumerate(cells[4:]):
+        all_ps[i].append(p)
+    all_xys = jnp.asarray(np.concatenate(all_xys))
+    all_ps = tuple(jnp.asarray(np.concatenate(p)) for p in all_ps)
+    utils.output(f"{C.prefix}There are {len(all_xys)} candidates.")
+    return all_xys, all_ps
+
   def _get_fp_candidates_by_aux_rank(self, num_segments=1, num_rank=100):
     utils.output(f"I am filtering out fixed point candidates with auxiliary function ...")
     all_xs = []
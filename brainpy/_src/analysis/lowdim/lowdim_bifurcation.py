@@ -42,6 +42,8 @@ class Bifurcation1D(Num1DAnalyzer):
     if len(self.target_pars) == 0:
       raise ValueError
 
+    self.special_points = []
+
   @property
   def F_vmap_dfxdx(self):
     if C.F_vmap_dfxdx not in self.analyzed_results:
@@ -69,28 +71,7 @@ class Bifurcation1D(Num1DAnalyzer):
 
     if with_plot:
       if len(self.target_pars) == 1:
-        container = {c: {'p': [], 'x': []} for c in stability.get_1d_stability_types()}
-
-        # fixed point
-        for p, x, dx in zip(pars[0], fixed_points, dfxdx):
-          fp_type = stability.stability_analysis(dx)
-          container[fp_type]['p'].append(p)
-          container[fp_type]['x'].append(x)
-
-        # visualization
-        pyplot.figure(self.x_var)
-        for fp_type, points in container.items():
-          if len(points['x']):
-            plot_style = deepcopy(plotstyle.plot_schema[fp_type])
-            pyplot.plot(points['p'], points['x'], **plot_style, label=fp_type)
-        pyplot.xlabel(self.target_par_names[0])
-        pyplot.ylabel(self.x_var)
-
-        scale = (self.lim_scale - 1) / 2
-        pyplot.xlim(*utils.rescale(self.target_pars[self.target_par_names[0]], scale=scale))
-        pyplot.ylim(*utils.rescale(self.target_vars[self.x_var], scale=scale))
-
-        pyplot.legend()
+        self._plot_codim1(pars[0], fixed_points, dfxdx)
         if show:
           pyplot.show()
 
@@ -137,6 +118,105 @@ class Bifurcation1D(Num1DAnalyzer):
     if with_return:
       return fixed_points, pars, dfxdx
 
+  def plot_bifurcation_by_continuation(self, seeds=None, step=None, num_step=1000,
+                                       with_plot=True, show=False, with_return=False,
+                                       tol=None, branch_switching=True):
+    """Make the co-dimension 1 bifurcation analysis by the pseudo-arclength continuation.
+
+    Different from :py:meth:`plot_bifurcation`, which searches the fixed points
+    over the grid of variables and parameters, the equilibrium branches are traced
+    from a few seeds (see :py:func:`~.continue_branches`). Along the branches, the
+    limit points (``'LP'``) and the branch points (``'BP'``) are detected, and the
+    other branch crossing at a branch point is traced if ``branch_switching=True``.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    seeds: ArrayType, optional
+      The equilibria to start with, with the shape of ``(num_seed, 2)``, each row
+      is ``(x, p)``. By default, the seeds are searched by Newton's method from
+      the resolution grid of the variable at the two ends of the parameter range.
+    step: float, optional
+      The arclength step. Default is the interval of the parameter resolution.
+    num_step: int
+      The maximal number of steps along each direction of a branch.
+    with_plot: bool
+      Whether plot the bifurcation figure.
+    show: bool
+      Whether show the figure.
+    with_return: bool
+      Whether return the computed bifurcation results.
+    tol: float, optional
+      The tolerance of the residual to confirm an equilibrium.
+    branch_switching: bool
+      Whether trace the other branches at the detected branch points.
+
+    Returns
+    -------
+    results : tuple
+      The same as :py:meth:`plot_bifurcation`, a tuple of
+      ``(fixed_points, (parameters,), dfxdx)``. The detected special points
+      are stored in ``self.special_points``.
+    """
+    global pyplot
+    if pyplot is None: from matplotlib import pyplot
+    if len(self.target_pars) != 1:
+      raise ValueError(f'Continuation only supports co-dimension 1 bifurcation analysis, '
+                       f'but we got {len(self.target_pars)} parameters.')
+    utils.output('I am making bifurcation analysis by continuation ...')
+
+    p_name = self.target_par_names[0]
+    f = lambda x, p: jnp.atleast_1d(self.F_fx(x[0], p))
+    fixed_points, pars, self.special_points = _continue_equilibria(
+      f,
+      x_grids=(self.resolutions[self.x_var],),
+      x_ranges=(self.target_vars[self.x_var],),
+      p_range=self.target_pars[p_name],
+      p_resolution=self.resolutions[p_name],
+      seeds=seeds,
+      step=step,
+      num_step=num_step,
+      tol=tol,
+      branch_switching=branch_switching
+    )
+    fixed_points = fixed_points[:, 0]
+    dfxdx = np.asarray(self.F_vmap_dfxdx(jnp.asarray(fixed_points), jnp.asarray(pars)))
+    pars = (pars,)
+
+    if with_plot:
+      self._plot_codim1(pars[0], fixed_points, dfxdx, self.special_points)
+      if show:
+        pyplot.show()
+
+    if with_return:
+      return fixed_points, pars, dfxdx
+
+  def _plot_codim1(self, pars, fixed_points, dfxdx, special_points=()):
+    container = {c: {'p': [], 'x': []} for c in stability.get_1d_stability_types()}
+
+    # fixed point
+    for p, x, dx in zip(pars, fixed_points, dfxdx):
+      fp_type = stability.stability_analysis(dx)
+      container[fp_type]['p'].append(p)
+      container[fp_type]['x'].append(x)
+
+    # visualization
+    pyplot.figure(self.x_var)
+    for fp_type, points in container.items():
+      if len(points['x']):
+        plot_style = deepcopy(plotstyle.plot_schema[fp_type])
+        pyplot.plot(points['p'], points['x'], **plot_style, label=fp_type)
+    _plot_special_points(special_points, 0)
+    pyplot.xlabel(self.target_par_names[0])
+    pyplot.ylabel(self.x_var)
+
+    scale = (self.lim_scale - 1) / 2
+    pyplot.xlim(*utils.rescale(self.target_pars[self.target_par_names[0]], scale=scale))
+    pyplot.ylim(*utils.rescale(self.target_vars[self.x_var], scale=scale))
+
+    pyplot.legend()
+
 
 class Bifurcation2D(Num2DAnalyzer):
   """Bifurcation analysis of 2D system.
@@ -158,6 +238,7 @@ class Bifurcation2D(Num2DAnalyzer):
       raise ValueError
 
     self._fixed_points = None
+    self.special_points = []
 
   @property
   def F_vmap_jacobian(self):
@@ -171,7 +252,7 @@ class Bifurcation2D(Num2DAnalyzer):
   def plot_bifurcation(self, with_plot=True, show=False, with_return=False,
                        tol_aux=1e-8, tol_unique=1e-2, tol_opt_candidate=None,
                        num_par_segments=1, num_fp_segment=1, nullcline_aux_filter=1.,
-                       select_candidates='aux_rank', num_rank=100):
+                       select_candidates='aux_rank', num_rank=100, refine_level=0, tol_refine=0.):
     """Make the bifurcation analysis.
 
     Parameters
@@ -207,9 +288,24 @@ class Bifurcation2D(Num2DAnalyzer):
       - ``fy-nullcline``: use the points of fy-nullcline.
       - ``nullclines``: use the points in both of fx-nullcline and fy-nullcline.
       - ``aux_rank``: use the minimal value of points for the auxiliary function.
+      - ``quadtree``: use the centers of the cells where both of fx and fy change
+        their signs, which are refined ``refine_level`` times by the quadtree.
     num_rank: int
       The number of candidates to be used to optimize the fixed points.
       rank to use.
+    refine_level: int
+      The number of quadtree refinement levels. The grid of ``resolutions`` is used
+      as the coarse cells, and only the cells where the derivatives change their
+      signs are subdivided. It is used by the ``quadtree`` candidates and the
+      nullcline candidates.
+
+      .. versionadded:: 2.6.1
+
+    tol_refine: float
+      The cells whose absolute derivative at one corner is smaller than
+      ``tol_refine`` are also subdivided.
+
+      .. versionadded:: 2.6.1
 
     Returns
     -------
@@ -238,19 +334,27 @@ class Bifurcation2D(Num2DAnalyzer):
     else:
       if select_candidates == 'fx-nullcline':
         fx_nullclines = self._get_fx_nullcline_points(num_segments=num_par_segments,
-                                                      fp_aux_filter=nullcline_aux_filter)
+                                                      fp_aux_filter=nullcline_aux_filter,
+                                                      refine_level=refine_level,
+                                                      tol_refine=tol_refine)
         candidates = fx_nullclines[0]
         parameters = fx_nullclines[1:]
       elif select_candidates == 'fy-nullcline':
         fy_nullclines = self._get_fy_nullcline_points(num_segments=num_par_segments,
-                                                      fp_aux_filter=nullcline_aux_filter)
+                                                      fp_aux_filter=nullcline_aux_filter,
+                                                      refine_level=refine_level,
+                                                      tol_refine=tol_refine)
         candidates = fy_nullclines[0]
         parameters = fy_nullclines[1:]
       elif select_candidates == 'nullclines':
         fx_nullclines = self._get_fx_nullcline_points(num_segments=num_par_segments,
-                                                      fp_aux_filter=nullcline_aux_filter)
+                                                      fp_aux_filter=nullcline_aux_filter,
+                                                      refine_level=refine_level,
+                                                      tol_refine=tol_refine)
         fy_nullclines = self._get_fy_nullcline_points(num_segments=num_par_segments,
-                                                      fp_aux_filter=nullcline_aux_filter)
+                                                      fp_aux_filter=nullcline_aux_filter,
+                                                      refine_level=refine_level,
+                                                      tol_refine=tol_refine)
         candidates = jnp.vstack([fx_nullclines[0], fy_nullclines[0]])
         parameters = [jnp.concatenate([fx_nullclines[i], fy_nullclines[i]])
                       for i in range(1, len(fy_nullclines))]
@@ -258,6 +362,10 @@ class Bifurcation2D(Num2DAnalyzer):
         assert nullcline_aux_filter > 0.
         candidates, parameters = self._get_fp_candidates_by_aux_rank(num_segments=num_par_segments,
                                                                      num_rank=num_rank)
+      elif select_candidates == 'quadtree':
+        candidates, parameters = self._get_fp_candidates_by_quadtree(num_segments=num_par_segments,
+                                                                     num_level=refine_level,
+                                                                     tol_refine=tol_refine)
       else:
         raise ValueError
     candidates, _, parameters = self._get_fixed_points(candidates,
@@ -287,31 +395,7 @@ class Bifurcation2D(Num2DAnalyzer):
     if with_plot:
       # bifurcation analysis of co-dimension 1
       if len(self.target_pars) == 1:
-        container = {c: {'p': [], self.x_var: [], self.y_var: []}
-                     for c in stability.get_2d_stability_types()}
-
-        # fixed point
-        for p, xy, J in zip(final_pars, final_fps, jacobians):
-          fp_type = stability.stability_analysis(J)
-          container[fp_type]['p'].append(p[0])
-          container[fp_type][self.x_var].append(xy[0])
-          container[fp_type][self.y_var].append(xy[1])
-
-        # visualization
-        for var in self.target_var_names:
-          pyplot.figure(var)
-          for fp_type, points in container.items():
-            if len(points['p']):
-              plot_style = deepcopy(plotstyle.plot_schema[fp_type])
-              pyplot.plot(points['p'], points[var], **plot_style, label=fp_type)
-          pyplot.xlabel(self.target_par_names[0])
-          pyplot.ylabel(var)
-
-          scale = (self.lim_scale - 1) / 2
-          pyplot.xlim(*utils.rescale(self.target_pars[self.target_par_names[0]], scale=scale))
-          pyplot.ylim(*utils.rescale(self.target_vars[var], scale=scale))
-
-          pyplot.legend()
+        self._plot_codim1(final_pars, final_fps, jacobians)
         if show:
           pyplot.show()
 
@@ -360,6 +444,112 @@ class Bifurcation2D(Num2DAnalyzer):
     if with_return:
       return final_fps, final_pars, jacobians
 
+  def plot_bifurcation_by_continuation(self, seeds=None, step=None, num_step=1000,
+                                       with_plot=True, show=False, with_return=False,
+                                       tol=None, branch_switching=True):
+    """Make the co-dimension 1 bifurcation analysis by the pseudo-arclength continuation.
+
+    Different from :py:meth:`plot_bifurcation`, which searches the fixed points
+    over the grid of variables and parameters, the equilibrium branches are traced
+    from a few seeds (see :py:func:`~.continue_branches`). Along the branches, the
+    limit points (``'LP'``), the Hopf points (``'H'``) and the branch points (``'BP'``)
+    are detected, and the other branch crossing at a branch point is traced if
+    ``branch_switching=True``.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    seeds: ArrayType, optional
+      The equilibria to start with, with the shape of ``(num_seed, 3)``, each row
+      is ``(x, y, p)``. By default, the seeds are searched by Newton's method from
+      the resolution grid of the variables at the two ends of the parameter range.
+    step: float, optional
+      The arclength step. Default is the interval of the parameter resolution.
+    num_step: int
+      The maximal number of steps along each direction of a branch.
+    with_plot: bool
+      Whether plot the bifurcation figure.
+    show: bool
+      Whether show the figure.
+    with_return: bool
+      Whether return the computed bifurcation results.
+    tol: float, optional
+      The tolerance of the residual to confirm an equilibrium.
+    branch_switching: bool
+      Whether trace the other branches at the detected branch points.
+
+    Returns
+    -------
+    results : tuple
+      The same as :py:meth:`plot_bifurcation`, a tuple of
+      ``(fixed_points, parameters, jacobians)``. The detected special points
+      are stored in ``self.special_points``.
+    """
+    global pyplot
+    if pyplot is None: from matplotlib import pyplot
+    if len(self.target_pars) != 1:
+      raise ValueError(f'Continuation only supports co-dimension 1 bifurcation analysis, '
+                       f'but we got {len(self.target_pars)} parameters.')
+    utils.output('I am making bifurcation analysis by continuation ...')
+
+    p_name = self.target_par_names[0]
+    f = lambda xy, p: jnp.array([self.F_fx(xy[0], xy[1], p), self.F_fy(xy[0], xy[1], p)])
+    final_fps, final_pars, self.special_points = _continue_equilibria(
+      f,
+      x_grids=(self.resolutions[self.x_var], self.resolutions[self.y_var]),
+      x_ranges=(self.target_vars[self.x_var], self.target_vars[self.y_var]),
+      p_range=self.target_pars[p_name],
+      p_resolution=self.resolutions[p_name],
+      seeds=seeds,
+      step=step,
+      num_step=num_step,
+      tol=tol,
+      branch_switching=branch_switching
+    )
+    final_pars = final_pars[:, None]
+    jacobians = np.asarray(self.F_vmap_jacobian(jnp.asarray(final_fps), *final_pars.T))
+    utils.output(f'{C.prefix}Found {len(final_fps)} fixed points.')
+
+    # remember the fixed points for later limit cycle plotting
+    self._fixed_points = (final_fps, final_pars)
+
+    if with_plot:
+      self._plot_codim1(final_pars, final_fps, jacobians, self.special_points)
+      if show:
+        pyplot.show()
+
+    if with_return:
+      return final_fps, final_pars, jacobians
+
+  def _plot_codim1(self, final_pars, final_fps, jacobians, special_points=()):
+    container = {c: {'p': [], self.x_var: [], self.y_var: []}
+                 for c in stability.get_2d_stability_types()}
+
+    # fixed point
+    for p, xy, J in zip(final_pars, final_fps, jacobians):
+      fp_type = stability.stability_analysis(J)
+      container[fp_type]['p'].append(p[0])
+      container[fp_type][self.x_var].append(xy[0])
+      container[fp_type][self.y_var].append(xy[1])
+
+    # visualization
+    for i, var in enumerate(self.target_var_names):
+      pyplot.figure(var)
+      for fp_type, points in container.items():
+        if len(points['p']):
+          plot_style = deepcopy(plotstyle.plot_schema[fp_type])
+          pyplot.plot(points['p'], points[var], **plot_style, label=fp_type)
+      _plot_special_points(special_points, i)
+      pyplot.xlabel(self.target_par_names[0])
+      pyplot.ylabel(var)
+
+      scale = (self.lim_scale - 1) / 2
+      pyplot.xlim(*utils.rescale(self.target_pars[self.target_par_names[0]], scale=scale))
+      pyplot.ylim(*utils.rescale(self.target_vars[var], scale=scale))
+
+      pyplot.legend()
+
   def plot_limit_cycle_by_sim(
       self,
       duration=100,
@@ -621,3 +811,96 @@ class FastSlow2D(Bifurcation2D):
 
     if with_return:
       return mon_res
+
+
+def _plot_special_points(special_points, var_index):
+  for sp_type in (utils.LIMIT_POINT, utils.HOPF_POINT, utils.BRANCH_POINT):
+    points = [sp for sp in special_points if sp['type'] == sp_type]
+    if len(points):
+      ps = [sp['p'] for sp in points]
+      xs = [sp['x'][var_index] for sp in points]
+      pyplot.plot(ps, xs, **plotstyle.plot_schema[sp_type], label=sp_type)
+      for p, x in zip(ps, xs):
+        pyplot.annotate(sp_type, (p, x), textcoords='offset points', xytext=(5, 5))
+
+
+def _continue_equilibria(f, x_grids, x_ranges, p_range, p_resolution, seeds=None,
+                         step=None, num_step=1000, tol=None, branch_switching=True):
+  """Trace the equilibrium branches of ``f(x, p) = 0`` by the continuation.
+
+  Returns the points along the branches, their parameters, and the special points.
+  """
+  num_var = len(x_grids)
+  x_ranges = np.asarray(x_ranges, dtype=float)
+  p_range = tuple(float(a) for a in p_range)
+  dtype = bm.get_float()
+  if step is None:
+    p_resolution = np.asarray(p_resolution)
+    step = float(np.mean(np.diff(p_resolution))) if p_resolution.size > 1 else (p_range[1] - p_range[0]) / 100
+  kwargs = dict(step=step, num_step=num_step, x_range=x_ranges, p_range=p_range, tol=tol)
+
+  # seeds
+  if seeds is None:
+    candidates = jnp.stack([jnp.asarray(g, dtype=dtype).flatten()
+                            for g in jnp.meshgrid(*x_grids, indexing='ij')], axis=1)
+    newton = jax.jit(vmap(partial(utils.newton_equilibria, f, tol=tol), in_axes=(0, None)))
+    seeds = []
+    for p in p_range:
+      xs, converged = newton(candidates, jnp.asarray(p, dtype=dtype))
+      xs, converged = np.asarray(xs), np.asarray(converged)
+      in_range = np.all((xs >= x_ranges[:, 0]) & (xs <= x_ranges[:, 1]), axis=1)
+      xs = xs[np.logical_and(converged, in_range)]
+      if len(xs):
+        xs, _ = utils.keep_unique(xs, tolerance=step)
+        seeds.append(np.concatenate([xs, np.full((len(xs), 1), p)], axis=1))
+    if len(seeds) == 0:
+      utils.output(f'{C.prefix}No equilibrium is found at the ends of the parameter range, '
+                   f'please provide "seeds".')
+      return np.zeros((0, num_var)), np.zeros(0), []
+    seeds = np.concatenate(seeds)
+  seeds = np.asarray(seeds, dtype=dtype)
+  if seeds.ndim != 2 or seeds.shape[1] != num_var + 1:
+    raise ValueError(f'"seeds" should be a 2D array with the shape of (num_seed, {num_var + 1}), '
+                     f'but we got {seeds.shape}.')
+  utils.output(f'{C.prefix}Tracing the branches from {len(seeds)} seeds ...')
+
+  def trace(xs, ps, tangents=None):
+    branches = utils.continue_branches(f, xs, ps, tangents, **kwargs)
+    points, special_points = [], []
+    for x, p, t, valid in zip(branches['x'], branches['p'], branches['tangent'], branches['valid']):
+      points.append(np.concatenate([x[valid], p[valid, None]], axis=1))
+      special_points.extend(utils.detect_special_points(f, x, p, t, valid))
+    return points, special_points
+
+  def is_new(point, others):
+    return all(np.linalg.norm(np.append(point['x'], point['p']) - np.append(o['x'], o['p'])) > step
+               for o in others)
+
+  points, special_points = trace(seeds[:, :-1], seeds[:, -1])
+  # the same special point may be passed by several branches
+  unique_points = []
+  for sp in special_points:
+    if is_new(sp, [o for o in unique_points if o['type'] == sp['type']]):
+      unique_points.append(sp)
+  special_points = unique_points
+
+  # branch switching
+  bps = [sp for sp in special_points if sp['type'] == utils.BRANCH_POINT]
+  if branch_switching and len(bps):
+    utils.output(f'{C.prefix}Switching branches at {len(bps)} branch points ...')
+    tangents = np.asarray([utils.branch_switch_tangent(f, sp['x'], sp['p'], sp['tangent']) for sp in bps])
+    new_points, new_special_points = trace(np.asarray([sp['x'] for sp in bps], dtype=dtype),
+                                           np.asarray([sp['p'] for sp in bps], dtype=dtype),
+                                           np.asarray(tangents, dtype=dtype))
+    points.extend(new_points)
+    for sp in new_special_points:
+      if is_new(sp, [o for o in special_points if o['type'] == sp['type']]):
+        special_points.append(sp)
+
+  # the branches traced from different seeds may overlap
+  points = np.concatenate(points)
+  points, _ = utils.keep_unique(points, tolerance=0.75 * step)
+  for sp in special_points:
+    sp.pop('index')
+  utils.output(f'{C.prefix}Found {len(points)} points and {len(special_points)} special points.')
+  return points[:, :-1], points[:, -1], special_points
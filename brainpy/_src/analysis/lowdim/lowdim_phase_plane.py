@@ -232,8 +232,27 @@ class PhasePlane2D(Num2DAnalyzer):
 
   def plot_nullcline(self, with_plot=True, with_return=False,
                      y_style=None, x_style=None, show=False,
-                     coords=None, tol_nullcline=1e-7):
-    """Plot the nullcline."""
+                     coords=None, tol_nullcline=1e-7,
+                     refine_level=0, tol_refine=0.):
+    """Plot the nullcline.
+
+    Parameters
+    ----------
+    refine_level: int
+      The number of quadtree refinement levels. If ``refine_level > 0``, the grid of
+      ``resolutions`` is used as the coarse cells, and only the cells where the
+      derivative changes its sign are subdivided, so that the nullclines are resolved
+      at ``2 ** refine_level`` times of the resolution without evaluating the whole
+      fine grid. ``coords`` is ignored in this mode.
+
+      .. versionadded:: 2.6.1
+
+    tol_refine: float
+      The cells whose absolute derivative at one corner is smaller than
+      ``tol_refine`` are also subdivided.
+
+      .. versionadded:: 2.6.1
+    """
     global pyplot
     if pyplot is None: from matplotlib import pyplot
     utils.output('I am computing fx-nullcline ...')
@@ -244,7 +263,8 @@ class PhasePlane2D(Num2DAnalyzer):
     y_coord = coords.get(self.y_var, None)
 
     # Nullcline of the x variable
-    xy_values_in_fx, = self._get_fx_nullcline_points(coords=x_coord, tol=tol_nullcline)
+    xy_values_in_fx, = self._get_fx_nullcline_points(coords=x_coord, tol=tol_nullcline,
+                                                     refine_level=refine_level, tol_refine=tol_refine)
     x_values_in_fx = np.asarray(xy_values_in_fx[:, 0])
     y_values_in_fx = np.asarray(xy_values_in_fx[:, 1])
 
@@ -256,7 +276,8 @@ class PhasePlane2D(Num2DAnalyzer):
 
     # Nullcline of the y variable
     utils.output('I am computing fy-nullcline ...')
-    xy_values_in_fy, = self._get_fy_nullcline_points(coords=y_coord, tol=tol_nullcline)
+    xy_values_in_fy, = self._get_fy_nullcline_points(coords=y_coord, tol=tol_nullcline,
+                                                     refine_level=refine_level, tol_refine=tol_refine)
     x_values_in_fy = np.asarray(xy_values_in_fy[:, 0])
     y_values_in_fy = np.asarray(xy_values_in_fy[:, 1])
 
@@ -282,8 +303,31 @@ class PhasePlane2D(Num2DAnalyzer):
 
   def plot_fixed_point(self, with_plot=True, with_return=False, show=False,
                        tol_unique=1e-2, tol_aux=1e-8, tol_opt_screen=None,
-                       select_candidates='fx-nullcline', num_rank=100, ):
+                       select_candidates='fx-nullcline', num_rank=100,
+                       refine_level=0, tol_refine=0.):
     """Plot the fixed point and analyze its stability.
+
+    Parameters
+    ----------
+    select_candidates: str
+      The method to select candidate fixed points. It can be:
+
+      - ``fx-nullcline``: use the points of fx-nullcline.
+      - ``fy-nullcline``: use the points of fy-nullcline.
+      - ``nullclines``: use the points in both of fx-nullcline and fy-nullcline.
+      - ``aux_rank``: use the minimal value of points for the auxiliary function.
+      - ``quadtree``: use the centers of the cells where both of fx and fy change
+        their signs, which are refined ``refine_level`` times by the quadtree.
+    refine_level: int
+      The number of quadtree refinement levels for ``select_candidates='quadtree'``.
+
+      .. versionadded:: 2.6.1
+
+    tol_refine: float
+      The cells whose absolute derivative at one corner is smaller than
+      ``tol_refine`` are also subdivided.
+
+      .. versionadded:: 2.6.1
     """
     global pyplot
     if pyplot is None: from matplotlib import pyplot
@@ -318,6 +362,8 @@ class PhasePlane2D(Num2DAnalyzer):
         candidates = jnp.vstack(candidates)
       elif select_candidates == 'aux_rank':
         candidates, _ = self._get_fp_candidates_by_aux_rank(num_rank=num_rank)
+      elif select_candidates == 'quadtree':
+        candidates, _ = self._get_fp_candidates_by_quadtree(num_level=refine_level, tol_refine=tol_refine)
       else:
         raise ValueError
 
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import jax.numpy as jnp
+import matplotlib.pyplot as plt
+import numpy as np
+
+import brainpy as bp
+from brainpy._src.analysis import utils
+
+show = False
+
+
+class TestContinuation(unittest.TestCase):
+  def setUp(self):
+    bp.math.enable_x64()
+
+  def tearDown(self):
+    bp.math.disable_x64()
+
+  def test_limit_point(self):
+    f = lambda x, p: p - x ** 2
+    branches = utils.continue_branches(f, jnp.array([[1.]]), jnp.array([1.]), step=0.05,
+                                       num_step=200, x_range=[(-2., 2.)], p_range=(-1., 1.))
+    xs = np.concatenate([x[v, 0] for x, v in zip(branches['x'], branches['valid'])])
+    ps = np.concatenate([p[v] for p, v in zip(branches['p'], branches['valid'])])
+    # the branch passes through the fold
+    np.testing.assert_allclose(ps, xs ** 2, atol=1e-8)
+    self.assertLess(xs.min(), -0.9)
+
+    points = [sp
+              for x, p, t, v in zip(branches['x'], branches['p'], branches['tangent'], branches['valid'])
+              for sp in utils.detect_special_points(f, x, p, t, v)]
+    self.assertEqual([sp['type'] for sp in points], [utils.LIMIT_POINT])
+    self.assertAlmostEqual(points[0]['p'], 0., delta=1e-2)
+    self.assertAlmostEqual(points[0]['x'][0], 0., delta=1e-2)
+
+  def test_branch_switching(self):
+    f = lambda x, p: p * x - x ** 2
+    branches = utils.continue_branches(f, jnp.array([[0.]]), jnp.array([-1.]), step=0.05,
+                                       num_step=200, x_range=[(-2., 2.)], p_range=(-1., 1.))
+    points = utils.detect_special_points(f, branches['x'][0], branches['p'][0],
+                                         branches['tangent'][0], branches['valid'][0])
+    self.assertEqual([sp['type'] for sp in points], [utils.BRANCH_POINT])
+    bp_ = points[0]
+    self.assertAlmostEqual(bp_['p'], 0., delta=1e-6)
+
+    tangent = utils.branch_switch_tangent(f, bp_['x'], bp_['p'], bp_['tangent'])
+    branches = utils.continue_branches(f, bp_['x'][None], np.array([bp_['p']]), tangent[None],
+                                       step=0.05, num_step=200, x_range=[(-2., 2.)], p_range=(-1., 1.))
+    for x, p, v in zip(branches['x'], branches['p'], branches['valid']):
+      self.assertGreater(v.sum(), 10)
+      np.testing.assert_allclose(x[v, 0], p[v], atol=1e-8)
+
+  def test_newton_equilibria(self):
+    f = lambda x, p: p - x ** 2
+    x, converged = utils.newton_equilibria(f, jnp.array([2.]), 4.)
+    self.assertTrue(converged)
+    self.assertAlmostEqual(float(x[0]), 2., places=6)
+
+  def test_bifurcation_1d(self):
+    @bp.odeint
+    def int_x(x, t, p):
+      return p - x ** 2
+
+    bif = bp.analysis.Bifurcation1D(model=int_x,
+                                    target_vars={'x': [-2., 2.]},
+                                    target_pars={'p': [-1., 1.]},
+                                    resolutions={'p': 0.05, 'x': 0.5})
+    fps, pars, dfxdx = bif.plot_bifurcation_by_continuation(with_return=True, show=show)
+    np.testing.assert_allclose(pars[0], fps ** 2, atol=1e-8)
+    np.testing.assert_allclose(dfxdx, -2 * fps, atol=1e-8)
+    self.assertEqual([sp['type'] for sp in bif.special_points], [utils.LIMIT_POINT])
+    plt.close('all')
+
+  def test_bifurcation_2d(self):
+    @bp.odeint
+    def int_V(V, t, w, Iext):
+      return V - V * V * V / 3 - w + Iext
+
+    @bp.odeint
+    def int_w(w, t, V):
+      return (V + 0.7 - 0.8 * w) / 12.5
+
+    bif = bp.analysis.Bifurcation2D(model=[int_V, int_w],
+                                    target_vars={'V': [-3., 3.], 'w': [-1., 3.]},
+                                    target_pars={'Iext': [0., 2.]},
+                                    resolutions={'Iext': 0.02, 'V': 0.5, 'w': 0.5})
+    fps, pars, jacobians = bif.plot_bifurcation_by_continuation(with_return=True, show=show)
+    self.assertEqual(fps.shape[1], 2)
+    self.assertEqual(pars.shape[1], 1)
+    self.assertEqual(jacobians.shape, (fps.shape[0], 2, 2))
+    hopf = sorted(sp['p'] for sp in bif.special_points if sp['type'] == utils.HOPF_POINT)
+    np.testing.assert_allclose(hopf, [0.3313, 1.4187], atol=1e-2)
+    plt.close('all')
+
+  def test_codim2_not_supported(self):
+    @bp.odeint
+    def int_x(x, t, a, b):
+      return a + b * x - x ** 3
+
+    bif = bp.analysis.Bifurcation1D(model=int_x,
+                                    target_vars={'x': [-2., 2.]},
+                                    target_pars={'a': [-1., 1.], 'b': [-1., 1.]})
+    with self.assertRaises(ValueError):
+      bif.plot_bifurcation_by_continuation()
@@ -5,6 +5,9 @@ import unittest
 import brainpy as bp
 import matplotlib.pyplot as plt
 import jax.numpy as jnp
+import numpy as np
+
+from brainpy._src.analysis import utils
 
 
 show = False
@@ -79,3 +82,49 @@ class TestPhasePlane(unittest.TestCase):
       plt.show()
     plt.close()
     bp.math.disable_x64()
+
+  def test_2d_quadtree(self):
+    bp.math.enable_x64()
+
+    @bp.odeint
+    def int_V(V, t, w, Iext=0.8):
+      return V - V * V * V / 3 - w + Iext
+
+    @bp.odeint
+    def int_w(w, t, V):
+      return (V + 0.7 - 0.8 * w) / 12.5
+
+    analyzer = bp.analysis.PhasePlane2D(
+      model=[int_V, int_w],
+      target_vars={'V': [-3, 3], 'w': [-3, 3]},
+      resolutions=0.32
+    )
+    plt.ion()
+    nullclines = analyzer.plot_nullcline(with_return=True, refine_level=4)
+    V, w = nullclines['V']
+    self.assertGreater(len(V), 100)
+    self.assertTrue(np.allclose(V - V ** 3 / 3 - w + 0.8, 0., atol=1e-8))
+    V, w = nullclines['w']
+    self.assertTrue(np.allclose(V + 0.7 - 0.8 * w, 0., atol=1e-8))
+
+    fps = analyzer.plot_fixed_point(with_return=True, select_candidates='quadtree', refine_level=4)
+    self.assertEqual(fps.shape, (1, 2))
+    self.assertTrue(np.allclose(fps, [[-0.2733, 0.5333]], atol=1e-2))
+    if show:
+      plt.show()
+    plt.close()
+    bp.math.disable_x64()
+
+  def test_quadtree_cells(self):
+    bp.math.enable_x64()
+    f = lambda x, y: x ** 2 + y ** 2 - 1.
+    xs = np.linspace(-2, 2, 9)
+    cells, (values,) = utils.quadtree_cells(f, xs, xs, num_level=3)
+    x0, x1, y0, y1 = cells
+    # the finest cells are 8 times smaller
+    self.assertTrue(np.allclose(x1 - x0, 0.5 / 8))
+    # every kept cell crosses the circle
+    self.assertTrue(np.all(values.min(axis=1) <= 0.) and np.all(values.max(axis=1) >= 0.))
+    # far fewer cells than the uniform fine grid
+    self.assertLess(len(x0), 64 * 64 / 4)
+    bp.math.disable_x64()
@@ -15,6 +15,7 @@ from .stability import (CENTER_MANIFOLD, SADDLE_NODE, STABLE_POINT_1D,
                         STABLE_POINT_3D, UNSTABLE_POINT_3D, STABLE_NODE_3D, 
                         UNSTABLE_SADDLE_3D, UNSTABLE_NODE_3D, STABLE_FOCUS_3D, 
                         UNSTABLE_FOCUS_3D, UNSTABLE_CENTER_3D, UNKNOWN_3D)
+from .utils.continuation import LIMIT_POINT, HOPF_POINT, BRANCH_POINT
 
 
 _markersize = 10
@@ -53,6 +54,13 @@ plot_schema.update({
   UNKNOWN_3D: {'color': 'tab:cyan', 'markersize': _markersize, 'linestyle': 'None', 'marker': '.'},
 })
 
+# special points along the equilibrium branches
+plot_schema.update({
+  LIMIT_POINT: {'color': 'k', 'markersize': _markersize, 'linestyle': 'None', 'marker': 's'},
+  HOPF_POINT: {'color': 'k', 'markersize': _markersize, 'linestyle': 'None', 'marker': '*'},
+  BRANCH_POINT: {'color': 'k', 'markersize': _markersize, 'linestyle': 'None', 'marker': 'x'},
+})
+
 
 def set_plot_schema(fixed_point: str, **schema):
   if not isinstance(fixed_point, str):
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import numpy as np
+from scipy.spatial.distance import squareform, pdist
+
+from brainpy._src.analysis import utils
+
+
+def _keep_unique_naive(points, tolerance):
+  distances = squareform(pdist(points))
+  drop = [j for j in range(len(points)) if np.any(distances[:j, j] <= tolerance)]
+  return np.setdiff1d(np.arange(len(points)), drop)
+
+
+class TestEuclideanDistance(unittest.TestCase):
+  def test_distance_matrix(self):
+    points = np.random.RandomState(0).normal(size=(50, 8))
+    expected = squareform(pdist(points))
+    self.assertTrue(np.allclose(utils.euclidean_distance(points), expected, atol=1e-4))
+    self.assertTrue(np.allclose(utils.euclidean_distance_jax(points), expected, atol=1e-4))
+
+  def test_distance_matrix_dict(self):
+    rng = np.random.RandomState(0)
+    points = {'a': rng.normal(size=(30, 3)), 'b': rng.normal(size=(30, 2, 2))}
+    stacked = np.concatenate([points['a'], points['b'].reshape(30, -1)], axis=1)
+    expected = squareform(pdist(stacked))
+    self.assertTrue(np.allclose(utils.euclidean_distance(points, 30), expected, atol=1e-4))
+    with self.assertRaises(ValueError):
+      utils.euclidean_distance_jax(points)
+
+  def test_closest_neighbor_distance(self):
+    points = np.random.RandomState(1).normal(size=(103, 5))
+    distances = squareform(pdist(points))
+    np.fill_diagonal(distances, np.inf)
+    for block_size in [7, 32, 1024]:
+      res = utils.closest_neighbor_distance(points, block_size=block_size)
+      self.assertTrue(np.allclose(res, distances.min(axis=0), atol=1e-4))
+
+  def test_closest_previous_distance(self):
+    points = np.random.RandomState(2).normal(size=(61, 4))
+    distances = squareform(pdist(points))
+    expected = [np.inf] + [distances[:j, j].min() for j in range(1, 61)]
+    res = utils.closest_previous_distance(points, block_size=16)
+    self.assertTrue(np.allclose(res, expected, atol=1e-4))
+
+  def test_keep_unique(self):
+    rng = np.random.RandomState(3)
+    points = rng.normal(size=(20, 3))
+    points = np.concatenate([points, points[:10] + 1e-3, points[5:15]])
+    points = points[rng.permutation(len(points))]
+    fps, keep_ids = utils.keep_unique(points, tolerance=2.5e-2, block_size=16)
+    self.assertTrue(np.array_equal(keep_ids, _keep_unique_naive(points, 2.5e-2)))
+    self.assertEqual(len(keep_ids), 20)
+    self.assertTrue(np.allclose(fps, points[keep_ids]))
+
+  def test_duplicates_in_high_dimensions(self):
+    rng = np.random.RandomState(4)
+    for num_dim in [100, 2000]:
+      points = rng.normal(size=(50, num_dim)).astype(np.float32)
+      points = np.concatenate([points, points])[rng.permutation(100)]
+      fps, keep_ids = utils.keep_unique(points, tolerance=2.5e-2, block_size=32)
+      self.assertEqual(len(keep_ids), 50)
+      self.assertTrue(np.allclose(utils.closest_neighbor_distance(points, block_size=32), 0.))
+      dist = utils.euclidean_distance(points)
+      expected = squareform(pdist(points.astype(np.float64)))
+      self.assertTrue(np.allclose(dist[expected == 0.], 0.))
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+from .continuation import *
 from .function import *
 from .measurement import *
 from .model import *
 from .optimization import *
 from .others import *
 from .outputs import *
+from .quadtree import *
 from .visualization import *
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pseudo-arclength continuation of the equilibrium branches :math:`F(x, p) = 0`,
+where :math:`x \\in R^n` are the variables and :math:`p` is a scalar parameter.
+"""
+
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+__all__ = [
+  'LIMIT_POINT',
+  'HOPF_POINT',
+  'BRANCH_POINT',
+  'newton_equilibria',
+  'continue_branches',
+  'detect_special_points',
+  'branch_switch_tangent',
+]
+
+LIMIT_POINT = 'LP'
+HOPF_POINT = 'H'
+BRANCH_POINT = 'BP'
+
+
+def _jac_u(f, u):
+  # the Jacobian of F with respect to (x, p), with the shape of (n, n + 1)
+  return jax.jacfwd(lambda u_: f(u_[:-1], u_[-1]))(u)
+
+
+def _tangent(f, u, t_prev):
+  # the unit null vector of J_u, oriented along the previous tangent
+  n = u.shape[0] - 1
+  A = jnp.vstack([_jac_u(f, u), t_prev[None]])
+  b = jnp.zeros(n + 1, dtype=u.dtype).at[-1].set(1.)
+  t = jnp.linalg.solve(A, b)
+  return t / jnp.linalg.norm(t)
+
+
+def newton_equilibria(f: Callable, x0, p, tol: float = None, max_iter: int = 20):
+  """Solve :math:`F(x, p) = 0` with Newton's method at the fixed parameter ``p``.
+
+  It can be transformed by ``jit`` and ``vmap``.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  f: callable
+    The function ``f(x, p)`` returning an array with the shape of ``x``.
+  x0: ArrayType
+    The initial guess with the shape of ``(n,)``.
+  p: float
+    The parameter.
+  tol: float
+    The tolerance of the residual norm.
+  max_iter: int
+    The number of Newton iterations.
+
+  Returns
+  -------
+  res: tuple
+    The ``(x, converged)`` pair.
+  """
+  x0 = jnp.asarray(x0)
+  tol = _default_tol(x0.dtype) if tol is None else tol
+  jac = jax.jacfwd(f, argnums=0)
+
+  def body(_, x):
+    dx = jnp.linalg.solve(jac(x, p), f(x, p))
+    return jnp.where(jnp.all(jnp.isfinite(dx)), x - dx, x)
+
+  x = jax.lax.fori_loop(0, max_iter, body, x0)
+  return x, jnp.linalg.norm(f(x, p)) < tol
+
+
+def _default_tol(dtype):
+  return 1e-10 if jnp.finfo(dtype).bits == 64 else 1e-5
+
+
+def _continue_branch(f, u0, t0, *, step, min_step, max_step, num_step,
+                     lower, upper, tol, max_iter):
+  """Trace one branch from ``u0`` along the initial tangent ``t0``."""
+
+  def correct(u_pred, t):
+    # Newton's method on {F(u) = 0, t . (u - u_pred) = 0}
+    def body(_, u):
+      G = jnp.append(f(u[:-1], u[-1]), jnp.dot(t, u - u_pred))
+      J = jnp.vstack([_jac_u(f, u), t[None]])
+      du = jnp.linalg.solve(J, G)
+      return jnp.where(jnp.all(jnp.isfinite(du)), u - du, u)
+
+    u = jax.lax.fori_loop(0, max_iter, body, u_pred)
+    return u, jnp.linalg.norm(f(u[:-1], u[-1])) < tol
+
+  def scan_step(carry, _):
+    u, t, h, done = carry
+    u_new, converged = correct(u + h * t, t)
+    # a step which jumps far away from the prediction is rejected
+    accept = jnp.logical_and(converged, jnp.linalg.norm(u_new - u) < 2. * h)
+    accept = jnp.logical_and(accept, jnp.logical_not(done))
+    t_new = _tangent(f, u_new, t)
+    out_of_range = jnp.logical_or(jnp.any(u_new < lower), jnp.any(u_new > upper))
+    u = jnp.where(accept, u_new, u)
+    t = jnp.where(accept, t_new, t)
+    h = jnp.where(accept, jnp.minimum(h * 1.5, max_step), h * 0.5)
+    done = jnp.logical_or(done, jnp.logical_and(accept, out_of_range))
+    done = jnp.logical_or(done, h < min_step)
+    return (u, t, h, done), (u, t, jnp.logical_and(accept, jnp.logical_not(out_of_range)))
+
+  init = (u0, t0, jnp.asarray(step, dtype=u0.dtype), jnp.asarray(False))
+  _, (us, ts, accepts) = jax.lax.scan(scan_step, init, None, length=num_step)
+  us = jnp.vstack([u0[None], us])
+  ts = jnp.vstack([t0[None], ts])
+  accepts = jnp.append(True, accepts)
+  return us, ts, accepts
+
+
+def continue_branches(
+    f: Callable,
+    xs,
+    ps,
+    tangents=None,
+    *,
+    step: float,
+    num_step: int = 500,
+    min_step: Optional[float] = None,
+    max_step: Optional[float] = None,
+    x_range: Optional[Sequence] = None,
+    p_range: Optional[Sequence] = None,
+    tol: Optional[float] = None,
+    max_iter: int = 5,
+) -> Dict[str, np.ndarray]:
+  """Trace the equilibrium branches of :math:`F(x, p) = 0` by the pseudo-arclength continuation.
+
+  Starting from each equilibrium ``(xs[i], ps[i])``, a branch is traced along both
+  directions. At each step, the point is predicted along the tangent of the branch,
+  and corrected by Newton's method on the hyperplane orthogonal to the tangent, so
+  that the folds of the branch are passed through. The step size is increased after
+  a successful step, and halved after a failed one. All seeds are traced in parallel
+  by ``vmap``, and the whole tracing is compiled by ``jit``.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  f: callable
+    The function ``f(x, p)`` returning an array with the shape of ``x``.
+  xs: ArrayType
+    The equilibria to start with, with the shape of ``(num_seed, n)``.
+  ps: ArrayType
+    The parameters of the equilibria, with the shape of ``(num_seed,)``.
+  tangents: ArrayType, optional
+    The initial tangents with the shape of ``(num_seed, n + 1)``. By default,
+    the tangent is computed at each seed, and it is oriented to the increasing
+    parameter. Branches are traced along ``tangents`` and ``-tangents``.
+  step: float
+    The initial arclength step.
+  num_step: int
+    The number of continuation steps of each direction.
+  min_step: float
+    The minimal step. The tracing stops when the step is smaller than it.
+    Default is ``step / 1000``.
+  max_step: float
+    The maximal step. Default is ``step``.
+  x_range: sequence
+    The ``(min, max)`` of each variable. The tracing stops when the branch leaves it.
+  p_range: sequence
+    The ``(min, max)`` of the parameter. The tracing stops when the branch leaves it.
+  tol: float
+    The tolerance of the residual norm.
+  max_iter: int
+    The number of Newton iterations in each corrector step.
+
+  Returns
+  -------
+  branches: dict
+    The traced branches with the keys of
+
+    - ``x``: the variables with the shape of ``(num_branch, num_step + 1, n)``,
+    - ``p``: the parameters with the shape of ``(num_branch, num_step + 1)``,
+    - ``tangent``: the tangents with the shape of ``(num_branch, num_step + 1, n + 1)``,
+    - ``valid``: the mask of accepted points with the shape of ``(num_branch, num_step + 1)``.
+
+    The branches ``i`` and ``i + num_seed`` start from the same seed along
+    the opposite directions.
+  """
+  xs = jnp.asarray(xs)
+  if xs.ndim != 2:
+    raise ValueError(f'"xs" should be a 2D array with the shape of (num_seed, num_var), but we got {xs.shape}.')
+  ps = jnp.asarray(ps, dtype=xs.dtype).reshape(-1)
+  if ps.shape[0] != xs.shape[0]:
+    raise ValueError(f'The number of parameters {ps.shape[0]} should be equal to the number of seeds {xs.shape[0]}.')
+  num_var = xs.shape[1]
+  min_step = step / 1000 if min_step is None else min_step
+  max_step = step if max_step is None else max_step
+  tol = _default_tol(xs.dtype) if tol is None else tol
+  lower = np.full(num_var + 1, -np.inf)
+  upper = np.full(num_var + 1, np.inf)
+  if x_range is not None:
+    x_range = np.asarray(x_range, dtype=float).reshape(num_var, 2)
+    lower[:-1], upper[:-1] = x_range[:, 0], x_range[:, 1]
+  if p_range is not None:
+    lower[-1], upper[-1] = p_range
+  lower = jnp.asarray(lower, dtype=xs.dtype)
+  upper = jnp.asarray(upper, dtype=xs.dtype)
+
+  us = jnp.concatenate([xs, ps[:, None]], axis=1)
+  if tangents is None:
+    e_p = jnp.zeros(num_var + 1, dtype=xs.dtype).at[-1].set(1.)
+    tangents = jax.vmap(partial(_tangent, f), in_axes=(0, None))(us, e_p)
+  tangents = jnp.asarray(tangents, dtype=xs.dtype)
+  trace = jax.jit(jax.vmap(partial(_continue_branch, f, step=step, min_step=min_step, max_step=max_step,
+                                   num_step=num_step, lower=lower, upper=upper, tol=tol, max_iter=max_iter)))
+  us, ts, valid = trace(jnp.concatenate([us, us]), jnp.concatenate([tangents, -tangents]))
+  us = np.asarray(us)
+  return dict(x=us[..., :-1], p=us[..., -1], tangent=np.asarray(ts), valid=np.asarray(valid))
+
+
+def _hopf_test(J):
+  # prod_{i<j} (l_i + l_j), which is zero when a pair of eigenvalues sums to zero
+  eigs = jnp.linalg.eigvals(J)
+  n = eigs.shape[0]
+  i, j = np.triu_indices(n, k=1)
+  if len(i) == 0:
+    return jnp.ones((), dtype=J.dtype), eigs
+  return jnp.real(jnp.prod(eigs[i] + eigs[j])), eigs
+
+
+@partial(jax.jit, static_argnums=0)
+def _test_functions(f, us, ts):
+  def tests(u, t):
+    J_u = _jac_u(f, u)
+    hopf, eigs = _hopf_test(J_u[:, :-1])
+    bp = jnp.linalg.det(jnp.vstack([J_u, t[None]]))
+    return t[-1], hopf, bp, jnp.max(jnp.abs(jnp.imag(eigs)))
+
+  return jax.vmap(tests)(us, ts)
+
+
+def detect_special_points(
+    f: Callable,
+    x,
+    p,
+    tangent,
+    valid=None,
+) -> List[Dict]:
+  """Detect the limit points, Hopf points and branch points along a traced branch.
+
+  The test functions are evaluated at each point of the branch, and a special point
+  is located by the linear interpolation between two successive points where the
+  test function changes its sign:
+
+  - limit (fold) point ``'LP'``: the parameter component of the tangent,
+  - Hopf point ``'H'``: :math:`\\prod_{i<j}(\\lambda_i + \\lambda_j)` of the eigenvalues
+    of :math:`\\partial F/\\partial x`, when a complex pair crosses the imaginary axis,
+  - branch point ``'BP'``: the determinant of the Jacobian :math:`\\partial F/\\partial (x, p)`
+    augmented by the tangent.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  f: callable
+    The function ``f(x, p)`` returning an array with the shape of ``x``.
+  x: ArrayType
+    The variables of the branch with the shape of ``(num_point, n)``.
+  p: ArrayType
+    The parameters of the branch with the shape of ``(num_point,)``.
+  tangent: ArrayType
+    The tangents of the branch with the shape of ``(num_point, n + 1)``.
+  valid: ArrayType, optional
+    The mask of the accepted points.
+
+  Returns
+  -------
+  points: list of dict
+    The special points, each with the keys of ``type``, ``x``, ``p``, ``tangent``
+    and ``index`` (the position of the point among the valid points).
+  """
+  x, p, tangent = np.asarray(x), np.asarray(p), np.asarray(tangent)
+  us = np.concatenate([x, p[:, None]], axis=1)
+  # the tests are evaluated on all points, so that the branches
+  # with the same length share one compilation
+  lp, hopf, bp, max_imag = tuple(np.asarray(a) for a in _test_functions(f, us, tangent))
+  if valid is not None:
+    valid = np.asarray(valid, dtype=bool)
+    us, tangent = us[valid], tangent[valid]
+    lp, hopf, bp, max_imag = lp[valid], hopf[valid], bp[valid], max_imag[valid]
+  if us.shape[0] < 2:
+    return []
+
+  points = []
+
+  def add(kind, values, ids):
+    for i in ids:
+      s = values[i] / (values[i] - values[i + 1])
+      u = us[i] + s * (us[i + 1] - us[i])
+      t = tangent[i] + s * (tangent[i + 1] - tangent[i])
+      points.append(dict(type=kind, x=u[:-1], p=u[-1], tangent=t / np.linalg.norm(t), index=i))
+
+  add(LIMIT_POINT, lp, np.where(lp[:-1] * lp[1:] < 0)[0])
+  add(BRANCH_POINT, bp, np.where(bp[:-1] * bp[1:] < 0)[0])
+  # the sign changes caused by the branch points and the neutral saddles are excluded
+  bp_ids = set(np.where(bp[:-1] * bp[1:] < 0)[0].tolist())
+  hopf_ids = [i for i in np.where(hopf[:-1] * hopf[1:] < 0)[0]
+              if i not in bp_ids and max(max_imag[i], max_imag[i + 1]) > 0.]
+  add(HOPF_POINT, hopf, hopf_ids)
+  points.sort(key=lambda a: a['index'])
+  return points
+
+
+def branch_switch_tangent(f: Callable, x, p, tangent):
+  """Compute the tangent of the other branch crossing at a branch point.
+
+  At a branch point, the null space of :math:`\\partial F/\\partial (x, p)` is
+  two-dimensional. The tangent of the other branch is the null vector orthogonal
+  to the tangent of the current branch.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  f: callable
+    The function ``f(x, p)`` returning an array with the shape of ``x``.
+  x: ArrayType
+    The variables at the branch point.
+  p: float
+    The parameter at the branch point.
+  tangent: ArrayType
+    The tangent of the current branch.
+
+  Returns
+  -------
+  tangent: np.ndarray
+    The unit tangent of the other branch.
+  """
+  u = jnp.append(jnp.asarray(x), p)
+  _, _, vh = np.linalg.svd(np.asarray(_jac_u(f, u)))
+  null = vh[-2:]  # the two right singular vectors of the smallest singular values
+  tangent = np.asarray(tangent)
+  tangent = tangent / np.linalg.norm(tangent)
+  null = null - np.outer(null @ tangent, tangent)
+  t = null[np.argmax(np.linalg.norm(null, axis=1))]
+  return t / np.linalg.norm(t)
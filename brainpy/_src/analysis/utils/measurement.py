@@ -9,16 +9,18 @@ import numpy as np
 from jax.tree_util import tree_flatten
 
 import brainpy._src.math as bm
-from brainpy.tools import numba_jit
+from brainpy._src.tools.package import _lazy_numba_jit
 
 __all__ = [
   'find_indexes_of_limit_cycle_max',
   'euclidean_distance',
   'euclidean_distance_jax',
+  'closest_neighbor_distance',
+  'closest_previous_distance',
 ]
 
 
-@numba_jit
+@_lazy_numba_jit
 def _f1(arr, grad, tol):
   condition = np.logical_and(grad[:-1] * grad[1:] <= 0, grad[:-1] >= 0)
   indexes = np.where(condition)[0]
@@ -38,7 +40,47 @@ def find_indexes_of_limit_cycle_max(arr, tol=0.001):
   return _f1(arr, grad, tol)
 
 
-@numba_jit
+def _as_matrix(points, num_point=None):
+  """Flatten the points (an array or a dict of arrays) into a matrix with the shape of
+  ``(num_point, num_dim)``."""
+  if isinstance(points, dict):
+    if num_point is None:
+      raise ValueError('Please provide num_point')
+  leaves, _ = tree_flatten(points, is_leaf=lambda a: isinstance(a, bm.Array))
+  leaves = [bm.as_jax(leaf) for leaf in leaves]
+  if num_point is None:
+    num_point = leaves[0].shape[0]
+  leaves = [jnp.reshape(leaf, (num_point, -1)) for leaf in leaves]
+  return leaves[0] if len(leaves) == 1 else jnp.concatenate(leaves, axis=1)
+
+
+# The number of the closest candidates of each point whose distances are recomputed
+# with the exact differences. The GEMM form ``||x||^2 + ||y||^2 - 2 x y^T`` loses the
+# precision of the small distances in high dimensions (e.g., two identical points in
+# 1000 dimensions can be 0.02 apart in float32), which are what the uniqueness and
+# the outlier queries rely on.
+_NUM_REFINED = 8
+
+
+def _sq_distance(x, y):
+  """The squared distance by ``||x||^2 + ||y||^2 - 2 x y^T``."""
+  x_norm = jnp.sum(x * x, axis=1)
+  y_norm = jnp.sum(y * y, axis=1)
+  dist = x_norm[:, None] + y_norm[None, :] - 2. * (x @ y.T)
+  return jnp.maximum(dist, 0.)
+
+
+def _exact_sq_distance(x, y, ids):
+  """The squared distance between each row of ``x`` and the rows ``y[ids]`` computed
+  with the exact differences, where ``ids`` has the shape of ``(x.shape[0], k)``."""
+
+  def f(_, i):
+    diff = x - y[i]
+    return None, jnp.sum(diff * diff, axis=1)
+
+  return jax.lax.scan(f, None, ids.T)[1].T
+
+
 def euclidean_distance(points: np.ndarray, num_point=None):
   """Get the distance matrix.
 
@@ -49,41 +91,32 @@ def euclidean_distance(points: np.ndarray, num_point=None):
 
   Parameters
   ----------
-  points: ArrayType
+  points: ArrayType, dict
     The points.
+  num_point: int
+    The number of points. It must be provided when ``points`` is a dict.
 
   Returns
   -------
-  dist_matrix: jnp.ndarray
+  dist_matrix: np.ndarray
     The distance matrix.
   """
-
-  if isinstance(points, dict):
-    if num_point is None:
-      raise ValueError('Please provide num_point')
-    indices = np.triu_indices(num_point)
-    dist_mat = np.zeros((num_point, num_point))
-    for idx in range(len(indices[0])):
-      i = indices[0][idx]
-      j = indices[1][idx]
-      dist_mat[i, j] = np.sqrt(np.sum([np.sum((value[i] - value[j]) ** 2) for value in points.values()]))
-  else:
-    num_point = points.shape[0]
-    indices = np.triu_indices(num_point)
-    dist_mat = np.zeros((num_point, num_point))
-    for idx in range(len(indices[0])):
-      i = indices[0][idx]
-      j = indices[1][idx]
-      dist_mat[i, j] = np.linalg.norm(points[i] - points[j])
-  dist_mat = np.maximum(dist_mat, dist_mat.T)
-  return dist_mat
+  return np.asarray(euclidean_distance_jax(points, num_point))
 
 
 @jax.jit
-@partial(jax.vmap, in_axes=[0, 0, None])
-def _ed(i, j, leaves):
-  squares = jnp.asarray([((leaf[i] - leaf[j]) ** 2).sum() for leaf in leaves])
-  return jnp.sqrt(jnp.sum(squares))
+def _ed(x):
+  x = x - jnp.mean(x, axis=0)
+  num_point = x.shape[0]
+  dist = _sq_distance(x, x)
+  dist = jnp.maximum(dist, dist.T)
+  # the closest distances of each point are recomputed exactly
+  _, ids = jax.lax.top_k(-dist, min(_NUM_REFINED, num_point))
+  exact = jnp.full_like(dist, jnp.inf)
+  exact = exact.at[jnp.arange(num_point)[:, None], ids].set(_exact_sq_distance(x, x, ids))
+  exact = jnp.minimum(exact, exact.T)
+  dist = jnp.sqrt(jnp.where(jnp.isinf(exact), dist, exact))
+  return jnp.fill_diagonal(dist, 0., inplace=False)
 
 
 def euclidean_distance_jax(points: Union[jnp.ndarray, bm.ndarray], num_point=None):
@@ -96,24 +129,106 @@ def euclidean_distance_jax(points: Union[jnp.ndarray, bm.ndarray], num_point=Non
 
   Parameters
   ----------
-  points: ArrayType
+  points: ArrayType, dict
     The points.
   num_point: int
+    The number of points. It must be provided when ``points`` is a dict.
 
   Returns
   -------
   dist_matrix: ArrayType
     The distance matrix.
   """
-  if isinstance(points, dict):
-    if num_point is None:
-      raise ValueError('Please provide num_point')
-  else:
-    num_point = points.shape[0]
-  indices = jnp.triu_indices(num_point)
-  dist_mat = bm.zeros((num_point, num_point))
-  leaves, _ = tree_flatten(points)
-  dist_mat[indices] = _ed(*indices, leaves)
-  dist_mat = jnp.maximum(dist_mat.value, dist_mat.value.T)
-  return dist_mat
+  return _ed(_as_matrix(points, num_point))
+
+
+@partial(jax.jit, static_argnames=('block_size', 'lower'))
+def _block_min_distance(x, start, num_point, block_size, lower=False):
+  rows = jax.lax.dynamic_slice_in_dim(x, start, block_size)
+  row_ids = start + jnp.arange(block_size)
+  num_refined = min(_NUM_REFINED, block_size)
+
+  def body(i, carry):
+    col_start = i * block_size
+    cols = jax.lax.dynamic_slice_in_dim(x, col_start, block_size)
+    col_ids = col_start + jnp.arange(block_size)
+    dist = _sq_distance(rows, cols)
+    if lower:
+      invalid = col_ids[None, :] >= row_ids[:, None]
+    else:
+      invalid = col_ids[None, :] == row_ids[:, None]
+    invalid = jnp.logical_or(invalid, col_ids[None, :] >= num_point)
+    dist = jnp.where(invalid, jnp.inf, dist)
+    # keep the closest candidates of each row
+    dist = jnp.concatenate([carry[0], dist], axis=1)
+    ids = jnp.concatenate([carry[1], jnp.broadcast_to(col_ids, (block_size, block_size))], axis=1)
+    neg_dist, pos = jax.lax.top_k(-dist, num_refined)
+    return -neg_dist, jnp.take_along_axis(ids, pos, axis=1)
+
+  # only the column blocks before (and including) the row block are needed for "lower"
+  num_block = start // block_size + 1 if lower else x.shape[0] // block_size
+  init = (jnp.full((block_size, num_refined), jnp.inf, dtype=x.dtype),
+          jnp.zeros((block_size, num_refined), dtype=row_ids.dtype))
+  dist, ids = jax.lax.fori_loop(0, num_block, body, init)
+  # the distances of the closest candidates are recomputed exactly
+  dist = jnp.where(jnp.isinf(dist), jnp.inf, _exact_sq_distance(rows, x, ids))
+  return jnp.sqrt(jnp.min(dist, axis=1))
+
+
+def _min_distance(points, num_point=None, block_size=1024, lower=False):
+  x = _as_matrix(points, num_point)
+  num_point = x.shape[0]
+  block_size = min(block_size, num_point)
+  x = x - jnp.mean(x, axis=0)
+  num_pad = (-num_point) % block_size
+  if num_pad > 0:
+    x = jnp.concatenate([x, jnp.zeros((num_pad, x.shape[1]), dtype=x.dtype)], axis=0)
+  res = [_block_min_distance(x, i, num_point, block_size=block_size, lower=lower)
+         for i in range(0, num_point, block_size)]
+  return np.asarray(jnp.concatenate(res)[:num_point])
+
+
+def closest_neighbor_distance(points, num_point=None, block_size: int = 1024):
+  """Get the distance of each point to its closest neighbor.
+
+  The pairwise distances are computed block by block, so that the full
+  distance matrix with the shape of ``(num_point, num_point)`` is never built.
 
+  Parameters
+  ----------
+  points: ArrayType, dict
+    The points.
+  num_point: int
+    The number of points. It must be provided when ``points`` is a dict.
+  block_size: int
+    The number of points in each computing block.
+
+  Returns
+  -------
+  distance: np.ndarray
+    The closest neighbor distance with the shape of ``(num_point,)``.
+  """
+  return _min_distance(points, num_point, block_size, lower=False)
+
+
+def closest_previous_distance(points, num_point=None, block_size: int = 1024):
+  """Get the distance of each point to its closest point among all points before it.
+
+  The first point has the distance of ``inf``. Same as
+  :py:func:`~.closest_neighbor_distance`, the full distance matrix is never built.
+
+  Parameters
+  ----------
+  points: ArrayType, dict
+    The points.
+  num_point: int
+    The number of points. It must be provided when ``points`` is a dict.
+  block_size: int
+    The number of points in each computing block.
+
+  Returns
+  -------
+  distance: np.ndarray
+    The closest distance with the shape of ``(num_point,)``.
+  """
+  return _min_distance(points, num_point, block_size, lower=True)
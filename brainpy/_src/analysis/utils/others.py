@@ -9,7 +9,7 @@ from jax.tree_util import tree_map
 
 import brainpy.math as bm
 from .function import f_without_jaxarray_return
-from .measurement import euclidean_distance_jax
+from .measurement import closest_previous_distance
 
 __all__ = [
   'Segment',
@@ -89,7 +89,8 @@ def get_sign2(f, *xyz, args=()):
 
 
 def keep_unique(candidates: Union[np.ndarray, Dict[str, np.ndarray]],
-                tolerance: float=2.5e-2):
+                tolerance: float = 2.5e-2,
+                block_size: int = 1024):
   """Filter unique fixed points by choosing a representative within tolerance.
 
   Parameters
@@ -98,6 +99,8 @@ def keep_unique(candidates: Union[np.ndarray, Dict[str, np.ndarray]],
     The fixed points with the shape of (num_point, num_dim).
   tolerance: float
     tolerance.
+  block_size: int
+    The number of points in each block when computing pairwise distances.
 
   Returns
   -------
@@ -120,14 +123,8 @@ def keep_unique(candidates: Union[np.ndarray, Dict[str, np.ndarray]],
 
   # If point A and point B are within identical_tol of each other, and the
   # A is first in the list, we keep A.
-  distances = np.asarray(euclidean_distance_jax(candidates, num_fps))
-  example_idxs = np.arange(num_fps)
-  all_drop_idxs = []
-  for fidx in range(num_fps - 1):
-    distances_f = distances[fidx, fidx + 1:]
-    drop_idxs = example_idxs[fidx + 1:][distances_f <= tolerance]
-    all_drop_idxs += list(drop_idxs)
-  keep_ids = np.setdiff1d(example_idxs, np.unique(all_drop_idxs))
+  distances = closest_previous_distance(candidates, num_fps, block_size=block_size)
+  keep_ids = np.where(distances > tolerance)[0]
   if keep_ids.shape[0] > 0:
     unique_fps = tree_map(lambda a: a[keep_ids], candidates)
   else:
@@ -135,7 +132,7 @@ def keep_unique(candidates: Union[np.ndarray, Dict[str, np.ndarray]],
   return unique_fps, keep_ids
 
 
-def keep_unique_jax(candidates, tolerance=2.5e-2):
+def keep_unique_jax(candidates, tolerance=2.5e-2, block_size=1024):
   """Filter unique fixed points by choosing a representative within tolerance.
 
   Parameters
@@ -156,15 +153,8 @@ def keep_unique_jax(candidates, tolerance=2.5e-2):
 
   # If point A and point B are within identical_tol of each other, and the
   # A is first in the list, we keep A.
-  nfps = candidates.shape[0]
-  distances = euclidean_distance_jax(candidates)
-  example_idxs = np.arange(nfps)
-  all_drop_idxs = []
-  for fidx in range(nfps - 1):
-    distances_f = distances[fidx, fidx + 1:]
-    drop_idxs = example_idxs[fidx + 1:][distances_f <= tolerance]
-    all_drop_idxs += list(drop_idxs)
-  keep_ids = np.setdiff1d(example_idxs, np.unique(np.asarray(all_drop_idxs)))
+  distances = closest_previous_distance(candidates, block_size=block_size)
+  keep_ids = np.where(distances > tolerance)[0]
   if keep_ids.shape[0] > 0:
     unique_fps = candidates[keep_ids, :]
   else:
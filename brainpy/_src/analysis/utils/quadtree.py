@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+Quadtree-style refinement of the cells in the 2D phase plane.
+"""
+
+from typing import Callable, Sequence, Union
+
+import numpy as np
+
+import brainpy._src.math as bm
+
+__all__ = [
+  'quadtree_cells',
+  'cell_edge_candidates',
+]
+
+
+def _padded_call(vmap_f, *args):
+  # pad the batch to the next power of two, so that the jitted
+  # function is compiled only once for a range of batch sizes
+  num = args[0].shape[0]
+  size = max(int(2 ** np.ceil(np.log2(max(num, 1)))), 8)
+  args = tuple(np.concatenate([a, np.full(size - num, a[0] if num else 0., dtype=a.dtype)]) for a in args)
+  return np.asarray(vmap_f(*args))[:num]
+
+
+def _corner_values(vmap_f, x0, x1, y0, y1, pars):
+  n = x0.shape[0]
+  xs = np.concatenate([x0, x1, x0, x1])
+  ys = np.concatenate([y0, y0, y1, y1])
+  ps = tuple(np.tile(p, 4) for p in pars)
+  # with the shape of (num_cell, 4), for the corners (x0, y0), (x1, y0), (x0, y1), (x1, y1)
+  return _padded_call(vmap_f, xs, ys, *ps).reshape(4, n).T
+
+
+def quadtree_cells(
+    vmap_fs: Union[Callable, Sequence[Callable]],
+    xs,
+    ys,
+    *pars,
+    num_level: int = 3,
+    tol: float = 0.,
+):
+  """Refine the cells of the 2D phase plane where the functions may have roots.
+
+  The phase plane starts with the coarse cells of the grid ``xs`` x ``ys``. At each
+  level, a cell is kept only if every function changes its sign over the corners of
+  the cell (or the absolute value at one corner is below ``tol``), and each kept
+  cell is split into four children. All cells of one level are evaluated by one
+  call of the vectorized functions. Therefore, the number of evaluations grows
+  with the length of the curves, rather than with the area of the phase plane.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  vmap_fs: callable, sequence of callable
+    The vectorized function(s) ``f(x, y, *pars)``.
+  xs: ArrayType
+    The coarse grid of the first variable.
+  ys: ArrayType
+    The coarse grid of the second variable.
+  *pars: ArrayType
+    The grids of the parameters. Each cell is analyzed at each combination
+    of the parameters.
+  num_level: int
+    The number of refinement levels. The finest cells are ``2 ** num_level``
+    times smaller than the coarse cells along each axis.
+  tol: float
+    The cell whose absolute function value at one corner is smaller
+    than ``tol`` is also refined.
+
+  Returns
+  -------
+  res: tuple
+    The ``(cells, values)`` of the finest level. ``cells`` is a tuple of
+    ``(x0, x1, y0, y1, *pars)``, each with the shape of ``(num_cell,)``.
+    ``values`` is a list of the function values at the cell corners with the
+    shape of ``(num_cell, 4)``, where the corners are ordered as
+    ``(x0, y0)``, ``(x1, y0)``, ``(x0, y1)``, ``(x1, y1)``.
+  """
+  if callable(vmap_fs):
+    vmap_fs = (vmap_fs,)
+  if num_level < 0:
+    raise ValueError(f'"num_level" must be a non-negative integer, but we got {num_level}.')
+  xs = np.asarray(bm.as_numpy(xs))
+  ys = np.asarray(bm.as_numpy(ys))
+  pars = tuple(np.asarray(bm.as_numpy(p)).flatten() for p in pars)
+
+  # the coarse cells
+  mesh = np.meshgrid(np.arange(len(xs) - 1), np.arange(len(ys) - 1),
+                     *tuple(np.arange(len(p)) for p in pars), indexing='ij')
+  mesh = tuple(m.flatten() for m in mesh)
+  x0, x1 = xs[mesh[0]], xs[mesh[0] + 1]
+  y0, y1 = ys[mesh[1]], ys[mesh[1] + 1]
+  pars = tuple(p[ids] for p, ids in zip(pars, mesh[2:]))
+
+  for level in range(num_level + 1):
+    values = [_corner_values(f, x0, x1, y0, y1, pars) for f in vmap_fs]
+    keep = np.ones(x0.shape[0], dtype=bool)
+    for vals in values:
+      signs = np.sign(vals)
+      change = np.logical_or(np.any(signs != signs[:, :1], axis=1), np.any(signs == 0, axis=1))
+      if tol > 0.:
+        change = np.logical_or(change, np.min(np.abs(vals), axis=1) < tol)
+      keep = np.logical_and(keep, change)
+    x0, x1, y0, y1 = x0[keep], x1[keep], y0[keep], y1[keep]
+    pars = tuple(p[keep] for p in pars)
+    values = [vals[keep] for vals in values]
+    if level == num_level:
+      break
+
+    # split each cell into four children
+    xm = (x0 + x1) / 2
+    ym = (y0 + y1) / 2
+    x0, x1 = np.concatenate([x0, xm, x0, xm]), np.concatenate([xm, x1, xm, x1])
+    y0, y1 = np.concatenate([y0, y0, ym, ym]), np.concatenate([ym, ym, y1, y1])
+    pars = tuple(np.tile(p, 4) for p in pars)
+
+  return (x0, x1, y0, y1) + pars, values
+
+
+def cell_edge_candidates(cells, values):
+  """Get the cell edges on which the function changes its sign.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  cells: tuple
+    The cells ``(x0, x1, y0, y1, *pars)`` returned by :py:func:`quadtree_cells`.
+  values: ArrayType
+    The function values at the cell corners with the shape of ``(num_cell, 4)``.
+
+  Returns
+  -------
+  res: tuple
+    The ``(x_starts, x_ends, (ys, *pars))`` of the horizontal edges, and
+    the ``(y_starts, y_ends, (xs, *pars))`` of the vertical edges, which
+    can be used for the root finding along ``x`` and ``y``, respectively.
+  """
+  x0, x1, y0, y1 = cells[:4]
+  pars = cells[4:]
+  values = np.asarray(values)
+  # horizontal edges: bottom (corners 0, 1) and top (corners 2, 3)
+  bottom = values[:, 0] * values[:, 1] <= 0
+  top = values[:, 2] * values[:, 3] <= 0
+  h_starts = np.concatenate([x0[bottom], x0[top]])
+  h_ends = np.concatenate([x1[bottom], x1[top]])
+  h_args = (np.concatenate([y0[bottom], y1[top]]),) + tuple(np.concatenate([p[bottom], p[top]]) for p in pars)
+  # vertical edges: left (corners 0, 2) and right (corners 1, 3)
+  left = values[:, 0] * values[:, 2] <= 0
+  right = values[:, 1] * values[:, 3] <= 0
+  v_starts = np.concatenate([y0[left], y0[right]])
+  v_ends = np.concatenate([y1[left], y1[right]])
+  v_args = (np.concatenate([x0[left], x1[right]]),) + tuple(np.concatenate([p[left], p[right]]) for p in pars)
+  return (h_starts, h_ends, h_args), (v_starts, v_ends, v_args)
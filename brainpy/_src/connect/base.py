@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import abc
+import time
 from typing import Union, List, Tuple
 
 import jax.numpy as jnp
 import numpy as onp
 
 from brainpy import tools, math as bm
+from brainpy._src.math import telemetry
 from brainpy.errors import ConnectorError
 
 import textwrap
@@ -27,7 +29,7 @@ __all__ = [
 
   # methods
   'mat2coo', 'mat2csc', 'mat2csr',
-  'csr2csc', 'csr2mat', 'csr2coo',
+  'csr2csc', 'csr2mat', 'csr2coo', 'csr2ell',
   'coo2csr', 'coo2csc', 'coo2mat',
   'coo2mat_num', 'mat2mat_num',
 
@@ -47,13 +49,14 @@ POST_SLICE = 'post_slice'
 COO = 'coo'
 CSR = 'csr'
 CSC = 'csc'
+ELL = 'ell'
 
 SUPPORTED_SYN_STRUCTURE = [CONN_MAT,
                            PRE_IDS, POST_IDS,
                            PRE2POST, POST2PRE,
                            PRE2SYN, POST2SYN,
                            PRE_SLICE, POST_SLICE,
-                           COO, CSR, CSC]
+                           COO, CSR, CSC, ELL]
 
 MAT_DTYPE = jnp.bool_
 IDX_DTYPE = jnp.int32
@@ -269,6 +272,9 @@ class TwoEndConnector(Connector):
       all_data[CSR] = (bm.as_jax(indices, dtype=get_idx_type()),
                        bm.as_jax(indptr, dtype=get_idx_type()))
 
+    if (ELL in structures) and (ELL not in all_data):
+      all_data[ELL] = bm.as_jax(csr2ell((indices, indptr), self.post_num), dtype=get_idx_type())
+
     if (POST2PRE in structures) and (POST2PRE not in all_data):
       indc, indptrc = csr2csc((indices, indptr), self.post_num)
       all_data[POST2PRE] = (bm.as_jax(indc, dtype=get_idx_type()),
@@ -391,7 +397,16 @@ class TwoEndConnector(Connector):
     >>> mat.shape
     (10, 20)
     """
-
+    if not telemetry.is_enabled():
+      return self._require(*structures)
+    name = self.__class__.__name__
+    t0 = time.time()
+    with telemetry.scope('connector', name, track_cache=False):
+      res = self._require(*structures)
+    telemetry.add_event('connector', name, 'build', time.time() - t0)
+    return res
+
+  def _require(self, *structures):
     if len(structures) > 0:
       pre_size = None
       post_size = None
@@ -424,6 +439,8 @@ class TwoEndConnector(Connector):
         elif CSR in structures and _has_csr_imp:
           r = self.build_csr()
           return bm.as_jax(r[0], dtype=get_idx_type()), bm.as_jax(r[1], dtype=get_idx_type())
+        elif ELL in structures and _has_csr_imp:
+          return bm.as_jax(csr2ell(self.build_csr(), self.post_num), dtype=get_idx_type())
         elif CONN_MAT in structures and _has_mat_imp:
           return bm.as_jax(self.build_mat(), dtype=MAT_DTYPE)
         elif PRE_IDS in structures and _has_coo_imp:
@@ -654,6 +671,39 @@ def csr2coo(csr):
   return pre_ids, indices
 
 
+def csr2ell(csr, post_num):
+  """Convert csr to the ELL format.
+
+  The ELL format is a 2D array with the shape of ``(num_pre, max_num_post)``,
+  in which each row contains the post-synaptic ids of a pre-synaptic neuron.
+  Rows with less connections are padded with ``post_num``. For connections
+  with the same number of post-synaptic neurons per row (like
+  :py:class:`~.FixedPostNum`), it is a reshape of ``indices``.
+
+  Parameters
+  ----------
+  csr: tuple
+    The ``(indices, indptr)`` of the CSR structure.
+  post_num: int
+    The number of the post-synaptic neurons.
+
+  Returns
+  -------
+  indices: Array
+    The post-synaptic ids with the shape of ``(num_pre, max_num_post)``.
+  """
+  indices, indptr = onp.asarray(csr[0]), onp.asarray(csr[1])
+  num_pre = indptr.size - 1
+  num_per_row = onp.diff(indptr)
+  num_col = int(num_per_row.max()) if num_pre > 0 else 0
+  if onp.all(num_per_row == num_col):
+    return indices.reshape(num_pre, num_col)
+  ell = onp.full((num_pre, num_col), post_num, dtype=indices.dtype)
+  pre_ids = onp.repeat(onp.arange(num_pre), num_per_row)
+  ell[pre_ids, onp.arange(indices.size) - indptr[pre_ids]] = indices
+  return ell
+
+
 def coo2mat(ij, num_pre, num_post):
   """convert (indices, indptr) to a dense matrix."""
   pre_ids, post_ids = ij
@@ -8,7 +8,8 @@ import numpy as np
 
 import brainpy.math as bm
 from brainpy.errors import ConnectorError
-from brainpy.tools import numba_seed, numba_jit, numba_range, format_seed
+from brainpy._src.tools.package import _lazy_numba_jit
+from brainpy.tools import numba_seed, numba_jit, format_seed
 from brainpy._src.tools.package import SUPPORT_NUMBA
 from .base import *
 
@@ -96,6 +97,8 @@ class FixedProb(TwoEndConnector):
       else:
         rng = self._nprand
 
+      from brainpy.tools import numba_range
+
       @numba_jit  # (parallel=True, nogil=True)
       def single_conn():
         posts = np.zeros((pre_num_to_select, post_num_to_select), dtype=IDX_DTYPE)
@@ -251,6 +254,8 @@ class FixedPreNum(FixedNum):
       else:
         rng = self.rng
 
+      from brainpy.tools import numba_range
+
       @numba_jit  # (parallel=True, nogil=True)
       def single_conn():
         posts = np.zeros((post_num_total, pre_num_to_select), dtype=IDX_DTYPE)
@@ -312,6 +317,8 @@ class FixedPostNum(FixedNum):
       else:
         rng = self.rng
 
+      from brainpy.tools import numba_range
+
       @numba_jit  # (parallel=True, nogil=True)
       def single_conn():
         posts = np.zeros((pre_num_to_select, post_num_to_select), dtype=IDX_DTYPE)
@@ -1058,7 +1065,7 @@ class PowerLaw(TwoEndConnector):
     return conn
 
 
-@numba_jit
+@_lazy_numba_jit
 def pos2ind(pos, size):
   idx = 0
   for i, p in enumerate(pos):
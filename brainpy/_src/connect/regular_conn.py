@@ -137,6 +137,25 @@ class GridConn(OneEndConnector):
   def _select_dist(self, dist: jnp.ndarray) -> jnp.ndarray:
     raise NotImplementedError
 
+  def build_stencil(self) -> np.ndarray:
+    """Build the lattice offsets of the post-synaptic neurons.
+
+    Each pre-synaptic neuron at the position ``p`` connects to the post-synaptic
+    neurons at ``p + offset`` (modulo the lattice size when ``periodic_boundary=True``).
+
+    .. versionadded:: 2.6.1
+
+    Returns
+    -------
+    offsets: np.ndarray
+      The integer offsets with the shape of ``(num_offset, num_dim)``.
+    """
+    if self.pre_num != self.post_num:
+      raise ConnectorError(f'{self.__class__.__name__} is used to for connection within '
+                           f'a same population. But we detect pre_num != post_num '
+                           f'({self.pre_num} != {self.post_num}).')
+    return np.asarray(self._get_strides(len(self.post_size)))
+
   def build_mat(self):
     sizes, _, indices = self._format()
 
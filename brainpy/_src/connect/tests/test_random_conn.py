@@ -27,6 +27,19 @@ class TestFixedProb(unittest.TestCase):
         mat = conn2.require(10, 20, bp.connect.CONN_MAT)
         self.assertTrue(mat.shape == (10, 20))
 
+    def test_require_ell(self):
+        conn = bp.connect.FixedProb(prob=0.1, seed=123)(pre_size=100, post_size=50)
+        mat, ell = conn.require(bp.connect.CONN_MAT, bp.connect.ELL)
+        self.assertTrue(ell.shape[0] == 100)
+        self.assertTrue(ell.shape[1] == mat.sum(1).max())
+        for i in range(100):
+            post_ids = ell[i][ell[i] < 50]
+            self.assertTrue(bp.math.array_equal(bp.math.sort(post_ids), bp.math.where(mat[i])[0]))
+
+        ell = bp.connect.FixedPostNum(10, seed=123)(pre_size=100, post_size=50).require('ell')
+        self.assertTrue(ell.shape == (100, 10))
+        self.assertTrue(bp.math.all(ell < 50))
+
 
 def test_random_fix_pre1():
     for num in [0.4, 20]:
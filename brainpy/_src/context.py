@@ -4,6 +4,8 @@ Context for brainpy computation.
 This context defines all shared data used in all modules in a computation.
 """
 
+import contextlib
+import contextvars
 from typing import Any, Union
 
 from brainpy._src.math.environment import get_dt
@@ -21,8 +23,55 @@ class _ShareContext:
     # Shared data across all nodes at current time step.
     # -------------
 
-    self._arguments = DotDict()
-    self._category = dict()
+    self._global_arguments = DotDict()
+    self._global_category = dict()
+
+    # The shared data of the current scope (see ``context()``). It is
+    # local to each thread and each asyncio task. When it is not set,
+    # the process-global data are used.
+    self._scope = contextvars.ContextVar('brainpy_share', default=None)
+
+  @property
+  def _arguments(self) -> DotDict:
+    scope = self._scope.get()
+    return self._global_arguments if scope is None else scope[0]
+
+  @property
+  def _category(self) -> dict:
+    scope = self._scope.get()
+    return self._global_category if scope is None else scope[1]
+
+  @contextlib.contextmanager
+  def context(self, **kwargs):
+    """Open a scope of shared data.
+
+    Inside the scope, ``save()``, ``load()`` and ``clear()`` operate on a copy
+    of the shared data of the enclosing scope, updated by ``kwargs``. The
+    copy is discarded when exiting the scope. Since the scope is stored in a
+    :py:class:`contextvars.ContextVar`, the scopes opened in different threads
+    or asyncio tasks are isolated from each other, so that multiple models can
+    be traced and run concurrently. ``DSRunner.predict()`` and the ``fit()``
+    of the trainers run in their own scopes.
+
+    >>> import brainpy as bp
+    >>> with bp.share.context(fit=False):
+    ...   bp.share.save(t=1.)
+    ...   bp.share.load('t')
+    1.0
+
+    .. versionadded:: 2.6.1
+
+    Args:
+      kwargs: The shared data to save in the new scope.
+    """
+    arguments = self._arguments.copy()
+    arguments.update(kwargs)
+    category = {k: dict(v) for k, v in self._category.items()}
+    token = self._scope.set((arguments, category))
+    try:
+      yield self
+    finally:
+      self._scope.reset(token)
 
   @property
   def dt(self):
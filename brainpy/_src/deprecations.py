@@ -77,7 +77,7 @@ def deprecation_getattr(module, deprecations, redirects=None, redirect_module=No
   return get_attr
 
 
-def deprecation_getattr2(module, deprecations):
+def deprecation_getattr2(module, deprecations, default=None):
   def get_attr(name):
     if name in deprecations:
       old_name, new_name, fn = deprecations[name]
@@ -88,6 +88,8 @@ def deprecation_getattr2(module, deprecations):
         raise AttributeError(message)
       _deprecate(message)
       return fn
+    if default is not None:
+      return default(name)
     raise AttributeError(f"module {module!r} has no attribute {name!r}")
 
   return get_attr
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Taichi kernels and operators of the event-driven convolution in ``brainpy._src.dnn.conv``.
+"""
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+from jax.interpreters import ad
+
+from brainpy._src.dependency_check import import_taichi
+from brainpy._src.dnn.conv import _dense_event_conv
+from brainpy._src.math.op_register import XLACustomOp
+from brainpy._src.math.op_register.utils import _general_batching_rule
+
+ti = import_taichi()
+
+
+@ti.kernel
+def _event_conv(
+    events: ti.types.ndarray(ndim=3),  # (batch, num_in_site, in_channel)
+    weight: ti.types.ndarray(ndim=3),  # (num_kernel_site, in_channel // groups, out_channel)
+    geometry: ti.types.ndarray(ndim=2),  # (6, 3): in/out/kernel shape, stride, low padding, dilation
+    out: ti.types.ndarray(ndim=3)  # (batch, num_out_site, out_channel)
+):
+  num_batch, num_in, num_cin = events.shape
+  num_kernel, num_cin_group, num_cout = weight.shape
+  num_cout_group = num_cout // (num_cin // num_cin_group)
+  for b, j in ti.ndrange(out.shape[0], out.shape[1]):
+    for c in range(num_cout):
+      out[b, j, c] = 0.
+
+  # Each nonzero input site adds its kernel footprint to the outputs. The loop
+  # is parallelized on both CPU and GPU, since the "+=" is an atomic operation.
+  for b, i in ti.ndrange(num_batch, num_in):
+    i2 = i % geometry[0, 2]
+    i1 = (i // geometry[0, 2]) % geometry[0, 1]
+    i0 = i // (geometry[0, 2] * geometry[0, 1])
+    for c in range(num_cin):
+      e = events[b, i, c]
+      if e != 0.:
+        c_in = c % num_cin_group
+        c_start = (c // num_cin_group) * num_cout_group
+        for k in range(num_kernel):
+          k2 = k % geometry[2, 2]
+          k1 = (k // geometry[2, 2]) % geometry[2, 1]
+          k0 = k // (geometry[2, 2] * geometry[2, 1])
+          # the output site "o" receives the input site "i" when
+          # "o * stride - padding + k * dilation == i"
+          p0 = i0 + geometry[4, 0] - k0 * geometry[5, 0]
+          p1 = i1 + geometry[4, 1] - k1 * geometry[5, 1]
+          p2 = i2 + geometry[4, 2] - k2 * geometry[5, 2]
+          if p0 >= 0 and p1 >= 0 and p2 >= 0:
+            if p0 % geometry[3, 0] == 0 and p1 % geometry[3, 1] == 0 and p2 % geometry[3, 2] == 0:
+              o0 = p0 // geometry[3, 0]
+              o1 = p1 // geometry[3, 1]
+              o2 = p2 // geometry[3, 2]
+              if o0 < geometry[1, 0] and o1 < geometry[1, 1] and o2 < geometry[1, 2]:
+                j = (o0 * geometry[1, 1] + o1) * geometry[1, 2] + o2
+                for co in range(c_start, c_start + num_cout_group):
+                  out[b, j, co] += e * weight[k, c_in, co]
+
+
+def _event_conv_jvp_events(evt_dot, events, weight, geometry, **kwargs):
+  return [_dense_event_conv(evt_dot, weight, **kwargs)]
+
+
+def _event_conv_jvp_weight(w_dot, events, weight, geometry, **kwargs):
+  return event_conv_p(events, w_dot, geometry, **kwargs)
+
+
+def _event_conv_transpose(ct, events, weight, geometry, **kwargs):
+  if ad.is_undefined_primal(geometry):
+    raise ValueError("Cannot transpose with respect to the convolution geometry.")
+  ct = ct[0]
+  if ad.is_undefined_primal(events):
+    if type(ct) is ad.Zero:
+      return ad.Zero(events.aval), None, None
+    f = partial(_dense_event_conv, weight=weight, **kwargs)
+    ct_events, = jax.linear_transpose(f, jax.ShapeDtypeStruct(events.aval.shape, events.aval.dtype))(ct)
+    return ct_events, None, None
+  else:
+    if type(ct) is ad.Zero:
+      return None, ad.Zero(weight.aval), None
+    f = partial(_dense_event_conv, events, **kwargs)
+    ct_weight, = jax.linear_transpose(f, jax.ShapeDtypeStruct(weight.aval.shape, weight.aval.dtype))(ct)
+    return None, ct_weight, None
+
+
+def _event_conv_batching(args, axes, **kwargs):
+  events, weight, geometry = args
+  if axes[1] is not None or axes[2] is not None:
+    return _general_batching_rule(event_conv_p.primitive, args, axes, **kwargs)
+
+  # the batched inputs are merged into the batch dimension
+  events = jnp.moveaxis(events, axes[0], 0)
+  num_vmap, num_batch = events.shape[:2]
+  out_shape = kwargs['outs'][0].shape
+  kwargs['outs'] = [jax.ShapeDtypeStruct((num_vmap * num_batch,) + out_shape[1:], kwargs['outs'][0].dtype)]
+  out = event_conv_p(events.reshape((num_vmap * num_batch,) + events.shape[2:]), weight, geometry, **kwargs)[0]
+  return [out.reshape((num_vmap, num_batch) + out_shape[1:])], [0]
+
+
+event_conv_p = XLACustomOp(cpu_kernel=_event_conv, gpu_kernel=_event_conv)
+event_conv_p.defjvp(_event_conv_jvp_events, _event_conv_jvp_weight, None)
+event_conv_p.def_transpose_rule(_event_conv_transpose)
+event_conv_p.def_batching_rule(_event_conv_batching)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""
+Taichi kernels and operators of the weight updates in ``brainpy._src.dnn.linear``.
+"""
+
+from brainpy import math as bm
+from brainpy._src.dependency_check import import_taichi
+
+ti = import_taichi()
+
+
+# @numba.njit(nogil=True, fastmath=True, parallel=False)
+# def _cpu_dense_on_post(weight, spike, trace, w_min, w_max, out_w):
+#   out_w[:] = weight
+#   for i in numba.prange(spike.shape[0]):
+#     if spike[i]:
+#       out_w[:, i] = np.clip(out_w[:, i] + trace, w_min, w_max)
+
+@ti.kernel
+def _dense_on_post(
+    old_w: ti.types.ndarray(ndim=2),
+    post_spike: ti.types.ndarray(ndim=1),
+    pre_trace: ti.types.ndarray(ndim=1),
+    w_min: ti.types.ndarray(ndim=1),
+    w_max: ti.types.ndarray(ndim=1),
+    out_w: ti.types.ndarray(ndim=2)
+):
+  w_min0 = w_min[0]
+  w_max0 = w_max[0]
+  num_pre, num_post = out_w.shape
+
+  for i, j in ti.ndrange(num_pre, num_post):
+    if post_spike[j]:
+      new_value = out_w[i, j] + pre_trace[i]
+      if new_value < w_min0:
+        out_w[i, j] = w_min0
+      elif new_value > w_max0:
+        out_w[i, j] = w_max0
+      else:
+        out_w[i, j] = new_value
+    else:
+      out_w[i, j] = old_w[i, j]
+
+
+dense_on_post_prim = bm.XLACustomOp(cpu_kernel=_dense_on_post, gpu_kernel=_dense_on_post)
+
+
+# @numba.njit(nogil=True, fastmath=True, parallel=False)
+# def _cpu_dense_on_pre(weight, spike, trace, w_min, w_max, out_w):
+#   out_w[:] = weight
+#   for i in numba.prange(spike.shape[0]):
+#     if spike[i]:
+#       out_w[i] = np.clip(out_w[i] + trace, w_min, w_max)
+
+@ti.kernel
+def _dense_on_pre(
+    old_w: ti.types.ndarray(ndim=2),
+    pre_spike: ti.types.ndarray(ndim=1),
+    post_trace: ti.types.ndarray(ndim=1),
+    w_min: ti.types.ndarray(ndim=1),
+    w_max: ti.types.ndarray(ndim=1),
+    out_w: ti.types.ndarray(ndim=2)
+):
+  w_min0 = w_min[0]
+  w_max0 = w_max[0]
+  num_pre, num_post = out_w.shape
+
+  for i, j in ti.ndrange(num_pre, num_post):
+    if pre_spike[i]:
+      new_value = out_w[i, j] + post_trace[j]
+      if new_value < w_min0:
+        out_w[i, j] = w_min0
+      elif new_value > w_max0:
+        out_w[i, j] = w_max0
+      else:
+        out_w[i, j] = new_value
+    else:
+      out_w[i, j] = old_w[i, j]
+
+
+dense_on_pre_prim = bm.XLACustomOp(cpu_kernel=_dense_on_pre, gpu_kernel=_dense_on_pre)
+
+@ti.kernel
+def _csr_on_pre_update(
+    old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    indices: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    indptr: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre + 1)
+    spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
+    trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
+    w_min: ti.types.ndarray(ndim=1),  # scalar
+    w_max: ti.types.ndarray(ndim=1),  # scalar
+    out_w: ti.types.ndarray(ndim=1)  # vector with shape of (num_syn)
+):
+  w_min0 = w_min[0]
+  w_max0 = w_max[0]
+  num_pre = spike.shape[0]
+  for i_pre in range(num_pre):
+    if spike[i_pre]:
+      for i_syn in range(indptr[i_pre], indptr[i_pre + 1]):
+        out_w[i_syn] = min(max(old_w[i_syn] + trace[indices[i_syn]], w_min0), w_max0)
+    else:
+      for i_syn in range(indptr[i_pre], indptr[i_pre + 1]):
+        out_w[i_syn] = old_w[i_syn]
+
+
+csr_on_pre_update_prim = bm.XLACustomOp(cpu_kernel=_csr_on_pre_update, gpu_kernel=_csr_on_pre_update)
+
+
+@ti.kernel
+def _coo_on_pre_update(
+    old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    pre_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    post_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    pre_spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
+    post_trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
+    w_min: ti.types.ndarray(ndim=1),  # scalar
+    w_max: ti.types.ndarray(ndim=1),  # scalar
+    out_w: ti.types.ndarray(ndim=1)  # vector with shape of (num_syn)
+):
+  w_min0 = w_min[0]
+  w_max0 = w_max[0]
+  num_syn = old_w.shape[0]
+  for i_syn in range(num_syn):
+    if pre_spike[pre_ids[i_syn]]:  # pre spike
+      out_w[i_syn] = min(max(old_w[i_syn] + post_trace[post_ids[i_syn]], w_min0), w_max0)
+    else:
+      out_w[i_syn] = old_w[i_syn]
+
+
+coo_on_pre_update_prim = bm.XLACustomOp(cpu_kernel=_coo_on_pre_update, gpu_kernel=_coo_on_pre_update)
+
+
+@ti.kernel
+def _coo_on_post_update(
+    old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    pre_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    post_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    post_spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
+    pre_trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
+    w_min: ti.types.ndarray(ndim=1),  # scalar
+    w_max: ti.types.ndarray(ndim=1),  # scalar
+    out_w: ti.types.ndarray(ndim=1)  # vector with shape of (num_syn)
+):
+  w_min0 = w_min[0]
+  w_max0 = w_max[0]
+  num_syn = old_w.shape[0]
+  for i_syn in range(num_syn):
+    if post_spike[post_ids[i_syn]]:  # pre spike
+      out_w[i_syn] = min(max(old_w[i_syn] + pre_trace[pre_ids[i_syn]], w_min0), w_max0)
+    else:
+      out_w[i_syn] = old_w[i_syn]
+
+
+coo_on_post_update_prim = bm.XLACustomOp(cpu_kernel=_coo_on_post_update, gpu_kernel=_coo_on_post_update)
+
+
+# @numba.njit(nogil=True, fastmath=True, parallel=False)
+# def _cpu_csc_on_pre_update(w, post_ids, indptr, w_ids, spike, trace, w_min, w_max, out_w):
+#   out_w[:] = w
+#   w_min = w_min[()]
+#   w_max = w_max[()]
+#   for i in numba.prange(spike.shape[0]):  # post id
+#     if spike[i]:
+#       for k in range(indptr[i], indptr[i + 1]):
+#         j = post_ids[k]  # pre id
+#         l = w_ids[k]  # syn id
+#         out_w[l] = np.minimum(np.maximum(out_w[l] + trace[j], w_min), w_max)
+
+@ti.kernel
+def _csc_on_post_update(
+    old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    indices: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    indptr: ti.types.ndarray(ndim=1),  # vector with shape of (num_post + 1)
+    w_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+    post_spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
+    pre_trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
+    w_min: ti.types.ndarray(ndim=1),  # scalar
+    w_max: ti.types.ndarray(ndim=1),  # scalar
+    out_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
+):
+  w_min0 = w_min[0]
+  w_max0 = w_max[0]
+  num_post = post_spike.shape[0]
+  for i_post in range(num_post):
+    if post_spike[i_post]:
+      for k in range(indptr[i_post], indptr[i_post + 1]):
+        i_syn = w_ids[k]  # syn id
+        out_w[i_syn] = min(max(old_w[i_syn] + pre_trace[indices[k]], w_min0), w_max0)
+    else:
+      for k in range(indptr[i_post], indptr[i_post + 1]):
+        i_syn = w_ids[k]  # syn id
+        out_w[i_syn] = old_w[i_syn]
+
+
+csc_on_post_update_prim = bm.XLACustomOp(cpu_kernel=_csc_on_post_update, gpu_kernel=_csc_on_post_update)
@@ -2,16 +2,22 @@
 
 from typing import Union, Tuple, Optional, Sequence, Callable
 
+import jax
+import jax.numpy as jnp
+import numpy as np
 from jax import lax
 
 from brainpy import math as bm, tools
+from brainpy._src.dependency_check import import_taichi
 from brainpy._src.dnn.base import Layer
 from brainpy._src.initialize import Initializer, XavierNormal, ZeroInit, parameter
+from brainpy.errors import PackageMissingError
 from brainpy.types import ArrayType
 
 __all__ = [
   'Conv1d', 'Conv2d', 'Conv3d',
   'Conv1D', 'Conv2D', 'Conv3D',
+  'EventConv1d', 'EventConv2d', 'EventConv3d',
   'ConvTranspose1d', 'ConvTranspose2d', 'ConvTranspose3d',
 ]
 
@@ -36,6 +42,74 @@ def to_dimension_numbers(num_spatial_dims: int,
                                   out_spec=image_dn)
 
 
+def event_conv(
+    events: jax.Array,
+    weight: jax.Array,
+    stride: Sequence[int],
+    padding: Union[str, Sequence[Tuple[int, int]]],
+    rhs_dilation: Sequence[int],
+    groups: int = 1,
+):
+  """The event-driven convolution of the channels-last inputs.
+
+  It is equivalent to ``lax.conv_general_dilated`` with the
+  ``(N, *spatial, C)`` inputs and the ``(*kernel, C // groups, C_out)``
+  kernel. However, only the nonzero input sites are visited, each of
+  which adds the kernel footprint to the outputs.
+  """
+  if import_taichi(error_if_not_found=False) is None:
+    raise PackageMissingError.by_purpose('taichi', 'event-driven convolution')
+  from brainpy._src.dnn._conv_taichi import event_conv_p
+
+  events = bm.as_jax(events)
+  weight = bm.as_jax(weight)
+  num_dim = events.ndim - 2
+  in_shape = tuple(events.shape[1:-1])
+  kernel_shape = tuple(weight.shape[:-2])
+  if isinstance(padding, str):
+    dilated_kernel = [(k - 1) * d + 1 for k, d in zip(kernel_shape, rhs_dilation)]
+    padding = lax.padtype_to_pads(in_shape, dilated_kernel, stride, padding)
+  padding = tuple((int(low), int(high)) for low, high in padding)
+  out_shape = tuple((i + low + high - (k - 1) * d - 1) // s + 1
+                    for i, (low, high), k, d, s in zip(in_shape, padding, kernel_shape, rhs_dilation, stride))
+  if events.dtype != weight.dtype:
+    events = events.astype(weight.dtype)
+
+  # the geometry of the convolution, whose spatial dimensions are padded to three
+  geometry = np.ones((6, 3), dtype=np.int32)
+  geometry[4] = 0
+  for row, value in enumerate([in_shape, out_shape, kernel_shape, stride, [p[0] for p in padding], rhs_dilation]):
+    geometry[row, 3 - num_dim:] = value
+
+  batch_size, num_out = events.shape[0], weight.shape[-1]
+  out = event_conv_p(events.reshape(batch_size, -1, events.shape[-1]),
+                     weight.reshape((-1,) + weight.shape[-2:]),
+                     jnp.asarray(geometry),
+                     outs=[jax.ShapeDtypeStruct((batch_size, int(np.prod(out_shape)), num_out), weight.dtype)],
+                     in_shape=in_shape,
+                     kernel_shape=kernel_shape,
+                     stride=tuple(stride),
+                     padding=padding,
+                     rhs_dilation=tuple(rhs_dilation),
+                     groups=groups)[0]
+  return out.reshape((batch_size,) + out_shape + (num_out,))
+
+
+def _dense_event_conv(events, weight, *, in_shape, kernel_shape, stride, padding, rhs_dilation, groups, **kwargs):
+  # The dense convolution of the flattened inputs of ``event_conv_p``,
+  # which defines the gradients of the event-driven convolution.
+  x = events.reshape(events.shape[:1] + in_shape + events.shape[-1:])
+  w = weight.reshape(kernel_shape + weight.shape[-2:])
+  y = lax.conv_general_dilated(lhs=x,
+                               rhs=w,
+                               window_strides=stride,
+                               padding=padding,
+                               rhs_dilation=rhs_dilation,
+                               feature_group_count=groups,
+                               dimension_numbers=to_dimension_numbers(len(in_shape), True, False))
+  return y.reshape(y.shape[:1] + (-1,) + y.shape[-1:])
+
+
 class _GeneralConv(Layer):
   """Apply a convolution to the inputs.
 
@@ -479,6 +553,323 @@ Conv2D = Conv2d
 Conv3D = Conv3d
 
 
+class _GeneralEventConv(_GeneralConv):
+  """Apply an event-driven convolution to the spiking inputs.
+
+  The computation is equivalent to :py:class:`~._GeneralConv` (without the
+  input dilation). However, only the nonzero input sites are visited, each
+  of which adds the kernel footprint to the outputs. Therefore, the cost
+  scales with the number of input events, rather than the input size.
+  The gradients are the same with the dense convolution.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  num_spatial_dims: int
+    The number of spatial dimensions of the input.
+  in_channels: int
+    The number of input channels.
+  out_channels: int
+    The number of output channels.
+  kernel_size: int, sequence of int
+    The shape of the convolutional kernel.
+  stride: int, sequence of int
+    An integer or a sequence of `n` integers, representing the inter-window strides (default: 1).
+  padding: str, int, sequence of int, sequence of tuple
+    Either the string `'SAME'`, the string `'VALID'`, or a sequence of n `(low,
+    high)` integer pairs that give the padding to apply before and after each
+    spatial dimension.
+  rhs_dilation: int, sequence of int
+    An integer or a sequence of `n` integers, giving the
+    dilation factor to apply in each spatial dimension of the convolution
+    kernel (default: 1).
+  groups: int
+    If specified, divides the input features into groups. default 1.
+  w_initializer: Callable, ArrayType, Initializer
+    The initializer for the convolutional kernel.
+  b_initializer: Optional, Callable, ArrayType, Initializer
+    The initializer for the bias.
+  mask: ArrayType, Optional
+    The optional mask of the weights.
+  mode: Mode
+    The computation mode of the current object. Default it is `training`.
+  name: str, Optional
+    The name of the object.
+  """
+
+  def __init__(
+      self,
+      num_spatial_dims: int,
+      in_channels: int,
+      out_channels: int,
+      kernel_size: Union[int, Tuple[int, ...]],
+      stride: Union[int, Tuple[int, ...]] = 1,
+      padding: Union[str, int, Tuple[int, int], Sequence[Tuple[int, int]]] = 'SAME',
+      rhs_dilation: Union[int, Tuple[int, ...]] = 1,
+      groups: int = 1,
+      w_initializer: Union[Callable, ArrayType, Initializer] = XavierNormal(),
+      b_initializer: Optional[Union[Callable, ArrayType, Initializer]] = ZeroInit(),
+      mask: Optional[ArrayType] = None,
+      mode: bm.Mode = None,
+      name: str = None,
+  ):
+    super().__init__(num_spatial_dims=num_spatial_dims,
+                     in_channels=in_channels,
+                     out_channels=out_channels,
+                     kernel_size=kernel_size,
+                     stride=stride,
+                     padding=padding,
+                     rhs_dilation=rhs_dilation,
+                     groups=groups,
+                     w_initializer=w_initializer,
+                     b_initializer=b_initializer,
+                     mask=mask,
+                     mode=mode,
+                     name=name)
+
+  def update(self, x):
+    self._check_input_dim(x)
+    nonbatching = False
+    if x.ndim == self.num_spatial_dims + 1:
+      nonbatching = True
+      x = bm.unsqueeze(x, 0)
+    w = self.w.value
+    if self.mask is not None:
+      try:
+        lax.broadcast_shapes(self.w.shape, self.mask.shape)
+      except:
+        raise ValueError(f"Mask needs to have the same shape as weights. {self.mask.shape} != {self.w.shape}")
+      w = w * self.mask
+    y = event_conv(x,
+                   w,
+                   stride=self.stride,
+                   padding=self.padding,
+                   rhs_dilation=self.rhs_dilation,
+                   groups=self.groups)
+    if nonbatching:
+      return y[0] if self.b is None else (y + self.b.value)[0]
+    else:
+      return y if self.b is None else (y + self.b.value)
+
+
+class EventConv1d(_GeneralEventConv):
+  """One-dimensional event-driven convolution.
+
+  The input should be a 2d spike array with the shape of ``[H, C]``, or
+  a 3d spike array with the shape of ``[B, H, C]``. Only the nonzero input
+  sites are computed, so that the cost scales with the number of spikes.
+  The result and the gradients are the same with :py:class:`~.Conv1d`.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  in_channels: int
+    The number of input channels.
+  out_channels: int
+    The number of output channels.
+  kernel_size: int, sequence of int
+    The shape of the convolutional kernel.
+  stride: int, sequence of int
+    An integer or a sequence of `n` integers, representing the inter-window strides (default: 1).
+  padding: str, int, sequence of int, sequence of tuple
+    Either the string `'SAME'`, the string `'VALID'`, or a sequence of n `(low,
+    high)` integer pairs that give the padding to apply before and after each
+    spatial dimension.
+  rhs_dilation: int, sequence of int
+    An integer or a sequence of `n` integers, giving the
+    dilation factor to apply in each spatial dimension of the convolution
+    kernel (default: 1).
+  groups: int
+    If specified, divides the input features into groups. default 1.
+  w_initializer: Callable, ArrayType, Initializer
+    The initializer for the convolutional kernel.
+  b_initializer: Callable, ArrayType, Initializer
+    The initializer for the bias.
+  mask: ArrayType, Optional
+    The optional mask of the weights.
+  mode: Mode
+    The computation mode of the current object. Default it is `training`.
+  name: str, Optional
+    The name of the object.
+  """
+
+  def __init__(
+      self,
+      in_channels: int,
+      out_channels: int,
+      kernel_size: Union[int, Tuple[int, ...]],
+      stride: Union[int, Tuple[int, ...]] = 1,
+      padding: Union[str, int, Tuple[int, int], Sequence[Tuple[int, int]]] = 'SAME',
+      rhs_dilation: Union[int, Tuple[int, ...]] = 1,
+      groups: int = 1,
+      w_initializer: Union[Callable, ArrayType, Initializer] = XavierNormal(),
+      b_initializer: Optional[Union[Callable, ArrayType, Initializer]] = ZeroInit(),
+      mask: Optional[ArrayType] = None,
+      mode: Optional[bm.Mode] = None,
+      name: Optional[str] = None,
+  ):
+    super().__init__(num_spatial_dims=1,
+                     in_channels=in_channels,
+                     out_channels=out_channels,
+                     kernel_size=kernel_size,
+                     stride=stride,
+                     padding=padding,
+                     rhs_dilation=rhs_dilation,
+                     groups=groups,
+                     w_initializer=w_initializer,
+                     b_initializer=b_initializer,
+                     mask=mask,
+                     mode=mode,
+                     name=name)
+
+
+class EventConv2d(_GeneralEventConv):
+  """Two-dimensional event-driven convolution.
+
+  The input should be a 3d spike array with the shape of ``[H, W, C]``, or
+  a 4d spike array with the shape of ``[B, H, W, C]``, like the DVS event
+  frames. Only the nonzero input sites are computed, so that the cost scales
+  with the number of spikes. The result and the gradients are the same with
+  :py:class:`~.Conv2d`.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  in_channels: int
+    The number of input channels.
+  out_channels: int
+    The number of output channels.
+  kernel_size: int, sequence of int
+    The shape of the convolutional kernel.
+  stride: int, sequence of int
+    An integer or a sequence of `n` integers, representing the inter-window strides (default: 1).
+  padding: str, int, sequence of int, sequence of tuple
+    Either the string `'SAME'`, the string `'VALID'`, or a sequence of n `(low,
+    high)` integer pairs that give the padding to apply before and after each
+    spatial dimension.
+  rhs_dilation: int, sequence of int
+    An integer or a sequence of `n` integers, giving the
+    dilation factor to apply in each spatial dimension of the convolution
+    kernel (default: 1).
+  groups: int
+    If specified, divides the input features into groups. default 1.
+  w_initializer: Callable, ArrayType, Initializer
+    The initializer for the convolutional kernel.
+  b_initializer: Callable, ArrayType, Initializer
+    The initializer for the bias.
+  mask: ArrayType, Optional
+    The optional mask of the weights.
+  mode: Mode
+    The computation mode of the current object. Default it is `training`.
+  name: str, Optional
+    The name of the object.
+  """
+
+  def __init__(
+      self,
+      in_channels: int,
+      out_channels: int,
+      kernel_size: Union[int, Tuple[int, ...]],
+      stride: Union[int, Tuple[int, ...]] = 1,
+      padding: Union[str, int, Tuple[int, int], Sequence[Tuple[int, int]]] = 'SAME',
+      rhs_dilation: Union[int, Tuple[int, ...]] = 1,
+      groups: int = 1,
+      w_initializer: Union[Callable, ArrayType, Initializer] = XavierNormal(),
+      b_initializer: Optional[Union[Callable, ArrayType, Initializer]] = ZeroInit(),
+      mask: Optional[ArrayType] = None,
+      mode: Optional[bm.Mode] = None,
+      name: Optional[str] = None,
+  ):
+    super().__init__(num_spatial_dims=2,
+                     in_channels=in_channels,
+                     out_channels=out_channels,
+                     kernel_size=kernel_size,
+                     stride=stride,
+                     padding=padding,
+                     rhs_dilation=rhs_dilation,
+                     groups=groups,
+                     w_initializer=w_initializer,
+                     b_initializer=b_initializer,
+                     mask=mask,
+                     mode=mode,
+                     name=name)
+
+
+class EventConv3d(_GeneralEventConv):
+  """Three-dimensional event-driven convolution.
+
+  The input should be a 4d spike array with the shape of ``[H, W, D, C]``, or
+  a 5d spike array with the shape of ``[B, H, W, D, C]``. Only the nonzero
+  input sites are computed, so that the cost scales with the number of spikes.
+  The result and the gradients are the same with :py:class:`~.Conv3d`.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  in_channels: int
+    The number of input channels.
+  out_channels: int
+    The number of output channels.
+  kernel_size: int, sequence of int
+    The shape of the convolutional kernel.
+  stride: int, sequence of int
+    An integer or a sequence of `n` integers, representing the inter-window strides (default: 1).
+  padding: str, int, sequence of int, sequence of tuple
+    Either the string `'SAME'`, the string `'VALID'`, or a sequence of n `(low,
+    high)` integer pairs that give the padding to apply before and after each
+    spatial dimension.
+  rhs_dilation: int, sequence of int
+    An integer or a sequence of `n` integers, giving the
+    dilation factor to apply in each spatial dimension of the convolution
+    kernel (default: 1).
+  groups: int
+    If specified, divides the input features into groups. default 1.
+  w_initializer: Callable, ArrayType, Initializer
+    The initializer for the convolutional kernel.
+  b_initializer: Callable, ArrayType, Initializer
+    The initializer for the bias.
+  mask: ArrayType, Optional
+    The optional mask of the weights.
+  mode: Mode
+    The computation mode of the current object. Default it is `training`.
+  name: str, Optional
+    The name of the object.
+  """
+
+  def __init__(
+      self,
+      in_channels: int,
+      out_channels: int,
+      kernel_size: Union[int, Tuple[int, ...]],
+      stride: Union[int, Tuple[int, ...]] = 1,
+      padding: Union[str, int, Tuple[int, int], Sequence[Tuple[int, int]]] = 'SAME',
+      rhs_dilation: Union[int, Tuple[int, ...]] = 1,
+      groups: int = 1,
+      w_initializer: Union[Callable, ArrayType, Initializer] = XavierNormal(),
+      b_initializer: Optional[Union[Callable, ArrayType, Initializer]] = ZeroInit(),
+      mask: Optional[ArrayType] = None,
+      mode: Optional[bm.Mode] = None,
+      name: Optional[str] = None,
+  ):
+    super().__init__(num_spatial_dims=3,
+                     in_channels=in_channels,
+                     out_channels=out_channels,
+                     kernel_size=kernel_size,
+                     stride=stride,
+                     padding=padding,
+                     rhs_dilation=rhs_dilation,
+                     groups=groups,
+                     w_initializer=w_initializer,
+                     b_initializer=b_initializer,
+                     mask=mask,
+                     mode=mode,
+                     name=name)
+
+
 class _GeneralConvTranspose(Layer):
   supported_modes = (bm.TrainingMode, bm.BatchingMode, bm.NonBatchingMode)
 
@@ -44,7 +44,7 @@ class Dropout(Layer):
     if fit is None:
       fit = share['fit']
     if fit:
-      keep_mask = bm.random.bernoulli(self.prob, x.shape)
+      keep_mask = bm.random.bernoulli(self.prob, x.shape, key=bm.random.module_key(self))
       return bm.where(keep_mask, x / self.prob, 0.)
     else:
       return x
@@ -10,9 +10,11 @@ import numpy as np
 
 from brainpy import math as bm
 from brainpy._src import connect, initialize as init
+from brainpy._src.connect.regular_conn import GridConn
 from brainpy._src.context import share
 from brainpy._src.dependency_check import import_taichi
 from brainpy._src.dnn.base import Layer
+from brainpy._src.math.event.ell_matvec import ell_matvec
 from brainpy._src.mixin import SupportOnline, SupportOffline, SupportSTDP
 from brainpy.check import is_initializer
 from brainpy.connect import csr2csc
@@ -20,8 +22,6 @@ from brainpy.errors import MathError, PackageMissingError
 from brainpy.initialize import XavierNormal, ZeroInit, Initializer, parameter
 from brainpy.types import ArrayType, Sharding
 
-ti = import_taichi(error_if_not_found=False)
-
 __all__ = [
   'Dense', 'Linear',
   'Identity',
@@ -29,6 +29,8 @@ __all__ = [
   'OneToOne',
   'MaskedLinear',
   'CSRLinear', 'EventCSRLinear',
+  'ELLLinear', 'EventELLLinear',
+  'GridLinear',
   'JitFPHomoLinear', 'JitFPUniformLinear', 'JitFPNormalLinear',
   'EventJitFPHomoLinear', 'EventJitFPNormalLinear', 'EventJitFPUniformLinear',
 ]
@@ -238,87 +240,10 @@ class Identity(Layer):
     return x
 
 
-if ti is not None:
-
-  # @numba.njit(nogil=True, fastmath=True, parallel=False)
-  # def _cpu_dense_on_post(weight, spike, trace, w_min, w_max, out_w):
-  #   out_w[:] = weight
-  #   for i in numba.prange(spike.shape[0]):
-  #     if spike[i]:
-  #       out_w[:, i] = np.clip(out_w[:, i] + trace, w_min, w_max)
-
-  @ti.kernel
-  def _dense_on_post(
-      old_w: ti.types.ndarray(ndim=2),
-      post_spike: ti.types.ndarray(ndim=1),
-      pre_trace: ti.types.ndarray(ndim=1),
-      w_min: ti.types.ndarray(ndim=1),
-      w_max: ti.types.ndarray(ndim=1),
-      out_w: ti.types.ndarray(ndim=2)
-  ):
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    num_pre, num_post = out_w.shape
-
-    for i, j in ti.ndrange(num_pre, num_post):
-      if post_spike[j]:
-        new_value = out_w[i, j] + pre_trace[i]
-        if new_value < w_min0:
-          out_w[i, j] = w_min0
-        elif new_value > w_max0:
-          out_w[i, j] = w_max0
-        else:
-          out_w[i, j] = new_value
-      else:
-        out_w[i, j] = old_w[i, j]
-
-
-  dense_on_post_prim = bm.XLACustomOp(cpu_kernel=_dense_on_post, gpu_kernel=_dense_on_post)
-
-
-  # @numba.njit(nogil=True, fastmath=True, parallel=False)
-  # def _cpu_dense_on_pre(weight, spike, trace, w_min, w_max, out_w):
-  #   out_w[:] = weight
-  #   for i in numba.prange(spike.shape[0]):
-  #     if spike[i]:
-  #       out_w[i] = np.clip(out_w[i] + trace, w_min, w_max)
-
-  @ti.kernel
-  def _dense_on_pre(
-      old_w: ti.types.ndarray(ndim=2),
-      pre_spike: ti.types.ndarray(ndim=1),
-      post_trace: ti.types.ndarray(ndim=1),
-      w_min: ti.types.ndarray(ndim=1),
-      w_max: ti.types.ndarray(ndim=1),
-      out_w: ti.types.ndarray(ndim=2)
-  ):
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    num_pre, num_post = out_w.shape
-
-    for i, j in ti.ndrange(num_pre, num_post):
-      if pre_spike[i]:
-        new_value = out_w[i, j] + post_trace[j]
-        if new_value < w_min0:
-          out_w[i, j] = w_min0
-        elif new_value > w_max0:
-          out_w[i, j] = w_max0
-        else:
-          out_w[i, j] = new_value
-      else:
-        out_w[i, j] = old_w[i, j]
-
-
-  dense_on_pre_prim = bm.XLACustomOp(cpu_kernel=_dense_on_pre, gpu_kernel=_dense_on_pre)
-
-else:
-  dense_on_pre_prim = None
-  dense_on_post_prim = None
-
-
 def dense_on_pre(weight, spike, trace, w_min, w_max):
-  if dense_on_pre_prim is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', 'custom operators')
+  from brainpy._src.dnn._linear_taichi import dense_on_pre_prim
 
   if w_min is None:
     w_min = -np.inf
@@ -331,8 +256,9 @@ def dense_on_pre(weight, spike, trace, w_min, w_max):
 
 
 def dense_on_post(weight, spike, trace, w_min, w_max):
-  if dense_on_post_prim is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', 'custom operators')
+  from brainpy._src.dnn._linear_taichi import dense_on_post_prim
 
   if w_min is None:
     w_min = -np.inf
@@ -555,6 +481,38 @@ class MaskedLinear(Layer, SupportSTDP):
       self.weight.value = dense_on_post(self.weight.value, spike, trace, w_min, w_max)
 
 
+def _partition_csr(indices, indptr, shape, num_shard, transpose=True):
+  """Split the synapses of a CSR matrix into ``num_shard`` pieces by the output neurons.
+
+  The output neurons are the columns of the matrix if ``transpose=True``, otherwise
+  the rows. Each piece takes a contiguous range of ``ceil(num_output / num_shard)``
+  output neurons. The synapses of each piece are padded to the same number, and the
+  local output ids of the padded synapses are out of range.
+
+  Returns
+  -------
+  res: tuple
+    The stacked input neuron ids, local output neuron ids, and the ids of
+    the synapses in the CSR matrix, each with the shape of ``(num_shard, max_nnz)``.
+  """
+  indices = np.asarray(indices)
+  rows = np.repeat(np.arange(shape[0]), np.diff(np.asarray(indptr)))
+  in_ids, out_ids = (rows, indices) if transpose else (indices, rows)
+  size = -(-shape[int(transpose)] // num_shard)
+  shard_ids = out_ids // size
+
+  all_ids = [np.where(shard_ids == i)[0] for i in range(num_shard)]
+  max_nnz = max(max(len(ids) for ids in all_ids), 1)
+  local_in_ids = np.zeros((num_shard, max_nnz), dtype=indices.dtype)
+  local_out_ids = np.full((num_shard, max_nnz), size, dtype=indices.dtype)
+  local_syn_ids = np.zeros((num_shard, max_nnz), dtype=np.int32)
+  for i, ids in enumerate(all_ids):
+    local_in_ids[i, :len(ids)] = in_ids[ids]
+    local_out_ids[i, :len(ids)] = out_ids[ids] - i * size
+    local_syn_ids[i, :len(ids)] = ids
+  return local_in_ids, local_out_ids, local_syn_ids
+
+
 class _CSRLayer(Layer, SupportSTDP):
   def __init__(
       self,
@@ -568,7 +526,6 @@ class _CSRLayer(Layer, SupportSTDP):
     super().__init__(name=name, mode=mode)
 
     assert isinstance(conn, connect.TwoEndConnector)
-    assert sharding is None, 'Currently this model does not support sharding.'
     self.conn = conn
     self.sharding = sharding
     self.transpose = transpose
@@ -578,10 +535,84 @@ class _CSRLayer(Layer, SupportSTDP):
 
     # weight
     weight = init.parameter(weight, (self.indices.size,))
+
+    # partition synapses by the output neurons
+    self._mesh_axis = self._get_mesh_axis(sharding)
+    if self._mesh_axis is not None:
+      # The mesh is kept, since the layer can be called outside
+      # the "brainpy.math.sharding.device_mesh()" context.
+      self._mesh = mesh = bm.sharding.get_sharding(sharding).mesh
+      self._num_shard = mesh.shape[self._mesh_axis]
+      self._shard_size = -(-self._num_out // self._num_shard)
+      in_ids, out_ids, syn_ids = _partition_csr(self.indices,
+                                                self.indptr,
+                                                (self.conn.pre_num, self.conn.post_num),
+                                                self._num_shard,
+                                                transpose=self.transpose)
+      shard = jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec(self._mesh_axis))
+      self._in_ids = bm.sharding.partition(in_ids, shard)
+      self._out_ids = bm.sharding.partition(out_ids, shard)
+      if bm.size(weight) != 1:
+        weight = np.where(out_ids < self._shard_size, np.asarray(weight)[syn_ids], 0.)
+        weight = bm.sharding.partition(weight, shard)
+
     if isinstance(self.mode, bm.TrainingMode):
       weight = bm.TrainVar(weight)
     self.weight = weight
 
+  @property
+  def _num_out(self):
+    return self.conn.post_num if self.transpose else self.conn.pre_num
+
+  def _get_mesh_axis(self, sharding):
+    # the mesh axis along which the output neurons are partitioned
+    if sharding is None:
+      return None
+    if not (isinstance(sharding, (tuple, list)) and len(sharding) == 2):
+      raise ValueError('"sharding" should be a sequence of two axis names for the '
+                       f'(pre_num, post_num) connection matrix, but we got {sharding}.')
+    named_sharding = bm.sharding.get_sharding(sharding)
+    if named_sharding is None:
+      return None
+    out_axis, in_axis = (1, 0) if self.transpose else (0, 1)
+    spec = tuple(named_sharding.spec) + (None,) * 2
+    if spec[in_axis] is not None:
+      raise ValueError(f'{self.__class__.__name__} only supports partitioning the synapses '
+                       f'by the output neurons, i.e., "sharding" should be '
+                       f'{[None, sharding[1]] if self.transpose else [sharding[0], None]}. '
+                       f'But we got {sharding}.')
+    if spec[out_axis] is None or named_sharding.mesh.shape[spec[out_axis]] == 1:
+      return None
+    return spec[out_axis]
+
+  def _sharded_update(self, x):
+    """Compute the synaptic inputs of each piece of synapses locally.
+
+    The inputs are replicated across devices (i.e., all-gathered once), and the
+    outputs are partitioned along the mesh axis by the output neurons.
+    """
+    from jax.experimental.shard_map import shard_map
+
+    P = jax.sharding.PartitionSpec
+    x = bm.as_jax(x)
+    weight = bm.as_jax(self.weight)
+    homo_weight = bm.size(weight) == 1
+
+    def f_local(w, in_ids, out_ids, x):
+      w = w if homo_weight else w[0]
+      # the taichi operators are not used here, since their CPU kernels
+      # cannot be launched by multiple devices at the same time
+      y = jnp.moveaxis(x[..., in_ids[0]] * w, -1, 0)
+      return jnp.moveaxis(jax.ops.segment_sum(y, out_ids[0], self._shard_size), 0, -1)
+
+    out = shard_map(f_local,
+                    mesh=self._mesh,
+                    in_specs=(P() if homo_weight else P(self._mesh_axis), P(self._mesh_axis), P(self._mesh_axis), P()),
+                    out_specs=P(*([None] * (x.ndim - 1)), self._mesh_axis))(weight, bm.as_jax(self._in_ids), bm.as_jax(self._out_ids), x)
+    if out.shape[-1] != self._num_out:
+      out = out[..., :self._num_out]
+    return out
+
   def stdp_update(
       self,
       on_pre: Dict = None,
@@ -589,6 +620,8 @@ class _CSRLayer(Layer, SupportSTDP):
       w_min: numbers.Number = None,
       w_max: numbers.Number = None
   ):
+    if self._mesh_axis is not None:
+      raise NotImplementedError(f'STDP is not supported by the sharded {self.__class__.__name__}.')
     if bm.isscalar(self.weight):
       raise ValueError(f'When using STDP to update synaptic weights, the weight cannot be a scalar.')
     if self.weight.shape != self.indices.shape:
@@ -626,7 +659,18 @@ class CSRLinear(_CSRLayer):
   Args:
     conn: TwoEndConnector. The connection.
     weight: Synaptic weights. Can be a scalar, array, or callable function.
-    sharding: The sharding strategy. 
+    sharding: The sharding strategy. The axis names of the ``(pre_num, post_num)``
+      connection matrix, like ``[None, bm.sharding.NEU_AXIS]``. Under a
+      :py:func:`~.brainpy.math.sharding.device_mesh`, the synapses are split into
+      contiguous ranges of the output neurons, each piece is computed locally on its
+      device, and the output is partitioned along the mesh axis. Note that the
+      weights are then stored in the padded ``(num_shard, max_nnz)`` layout of the
+      split synapses, where ``max_nnz`` is the largest number of synapses in a piece,
+      rather than in the ``(nnz,)`` layout of the CSR matrix. Moreover, each piece
+      gathers the inputs of all its synapses and sums them by the output neurons,
+      so that the cost is proportional to the number of synapses.
+
+      .. versionadded:: 2.6.1
     mode: The synaptic computing mode.
     name: The synapse model name.
   """
@@ -645,6 +689,8 @@ class CSRLinear(_CSRLayer):
     self.method = method
 
   def update(self, x):
+    if self._mesh_axis is not None:
+      return self._sharded_update(x)
     if x.ndim == 1:
       return bm.sparse.csrmv(self.weight, self.indices, self.indptr, x,
                              shape=(self.conn.pre_num, self.conn.post_num), transpose=self.transpose)
@@ -676,7 +722,19 @@ class EventCSRLinear(_CSRLayer):
   Args:
     conn: TwoEndConnector. The connection.
     weight: Synaptic weights. Can be a scalar, array, or callable function.
-    sharding: The sharding strategy.
+    sharding: The sharding strategy. The axis names of the ``(pre_num, post_num)``
+      connection matrix, like ``[None, bm.sharding.NEU_AXIS]``. Under a
+      :py:func:`~.brainpy.math.sharding.device_mesh`, the synapses are split into
+      contiguous ranges of the output neurons, each piece is computed locally on its
+      device, and the output is partitioned along the mesh axis. Note that the
+      weights are then stored in the padded ``(num_shard, max_nnz)`` layout of the
+      split synapses, where ``max_nnz`` is the largest number of synapses in a piece,
+      rather than in the ``(nnz,)`` layout of the CSR matrix. Moreover, each piece
+      gathers the inputs of all its synapses and sums them by the output neurons,
+      so that the cost is proportional to the number of synapses, regardless of
+      the number of spikes. That is, the sharded computation is not event-driven.
+
+      .. versionadded:: 2.6.1
     mode: The synaptic computing mode.
     name: The synapse model name.
   """
@@ -693,6 +751,8 @@ class EventCSRLinear(_CSRLayer):
     super().__init__(name=name, mode=mode, conn=conn, weight=weight, sharding=sharding, transpose=transpose)
 
   def update(self, x):
+    if self._mesh_axis is not None:
+      return self._sharded_update(x)
     if x.ndim == 1:
       return bm.event.csrmv(self.weight, self.indices, self.indptr, x,
                             shape=(self.conn.pre_num, self.conn.post_num),
@@ -711,131 +771,179 @@ class EventCSRLinear(_CSRLayer):
                           transpose=self.transpose)
 
 
-if ti is not None:
-  @ti.kernel
-  def _csr_on_pre_update(
-      old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      indices: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      indptr: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre + 1)
-      spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
-      trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
-      w_min: ti.types.ndarray(ndim=1),  # scalar
-      w_max: ti.types.ndarray(ndim=1),  # scalar
-      out_w: ti.types.ndarray(ndim=1)  # vector with shape of (num_syn)
+class _ELLLayer(Layer):
+  def __init__(
+      self,
+      conn: connect.TwoEndConnector,
+      weight: Union[float, ArrayType, Callable],
+      mode: Optional[bm.Mode] = None,
+      name: Optional[str] = None,
+      transpose: bool = True,
   ):
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    num_pre = spike.shape[0]
-    for i_pre in range(num_pre):
-      if spike[i_pre]:
-        for i_syn in range(indptr[i_pre], indptr[i_pre + 1]):
-          out_w[i_syn] = min(max(old_w[i_syn] + trace[indices[i_syn]], w_min0), w_max0)
-      else:
-        for i_syn in range(indptr[i_pre], indptr[i_pre + 1]):
-          out_w[i_syn] = old_w[i_syn]
+    super().__init__(name=name, mode=mode)
 
+    assert isinstance(conn, connect.TwoEndConnector)
+    self.conn = conn
+    self.transpose = transpose
 
-  csr_on_pre_update_prim = bm.XLACustomOp(cpu_kernel=_csr_on_pre_update, gpu_kernel=_csr_on_pre_update)
+    # connection
+    self.indices = self.conn.require('ell')
 
+    # weight
+    weight = init.parameter(weight, self.indices.shape)
+    if isinstance(self.mode, bm.TrainingMode):
+      weight = bm.TrainVar(weight)
+    self.weight = weight
 
-  @ti.kernel
-  def _coo_on_pre_update(
-      old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      pre_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      post_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      pre_spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
-      post_trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
-      w_min: ti.types.ndarray(ndim=1),  # scalar
-      w_max: ti.types.ndarray(ndim=1),  # scalar
-      out_w: ti.types.ndarray(ndim=1)  # vector with shape of (num_syn)
-  ):
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    num_syn = old_w.shape[0]
-    for i_syn in range(num_syn):
-      if pre_spike[pre_ids[i_syn]]:  # pre spike
-        out_w[i_syn] = min(max(old_w[i_syn] + post_trace[post_ids[i_syn]], w_min0), w_max0)
-      else:
-        out_w[i_syn] = old_w[i_syn]
+  def update(self, x):
+    if x.ndim == 1:
+      return self._ellmv(x)
+    elif x.ndim > 1:
+      shapes = x.shape[:-1]
+      x = bm.flatten(x, end_dim=-2)
+      y = jax.vmap(self._ellmv)(x)
+      return bm.reshape(y, shapes + (y.shape[-1],))
+    else:
+      raise ValueError
 
+  def _ellmv(self, x):
+    raise NotImplementedError
 
-  coo_on_pre_update_prim = bm.XLACustomOp(cpu_kernel=_coo_on_pre_update, gpu_kernel=_coo_on_pre_update)
 
+class ELLLinear(_ELLLayer):
+  r"""Synaptic matrix multiplication with ELL sparse computation.
 
-  @ti.kernel
-  def _coo_on_post_update(
-      old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      pre_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      post_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      post_spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
-      pre_trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
-      w_min: ti.types.ndarray(ndim=1),  # scalar
-      w_max: ti.types.ndarray(ndim=1),  # scalar
-      out_w: ti.types.ndarray(ndim=1)  # vector with shape of (num_syn)
-  ):
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    num_syn = old_w.shape[0]
-    for i_syn in range(num_syn):
-      if post_spike[post_ids[i_syn]]:  # pre spike
-        out_w[i_syn] = min(max(old_w[i_syn] + pre_trace[pre_ids[i_syn]], w_min0), w_max0)
-      else:
-        out_w[i_syn] = old_w[i_syn]
-
-
-  coo_on_post_update_prim = bm.XLACustomOp(cpu_kernel=_coo_on_post_update, gpu_kernel=_coo_on_post_update)
-
-
-  # @numba.njit(nogil=True, fastmath=True, parallel=False)
-  # def _cpu_csc_on_pre_update(w, post_ids, indptr, w_ids, spike, trace, w_min, w_max, out_w):
-  #   out_w[:] = w
-  #   w_min = w_min[()]
-  #   w_max = w_max[()]
-  #   for i in numba.prange(spike.shape[0]):  # post id
-  #     if spike[i]:
-  #       for k in range(indptr[i], indptr[i + 1]):
-  #         j = post_ids[k]  # pre id
-  #         l = w_ids[k]  # syn id
-  #         out_w[l] = np.minimum(np.maximum(out_w[l] + trace[j], w_min), w_max)
-
-  @ti.kernel
-  def _csc_on_post_update(
-      old_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      indices: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      indptr: ti.types.ndarray(ndim=1),  # vector with shape of (num_post + 1)
-      w_ids: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-      post_spike: ti.types.ndarray(ndim=1),  # vector with shape of (num_post,)
-      pre_trace: ti.types.ndarray(ndim=1),  # vector with shape of (num_pre,)
-      w_min: ti.types.ndarray(ndim=1),  # scalar
-      w_max: ti.types.ndarray(ndim=1),  # scalar
-      out_w: ti.types.ndarray(ndim=1),  # vector with shape of (num_syn)
-  ):
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    num_post = post_spike.shape[0]
-    for i_post in range(num_post):
-      if post_spike[i_post]:
-        for k in range(indptr[i_post], indptr[i_post + 1]):
-          i_syn = w_ids[k]  # syn id
-          out_w[i_syn] = min(max(old_w[i_syn] + pre_trace[indices[k]], w_min0), w_max0)
-      else:
-        for k in range(indptr[i_post], indptr[i_post + 1]):
-          i_syn = w_ids[k]  # syn id
-          out_w[i_syn] = old_w[i_syn]
+  It performs the computation of:
+
+  .. math::
 
+     y = x @ M
+
+  where :math:`y` is the postsynaptic value, :math:`x` the presynaptic value,
+  :math:`M` the synaptic weight using an ELL sparse matrix (see
+  :py:func:`~.brainpy.math.event.ellmv`). Compared with :py:class:`~.CSRLinear`,
+  it is suitable for the connections with a fixed number of post-synaptic
+  targets, like :py:class:`~.FixedPostNum`.
+
+  .. versionadded:: 2.6.1
+
+  Args:
+    conn: TwoEndConnector. The connection.
+    weight: Synaptic weights. Can be a scalar, array, or callable function.
+    mode: The synaptic computing mode.
+    name: The synapse model name.
+  """
+
+  def _ellmv(self, x):
+    return ell_matvec(jnp.atleast_1d(bm.as_jax(self.weight)), self.indices, bm.as_jax(x),
+                      shape=(self.conn.pre_num, self.conn.post_num), transpose=self.transpose)
+
+
+class EventELLLinear(_ELLLayer):
+  r"""Synaptic matrix multiplication with event ELL sparse computation.
+
+  It performs the computation of:
+
+  .. math::
+
+     y = x @ M
+
+  where :math:`y` is the postsynaptic value, :math:`x` the presynaptic spikes,
+  :math:`M` the synaptic weight using an ELL sparse matrix (see
+  :py:func:`~.brainpy.math.event.ellmv`). Compared with :py:class:`~.EventCSRLinear`,
+  it is suitable for the connections with a fixed number of post-synaptic
+  targets, like :py:class:`~.FixedPostNum`.
+
+  .. versionadded:: 2.6.1
+
+  Args:
+    conn: TwoEndConnector. The connection.
+    weight: Synaptic weights. Can be a scalar, array, or callable function.
+    mode: The synaptic computing mode.
+    name: The synapse model name.
+  """
+
+  def _ellmv(self, x):
+    return bm.event.ellmv(self.weight, self.indices, x,
+                          shape=(self.conn.pre_num, self.conn.post_num),
+                          transpose=self.transpose)
+
+
+class GridLinear(Layer):
+  r"""Synaptic matrix multiplication for the lattice connections with stencil computation.
+
+  It performs the computation of:
+
+  .. math::
+
+     y = x @ M
+
+  where :math:`M` is the synaptic weight of a :py:class:`~.GridFour`,
+  :py:class:`~.GridEight` or :py:class:`~.GridN` connection. Instead of a
+  sparse matrix, the population is reshaped into its lattice, and each
+  connection offset is computed as a shifted copy of the input (rolled
+  when ``periodic_boundary=True``, and zero-filled otherwise). Therefore,
+  no connection index is stored, and the result is the same as
+  :py:class:`~.CSRLinear`.
+
+  .. versionadded:: 2.6.1
+
+  Args:
+    conn: GridConn. The lattice connection.
+    weight: Synaptic weights. Can be a scalar, or an array with the shape
+      of ``(num_offset,)`` which gives the weight of each offset in
+      ``conn.build_stencil()``.
+    mode: The synaptic computing mode.
+    name: The synapse model name.
+  """
 
-  csc_on_post_update_prim = bm.XLACustomOp(cpu_kernel=_csc_on_post_update, gpu_kernel=_csc_on_post_update)
+  def __init__(
+      self,
+      conn: GridConn,
+      weight: Union[float, ArrayType, Callable],
+      mode: Optional[bm.Mode] = None,
+      name: Optional[str] = None,
+  ):
+    super().__init__(name=name, mode=mode)
+
+    if not isinstance(conn, GridConn):
+      raise TypeError(f'{self.__class__.__name__} only supports the lattice connections '
+                      f'(GridFour, GridEight and GridN), but we got {type(conn)}.')
+    self.conn = conn
+    self.offsets = conn.build_stencil()
 
+    # weight
+    weight = init.parameter(weight, (len(self.offsets),))
+    if isinstance(self.mode, bm.TrainingMode):
+      weight = bm.TrainVar(weight)
+    self.weight = weight
 
-else:
-  csr_on_pre_update_prim = None
-  coo_on_pre_update_prim = None
-  csc_on_post_update_prim = None
+  def update(self, x):
+    x = bm.as_jax(x)
+    weight = bm.as_jax(self.weight)
+    if x.dtype == jnp.bool_:
+      x = x.astype(weight.dtype)
+    sizes = tuple(self.conn.post_size)
+    batch_shape = x.shape[:-1]
+    x = x.reshape(batch_shape + sizes)
+    axes = tuple(range(len(batch_shape), x.ndim))
+
+    y = 0.
+    for i, offset in enumerate(self.offsets):
+      # "pre" at the position "p" targets "post" at "p + offset"
+      if self.conn.periodic_boundary:
+        shifted = jnp.roll(x, tuple(offset), axis=axes)
+      else:
+        shifted = jax.lax.pad(x, jnp.zeros((), dtype=x.dtype),
+                              [(0, 0, 0)] * len(batch_shape) + [(int(s), -int(s), 0) for s in offset])
+      y = y + shifted * (weight if jnp.size(weight) == 1 else weight[i])
+    return y.reshape(batch_shape + (self.conn.post_num,))
 
 
 def csr_on_pre_update(w, indices, indptr, spike, trace, w_min=None, w_max=None):
-  if csr_on_pre_update_prim is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', 'customized operators')
+  from brainpy._src.dnn._linear_taichi import csr_on_pre_update_prim
 
   if w_min is None:
     w_min = -np.inf
@@ -848,8 +956,9 @@ def csr_on_pre_update(w, indices, indptr, spike, trace, w_min=None, w_max=None):
 
 
 def coo_on_pre_update(w, pre_ids, post_ids, spike, trace, w_min=None, w_max=None):
-  if coo_on_pre_update_prim is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', 'customized operators')
+  from brainpy._src.dnn._linear_taichi import coo_on_pre_update_prim
 
   if w_min is None:
     w_min = -np.inf
@@ -862,8 +971,9 @@ def coo_on_pre_update(w, pre_ids, post_ids, spike, trace, w_min=None, w_max=None
 
 
 def csc_on_post_update(w, post_ids, indptr, w_ids, post_spike, pre_trace, w_min=None, w_max=None):
-  if csc_on_post_update_prim is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', 'customized operators')
+  from brainpy._src.dnn._linear_taichi import csc_on_post_update_prim
 
   if w_min is None:
     w_min = -np.inf
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 
+import unittest
+
+import jax
 import jax.numpy as jnp
 from absl.testing import absltest
 from absl.testing import parameterized
 
 import brainpy as bp
 import brainpy.math as bm
+from brainpy._src.dependency_check import import_taichi
+from brainpy._src.dnn.conv import event_conv
 
 
 class TestConv(parameterized.TestCase):
@@ -267,5 +272,50 @@ class TestConvTranspose3d(parameterized.TestCase):
     bm.clear_buffer_memory()
 
 
+@unittest.skipIf(import_taichi(error_if_not_found=False) is None, 'no taichi')
+class TestEventConv(parameterized.TestCase):
+  @parameterized.product(
+    num_dim=[1, 2, 3],
+    stride=[1, 2],
+    padding=['SAME', 'VALID', 1],
+    groups=[1, 2],
+  )
+  def test_same_as_dense(self, num_dim, stride, padding, groups):
+    bm.random.seed(123)
+    dense_cls = [bp.dnn.Conv1d, bp.dnn.Conv2d, bp.dnn.Conv3d][num_dim - 1]
+    event_cls = [bp.dnn.EventConv1d, bp.dnn.EventConv2d, bp.dnn.EventConv3d][num_dim - 1]
+    dense = dense_cls(4, 6, kernel_size=3, stride=stride, padding=padding, rhs_dilation=2, groups=groups)
+    event = event_cls(4, 6, kernel_size=3, stride=stride, padding=padding, rhs_dilation=2, groups=groups,
+                      w_initializer=dense.w, b_initializer=bm.random.rand(*dense.b.shape))
+    spikes = bm.random.rand(2, *([8] * num_dim), 4) < 0.2
+    self.assertTrue(bm.allclose(event(spikes), dense(spikes.astype(float)) + event.b, atol=1e-5))
+    self.assertTrue(bm.allclose(event(spikes[0]), (dense(spikes.astype(float)) + event.b)[0], atol=1e-5))
+    bm.clear_buffer_memory()
+
+  def test_grad_and_vmap(self):
+    bm.random.seed(123)
+    w = bm.random.randn(3, 3, 2, 5).value
+    x = (bm.random.rand(3, 2, 10, 10, 2) < 0.1).astype(float).value
+
+    def event_f(x, w):
+      return event_conv(x, w, (1, 1), 'SAME', (1, 1))
+
+    def dense_f(x, w):
+      return jax.lax.conv_general_dilated(x, w, (1, 1), 'SAME',
+                                          dimension_numbers=('NHWC', 'HWIO', 'NHWC'))
+
+    loss = lambda f: (lambda x, w: jnp.sum(f(x, w) ** 2))
+    g1 = jax.grad(loss(event_f), argnums=(0, 1))(x[0], w)
+    g2 = jax.grad(loss(dense_f), argnums=(0, 1))(x[0], w)
+    self.assertTrue(jnp.allclose(g1[0], g2[0], atol=1e-4))
+    self.assertTrue(jnp.allclose(g1[1], g2[1], atol=1e-4))
+    self.assertTrue(jnp.allclose(jax.vmap(event_f, in_axes=(0, None))(x, w),
+                                 jax.vmap(dense_f, in_axes=(0, None))(x, w), atol=1e-5))
+    ws = jnp.stack([w, -w])
+    self.assertTrue(jnp.allclose(jax.vmap(event_f, in_axes=(None, 0))(x[0], ws),
+                                 jax.vmap(dense_f, in_axes=(None, 0))(x[0], ws), atol=1e-5))
+    bm.clear_buffer_memory()
+
+
 if __name__ == '__main__':
   absltest.main()
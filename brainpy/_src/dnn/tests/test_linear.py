@@ -1,3 +1,9 @@
+import subprocess
+import sys
+import textwrap
+
+import jax
+import numpy as np
 import pytest
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -130,6 +136,76 @@ class TestLinear(parameterized.TestCase):
     self.assertTrue(y.shape == (100,))
     bm.clear_buffer_memory()
 
+  @parameterized.product(
+    conn=[
+      bp.conn.FixedPostNum(10, pre=100, post=80),
+      bp.conn.FixedProb(0.1, pre=100, post=80),
+    ],
+    homo=[True, False],
+    transpose=[True, False],
+  )
+  def test_ELLLinear(self, conn, homo, transpose):
+    bm.random.seed()
+    conn = bp.conn.CSRConn(*conn.require('csr'))(100, 80)
+    num_in, num_out = (100, 80) if transpose else (80, 100)
+    f1 = bp.dnn.CSRLinear(conn, weight=1.5 if homo else bp.init.Normal(), transpose=transpose)
+    weight = 1.5 if homo else bp.conn.csr2ell((bm.as_numpy(f1.weight), conn.require('csr')[1]), 0.)
+    f2 = bp.dnn.ELLLinear(conn, weight=weight, transpose=transpose)
+    f3 = bp.dnn.EventELLLinear(conn, weight=weight, transpose=transpose)
+
+    x = bm.random.random((16, num_in)) < 0.3
+    y = f2(x.astype(float))
+    self.assertTrue(y.shape == (16, num_out))
+    self.assertTrue(bm.allclose(y, f1(x.astype(float)), atol=1e-5))
+    self.assertTrue(bm.allclose(y, f3(x), atol=1e-5))
+    x = bm.random.random((num_in,)) < 0.3
+    y = f3(x)
+    self.assertTrue(y.shape == (num_out,))
+    self.assertTrue(bm.allclose(y, f1(x.astype(float)), atol=1e-5))
+    bm.clear_buffer_memory()
+
+  @parameterized.product(
+    conn=[
+      bp.conn.GridFour(),
+      bp.conn.GridEight(include_self=True),
+      bp.conn.GridN(N=2),
+    ],
+    size=[(10,), (6, 7), (4, 5, 3)],
+    periodic_boundary=[True, False],
+  )
+  def test_GridLinear(self, conn, size, periodic_boundary):
+    bm.random.seed()
+    conn.periodic_boundary = periodic_boundary
+    conn = conn(size, size)
+    num = int(np.prod(size))
+    f1 = bp.dnn.CSRLinear(conn, weight=0.5)
+    f2 = bp.dnn.GridLinear(conn, weight=0.5)
+    x = bm.random.random((16, num))
+    y = f2(x)
+    self.assertTrue(y.shape == (16, num))
+    self.assertTrue(bm.allclose(y, f1(x), atol=1e-5))
+    x = bm.random.random((num,)) < 0.3
+    self.assertTrue(bm.allclose(f2(x), f1(x.astype(float)), atol=1e-5))
+
+    # heterogeneous weights of the offsets
+    offsets = conn.build_stencil()
+    weight = bm.random.rand(len(offsets))
+    pre_ids = np.stack(np.meshgrid(*[np.arange(s) for s in size], indexing='ij'), -1).reshape(num, len(size))
+    mat = np.zeros((num, num))
+    for i, offset in enumerate(offsets):
+      post_ids = pre_ids + offset
+      if periodic_boundary:
+        post_ids = post_ids % np.asarray(size)
+        valid = np.ones(num, dtype=bool)
+      else:
+        valid = np.all((post_ids >= 0) & (post_ids < np.asarray(size)), axis=1)
+      post_ids = np.ravel_multi_index(tuple(post_ids[valid].T), size)
+      np.add.at(mat, (np.arange(num)[valid], post_ids), bm.as_numpy(weight)[i])
+    f3 = bp.dnn.GridLinear(conn, weight=weight)
+    x = bm.random.random((3, num))
+    self.assertTrue(bm.allclose(f3(x), x @ mat, atol=1e-5))
+    bm.clear_buffer_memory()
+
   @parameterized.product(
     prob=[0.1],
     weight=[0.01],
@@ -219,5 +295,61 @@ class TestLinear(parameterized.TestCase):
     bm.clear_buffer_memory()
 
 
+_SHARDED_CSR_SCRIPT = """
+import os
+os.environ['XLA_FLAGS'] = '--xla_force_host_platform_device_count=4'
+import jax
+import numpy as np
+import brainpy as bp
+import brainpy.math as bm
+
+for transpose in [True, False]:
+  for num_post in [200, 202]:
+    indices, indptr = bp.conn.FixedProb(0.1, pre=100, post=num_post, seed=1).require('csr')
+    conn = bp.conn.CSRConn(indices, indptr)(100, num_post)
+    weight = np.random.rand(indices.size).astype(np.float32)
+    num_in = 100 if transpose else num_post
+    sharding = [None, bm.sharding.NEU_AXIS] if transpose else [bm.sharding.NEU_AXIS, None]
+    layers = []
+    with bm.sharding.device_mesh(jax.devices(), [bm.sharding.NEU_AXIS]):
+      for w in [1.5, weight]:
+        for cls in [bp.dnn.EventCSRLinear, bp.dnn.CSRLinear]:
+          f1 = cls(conn, weight=w, transpose=transpose)
+          f2 = cls(conn, weight=w, transpose=transpose, sharding=sharding)
+          assert f2._num_shard == 4
+          x = bm.random.rand(num_in) < 0.2
+          if cls is bp.dnn.CSRLinear:
+            x = x.astype(float)
+          assert np.allclose(f1(x), bm.jit(f2)(x), atol=1e-5)
+          xs = bm.random.rand(3, num_in) < 0.2
+          if cls is bp.dnn.CSRLinear:
+            xs = xs.astype(float)
+          assert np.allclose(f1(xs), f2(xs), atol=1e-5)
+          layers.append((f1, f2, x, xs))
+    # the sharded layers can be called outside the mesh context
+    for f1, f2, x, xs in layers:
+      assert np.allclose(f1(x), bm.jit(f2)(x), atol=1e-5)
+      assert np.allclose(f1(xs), f2(xs), atol=1e-5)
+print('OK')
+"""
+
+
+class TestShardedCSRLinear(parameterized.TestCase):
+  def test_single_device(self):
+    conn = bp.conn.FixedProb(0.1, pre=100, post=100)
+    with bm.sharding.device_mesh(jax.devices()[:1], [bm.sharding.NEU_AXIS]):
+      f = bp.dnn.EventCSRLinear(conn, weight=1., sharding=[None, bm.sharding.NEU_AXIS])
+      self.assertIsNone(f._mesh_axis)
+      with self.assertRaises(ValueError):
+        bp.dnn.EventCSRLinear(conn, weight=1., sharding=[bm.sharding.NEU_AXIS, None])
+    bm.clear_buffer_memory()
+
+  def test_multiple_devices(self):
+    out = subprocess.run([sys.executable, '-c', textwrap.dedent(_SHARDED_CSR_SCRIPT)],
+                         capture_output=True, text=True)
+    self.assertEqual(out.returncode, 0, out.stderr[-2000:])
+    self.assertEqual(out.stdout.strip().splitlines()[-1], 'OK')
+
+
 if __name__ == '__main__':
   absltest.main()
@@ -22,3 +22,41 @@ class IonChaDyn(Dynamic):
   """Ion Channel Dynamics."""
   pass
 
+
+class _ChannelPlan(object):
+  """Resolve the children ion channels of a container once.
+
+  The resolved plan is cached, and it is rebuilt only when an
+  :py:class:`~.IonChaDyn` is attached to or deleted from the attributes,
+  or the ``children`` of the container are changed (including replacing
+  a child with another one).
+  """
+
+  def _resolve_plan(self):
+    raise NotImplementedError
+
+  def _get_plan(self):
+    # The children are referenced by the cached plan, so that
+    # their identities can not be reused by other objects.
+    key = tuple((k, id(v)) for k, v in self.children.items())
+    plan = self.__dict__.get('_plan_cache', None)
+    if plan is None or plan[0] != key:
+      plan = (key, self._resolve_plan())
+      self.__dict__['_plan_cache'] = plan
+    return plan[1]
+
+  def _clear_plan(self):
+    self.__dict__.pop('_plan_cache', None)
+
+  def _find_channels(self):
+    return tuple(self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values())
+
+  def __setattr__(self, key, value):
+    if isinstance(value, IonChaDyn) or isinstance(self.__dict__.get(key, None), IonChaDyn):
+      self._clear_plan()
+    super().__setattr__(key, value)
+
+  def __delattr__(self, key):
+    if isinstance(self.__dict__.get(key, None), IonChaDyn):
+      self._clear_plan()
+    super().__delattr__(key)
@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import inspect
+from typing import Sequence, Tuple, Optional
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+import brainpy.math as bm
 from brainpy._src.dyn.base import IonChaDyn
 from brainpy._src.mixin import TreeNode
 from brainpy._src.dyn.neurons.hh import HHTypedNeuron
@@ -9,12 +17,65 @@ __all__ = [
 ]
 
 
+class _RateTable(object):
+  """A voltage-indexed lookup table of one gating-rate function.
+
+  Inside ``[V_min, V_max]`` the rate is linearly interpolated between
+  the precomputed grid points. The voltages outside the range are clamped
+  into the range, or, if ``fallback=True``, the original analytic function
+  is evaluated for them when any voltage falls outside the range.
+  """
+
+  def __init__(self, fun, V_min: float, V_max: float, dV: float, fallback: bool = False):
+    self.fun = fun
+    self.fallback = fallback
+    self.V_min = V_min
+    self.dV = dV
+    num = int(np.ceil((V_max - V_min) / dV)) + 1
+    self.V_max = V_min + (num - 1) * dV
+    grid = V_min + np.arange(num) * dV
+    # The rate at one single voltage must be a scalar. Otherwise, the rate function
+    # depends on the parameters which are heterogeneous across the neurons.
+    rate_shape = jnp.shape(fun(jnp.asarray(V_min, dtype=bm.float_)))
+    if int(np.prod(rate_shape)) != 1:
+      raise ValueError(f'The rate function {fun} can not be tabulated, because it depends on '
+                       f'heterogeneous parameters: the rate at one voltage has the shape '
+                       f'of {rate_shape}, while a scalar is expected.')
+    table = jnp.reshape(bm.as_jax(fun(jnp.asarray(grid, dtype=bm.float_))), (num,))
+    # removable singularities (like "x / (1 - exp(-x))" at x = 0)
+    # are evaluated at the slightly shifted voltage
+    shifted = bm.as_jax(fun(jnp.asarray(grid + dV * 1e-3, dtype=bm.float_)))
+    self.table = jnp.where(jnp.isfinite(table), table, shifted)
+
+  def interpolate(self, V):
+    pos = (V - self.V_min) / self.dV
+    i = jnp.clip(jnp.floor(pos).astype(jnp.int32), 0, self.table.shape[0] - 2)
+    frac = pos - i
+    return self.table[i] * (1. - frac) + self.table[i + 1] * frac
+
+  def __call__(self, V):
+    V = bm.as_jax(V)
+    if not self.fallback:
+      return self.interpolate(jnp.clip(V, self.V_min, self.V_max))
+    inside = (V >= self.V_min) & (V <= self.V_max)
+    return jax.lax.cond(
+      jnp.all(inside),
+      self.interpolate,
+      lambda v: jnp.where(inside, self.interpolate(v), bm.as_jax(self.fun(v))),
+      V
+    )
+
+
 class IonChannel(IonChaDyn, TreeNode):
   """Base class for ion channels."""
 
   '''The type of the master object.'''
   master_type = HHTypedNeuron
 
+  '''Whether ``update(V)`` only integrates the states with ``self.integral``,
+  so that the update can be fused by the master neuron group.'''
+  _fusible = False
+
   def update(self, *args, **kwargs):
     raise NotImplementedError('Must be implemented by the subclass.')
 
@@ -27,5 +88,76 @@ class IonChannel(IonChaDyn, TreeNode):
   def clear_input(self):
     pass
 
+  def tabulate_rates(
+      self,
+      V_range: Tuple[float, float] = (-120., 80.),
+      resolution: float = 0.01,
+      names: Optional[Sequence[str]] = None,
+      fallback: bool = False,
+  ):
+    """Replace the voltage-dependent rate functions with the lookup tables.
+
+    Each rate function (``f_p_alpha``, ``f_p_beta``, ``f_p_inf``, ``f_p_tau``, etc.)
+    is evaluated once over the voltage grid of ``V_range`` with the step of
+    ``resolution``. In the following steps, the rate is linearly interpolated
+    from the table, and the voltages outside of ``V_range`` are clamped into
+    the range. This avoids the transcendental functions evaluated at every
+    step for every neuron.
+
+    Note that only the rate functions whose parameters are homogeneous
+    across the neurons can be tabulated.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    V_range: tuple of float
+      The voltage range (mV) of the table.
+    resolution: float
+      The voltage step (mV) of the table.
+    names: sequence of str, optional
+      The names of the rate functions to tabulate. Default is all the
+      methods whose names start with ``f_`` and which only receive ``V``.
+    fallback: bool
+      Whether to evaluate the analytic functions when the voltages are
+      outside of ``V_range``, rather than clamping them into the range.
+      The range check needs a reduction over all neurons at each call,
+      which can cost more than the analytic functions. Therefore, it is
+      only recommended when ``V_range`` can not cover the simulated dynamics.
+      Default is ``False``.
+
+    Returns
+    -------
+    channel: IonChannel
+      The channel itself.
+    """
+    V_min, V_max = V_range
+    if V_max <= V_min:
+      raise ValueError(f'"V_range" should be (V_min, V_max) with V_min < V_max, but we got {V_range}.')
+    if resolution <= 0.:
+      raise ValueError(f'"resolution" must be positive, but we got {resolution}.')
+    if names is None:
+      names = []
+      for key in dir(type(self)):
+        if not key.startswith('f_'):
+          continue
+        fun = getattr(type(self), key)
+        if not inspect.isfunction(fun):
+          continue
+        if list(inspect.signature(fun).parameters) == ['self', 'V']:
+          names.append(key)
+    tables = dict()
+    for key in names:
+      fun = getattr(self, key)
+      if isinstance(fun, _RateTable):
+        fun = fun.fun
+      try:
+        tables[key] = _RateTable(fun, V_min, V_max, resolution, fallback)
+      except NotImplementedError:
+        continue
+    for key, table in tables.items():
+      setattr(self, key, table)
+    return self
+
   def __repr__(self):
     return f'{self.name}(size={self.size})'
@@ -56,6 +56,7 @@ class Ih_HM1992(IonChannel):
   """
 
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -1047,6 +1047,7 @@ class _IK_p4_markov(PotassiumChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -1364,6 +1365,7 @@ class _IKA_p4q_ss(PotassiumChannel):
          neurons." Journal of neurophysiology 66.4 (1991): 1316-1328.
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -1659,6 +1661,7 @@ class _IKK2_pq_ss(PotassiumChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -1946,6 +1949,7 @@ class IKNI_Ya1989(PotassiumChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
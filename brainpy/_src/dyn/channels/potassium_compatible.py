@@ -63,6 +63,7 @@ class _IK_p4_markov(IonChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -380,6 +381,7 @@ class _IKA_p4q_ss(IonChannel):
          neurons." Journal of neurophysiology 66.4 (1991): 1316-1328.
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -675,6 +677,7 @@ class _IKK2_pq_ss(IonChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -962,6 +965,7 @@ class IKNI_Ya1989(IonChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -52,6 +52,7 @@ class _INa_p3q_markov(IonChannel):
 
   """
   master_type = HHTypedNeuron
+  _fusible = True
 
   def __init__(
       self,
@@ -29,3 +29,46 @@ class Test_Na(parameterized.TestCase):
     self.assertTupleEqual(runner.mon['INa_2.q'].shape, (100, 1))
     self.assertTupleEqual(runner.mon['INa_3.p'].shape, (100, 1))
     self.assertTupleEqual(runner.mon['INa_3.q'].shape, (100, 1))
+
+  def test_tabulate_rates(self):
+    class Neuron(bp.dyn.CondNeuGroup):
+      def __init__(self, size, tabulate):
+        super().__init__(size, V_initializer=bp.init.Constant(-65.))
+        self.INa = bp.dyn.INa_Ba2002(size)
+        self.IK = bp.dyn.IKDR_Ba2002(size)
+        if tabulate:
+          self.INa.tabulate_rates()
+          self.IK.tabulate_rates(V_range=(-100., 60.), resolution=0.05)
+
+    res = []
+    for tabulate in [False, True]:
+      model = Neuron(10, tabulate)
+      runner = bp.DSRunner(model, monitors=['V', 'INa.p'], progress_bar=False,
+                           inputs=('input', bm.linspace(0., 10., 10)))
+      runner.run(20.)
+      res.append(runner.mon)
+    self.assertTrue(bm.allclose(res[0]['V'], res[1]['V'], atol=1e-2))
+    self.assertTrue(bm.allclose(res[0]['INa.p'], res[1]['INa.p'], atol=1e-4))
+
+  def test_tabulate_rates_fallback(self):
+    channel = bp.dyn.INa_HH1952(5)
+    V = bm.asarray([-200., -65., -50.005, 0., 150.])
+    analytic = [channel.f_p_alpha(V), channel.f_q_beta(V)]
+    channel.tabulate_rates(V_range=(-100., 50.), fallback=True)
+    tabulated = [channel.f_p_alpha(V), channel.f_q_beta(V)]
+    for a, b in zip(analytic, tabulated):
+      self.assertTrue(bm.allclose(a, b, rtol=1e-3, atol=1e-6))
+
+  def test_tabulate_rates_clamp(self):
+    channel = bp.dyn.INa_HH1952(3)
+    channel.tabulate_rates(V_range=(-100., 50.))
+    self.assertTrue(bm.allclose(channel.f_p_alpha(bm.asarray([-200., 50., 100.])),
+                                channel.f_p_alpha.fun(bm.asarray([-100., 50., 50.])),
+                                rtol=1e-4))
+
+  def test_tabulate_rates_heterogeneous(self):
+    # the number of neurons is different from, or the same as, the table size
+    for size in [7, 301]:
+      channel = bp.dyn.INa_HH1952(size, V_sh=bm.linspace(-50., -40., size))
+      with self.assertRaisesRegex(ValueError, 'heterogeneous'):
+        channel.tabulate_rates(V_range=(-100., 50.), resolution=0.5)
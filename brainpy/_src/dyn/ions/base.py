@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union, Optional, Dict, Sequence, Callable
+from typing import Union, Optional, Dict, Sequence, Callable, Tuple
 
 import brainpy.math as bm
-from brainpy._src.dyn.base import IonChaDyn
+from brainpy._src.dyn.base import IonChaDyn, _ChannelPlan
 from brainpy._src.dyn.neurons.hh import HHTypedNeuron
 from brainpy._src.mixin import Container, TreeNode, _JointGenericAlias
 from brainpy.types import Shape
@@ -15,7 +15,7 @@ __all__ = [
 ]
 
 
-class MixIons(IonChaDyn, Container, TreeNode):
+class MixIons(_ChannelPlan, IonChaDyn, Container, TreeNode):
   """Mixing Ions.
 
   Args:
@@ -39,12 +39,15 @@ class MixIons(IonChaDyn, Container, TreeNode):
     for k, v in channels.items():
       self.add_elem(k=v)
 
-  def update(self, V):
-    nodes = tuple(self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values())
+  def _resolve_plan(self):
+    nodes = self._find_channels()
     self.check_hierarchies(self._ion_classes, *nodes)
-    for node in nodes:
-      infos = tuple([self._get_imp(root).pack_info() for root in node.master_type.__args__])
-      node.update(V, *infos)
+    return tuple([(node, tuple([self._get_imp(root) for root in node.master_type.__args__]))
+                  for node in nodes])
+
+  def update(self, V):
+    for node, ions in self._get_plan():
+      node.update(V, *[ion.pack_info() for ion in ions])
 
   def current(self, V):
     """Generate ion channel current.
@@ -55,24 +58,14 @@ class MixIons(IonChaDyn, Container, TreeNode):
     Returns:
       Current.
     """
-    nodes = tuple(self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values())
-    self.check_hierarchies(self._ion_classes, *nodes)
-
-    if len(nodes) == 0:
-      return 0.
-    else:
-      current = 0.
-      for node in nodes:
-        infos = tuple([self._get_imp(root).pack_info() for root in node.master_type.__args__])
-        current = current + node.current(V, *infos)
-      return current
+    current = 0.
+    for node, ions in self._get_plan():
+      current = current + node.current(V, *[ion.pack_info() for ion in ions])
+    return current
 
   def reset_state(self, V, batch_size=None):
-    nodes = tuple(self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values())
-    self.check_hierarchies(self._ion_classes, *nodes)
-    for node in nodes:
-      infos = tuple([self._get_imp(root).pack_info() for root in node.master_type.__args__])
-      node.reset_state(V, *infos, batch_size)
+    for node, ions in self._get_plan():
+      node.reset_state(V, *[ion.pack_info() for ion in ions], batch_size)
 
   def check_hierarchy(self, roots, leaf):
     # 'master_type' should be a brainpy.mixin.JointType
@@ -132,7 +125,7 @@ def mix_ions(*ions) -> MixIons:
   return MixIons(*ions)
 
 
-class Ion(IonChaDyn, Container, TreeNode):
+class Ion(_ChannelPlan, IonChaDyn, Container, TreeNode):
   """The brainpy_object calcium dynamics.
 
   Args:
@@ -166,8 +159,18 @@ class Ion(IonChaDyn, Container, TreeNode):
     self.children = bm.node_dict(self.format_elements(IonChaDyn, **channels))
     self.external: Dict[str, Callable] = dict()  # not found by `.nodes()` or `.vars()`
 
+  @property
+  def channels(self) -> Tuple[IonChaDyn, ...]:
+    """The ion channels of this ion."""
+    return self._get_plan()
+
+  def _resolve_plan(self):
+    nodes = self._find_channels()
+    self.check_hierarchies(type(self), *nodes)
+    return nodes
+
   def update(self, V):
-    for node in self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values():
+    for node in self.channels:
       node.update(V, self.C, self.E)
 
   def current(self, V, C=None, E=None, external: bool = False):
@@ -184,22 +187,16 @@ class Ion(IonChaDyn, Container, TreeNode):
     """
     C = self.C if (C is None) else C
     E = self.E if (E is None) else E
-    nodes = tuple(self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values())
-    self.check_hierarchies(type(self), *nodes)
-
     current = 0.
-    if len(nodes) > 0:
-      for node in nodes:
-        current = current + node.current(V, C, E)
+    for node in self.channels:
+      current = current + node.current(V, C, E)
     if external:
       for key, node in self.external.items():
         current = current + node(V, C, E)
     return current
 
   def reset_state(self, V, batch_size=None):
-    nodes = tuple(self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values())
-    self.check_hierarchies(type(self), *nodes)
-    for node in nodes:
+    for node in self.channels:
       node.reset_state(V, self.C, self.E, batch_size)
 
   def pack_info(self, C=None, E=None) -> Dict:
@@ -4,7 +4,6 @@ from typing import Union, Callable, Optional
 
 import brainpy.math as bm
 from brainpy._src.context import share
-from brainpy._src.dyn.base import IonChaDyn
 from brainpy._src.initialize import OneInit, Initializer, parameter, variable
 from brainpy._src.integrators.ode.generic import odeint
 from brainpy.types import Shape, ArrayType
@@ -53,7 +52,7 @@ class CalciumFixed(Calcium):
   def reset_state(self, V, C_Ca=None, E_Ca=None, batch_size=None):
     C_Ca = self.C if C_Ca is None else C_Ca
     E_Ca = self.E if E_Ca is None else E_Ca
-    for node in self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values():
+    for node in self.channels:
       node.reset_state(V, C_Ca, E_Ca, batch_size=batch_size)
 
 
@@ -119,11 +118,11 @@ class CalciumDyna(Calcium):
   def reset_state(self, V, C_Ca=None, E_Ca=None, batch_size=None):
     self.C.value = variable(self._C_initializer, batch_size, self.varshape) if (C_Ca is None) else C_Ca
     self.E.value = self._reversal_potential(self.C)
-    for node in self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values():
+    for node in self.channels:
       node.reset(V, self.C, self.E, batch_size=batch_size)
 
   def update(self, V):
-    for node in self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values():
+    for node in self.channels:
       node.update(V, self.C.value, self.E.value)
     self.C.value = self.integral(self.C.value, share['t'], V, share['dt'])
     self.E.value = self._reversal_potential(self.C.value)
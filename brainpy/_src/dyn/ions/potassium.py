@@ -1,7 +1,6 @@
 from typing import Union, Callable, Optional
 
 import brainpy.math as bm
-from brainpy._src.dyn.base import IonChaDyn
 from brainpy._src.initialize import Initializer
 from brainpy.types import Shape, ArrayType
 from .base import Ion
@@ -47,7 +46,5 @@ class PotassiumFixed(Potassium):
   def reset_state(self, V, C=None, E=None, batch_size=None):
     C = self.C if C is None else C
     E = self.E if E is None else E
-    nodes = self.nodes(level=1, include_self=False).unique().subset(IonChaDyn).values()
-    self.check_hierarchies(type(self), *tuple(nodes))
-    for node in nodes:
+    for node in self.channels:
       node.reset_state(V, C, E, batch_size)
@@ -1,13 +1,16 @@
+import inspect
 from functools import partial
-from typing import Any, Sequence
+from typing import Any, Sequence, Tuple
 from typing import Union, Callable, Optional
 
 import brainpy.math as bm
 from brainpy._src.context import share
-from brainpy._src.dyn.base import NeuDyn, IonChaDyn
+from brainpy._src.dyn.base import NeuDyn, IonChaDyn, _ChannelPlan
 from brainpy._src.initialize import OneInit
 from brainpy._src.initialize import Uniform, variable_, noise as init_noise
 from brainpy._src.integrators import JointEq
+from brainpy._src.integrators.joint_eq import _get_args
+from brainpy._src.integrators.ode.base import ODEIntegrator
 from brainpy._src.integrators import odeint, sdeint
 from brainpy._src.mixin import Container, TreeNode
 from brainpy._src.types import ArrayType
@@ -31,7 +34,43 @@ class HHTypedNeuron(NeuDyn):
   pass
 
 
-class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
+def _fusible_eqs(channel):
+  """Get the derivative functions of a channel whose ``update(V)`` only
+  integrates its states with ``channel.integral``, otherwise ``None``."""
+  if not getattr(channel, '_fusible', False):
+    return None
+  # the "update()" should not be overridden by the subclass
+  owner = next(cls for cls in type(channel).__mro__ if '_fusible' in cls.__dict__)
+  if type(channel).update is not owner.update:
+    return None
+  integral = getattr(channel, 'integral', None)
+  if not isinstance(integral, ODEIntegrator):
+    return None
+  eqs = integral.f.eqs if isinstance(integral.f, JointEq) else [integral.f]
+  for eq in eqs:
+    vars_, args, kwargs = _get_args(eq)
+    if len(kwargs) or args[len(vars_) + 1:] != ['V']:
+      return None
+    if not all(isinstance(getattr(channel, v, None), bm.Variable) for v in vars_):
+      return None
+  return eqs
+
+
+def _rename_vars(eq, prefix):
+  """Rename the state variables of a derivative function with a prefix."""
+  vars_, args, _ = _get_args(eq)
+  names = [(prefix + a if a in vars_ else a) for a in args]
+  signature = inspect.Signature([inspect.Parameter(a, inspect.Parameter.POSITIONAL_OR_KEYWORD) for a in names])
+
+  def f(*args, **kwargs):
+    bound = signature.bind(*args, **kwargs).arguments
+    return eq(*[bound[a] for a in names])
+
+  f.__signature__ = signature
+  return f
+
+
+class CondNeuGroupLTC(_ChannelPlan, HHTypedNeuron, Container, TreeNode):
   r"""Base class to model conductance-based neuron group.
 
   The standard formulation for a conductance-based model is given as
@@ -71,6 +110,13 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
     The numerical integration method.
   name : optional, str
     The neuron group name.
+  fuse_channels: bool
+    Integrate the gating variables of all the fusible channels in one
+    :py:class:`~.JointEq`, rather than calling the channels one by one.
+    The channels are fusible if their states only depend on the membrane
+    potential. Default is False.
+
+    .. versionadded:: 2.6.1
 
   """
 
@@ -89,6 +135,7 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
       init_var: bool = True,
       input_var: bool = True,
       spk_type: Optional[type] = None,
+      fuse_channels: bool = False,
       **channels
   ):
     super().__init__(size, keep_size=keep_size, mode=mode, name=name, )
@@ -103,6 +150,7 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
     self.V_th = V_th
     self.noise = init_noise(noise, self.varshape, num_vars=1)
     self._V_initializer = V_initializer
+    self.fuse_channels = fuse_channels
     self.spk_type = ((bm.float_ if isinstance(self.mode, bm.TrainingMode) else bm.bool)
                      if (spk_type is None) else spk_type)
 
@@ -115,11 +163,44 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
     if init_var:
       self.reset_state(self.mode)
 
+  @property
+  def channels(self) -> Tuple[IonChaDyn, ...]:
+    """The ion channels (and ions) of this neuron group."""
+    return self._get_plan()[0]
+
+  def _resolve_plan(self):
+    channels = self._find_channels()
+    # check whether the children channels have the correct parents.
+    self.check_hierarchies(self.__class__, *channels)
+    if not self.fuse_channels:
+      return channels, channels, ()
+
+    # group the fusible channels by their integrators
+    groups = dict()
+    others = []
+    for ch in channels:
+      eqs = _fusible_eqs(ch)
+      if eqs is None:
+        others.append(ch)
+      else:
+        groups.setdefault((type(ch.integral), ch.integral.dt), []).append((ch, eqs))
+    fused = []
+    for (integrator, dt), members in groups.items():
+      eqs, states = [], []
+      for ch, ch_eqs in members:
+        for eq in ch_eqs:
+          prefix = f'c{len(states)}_'
+          vars_ = _get_args(eq)[0]
+          eqs.append(_rename_vars(eq, prefix))
+          states.extend([getattr(ch, v) for v in vars_])
+      fused.append((integrator(f=JointEq(eqs), dt=dt), tuple(states)))
+    return channels, tuple(others), tuple(fused)
+
   def derivative(self, V, t, I):
     # synapses
     I = self.sum_current_inputs(V, init=I)
     # channels
-    for ch in self.nodes(level=1, include_self=False).subset(IonChaDyn).unique().values():
+    for ch in self.channels:
       I = I + ch.current(V)
     return I / self.C
 
@@ -128,7 +209,7 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
     self.spike = variable_(partial(bm.zeros, dtype=self.spk_type), self.varshape, batch_size)
     if self.input_var:
       self.input = variable_(bm.zeros, self.varshape, batch_size)
-    for channel in self.nodes(level=1, include_self=False).subset(IonChaDyn).unique().values():
+    for channel in self.channels:
       channel.reset_state(self.V.value, batch_size=batch_size)
 
   def update(self, x=None):
@@ -142,13 +223,15 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
     # integral
     V = self.integral(self.V.value, share['t'], x, share['dt']) + self.sum_delta_inputs()
 
-    # check whether the children channels have the correct parents.
-    channels = self.nodes(level=1, include_self=False).subset(IonChaDyn).unique()
-    self.check_hierarchies(self.__class__, **channels)
-
     # update channels
-    for node in channels.values():
+    _, others, fused = self._get_plan()
+    for node in others:
       node(self.V.value)
+    for integral, states in fused:
+      rets = integral(*[st.value for st in states], share['t'], self.V.value, share['dt'])
+      rets = rets if len(states) > 1 else [rets]
+      for st, r in zip(states, rets):
+        st.value = r
 
     # update variables
     if self.spike.dtype == bool:
@@ -169,7 +252,7 @@ class CondNeuGroupLTC(HHTypedNeuron, Container, TreeNode):
 
 class CondNeuGroup(CondNeuGroupLTC):
   def derivative(self, V, t, I):
-    for ch in self.nodes(level=1, include_self=False).subset(IonChaDyn).unique().values():
+    for ch in self.channels:
       I = I + ch.current(V)
     return I / self.C
 
@@ -139,3 +139,52 @@ class Test_HH(parameterized.TestCase):
     self.assertTupleEqual(runner.mon['n'].shape, (1, 100, 10))
     self.assertTupleEqual(runner.mon['h'].shape, (1, 100, 10))
     self.assertTupleEqual(runner.mon['spike'].shape, (1, 100, 10))
+
+
+class Test_CondNeuGroup(parameterized.TestCase):
+  def _model(self, fuse_channels):
+    class Neuron(bp.dyn.CondNeuGroup):
+      def __init__(self, size):
+        super().__init__(size, V_initializer=bp.init.Constant(-65.), fuse_channels=fuse_channels)
+        self.INa = bp.dyn.INa_HH1952(size, E=50., g_max=120.)
+        self.IK = bp.dyn.IK_HH1952(size, E=-77., g_max=36.)
+        self.IKA = bp.dyn.IKA1_HM1992(size)
+        self.IL = bp.dyn.IL(size, E=-54.387, g_max=0.03)
+
+    return Neuron(10)
+
+  def test_channels_are_cached(self):
+    model = self._model(False)
+    channels = model.channels
+    self.assertEqual(len(channels), 4)
+    self.assertIs(model.channels, channels)
+    model.IH = bp.dyn.Ih_HM1992(10)
+    self.assertEqual(len(model.channels), 5)
+
+    # replacing a channel with the same number of channels
+    IL = bp.dyn.IL(10, E=-60., g_max=0.1)
+    model.IL = IL
+    self.assertEqual(len(model.channels), 5)
+    self.assertIn(IL, model.channels)
+
+  def test_replace_children_channel(self):
+    model = bp.dyn.CondNeuGroupLTC(10, IL=bp.dyn.IL(10))
+    self.assertEqual(len(model.channels), 1)
+    IL = bp.dyn.IL(10, E=-60., g_max=0.1)
+    model.children['IL'] = IL
+    self.assertEqual(model.channels, (IL,))
+
+  def test_fuse_channels(self):
+    res = []
+    for fuse in [False, True]:
+      model = self._model(fuse)
+      runner = bp.DSRunner(model, monitors=['V', 'INa.p', 'IKA.q'], progress_bar=False,
+                           inputs=('input', bm.linspace(0., 10., 10)))
+      runner.run(20.)
+      res.append(runner.mon)
+    _, others, fused = model._get_plan()
+    self.assertEqual(len(others), 1)  # IL
+    self.assertEqual(len(fused), 1)
+    self.assertEqual(len(fused[0][1]), 5)  # p, q, p, p, q
+    for key in ['V', 'INa.p', 'IKA.q']:
+      self.assertTrue(bm.allclose(res[0][key], res[1][key]))
@@ -219,7 +219,11 @@ class PoissonGroup(NeuDyn):
     self.reset_state(self.mode)
 
   def update(self):
-    spikes = bm.random.rand_like(self.spike) <= (self.freqs * share['dt'] / 1000.)
+    # keep the probabilities concrete when possible, so that
+    # the low firing rates can be sampled by the sparse events
+    with jax.ensure_compile_time_eval():
+      prob = self.freqs * share['dt'] / 1000.
+    spikes = bm.random.bernoulli(prob, self.spike.shape, key=bm.random.module_key(self))
     spikes = bm.asarray(spikes, dtype=self.spk_type)
     # spikes = bm.sharding.partition(spikes, self.spike.sharding)
     self.spike.value = spikes
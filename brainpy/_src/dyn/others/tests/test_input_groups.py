@@ -26,3 +26,15 @@ class Test_input_Group(parameterized.TestCase):
     runner.run(30.)
     self.assertTupleEqual(runner.mon['spike'].shape, (300, 2))
     bp.math.clear_buffer_memory()
+
+  def test_PoissonGroup_low_rate(self):
+    bp.math.random.seed(1)
+    model = input.PoissonGroup(size=20000, freqs=bp.math.linspace(0., 20., 20000))
+    runner = bp.DSRunner(model,
+                         monitors=['spike'],
+                         progress_bar=False)
+    runner.run(100.)
+    rates = runner.mon['spike'].mean(axis=0) * 1e3 / bp.math.get_dt()
+    self.assertLess(abs(rates[:10000].mean() - 5.), 0.5)
+    self.assertLess(abs(rates[10000:].mean() - 15.), 0.5)
+    bp.math.clear_buffer_memory()
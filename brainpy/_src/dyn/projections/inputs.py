@@ -6,6 +6,7 @@ from brainpy import check, math as bm
 from brainpy._src.context import share
 from brainpy._src.dynsys import Dynamic
 from brainpy._src.dynsys import Projection
+from brainpy._src.inputs.generators import InputGenerator
 from brainpy._src.mixin import SupportAutoDelay
 from brainpy.types import Shape
 
@@ -73,6 +74,11 @@ class InputVar(Dynamic, SupportAutoDelay):
       bp.visualize.raster_plot(runner.mon.ts, runner.mon['I.spike'],
                                title='Spikes of Inhibitory Neurons', show=True)
 
+  An :py:class:`~.InputGenerator` can also be given by ``generator``, whose value at
+  the current step is added to the input without materializing the whole input::
+
+      self.Ein = bp.dyn.InputVar(self.E.varshape,
+                                 generator=bp.inputs.SectionInput([0., 20.], [100., 900.]))
 
   """
 
@@ -83,23 +89,32 @@ class InputVar(Dynamic, SupportAutoDelay):
       sharding: Optional[Any] = None,
       name: Optional[str] = None,
       mode: Optional[bm.Mode] = None,
-      method: str = 'exp_auto'
+      method: str = 'exp_auto',
+      generator: Optional[InputGenerator] = None,
   ):
     super().__init__(size=size, keep_size=keep_size, sharding=sharding, name=name, mode=mode, method=method)
 
+    if generator is not None and not isinstance(generator, InputGenerator):
+      raise TypeError(f'"generator" must be an instance of {InputGenerator.__name__}, but we got {generator}.')
+    self.generator = generator
     self.reset_state(self.mode)
 
   def reset_state(self, batch_or_mode=None, **kwargs):
     self.input = self.init_variable(bm.zeros, batch_or_mode)
+    if self.generator is not None:
+      self.generator.reset_state()
 
   def update(self, *args, **kwargs):
-    return self.input.value
+    if self.generator is None:
+      return self.input.value
+    return self.input.value + self.generator(share['i'])
 
   def return_info(self):
     return self.input
 
   def clear_input(self, *args, **kwargs):
-    self.reset_state(self.mode)
+    # the states of the generator are kept
+    self.input = self.init_variable(bm.zeros, self.mode)
 
 
 class PoissonInput(Projection):
@@ -148,17 +163,18 @@ class PoissonInput(Projection):
     p = self.freq * share['dt'] / 1e3
     a = self.num_input * p
     b = self.num_input * (1 - p)
+    key = bm.random.module_key(self)
 
     if isinstance(share['dt'], numbers.Number):  # dt is not traced
       if (a > 5) and (b > 5):
-        inp = bm.random.normal(a, b * p, self.target_var.shape)
+        inp = bm.random.normal(a, b * p, self.target_var.shape, key=key)
       else:
-        inp = bm.random.binomial(self.num_input, p, self.target_var.shape)
+        inp = bm.random.binomial(self.num_input, p, self.target_var.shape, key=key)
 
     else:  # dt is traced
       inp = bm.cond((a > 5) * (b > 5),
-                    lambda: bm.random.normal(a, b * p, self.target_var.shape),
-                    lambda: bm.random.binomial(self.num_input, p, self.target_var.shape))
+                    lambda: bm.random.normal(a, b * p, self.target_var.shape, key=key),
+                    lambda: bm.random.binomial(self.num_input, p, self.target_var.shape, key=key))
 
     # inp = bm.sharding.partition(inp, self.target_var.sharding)
     self.target_var += inp * self.weight
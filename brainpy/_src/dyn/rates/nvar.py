@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from itertools import combinations_with_replacement
-from typing import Union, Sequence, List, Optional
+from typing import Union, Sequence, List, Optional, Tuple
 
 import jax.numpy as jnp
 import numpy as np
@@ -34,6 +35,51 @@ def _comb(N, k):
     return 0
 
 
+@lru_cache(maxsize=None)
+def _triangle_positions(d: int, num_prev: int, starts: Tuple[int, ...]):
+  """The positions of the new monomials in the flattened ``(d, num_prev)`` outer product."""
+  mask = np.arange(num_prev)[None, :] >= np.asarray(starts)[:, None]
+  new_starts = np.concatenate([[0], np.cumsum(mask.sum(axis=1))])
+  return np.flatnonzero(mask).astype(np.int32), tuple(new_starts[:-1].tolist())
+
+
+def _monomials(linear_parts, orders: Sequence[int]) -> List:
+  """Generate the monomials of the given orders on the fly.
+
+  The monomials of each order are in the same order as
+  ``itertools.combinations_with_replacement``. They are built with the recurrence
+  that the monomials of order :math:`k` whose smallest index is :math:`i` are
+  :math:`x_i` multiplied by the monomials of order :math:`k-1` whose smallest
+  index is not less than :math:`i`. Therefore, each order only needs one outer
+  product and one gather with a 1D position vector, rather than the
+  ``(num_monomial, order)`` index table.
+
+  Parameters
+  ----------
+  linear_parts: ArrayType
+    The linear components, with the shape of ``(..., d)``.
+  orders: sequence of int
+    The orders of the monomials.
+
+  Returns
+  -------
+  monomials: list of ArrayType
+    The monomials of each order, with the shape of ``(..., C(d + order - 1, order))``.
+  """
+  d = linear_parts.shape[-1]
+  res = dict()
+  prev = linear_parts
+  starts = tuple(range(d))  # the position of the first monomial whose smallest index is "i"
+  for k in range(2, max(orders) + 1):
+    positions, new_starts = _triangle_positions(d, prev.shape[-1], starts)
+    outer = jnp.expand_dims(linear_parts, -1) * jnp.expand_dims(prev, -2)  # (..., d, num_prev)
+    prev = jnp.take(outer.reshape(outer.shape[:-2] + (-1,)), positions, axis=-1)
+    starts = new_starts
+    if k in orders:
+      res[k] = prev
+  return [res[k] for k in orders]
+
+
 class NVAR(Layer):
   """Nonlinear vector auto-regression (NVAR) node.
 
@@ -41,6 +87,10 @@ class NVAR(Layer):
 
   - it supports batch size,
   - it supports multiple orders,
+  - the monomials are generated on the fly, without the index tables of
+    the combinations,
+  - the sufficient statistics for the ridge regression can be accumulated
+    in time blocks (see :py:meth:`~.sufficient_statistics`).
 
   Parameters
   ----------
@@ -100,23 +150,26 @@ class NVAR(Layer):
 
     # linear dimension
     self.linear_dim = self.delay * num_in
-    # For each monomial created in the non-linear part, indices
-    # of the n components involved, n being the order of the
-    # monomials. Precompute them to improve efficiency.
-    self.comb_ids = []
-    for order in self.order:
-      assert order >= 2, f'"order" must be a integer >= 2, while we got {order}.'
-      idx = np.array(list(combinations_with_replacement(np.arange(self.linear_dim), order)))
-      self.comb_ids.append(jnp.asarray(idx))
     # number of non-linear components is (d + n - 1)! / (d - 1)! n!
     # i.e. number of all unique monomials of order n made from the
     # linear components.
-    self.nonlinear_dim = sum([len(ids) for ids in self.comb_ids])
+    self.nonlinear_dim = sum([_comb(self.linear_dim + order - 1, order) for order in self.order])
     # output dimension
     self.num_out = int(self.linear_dim + self.nonlinear_dim)
     if self.constant:
       self.num_out += 1
 
+  @property
+  def comb_ids(self) -> List:
+    """For each monomial created in the non-linear part, indices
+    of the n components involved, n being the order of the monomials.
+
+    .. note::
+       They are not used in the computation anymore, and are built on request.
+    """
+    return [jnp.asarray(np.array(list(combinations_with_replacement(np.arange(self.linear_dim), order))))
+            for order in self.order]
+
   def reset_state(self, batch_or_mode=None, **kwargs):
     """Reset the node state which depends on batch size."""
     self.idx[0] = 0
@@ -145,9 +198,9 @@ class NVAR(Layer):
         all_parts.append(constant)
       all_parts.append(linear_parts)
       # 3. Nonlinear part:
-      # select monomial terms and compute them
-      for ids in self.comb_ids:
-        all_parts.append(jnp.prod(linear_parts[:, ids], axis=2))
+      # generate monomial terms on the fly
+      if len(self.order):
+        all_parts.extend(_monomials(linear_parts, self.order))
 
     else:
       # 2. Linear part:
@@ -159,14 +212,80 @@ class NVAR(Layer):
         all_parts.append(constant)
       all_parts.append(linear_parts)
       # 3. Nonlinear part:
-      # select monomial terms and compute them
-      for ids in self.comb_ids:
-        all_parts.append(jnp.prod(linear_parts[ids], axis=1))
+      # generate monomial terms on the fly
+      if len(self.order):
+        all_parts.extend(_monomials(linear_parts, self.order))
 
     # 4. Finally
     self.idx.value = (self.idx + 1) % self.num_delay
     return jnp.concatenate(all_parts, axis=-1)
 
+  def sufficient_statistics(
+      self,
+      inputs,
+      targets,
+      block_size: int = 128,
+      reset_state: bool = True,
+  ) -> Tuple[jnp.ndarray, jnp.ndarray]:
+    r"""Accumulate the sufficient statistics for the ridge regression.
+
+    The features are generated block by block in time, and each block is
+    directly accumulated into :math:`X^T X` and :math:`X^T Y`, so that the
+    feature matrix :math:`X` with the shape of ``(num_time, num_out)`` is never
+    materialized. The readout weights can then be solved by
+    :math:`W = (X^T X + \alpha I)^{-1} X^T Y`.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    inputs: ArrayType
+      The input time series, with the shape of ``(num_time, num_in)``, or
+      ``(num_batch, num_time, num_in)`` for the batching mode.
+    targets: ArrayType
+      The target time series, with the shape of ``(num_time, num_target)``, or
+      ``(num_batch, num_time, num_target)`` for the batching mode.
+    block_size: int
+      The number of time steps in each block.
+    reset_state: bool
+      Whether to reset the delay states before the accumulation.
+
+    Returns
+    -------
+    stats: tuple of ArrayType
+      The :math:`X^T X` with the shape of ``(num_out, num_out)``, and
+      the :math:`X^T Y` with the shape of ``(num_out, num_target)``.
+    """
+    check.is_integer(block_size, 'block_size', min_bound=1)
+    inputs = bm.as_jax(inputs)
+    targets = bm.as_jax(targets)
+    batching = isinstance(self.mode, bm.BatchingMode)
+    if batching:
+      # time-major
+      inputs = jnp.moveaxis(inputs, 1, 0)
+      targets = jnp.moveaxis(targets, 1, 0)
+    if reset_state:
+      self.reset_state(inputs.shape[1] if batching else None)
+    xtx = bm.Variable(jnp.zeros((self.num_out, self.num_out), dtype=inputs.dtype))
+    xty = bm.Variable(jnp.zeros((self.num_out, targets.shape[-1]), dtype=inputs.dtype))
+
+    def accumulate(xs, ys):
+      features = bm.for_loop(self.update, xs, progress_bar=False)  # (block_size, [num_batch,] num_out)
+      features = features.reshape(-1, self.num_out)
+      xtx.value += features.T @ features
+      xty.value += features.T @ ys.reshape(-1, ys.shape[-1])
+
+    num_block = inputs.shape[0] // block_size
+    num_full = num_block * block_size
+    if num_block > 0:
+      bm.for_loop(accumulate,
+                  (inputs[:num_full].reshape((num_block, block_size) + inputs.shape[1:]),
+                   targets[:num_full].reshape((num_block, block_size) + targets.shape[1:])),
+                  progress_bar=False)
+    if num_full < inputs.shape[0]:
+      accumulate(inputs[num_full:], targets[num_full:])
+    return xtx.value, xty.value
+
   def get_feature_names(self, for_plot=False) -> List[str]:
     """Get output feature names for transformation.
 
@@ -184,8 +303,8 @@ class NVAR(Layer):
                             if for_plot else f'x{i}(t-{di * self.stride})')
                            for i in range(self.num_in)])
     nonlinear_names = []
-    for ids in self.comb_ids:
-      for id_ in np.asarray(ids):
+    for order in self.order:
+      for id_ in combinations_with_replacement(range(self.linear_dim), order):
         uniques, counts = np.unique(id_, return_counts=True)
         nonlinear_names.append(" ".join(
           "%s^%d" % (linear_names[ind], exp) if (exp != 1) else linear_names[ind]
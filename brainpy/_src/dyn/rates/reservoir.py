@@ -2,10 +2,12 @@
 
 from typing import Optional, Union, Callable, Tuple
 
+import jax
 import jax.numpy as jnp
+import numpy as np
 
 import brainpy.math as bm
-from brainpy._src.initialize import Normal, ZeroInit, Initializer, parameter, variable
+from brainpy._src.initialize import Normal, Uniform, ZeroInit, Initializer, parameter, variable
 from brainpy import check
 from brainpy.tools import to_size
 from brainpy.types import ArrayType
@@ -15,6 +17,10 @@ __all__ = [
   'Reservoir',
 ]
 
+# the maximum number of units of the sparse connectivity, whose spectral radius
+# is computed with the eigenvalues of the dense matrix
+_MAX_EIG_UNITS = 2048
+
 
 class Reservoir(Layer):
   r"""Reservoir node, a pool of leaky-integrator neurons with random recurrent connections [1]_.
@@ -69,7 +75,19 @@ class Reservoir(Layer):
     The connectivity type, can be "dense" or "sparse", "jit".
 
     - ``"dense"`` means the connectivity matrix is a dense matrix.
-    - ``"sparse"`` means the connectivity matrix is a CSR sparse matrix.
+    - ``"sparse"`` means the connectivity matrix is a CSR sparse matrix, which
+      is generated row block by row block (never as a dense matrix) and is
+      computed with :py:func:`brainpy.math.sparse.csrmv`. The initializers
+      are applied to the vector of the nonzero weights.
+    - ``"jit"`` means the connectivity matrix is generated just-in-time with
+      :py:func:`brainpy.math.jitconn.mv_prob_normal` or
+      :py:func:`brainpy.math.jitconn.mv_prob_uniform`, so that it is never
+      stored. Only :py:class:`~.Normal` and :py:class:`~.Uniform` initializers
+      are supported, and the weights are not trainable.
+
+    For the just-in-time connectivity, and the sparse connectivity with more
+    than 2048 units, the ``spectral_radius`` is rescaled with the estimation of
+    the circular law, rather than the eigenvalues of the matrix.
   spectral_radius : float, optional
     Spectral radius of recurrent weight matrix, by default None.
   noise_rec : float, optional
@@ -153,31 +171,54 @@ class Reservoir(Layer):
     # initialize feedforward weights
     weight_shape = (input_shape[-1], self.num_unit)
     self.Wff_shape = weight_shape
-    self.Win = parameter(self._Win_initializer, weight_shape)
-    if self.ff_connectivity < 1.:
-      conn_mat = bm.random.random(weight_shape) > self.ff_connectivity
-      self.Win[conn_mat] = 0.
-    if self.comp_type == 'sparse' and self.ff_connectivity < 1.:
-      self.ff_pres, self.ff_posts = jnp.where(jnp.logical_not(bm.as_jax(conn_mat)))
-      self.Win = self.Win[self.ff_pres, self.ff_posts]
-    if isinstance(self.mode, bm.TrainingMode):
+    if self.comp_type == 'dense' or self.ff_connectivity >= 1.:
+      self.Win = parameter(self._Win_initializer, weight_shape)
+      if self.ff_connectivity < 1.:
+        conn_mat = bm.random.random(weight_shape) > self.ff_connectivity
+        self.Win[conn_mat] = 0.
+    elif self.comp_type == 'sparse':
+      self.ff_indices, self.ff_indptr = _random_csr(weight_shape, self.ff_connectivity)
+      self.Win = parameter(self._Win_initializer, self.ff_indices.shape)
+    else:
+      self.ff_seed = _random_seed()
+      self.ff_jit = _jit_params(self._Win_initializer)
+    if isinstance(self.mode, bm.TrainingMode) and hasattr(self, 'Win'):
       self.Win = bm.TrainVar(self.Win)
 
     # initialize recurrent weights
     recurrent_shape = (self.num_unit, self.num_unit)
-    self.Wrec = parameter(self._Wrec_initializer, recurrent_shape)
-    if self.rec_connectivity < 1.:
-      conn_mat = bm.random.random(recurrent_shape) > self.rec_connectivity
-      self.Wrec[conn_mat] = 0.
-    if self.spectral_radius is not None:
-      current_sr = max(abs(jnp.linalg.eig(bm.as_jax(self.Wrec))[0]))
-      self.Wrec *= self.spectral_radius / current_sr
-    if self.comp_type == 'sparse' and self.rec_connectivity < 1.:
-      self.rec_pres, self.rec_posts = jnp.where(jnp.logical_not(bm.as_jax(conn_mat)))
-      self.Wrec = self.Wrec[self.rec_pres, self.rec_posts]
+    if self.comp_type == 'dense' or self.rec_connectivity >= 1.:
+      self.Wrec = parameter(self._Wrec_initializer, recurrent_shape)
+      if self.rec_connectivity < 1.:
+        conn_mat = bm.random.random(recurrent_shape) > self.rec_connectivity
+        self.Wrec[conn_mat] = 0.
+      if self.spectral_radius is not None:
+        current_sr = max(abs(jnp.linalg.eig(bm.as_jax(self.Wrec))[0]))
+        self.Wrec *= self.spectral_radius / current_sr
+    elif self.comp_type == 'sparse':
+      self.rec_indices, self.rec_indptr = _random_csr(recurrent_shape, self.rec_connectivity)
+      self.Wrec = parameter(self._Wrec_initializer, self.rec_indices.shape)
+      if self.spectral_radius is not None:
+        w = bm.as_jax(self.Wrec)
+        n = self.num_unit
+        if n <= _MAX_EIG_UNITS:
+          current_sr = _csr_spectral_radius(w, self.rec_indices, self.rec_indptr, n)
+        else:
+          mean, mean2 = w.sum() / n ** 2, (w ** 2).sum() / n ** 2
+          current_sr = _circular_law_radius(n, mean, mean2)
+        self.Wrec *= self.spectral_radius / current_sr
+    else:
+      self.rec_seed = _random_seed()
+      self.rec_jit = _jit_params(self._Wrec_initializer)
+      if self.spectral_radius is not None:
+        mean, mean2 = _jit_moments(self.rec_jit)
+        p = self.rec_connectivity
+        factor = self.spectral_radius / _circular_law_radius(self.num_unit, p * mean, p * mean2)
+        self.rec_jit = (self.rec_jit[0],) + tuple(v * factor for v in self.rec_jit[1:])
     self.bias = parameter(self._b_initializer, (self.num_unit,))
     if isinstance(self.mode, bm.TrainingMode):
-      self.Wrec = bm.TrainVar(self.Wrec)
+      if hasattr(self, 'Wrec'):
+        self.Wrec = bm.TrainVar(self.Wrec)
       self.bias = None if (self.bias is None) else bm.TrainVar(self.bias)
 
     # initialize state
@@ -192,21 +233,9 @@ class Reservoir(Layer):
     x = bm.as_jax(x)
     if self.noise_ff > 0:
       x += self.noise_ff * bm.random.uniform(-1, 1, x.shape)
-    if self.comp_type == 'sparse' and self.ff_connectivity < 1.:
-      sparse = {'data': self.Win,
-                'index': (self.ff_pres, self.ff_posts),
-                'shape': self.Wff_shape}
-      hidden = bm.sparse.seg_matmul(x, sparse)
-    else:
-      hidden = x @ self.Win
+    hidden = self._matvec(x, 'ff')
     # recurrent
-    if self.comp_type == 'sparse' and self.rec_connectivity < 1.:
-      sparse = {'data': self.Wrec,
-                'index': (self.rec_pres, self.rec_posts),
-                'shape': (self.num_unit, self.num_unit)}
-      hidden += bm.sparse.seg_matmul(self.state, sparse)
-    else:
-      hidden += self.state @ self.Wrec
+    hidden += self._matvec(self.state.value, 'rec')
     if self.activation_type == 'internal':
       hidden = self.activation(hidden)
     if self.noise_rec > 0.:
@@ -217,3 +246,79 @@ class Reservoir(Layer):
       state = self.activation(state)
     self.state.value = state
     return state
+
+  def _matvec(self, x, which: str):
+    """Compute ``x @ W`` for the feedforward (``"ff"``) or recurrent (``"rec"``) weights."""
+    if which == 'ff':
+      connectivity, shape = self.ff_connectivity, self.Wff_shape
+    else:
+      connectivity, shape = self.rec_connectivity, (self.num_unit, self.num_unit)
+    if self.comp_type == 'dense' or connectivity >= 1.:
+      return x @ (self.Win if which == 'ff' else self.Wrec)
+
+    if self.comp_type == 'sparse':
+      data = bm.as_jax(self.Win if which == 'ff' else self.Wrec)
+      indices = self.ff_indices if which == 'ff' else self.rec_indices
+      indptr = self.ff_indptr if which == 'ff' else self.rec_indptr
+      f = lambda v: bm.sparse.csrmv(data, indices, indptr, v, shape=shape, transpose=True)
+    else:
+      seed = self.ff_seed if which == 'ff' else self.rec_seed
+      dist, a, b = self.ff_jit if which == 'ff' else self.rec_jit
+      fun = bm.jitconn.mv_prob_normal if dist == 'normal' else bm.jitconn.mv_prob_uniform
+      f = lambda v: fun(v, a, b, connectivity, seed, shape=shape, transpose=True)
+
+    x = bm.as_jax(x)
+    if x.ndim == 1:
+      return f(x)
+    # batched inputs
+    return jax.vmap(f)(x.reshape(-1, x.shape[-1])).reshape(x.shape[:-1] + (shape[1],))
+
+
+def _random_csr(shape, prob, block_size=1024):
+  """Generate the ``(indices, indptr)`` of a random CSR connectivity row block by row block."""
+  num_row, num_col = shape
+  indices, counts = [], []
+  for i in range(0, num_row, block_size):
+    n = min(block_size, num_row - i)
+    mask = np.asarray(bm.random.random((n, num_col)) < prob)
+    indices.append(np.nonzero(mask)[1])
+    counts.append(mask.sum(axis=1))
+  indices = np.concatenate(indices).astype(np.int32)
+  indptr = np.concatenate([[0], np.cumsum(np.concatenate(counts))]).astype(np.int32)
+  return jnp.asarray(indices), jnp.asarray(indptr)
+
+
+def _random_seed():
+  return int(bm.random.randint(0, np.iinfo(np.int32).max))
+
+
+def _jit_params(initializer):
+  if isinstance(initializer, Normal):
+    return 'normal', float(initializer.mean), float(initializer.scale)
+  if isinstance(initializer, Uniform):
+    return 'uniform', float(initializer.min_val), float(initializer.max_val)
+  raise ValueError('comp_type="jit" only supports the "Normal" or "Uniform" initializer, '
+                   f'but we got {initializer}.')
+
+
+def _jit_moments(params):
+  """The first and second moments of the weights."""
+  dist, a, b = params
+  if dist == 'normal':
+    return a, a ** 2 + b ** 2
+  return (a + b) / 2, (a ** 2 + a * b + b ** 2) / 3
+
+
+def _csr_spectral_radius(data, indices, indptr, n):
+  """The spectral radius of a ``(n, n)`` CSR matrix, computed with its dense matrix."""
+  rows = np.repeat(np.arange(n), np.diff(np.asarray(indptr)))
+  dense = np.zeros((n, n), dtype=np.asarray(data).dtype)
+  dense[rows, np.asarray(indices)] = np.asarray(data)
+  return float(np.abs(np.linalg.eigvals(dense)).max())
+
+
+def _circular_law_radius(n, mean, mean2):
+  """Estimate the spectral radius of a ``(n, n)`` random matrix,
+  with the mean ``mean`` and the second moment ``mean2`` of its elements."""
+  var = mean2 - mean ** 2
+  return max(float(jnp.sqrt(n * var)), float(abs(n * mean)))
@@ -1,3 +1,5 @@
+import numpy as np
+
 import brainpy.math as bm
 from absl.testing import parameterized
 from absl.testing import absltest
@@ -20,5 +22,47 @@ class Test_NVAR(parameterized.TestCase):
         else:
             output=layer(input)
 
+    def test_NVAR_monomials(self):
+        bm.random.seed()
+        layer = bp.dnn.NVAR(num_in=3, delay=2, order=(3, 2), stride=2, constant=True)
+        xs = bm.random.randn(6, 3)
+        for x in xs:
+            output = layer(x)
+        self.assertEqual(output.shape, (layer.num_out,))
+        # the reference features with the index tables
+        linear = np.concatenate([np.asarray(xs[-1]), np.asarray(xs[-3])])
+        expected = [np.ones(1), linear]
+        for ids in layer.comb_ids:
+            expected.append(np.prod(linear[np.asarray(ids)], axis=1))
+        self.assertTrue(np.allclose(output, np.concatenate(expected), rtol=1e-5))
+        self.assertEqual(len(layer.get_feature_names()), layer.num_out)
+
+    @parameterized.product(
+        mode=[bm.BatchingMode(),
+              bm.NonBatchingMode()]
+    )
+    def test_NVAR_sufficient_statistics(self, mode):
+        bm.random.seed()
+        num_time = 50
+        if mode in [bm.NonBatchingMode()]:
+            xs = bm.random.randn(num_time, 3)
+            ys = bm.random.randn(num_time, 2)
+        else:
+            xs = bm.random.randn(4, num_time, 3)
+            ys = bm.random.randn(4, num_time, 2)
+        layer = bp.dnn.NVAR(num_in=3, delay=2, order=2, constant=True, mode=mode)
+        xtx, xty = layer.sufficient_statistics(xs, ys, block_size=16)
+
+        layer.reset_state(None if mode in [bm.NonBatchingMode()] else 4)
+        if mode in [bm.NonBatchingMode()]:
+            features = np.stack([np.asarray(layer(x)) for x in xs])
+            targets = np.asarray(ys)
+        else:
+            features = np.stack([np.asarray(layer(xs[:, i])) for i in range(num_time)]).reshape(-1, layer.num_out)
+            targets = np.asarray(bm.moveaxis(ys, 1, 0)).reshape(-1, 2)
+        self.assertTrue(np.allclose(xtx, features.T @ features, rtol=1e-4, atol=1e-4))
+        self.assertTrue(np.allclose(xty, features.T @ targets, rtol=1e-4, atol=1e-4))
+
+
 if __name__ == '__main__':
     absltest.main()
\ No newline at end of file
@@ -1,7 +1,12 @@
+from unittest import mock
+
+import numpy as np
+
 import brainpy.math as bm
 from absl.testing import parameterized
 from absl.testing import absltest
 import brainpy as bp
+from brainpy._src.dyn.rates import reservoir
 
 
 class Test_Reservoir(parameterized.TestCase):
@@ -24,6 +29,72 @@ class Test_Reservoir(parameterized.TestCase):
         else:
             output = layer(input)
 
+    @parameterized.product(
+        comp_type=['sparse', 'jit'],
+        mode=[bm.TrainingMode(4),
+              bm.BatchingMode(4),
+              bm.NonBatchingMode()]
+    )
+    def test_Reservoir_comp_type(self, comp_type, mode):
+        bm.random.seed()
+        layer = bp.dyn.Reservoir(input_shape=3,
+                                 num_out=50,
+                                 comp_type=comp_type,
+                                 in_connectivity=0.5,
+                                 spectral_radius=0.9,
+                                 mode=mode)
+        if mode in [bm.NonBatchingMode()]:
+            output = layer(bm.random.randn(3))
+            self.assertTupleEqual(output.shape, (50,))
+        else:
+            output = layer(bm.random.randn(4, 3))
+            self.assertTupleEqual(output.shape, (4, 50))
+
+    def _sparse_weights(self, layer, n):
+        rows = np.repeat(np.arange(n), np.diff(np.asarray(layer.rec_indptr)))
+        Wrec = np.zeros((n, n))
+        Wrec[rows, np.asarray(layer.rec_indices)] = np.asarray(layer.Wrec)
+        rows = np.repeat(np.arange(3), np.diff(np.asarray(layer.ff_indptr)))
+        Win = np.zeros((3, n))
+        Win[rows, np.asarray(layer.ff_indices)] = np.asarray(layer.Win)
+        return Win, Wrec
+
+    def test_Reservoir_sparse(self):
+        bm.random.seed(1)
+        n = 400
+        layer = bp.dyn.Reservoir(input_shape=3,
+                                 num_out=n,
+                                 comp_type='sparse',
+                                 in_connectivity=0.5,
+                                 rec_connectivity=0.1,
+                                 spectral_radius=0.9,
+                                 activation=lambda x: x)
+        Win, Wrec = self._sparse_weights(layer, n)
+
+        # the spectral radius is rescaled with the eigenvalues
+        self.assertAlmostEqual(np.abs(np.linalg.eigvals(Wrec)).max(), 0.9, delta=1e-4)
+
+        x = np.random.randn(3)
+        state = np.zeros(n)
+        for _ in range(3):
+            state = 0.7 * state + 0.3 * (x @ Win + state @ Wrec)
+            output = layer(x)
+        self.assertTrue(np.allclose(output, state, atol=1e-4))
+
+    @mock.patch.object(reservoir, '_MAX_EIG_UNITS', 100)
+    def test_Reservoir_sparse_large(self):
+        bm.random.seed(1)
+        n = 400
+        layer = bp.dyn.Reservoir(input_shape=3,
+                                 num_out=n,
+                                 comp_type='sparse',
+                                 rec_connectivity=0.1,
+                                 spectral_radius=0.9)
+        _, Wrec = self._sparse_weights(layer, n)
+
+        # the spectral radius is estimated by the circular law
+        self.assertAlmostEqual(np.abs(np.linalg.eigvals(Wrec)).max(), 0.9, delta=0.1)
+
 
 if __name__ == '__main__':
     absltest.main()
@@ -3,7 +3,9 @@
 import numbers
 from typing import Optional, Union, Sequence, Tuple, Callable
 
+import jax
 import jax.numpy as jnp
+import numpy as np
 from jax import vmap
 
 import brainpy.math as bm
@@ -19,6 +21,20 @@ __all__ = [
 ]
 
 
+def _format_csr(conn_mat):
+  """Get the ``(data, indices, indptr)`` of a CSR connection matrix,
+  or ``None`` if it is a dense matrix."""
+  if hasattr(conn_mat, 'tocsr'):  # scipy.sparse matrix
+    csr = conn_mat.tocsr()
+    return csr.data, csr.indices, csr.indptr, csr.shape
+  if isinstance(conn_mat, (tuple, list)):
+    if len(conn_mat) != 3:
+      raise ValueError('The sparse connection matrix should be given as '
+                       f'"(data, indices, indptr)". But we got {len(conn_mat)} elements.')
+    return tuple(conn_mat) + (None,)
+  return None
+
+
 class DelayCoupling(Projection):
   """Delay coupling.
 
@@ -28,12 +44,17 @@ class DelayCoupling(Projection):
     The delay variable.
   var_to_output: Variable, sequence of Variable
     The target variables to output.
-  conn_mat: ArrayType
-    The connection matrix.
+  conn_mat: ArrayType, tuple, scipy.sparse matrix
+    The connection matrix. It can be a dense matrix with the shape of
+    ``(pre.num, post.num)``, or a sparse matrix in the CSR format, given
+    as a ``scipy.sparse`` matrix or a tuple of ``(data, indices, indptr)``,
+    whose rows are the presynaptic nodes.
   required_shape: sequence of int
     The required shape of `(pre, post)`.
   delay_steps: int, ArrayType
-    The matrix of delay time steps. Must be int.
+    The matrix of delay time steps. Must be int. For the sparse connection
+    matrix, it can be the vector of the per-edge delay steps, which is
+    aligned with the ``data`` of the CSR matrix.
   initial_delay_data: Initializer, Callable
     The initializer of the initial delay data.
   """
@@ -64,17 +85,47 @@ class DelayCoupling(Projection):
     self.output_var = var_to_output
 
     # Connection matrix
-    self.conn_mat = conn_mat
-    if self.conn_mat.shape != required_shape:
-      raise ValueError(f'we expect the structural connection matrix has the shape of '
-                       f'(pre.num, post.num), i.e., {required_shape}, '
-                       f'while we got {self.conn_mat.shape}.')
+    csr = _format_csr(conn_mat)
+    self.is_sparse = csr is not None
+    if self.is_sparse:
+      data, indices, indptr, shape = csr
+      indices = np.asarray(indices)
+      indptr = np.asarray(indptr)
+      if shape is not None and tuple(shape) != tuple(required_shape):
+        raise ValueError(f'we expect the structural connection matrix has the shape of '
+                         f'(pre.num, post.num), i.e., {required_shape}, '
+                         f'while we got {shape}.')
+      if indptr.size != required_shape[0] + 1:
+        raise ValueError(f'"indptr" should have the size of pre.num + 1 = {required_shape[0] + 1}, '
+                         f'while we got {indptr.size}.')
+      # the presynaptic (row) and postsynaptic (column) index of each edge
+      self.pre_ids = jnp.asarray(np.repeat(np.arange(required_shape[0]), np.diff(indptr)), dtype=jnp.int32)
+      self.post_ids = jnp.asarray(indices, dtype=jnp.int32)
+      self.conn_mat = jnp.asarray(data)
+      self.num_post = required_shape[1]
+      self.conn_sum = self._sum_edges(self.conn_mat)  # (post.num,)
+      required_shape = (indices.size,)
+    else:
+      self.conn_mat = conn_mat
+      if self.conn_mat.shape != required_shape:
+        raise ValueError(f'we expect the structural connection matrix has the shape of '
+                         f'(pre.num, post.num), i.e., {required_shape}, '
+                         f'while we got {self.conn_mat.shape}.')
 
     # Delay matrix
     if delay_steps is None:
       self.delay_steps = None
       self.delay_type = 'none'
       num_delay_step = None
+    elif self.is_sparse and hasattr(delay_steps, 'tocsr'):
+      delay_steps = delay_steps.tocsr()
+      if not (np.array_equal(delay_steps.indptr, indptr) and np.array_equal(delay_steps.indices, indices)):
+        raise ValueError('The sparse delay matrix should have the same structure with "conn_mat".')
+      self.delay_steps = jnp.asarray(delay_steps.data)
+      if not jnp.issubdtype(self.delay_steps.dtype, jnp.integer):
+        raise ValueError(f'"delay_steps" must be integer typed. But we got {self.delay_steps.dtype}')
+      self.delay_type = 'array'
+      num_delay_step = self.delay_steps.max()
     elif callable(delay_steps):
       delay_steps = delay_steps(required_shape)
       if delay_steps.dtype not in [jnp.int32, jnp.int64, jnp.uint32, jnp.uint64]:
@@ -91,8 +142,8 @@ class DelayCoupling(Projection):
         self.delay_type = 'array'
         if delay_steps.shape != required_shape:
           raise ValueError(f'we expect the delay matrix has the shape of '
-                           f'(pre.num, post.num), i.e., {required_shape}. '
-                           f'While we got {delay_steps.shape}.')
+                           f'{"(num_edge,)" if self.is_sparse else "(pre.num, post.num)"}, '
+                           f'i.e., {required_shape}. While we got {delay_steps.shape}.')
       self.delay_steps = delay_steps
       num_delay_step = self.delay_steps.max()
     elif isinstance(delay_steps, int):
@@ -111,6 +162,24 @@ class DelayCoupling(Projection):
   def reset_state(self, batch_size=None):
     pass
 
+  def _edge_values(self, delay_var, data):
+    """Get the (delayed) presynaptic values on each edge, with the shape of ``(..., num_edge)``."""
+    if self.delay_steps is None:
+      return data[..., self.pre_ids]
+    if self.delay_type == 'int':
+      return bm.as_jax(delay_var.retrieve(self.delay_steps))[..., self.pre_ids]
+    if self.delay_type == 'array':
+      if isinstance(self.mode, bm.TrainingMode):
+        # (num_edge, batch) -> (batch, num_edge)
+        return bm.as_jax(delay_var.retrieve(self.delay_steps, slice(None, None, None), self.pre_ids)).T
+      return bm.as_jax(delay_var.retrieve(self.delay_steps, self.pre_ids))
+    raise ValueError(f'Unknown delay type {self.delay_type}')
+
+  def _sum_edges(self, values):
+    """Sum the per-edge values into the postsynaptic nodes, i.e., ``(..., num_edge) -> (..., post.num)``."""
+    res = jax.ops.segment_sum(jnp.moveaxis(values, -1, 0), self.post_ids, num_segments=self.num_post)
+    return jnp.moveaxis(res, 0, -1)
+
 
 class DiffusiveCoupling(DelayCoupling):
   """Diffusive coupling.
@@ -140,10 +209,15 @@ class DiffusiveCoupling(DelayCoupling):
     Another coupling variable.
   var_to_output: Variable, sequence of Variable
     The target variables to output.
-  conn_mat: ArrayType
-    The connection matrix.
+  conn_mat: ArrayType, tuple, scipy.sparse matrix
+    The connection matrix with the shape of ``(pre.num, post.num)``.
+    It can also be a CSR sparse matrix (a ``scipy.sparse`` matrix or
+    a tuple of ``(data, indices, indptr)``), so that the memory and the
+    computation scale with the number of edges.
   delay_steps: int, ArrayType
-    The matrix of delay time steps. Must be int.
+    The matrix of delay time steps. Must be int. For the sparse
+    ``conn_mat``, it can be the per-edge delay steps aligned with the
+    CSR ``data``, or a sparse matrix with the same structure.
   initial_delay_data: Initializer, Callable
     The initializer of the initial delay data.
   name: str
@@ -192,7 +266,12 @@ class DiffusiveCoupling(DelayCoupling):
     # delays
     axis = self.coupling_var1.ndim
     delay_var = self.get_delay_var(f'delay_{id(self.delay_var)}')
-    if self.delay_steps is None:
+    if self.is_sparse:
+      # sum_i C_ij (x_i - y_j) = (C^T x)_j - (sum_i C_ij) y_j
+      x = self._edge_values(delay_var, self.coupling_var1.value)
+      diffusive = (self._sum_edges(self.conn_mat * x) -
+                   self.conn_sum * self.coupling_var2.value)
+    elif self.delay_steps is None:
       diffusive = (jnp.expand_dims(self.coupling_var1.value, axis=axis) -
                    jnp.expand_dims(self.coupling_var2.value, axis=axis - 1))
       diffusive = (self.conn_mat * diffusive).sum(axis=axis - 1)
@@ -233,10 +312,15 @@ class AdditiveCoupling(DelayCoupling):
     The coupling variable, used for delay.
   var_to_output: Variable, sequence of Variable
     The target variables to output.
-  conn_mat: ArrayType
-    The connection matrix.
+  conn_mat: ArrayType, tuple, scipy.sparse matrix
+    The connection matrix with the shape of ``(pre.num, post.num)``.
+    It can also be a CSR sparse matrix (a ``scipy.sparse`` matrix or
+    a tuple of ``(data, indices, indptr)``), so that the memory and the
+    computation scale with the number of edges.
   delay_steps: int, ArrayType
-    The matrix of delay time steps. Must be int.
+    The matrix of delay time steps. Must be int. For the sparse
+    ``conn_mat``, it can be the per-edge delay steps aligned with the
+    CSR ``data``, or a sparse matrix with the same structure.
   initial_delay_data: Initializer, Callable
     The initializer of the initial delay data.
   name: str
@@ -277,7 +361,9 @@ class AdditiveCoupling(DelayCoupling):
     # delay function
     axis = self.coupling_var.ndim
     delay_var = self.get_delay_var(f'delay_{id(self.delay_var)}')
-    if self.delay_steps is None:
+    if self.is_sparse:
+      additive = self._sum_edges(self.conn_mat * self._edge_values(delay_var, self.coupling_var.value))
+    elif self.delay_steps is None:
       additive = self.coupling_var @ self.conn_mat
     elif self.delay_type == 'array':
       if isinstance(self.mode, bm.TrainingMode):
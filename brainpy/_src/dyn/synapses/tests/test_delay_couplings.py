@@ -39,3 +39,42 @@ class Test_delay_couplings(parameterized.TestCase):
     runner(10.)
     self.assertTupleEqual(runner.mon['fhn2.x'].shape, (100, 80))
     bm.clear_buffer_memory()
+
+  def _run_coupling(self, coupling, sparse, delay):
+    import numpy as np
+    rng = np.random.RandomState(0)
+    n = 30
+    mask = rng.rand(n, n) < 0.2
+    cmat = np.where(mask, rng.rand(n, n), 0.).astype(np.float32)
+    dmat = rng.randint(0, 10, (n, n)).astype(np.int32)
+    pre, post = np.nonzero(mask)  # row-major order as CSR
+    indptr = np.concatenate([[0], np.cumsum(mask.sum(1))])
+    if sparse:
+      conn_mat = (cmat[pre, post], post, indptr)
+      delay_steps = bm.asarray(dmat[pre, post]) if delay == 'array' else delay
+    else:
+      conn_mat = bm.asarray(cmat)
+      delay_steps = bm.asarray(dmat) if delay == 'array' else delay
+
+    areas = bp.rates.FHN(n, x_ou_sigma=0., y_ou_sigma=0.,
+                         x_initializer=bp.init.Constant(0.02), y_initializer=bp.init.Constant(0.02))
+    if coupling == 'diffusive':
+      conn = bp.synapses.DiffusiveCoupling(areas.x, areas.x, areas.input, conn_mat=conn_mat,
+                                           delay_steps=delay_steps, initial_delay_data=0.01)
+    else:
+      conn = bp.synapses.AdditiveCoupling(areas.x, areas.input, conn_mat=conn_mat,
+                                          delay_steps=delay_steps, initial_delay_data=0.01)
+    net = bp.Network(areas, conn)
+    runner = bp.DSRunner(net, monitors={'x': areas.x}, inputs=(areas.input, 1.), progress_bar=False)
+    runner.run(20.)
+    return runner.mon['x']
+
+  @parameterized.product(
+    coupling=['diffusive', 'additive'],
+    delay=[None, 5, 'array'],
+  )
+  def test_sparse_coupling(self, coupling, delay):
+    dense = self._run_coupling(coupling, False, delay)
+    sparse = self._run_coupling(coupling, True, delay)
+    self.assertTrue(bm.allclose(dense, sparse, atol=1e-4))
+    bm.clear_buffer_memory()
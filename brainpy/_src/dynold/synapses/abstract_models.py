@@ -6,6 +6,7 @@ import jax
 
 import brainpy.math as bm
 from brainpy._src.connect import TwoEndConnector, All2All, One2One
+from brainpy._src.connect.regular_conn import GridConn
 from brainpy._src.dnn import linear
 from brainpy._src.dyn import _docs
 from brainpy._src.dyn import synapses
@@ -266,6 +267,8 @@ class Exponential(TwoEndConn):
     elif isinstance(conn, One2One):
       assert post.num == pre.num
       self.comm = linear.OneToOne(pre.num, g_max)
+    elif isinstance(conn, GridConn) and comp_method == 'sparse' and isinstance(g_max, (int, float)):
+      self.comm = linear.GridLinear(conn, g_max)
     else:
       if comp_method == 'dense':
         self.comm = linear.MaskedLinear(conn, g_max)
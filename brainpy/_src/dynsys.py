@@ -13,6 +13,7 @@ from brainpy._src.context import share
 from brainpy._src.deprecations import _update_deprecate_msg
 from brainpy._src.initialize import parameter, variable_
 from brainpy._src.mixin import SupportAutoDelay, Container, SupportInputProj, DelayRegister, _get_delay_tool
+from brainpy._src.tools.package import _lazy_numba_jit
 from brainpy.errors import NoImplementationError, UnsupportedError
 from brainpy.types import ArrayType, Shape
 
@@ -843,7 +844,7 @@ class DynView(Dynamic):
     pass
 
 
-@tools.numba_jit
+@_lazy_numba_jit
 def _slice_to_num(slice_: slice, length: int):
   # start
   start = slice_.start
@@ -7,4 +7,5 @@ You can access them through ``brainpy.inputs.XXX``.
 """
 
 from .currents import *
+from .generators import *
 
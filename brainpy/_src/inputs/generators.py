@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+
+"""
+Input generators which compute the input value of the ``i``-th time step on the fly.
+
+Different from the functions in ``currents.py``, which materialize the whole input
+array with the shape of ``(duration / dt, ...)``, the generators only hold the
+parameters of the input, so that the peak memory is independent of the duration.
+"""
+
+from typing import Optional
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+from brainpy import math as bm
+from brainpy._src.context import share
+from brainpy.check import is_float, is_integer
+
+__all__ = [
+  'InputGenerator',
+  'SectionInput',
+  'SpikeInput',
+  'RampInput',
+  'WienerProcess',
+  'OUProcess',
+  'SinusoidalInput',
+  'SquareInput',
+]
+
+
+def _get_key(seed, module=None):
+  if seed is None:
+    if module is not None and bm.random.is_counter_based():
+      # the base key of the counter-based random streams
+      return bm.random.module_key(module, i=0)
+    return bm.random.split_key()
+  return jax.random.PRNGKey(seed)
+
+
+class InputGenerator(bm.BrainPyObject):
+  """The base class for the input generators.
+
+  An input generator computes the input value at the time step ``i`` on demand.
+  It can be directly used in :py:class:`~.DSRunner` inputs, like
+  ``inputs=[('input', generator)]``, or be given to :py:class:`~.InputVar`.
+
+  >>> import brainpy as bp
+  >>> gen = bp.inputs.SectionInput(values=[0., 1., 0.], durations=[100., 300., 100.])
+  >>> gen(1000)  # the value at the 1000-th step
+  >>> gen.chunk(0, 100)  # the values of the first 100 steps
+
+  Parameters
+  ----------
+  duration: float
+    The total input duration.
+  dt: float
+    The numerical precision.
+  name: str
+    The object name.
+  """
+
+  def __init__(self, duration: float, dt: Optional[float] = None, name: Optional[str] = None):
+    super().__init__(name=name)
+    self.dt = bm.get_dt() if dt is None else dt
+    is_float(self.dt, 'dt', allow_none=False, min_bound=0.)
+    self.duration = duration
+    self.num_step = int(np.ceil(duration / self.dt))
+
+  def __len__(self):
+    return self.num_step
+
+  def value(self, i):
+    """The input value at the time step ``i``."""
+    raise NotImplementedError
+
+  def __call__(self, i=None):
+    """Get the input value at the time step ``i``.
+
+    If ``i`` is not provided, the current running step ``share['i']`` is used.
+    """
+    i = share.load('i') if i is None else i
+    return self.value(bm.as_jax(i))
+
+  def chunk(self, i_start: int, length: int):
+    """Get the input values from the time step ``i_start`` to ``i_start + length``.
+
+    Returns
+    -------
+    values: ArrayType
+      The input values with the shape of ``(length, ...)``.
+    """
+    return jax.vmap(self.value)(jnp.arange(i_start, i_start + length))
+
+  def reset_state(self, *args, **kwargs):
+    pass
+
+
+class SectionInput(InputGenerator):
+  """Generate an input with different sections on the fly.
+
+  Same as :py:func:`~.section_input`.
+
+  Parameters
+  ----------
+  values : list, np.ndarray
+      The current values for each period duration.
+  durations : list, np.ndarray
+      The duration for each period.
+  dt : float
+      Default is None.
+  """
+
+  def __init__(self, values, durations, dt=None, name=None):
+    if len(durations) != len(values):
+      raise ValueError(f'"values" and "durations" must be the same length, while '
+                       f'we got {len(values)} != {len(durations)}.')
+    super().__init__(duration=sum(durations), dt=dt, name=name)
+
+    shape = ()
+    for val in values:
+      if len(jnp.shape(val)) > len(shape):
+        shape = jnp.shape(val)
+    values = [jnp.broadcast_to(bm.as_jax(val), shape) for val in values]
+    self.values = jnp.stack(values + [jnp.zeros(shape, dtype=values[0].dtype)])
+    self.ends = jnp.cumsum(jnp.asarray([int(d / self.dt) for d in durations]))
+
+  def value(self, i):
+    return self.values[jnp.searchsorted(self.ends, i, side='right')]
+
+
+class SpikeInput(InputGenerator):
+  """Generate a current input like a series of short-time spikes on the fly.
+
+  Same as :py:func:`~.spike_input`.
+
+  Parameters
+  ----------
+  sp_times : list, tuple
+      The spike time-points. Must be an iterable object.
+  sp_lens : int, float, list, tuple
+      The length of each point-current, mimicking the spike durations.
+  sp_sizes : int, float, list, tuple
+      The current sizes.
+  duration : int, float
+      The total current duration.
+  dt : float
+      The default is None.
+  """
+
+  def __init__(self, sp_times, sp_lens, sp_sizes, duration, dt=None, name=None):
+    super().__init__(duration=duration, dt=dt, name=name)
+    assert isinstance(sp_times, (list, tuple))
+    if isinstance(sp_lens, (float, int)):
+      sp_lens = [sp_lens] * len(sp_times)
+    if isinstance(sp_sizes, (float, int)):
+      sp_sizes = [sp_sizes] * len(sp_times)
+    self.starts = jnp.asarray([int(t / self.dt) for t in sp_times])
+    self.ends = self.starts + jnp.asarray([int(l / self.dt) for l in sp_lens])
+    self.sizes = jnp.asarray(sp_sizes, dtype=bm.float_)
+
+  def value(self, i):
+    # the later spike overrides the former one, same as "spike_input()"
+    active = jnp.logical_and(self.starts <= i, i < self.ends)
+    last = jnp.max(jnp.where(active, jnp.arange(self.starts.size), -1))
+    return jnp.where(last >= 0, self.sizes[last], 0.)
+
+
+class RampInput(InputGenerator):
+  """Generate the gradually changed input current on the fly.
+
+  Same as :py:func:`~.ramp_input`.
+
+  Parameters
+  ----------
+  c_start : float
+      The minimum (or maximum) current size.
+  c_end : float
+      The maximum (or minimum) current size.
+  duration : int, float
+      The total duration.
+  t_start : float
+      The ramped current start time-point.
+  t_end : float
+      The ramped current end time-point. Default is the None.
+  dt : float, int, optional
+      The numerical precision.
+  """
+
+  def __init__(self, c_start, c_end, duration, t_start=0, t_end=None, dt=None, name=None):
+    super().__init__(duration=duration, dt=dt, name=name)
+    t_end = duration if t_end is None else t_end
+    self.c_start = c_start
+    self.c_end = c_end
+    self.i_start = int(np.ceil(t_start / self.dt))
+    self.i_end = int(np.ceil(t_end / self.dt))
+
+  def value(self, i):
+    step = (self.c_end - self.c_start) / max(self.i_end - self.i_start - 1, 1)
+    val = self.c_start + (i - self.i_start) * step
+    return jnp.where(jnp.logical_and(i >= self.i_start, i < self.i_end), val, 0.)
+
+
+class WienerProcess(InputGenerator):
+  """Stimulus sampled from a Wiener process on the fly.
+
+  Different from :py:func:`~.wiener_process`, the noise at the step ``i`` is drawn
+  with the key ``fold_in(key, i)``, so that the value only depends on the
+  ``seed`` and the step ``i``.
+
+  Parameters
+  ----------
+  duration: float
+    The input duration.
+  dt: float
+    The numerical precision.
+  n: int
+    The variable number.
+  t_start: float
+    The start time.
+  t_end: float
+    The end time.
+  seed: int
+    The noise seed.
+  """
+
+  def __init__(self, duration, dt=None, n=1, t_start=0., t_end=None, seed=None, name=None):
+    super().__init__(duration=duration, dt=dt, name=name)
+    is_integer(n, 'n', allow_none=False, min_bound=0)
+    t_end = duration if t_end is None else t_end
+    self.n = n
+    self.i_start = int(t_start / self.dt)
+    self.i_end = int(t_end / self.dt)
+    self.key = _get_key(seed, self)
+
+  def value(self, i):
+    noise = jax.random.normal(jax.random.fold_in(self.key, i), (self.n,), dtype=bm.float_)
+    noise = noise * jnp.sqrt(self.dt)
+    return jnp.where(jnp.logical_and(i >= self.i_start, i < self.i_end), noise, 0.)
+
+
+class OUProcess(InputGenerator):
+  r"""Ornstein–Uhlenbeck input generated on the fly.
+
+  .. math::
+
+     dX = (mu - X)/\tau * dt + \sigma*dW
+
+  Different from :py:func:`~.ou_process`, the state :math:`X` is kept in a
+  :py:class:`~.Variable`, therefore the generator must be evaluated step by step
+  in order (which is the case in :py:class:`~.DSRunner`). Evaluating the same step
+  repeatedly returns the same value. Use ``reset_state()`` to restart the process.
+
+  Parameters
+  ----------
+  mean: float
+    Drift of the OU process.
+  sigma: float
+    Standard deviation of the Wiener process, i.e. strength of the noise.
+  tau: float
+    Timescale of the OU process, in ms.
+  duration: float
+    The input duration.
+  dt: float
+    The numerical precision.
+  n: int
+    The variable number.
+  t_start: float
+    The start time.
+  t_end: float
+    The end time.
+  seed: optional, int
+    The random seed.
+  """
+
+  def __init__(self, mean, sigma, tau, duration, dt=None, n=1, t_start=0., t_end=None, seed=None, name=None):
+    super().__init__(duration=duration, dt=dt, name=name)
+    is_integer(n, 'n', allow_none=False, min_bound=0)
+    t_end = duration if t_end is None else t_end
+    self.mean = mean
+    self.sigma = sigma
+    self.tau = tau
+    self.n = n
+    self.i_start = int(t_start / self.dt)
+    self.i_end = int(t_end / self.dt)
+    self.key = _get_key(seed, self)
+    self.x = bm.Variable(jnp.ones(n) * mean)
+    self.last_i = bm.Variable(jnp.asarray(-1))
+
+  def reset_state(self, *args, **kwargs):
+    self.x.value = jnp.ones(self.n) * self.mean
+    self.last_i.value = jnp.asarray(-1)
+
+  def value(self, i):
+    noise = jax.random.normal(jax.random.fold_in(self.key, i), (self.n,), dtype=bm.float_)
+    x = self.x.value
+    x = x + self.dt * ((self.mean - x) / self.tau) + self.sigma * jnp.sqrt(self.dt) * noise
+    active = jnp.logical_and(i >= self.i_start, i < self.i_end)
+    x = jnp.where(jnp.logical_and(active, i != self.last_i.value), x, self.x.value)
+    self.x.value = x
+    self.last_i.value = jnp.asarray(i, dtype=self.last_i.dtype)
+    return jnp.where(active, x, 0.)
+
+  def chunk(self, i_start: int, length: int):
+    return bm.for_loop(self.value, jnp.arange(i_start, i_start + length))
+
+
+class SinusoidalInput(InputGenerator):
+  """Sinusoidal input generated on the fly.
+
+  Same as :py:func:`~.sinusoidal_input`.
+
+  Parameters
+  ----------
+  amplitude: float
+    Amplitude of the sinusoid.
+  frequency: float
+    Frequency of the sinus oscillation, in Hz
+  duration: float
+    The input duration.
+  t_start: float
+    The start time.
+  t_end: float
+    The end time.
+  dt: float
+    The numerical precision.
+  bias: bool
+    Whether the sinusoid oscillates around 0 (False), or
+    has a positive DC bias, thus non-negative (True).
+  """
+
+  def __init__(self, amplitude, frequency, duration, dt=None, t_start=0., t_end=None, bias=False, name=None):
+    super().__init__(duration=duration, dt=dt, name=name)
+    t_end = duration if t_end is None else t_end
+    self.amplitude = amplitude
+    self.frequency = frequency
+    self.bias = bias
+    self.i_start = int(t_start / self.dt)
+    self.i_end = int(t_end / self.dt)
+
+  def value(self, i):
+    t = (i - self.i_start) * self.dt
+    val = self.amplitude * jnp.sin(2 * jnp.pi * t * (self.frequency / 1000.0))
+    if self.bias:
+      val += self.amplitude
+    return jnp.where(jnp.logical_and(i >= self.i_start, i < self.i_end), val, 0.)
+
+
+class SquareInput(InputGenerator):
+  """Oscillatory square input generated on the fly.
+
+  Same as :py:func:`~.square_input`.
+
+  Parameters
+  ----------
+  amplitude: float
+    Amplitude of the square oscillation.
+  frequency: float
+    Frequency of the square oscillation, in Hz.
+  duration: float
+    The input duration.
+  t_start: float
+    The start time.
+  t_end: float
+    The end time.
+  dt: float
+    The numerical precision.
+  bias: bool
+    Whether the sinusoid oscillates around 0 (False), or
+    has a positive DC bias, thus non-negative (True).
+  """
+
+  def __init__(self, amplitude, frequency, duration, dt=None, bias=False, t_start=0., t_end=None, name=None):
+    super().__init__(duration=duration, dt=dt, name=name)
+    t_end = duration if t_end is None else t_end
+    self.amplitude = amplitude
+    self.frequency = frequency
+    self.bias = bias
+    self.i_start = int(t_start / self.dt)
+    self.i_end = int(t_end / self.dt)
+
+  def value(self, i):
+    t = (i - self.i_start) * self.dt
+    phase = jnp.mod(2 * jnp.pi * t * (self.frequency / 1000.0), 2 * jnp.pi)
+    val = self.amplitude * jnp.where(phase < jnp.pi, 1., -1.)
+    if self.bias:
+      val += self.amplitude
+    return jnp.where(jnp.logical_and(i >= self.i_start, i < self.i_end), val, 0.)
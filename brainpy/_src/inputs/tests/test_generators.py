@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import jax.numpy as jnp
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class TestGenerators(unittest.TestCase):
+  def _check(self, gen, current):
+    self.assertEqual(len(gen), current.shape[0])
+    self.assertTrue(np.allclose(gen.chunk(0, len(gen)), current, atol=1e-5))
+    i = len(gen) // 3
+    self.assertTrue(np.allclose(gen(i), current[i], atol=1e-5))
+
+  def test_section_input(self):
+    gen = bp.inputs.SectionInput(values=[0., 1., 0.5], durations=[10, 30, 10], dt=0.1)
+    current = bp.inputs.section_input(values=[0., 1., 0.5], durations=[10, 30, 10], dt=0.1)
+    self._check(gen, current)
+
+  def test_section_input_vector(self):
+    values = [0., bm.arange(4.), 2.]
+    gen = bp.inputs.SectionInput(values=values, durations=[1., 2., 1.], dt=0.1)
+    current = bp.inputs.section_input(values=values, durations=[1., 2., 1.], dt=0.1)
+    self._check(gen, current)
+
+  def test_spike_input(self):
+    kwargs = dict(sp_times=[1., 2., 3., 2.5], sp_lens=[1., 1., 0.2, 0.3], sp_sizes=[0.5, 1., 2., 3.], duration=5.)
+    self._check(bp.inputs.SpikeInput(**kwargs, dt=0.1), bp.inputs.spike_input(**kwargs, dt=0.1))
+
+  def test_ramp_input(self):
+    kwargs = dict(c_start=0., c_end=1., duration=10., t_start=2., t_end=8.)
+    self._check(bp.inputs.RampInput(**kwargs, dt=0.1), bp.inputs.ramp_input(**kwargs, dt=0.1))
+
+  def test_sinusoidal_input(self):
+    kwargs = dict(amplitude=1., frequency=100., duration=50., t_start=10., t_end=40., bias=True)
+    self._check(bp.inputs.SinusoidalInput(**kwargs, dt=0.1), bp.inputs.sinusoidal_input(**kwargs, dt=0.1))
+
+  def test_square_input(self):
+    kwargs = dict(amplitude=1., frequency=30., duration=50., t_start=10.)
+    gen = bp.inputs.SquareInput(**kwargs, dt=0.1)
+    current = bp.inputs.square_input(**kwargs, dt=0.1)
+    # the values at the discontinuities may differ due to the float precision
+    self.assertTrue(np.mean(np.isclose(gen.chunk(0, len(gen)), current)) > 0.99)
+
+  def test_wiener_process(self):
+    gen = bp.inputs.WienerProcess(duration=100., dt=0.1, n=50, t_start=10., t_end=90., seed=1)
+    values = gen.chunk(0, len(gen))
+    self.assertEqual(values.shape, (1000, 50))
+    self.assertTrue(np.all(values[:100] == 0.))
+    self.assertTrue(np.all(values[900:] == 0.))
+    self.assertAlmostEqual(float(jnp.std(values[100:900])), 0.1 ** 0.5, delta=0.01)
+    self.assertTrue(np.allclose(gen(500), values[500]))
+
+  def test_ou_process(self):
+    gen = bp.inputs.OUProcess(mean=1., sigma=0.1, tau=10., duration=100., dt=0.1, n=20, seed=1)
+    values = gen.chunk(0, len(gen))
+    self.assertEqual(values.shape, (1000, 20))
+    self.assertAlmostEqual(float(jnp.mean(values)), 1., delta=0.05)
+    gen.reset_state()
+    self.assertTrue(np.allclose(gen(0), values[0]))
+    self.assertTrue(np.allclose(gen(0), values[0]))  # the same step is not integrated twice
+    self.assertTrue(np.allclose(gen(1), values[1]))
+
+
+class TestGeneratorInputs(unittest.TestCase):
+  def test_dsrunner(self):
+    class Model(bp.DynamicalSystem):
+      def __init__(self):
+        super().__init__()
+        self.a = bm.Variable(bm.zeros(3))
+        self.b = bm.Variable(bm.zeros(3))
+
+      def update(self):
+        self.b.value = self.a.value * 2.
+
+    with bm.environment(dt=0.1):
+      model = Model()
+      gen = bp.inputs.SectionInput(values=[0., 20., 0.], durations=[10., 30., 10.])
+      runner = bp.DSRunner(model, inputs=[('a', gen, 'fix', '=')], monitors=['b'], progress_bar=False)
+      runner.run(50.)
+    expected = bp.inputs.section_input(values=[0., 20., 0.], durations=[10., 30., 10.], dt=0.1)
+    self.assertTrue(np.allclose(runner.mon['b'][:, 0], expected * 2.))
+
+  def test_input_var(self):
+    with bm.environment(dt=0.1):
+      gen = bp.inputs.RampInput(0., 1., 10.)
+      var = bp.dyn.InputVar(5, generator=gen)
+      runner = bp.DSRunner(var, progress_bar=False)
+      out = runner.run(10.)
+    self.assertTrue(np.allclose(out[:, 0], bp.inputs.ramp_input(0., 1., 10., dt=0.1)))
+
+    with self.assertRaises(TypeError):
+      bp.dyn.InputVar(5, generator=lambda i: i)
+
+  def test_input_var_reset(self):
+    with bm.environment(dt=0.1):
+      gen = bp.inputs.OUProcess(0.5, 0.2, 5., 10., n=5, seed=1)
+      var = bp.dyn.InputVar(5, generator=gen)
+      outs = []
+      for _ in range(2):
+        var.reset()
+        outs.append(bp.DSRunner(var, progress_bar=False).run(10.))
+    self.assertFalse(np.allclose(outs[0][0], outs[0][-1]))
+    self.assertTrue(np.allclose(outs[0], outs[1]))
@@ -8,7 +8,6 @@ This module provides numerical methods for integrating Caputo fractional derivat
 from typing import Union, Dict, Sequence, Callable
 
 import jax
-from scipy.special import gamma, rgamma
 
 import brainpy.math as bm
 from brainpy import check
@@ -138,6 +137,7 @@ class CaputoEuler(FDEIntegrator):
     self.inits = check_inits(inits, self.variables)
 
     # coefficients
+    from scipy.special import rgamma
     rgamma_alpha = bm.asarray(rgamma(bm.as_numpy(self.alpha)))
     ranges = bm.asarray([bm.arange(num_memory + 1) for _ in self.variables]).T
     coef = rgamma_alpha * bm.diff(bm.power(ranges, self.alpha), axis=0)
@@ -325,6 +325,7 @@ class CaputoL1Schema(FDEIntegrator):
     if not bm.all(bm.logical_and(self.alpha <= 1, self.alpha > 0)):
       raise UnsupportedError(f'Only support the fractional order in (0, 1), '
                              f'but we got {self.alpha}.')
+    from scipy.special import gamma
     self.gamma_alpha = bm.asarray(gamma(bm.as_numpy(2 - self.alpha)))
 
     # initial values
@@ -82,6 +82,19 @@ class SDEIntegrator(Integrator):
     # others
     self.show_code = show_code
 
+  def _wiener_noise(self, shape, t, dt, count: int = 0):
+    """Draw the standard normal noise of the Wiener increments.
+
+    In the counter-based random mode (see :py:func:`brainpy.math.random.set_counter_based`),
+    the key is derived from the integrator, the time step index ``round(t / dt)``
+    and ``count``, i.e., the index of the draw within one step.
+    """
+    key = None
+    if bm.random.is_counter_based():
+      i = jnp.round(bm.as_jax(t) / dt).astype(jnp.int32)
+      key = bm.random.module_key(self, i=i, count=count)
+    return bm.random.randn(*shape, key=key)
+
   def _check_vector_wiener_dim(self, noise_size, var_size):
     if noise_size[:-1] > var_size[-len(noise_size) +1:]:
       raise ValueError(f"Incompatible shapes for shapes of noise {noise_size} and variable {var_size}")
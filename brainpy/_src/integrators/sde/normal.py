@@ -132,22 +132,22 @@ class Euler(SDEIntegrator):
     # integral results
     integrals = []
     if self.intg_type == constants.ITO_SDE:
-      for key in self.variables:
+      for i, key in enumerate(self.variables):
         integral = all_args[key] + drifts[key] * dt
         if diffusions[key] is not None:
           shape = jnp.shape(all_args[key])
           if self.wiener_type == constants.SCALAR_WIENER:
-            integral += diffusions[key] * bm.random.randn(*shape) * jnp.sqrt(dt)
+            integral += diffusions[key] * self._wiener_noise(shape, all_args['t'], dt, i) * jnp.sqrt(dt)
           else:
             shape += jnp.shape(diffusions[key])[-1:]
-            integral += jnp.sum(diffusions[key] * bm.random.randn(*shape), axis=-1) * jnp.sqrt(dt)
+            integral += jnp.sum(diffusions[key] * self._wiener_noise(shape, all_args['t'], dt, i), axis=-1) * jnp.sqrt(dt)
         integrals.append(integral)
 
     else:
       # \bar{Y}_{n}=Y_{n}+g_{n} \Delta W_{n}
       all_args_bar = {key: val for key, val in all_args.items()}
       all_noises = {}
-      for key in self.variables:
+      for i, key in enumerate(self.variables):
         if diffusions[key] is None:
           all_args_bar[key] = all_args[key]
         else:
@@ -156,7 +156,7 @@ class Euler(SDEIntegrator):
             noise_shape = jnp.shape(diffusions[key])
             self._check_vector_wiener_dim(noise_shape, shape)
             shape += noise_shape[-1:]
-          noise = bm.random.randn(*shape)
+          noise = self._wiener_noise(shape, all_args['t'], dt, i)
           all_noises[key] = noise * jnp.sqrt(dt)
           if self.wiener_type == constants.VECTOR_WIENER:
             y_bar = all_args[key] + jnp.sum(diffusions[key] * noise, axis=-1)
@@ -358,7 +358,7 @@ class Milstein(SDEIntegrator):
           noise_shape = jnp.shape(diffusions[key])
           self._check_vector_wiener_dim(noise_shape, shape)
           shape += noise_shape[-1:]
-        noise = bm.random.randn(*shape) * jnp.sqrt(dt)
+        noise = self._wiener_noise(shape, all_args['t'], dt, i) * jnp.sqrt(dt)
         if self.wiener_type == constants.VECTOR_WIENER:
           integral += jnp.sum(diffusions[key] * noise, axis=-1)
         else:
@@ -483,7 +483,7 @@ class MilsteinGradFree(SDEIntegrator):
           noise_shape = jnp.shape(diffusions[key])
           self._check_vector_wiener_dim(noise_shape, shape)
           shape += noise_shape[-1:]
-        noise = bm.random.randn(*shape) * jnp.sqrt(dt)
+        noise = self._wiener_noise(shape, all_args['t'], dt, i) * jnp.sqrt(dt)
         if self.wiener_type == constants.VECTOR_WIENER:
           integral += jnp.sum(diffusions[key] * noise, axis=-1)
         else:
@@ -597,9 +597,9 @@ class ExponentialEuler(SDEIntegrator):
             noise_shape = jnp.shape(diffusion)
             self._check_vector_wiener_dim(noise_shape, shape)
             shape += noise_shape[-1:]
-            diffusion = jnp.sum(diffusion * bm.random.randn(*shape), axis=-1)
+            diffusion = jnp.sum(diffusion * self._wiener_noise(shape, params_in['t'], dt, i), axis=-1)
           else:
-            diffusion = diffusion * bm.random.randn(*shape)
+            diffusion = diffusion * self._wiener_noise(shape, params_in['t'], dt, i)
           r += diffusion * jnp.sqrt(params_in[constants.DT])
         # final result
         results.append(r)
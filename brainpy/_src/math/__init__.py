@@ -44,7 +44,7 @@ from .interoperability import *
 from .compat_numpy import *
 from .compat_tensorflow import *
 from .others import *
-from . import random, linalg, fft, tifunc
+from . import random, linalg, fft
 
 # operators
 from .op_register import *
@@ -59,3 +59,11 @@ from .modes import *
 from .environment import *
 from .scales import *
 
+
+def __getattr__(name):
+  # "tifunc" defines the Taichi functions, which needs to import taichi.
+  # It is imported at the first access of ``brainpy.math.tifunc``.
+  if name == 'tifunc':
+    import importlib
+    return importlib.import_module(f'{__name__}.tifunc')
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,14 +1,11 @@
 import jax.numpy as jnp
 from jax import config
 
-from brainpy._src.dependency_check import import_taichi
 from .modes import NonBatchingMode
 from .scales import IdScaling
 
 __all__ = ['mode', 'membrane_scaling', 'dt', 'bool_', 'int_', 'ti_int', 'float_', 'ti_float', 'complex_']
 
-ti = import_taichi(error_if_not_found=False)
-
 # Default computation mode.
 mode = NonBatchingMode()
 
@@ -38,14 +35,15 @@ bp_object_as_pytree = False
 numpy_func_return = 'bp_array'  # 'bp_array','jax_array'
 
 
-if ti is not None:
-  # Default integer data type in Taichi.
-  ti_int = ti.int64 if config.read('jax_enable_x64') else ti.int32
-
-  # Default float data type in Taichi.
-  ti_float = ti.float64 if config.read('jax_enable_x64') else ti.float32
-
-else:
-  ti_int = None
-  ti_float = None
-
+def __getattr__(name):
+  # The default data types in Taichi follow the current ``int_`` and
+  # ``float_``. They are resolved at the first access, so that importing
+  # this module does not need to import taichi.
+  if name in ('ti_int', 'ti_float'):
+    from brainpy._src.dependency_check import import_taichi
+    ti = import_taichi(error_if_not_found=False)
+    if ti is None:
+      return None
+    dtype = int_ if name == 'ti_int' else float_
+    return getattr(ti, jnp.dtype(dtype).name)
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,2 +1,3 @@
 from .csr_matvec import *
+from .ell_matvec import *
 
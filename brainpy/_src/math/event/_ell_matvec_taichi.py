@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Taichi kernels and operators of :py:func:`brainpy.math.event.ellmv`.
+"""
+
+import jax.numpy as jnp
+from jax.interpreters import ad
+
+from brainpy._src.dependency_check import import_taichi
+from brainpy._src.math.event.ell_matvec import raw_ellmv_taichi, ell_matvec
+from brainpy._src.math.op_register import XLACustomOp
+
+ti = import_taichi()
+
+
+# -------------
+# CPU operators
+# -------------
+
+# 1. Same as the CSR kernels, the transpose kernels are serialized on CPU.
+# 2. Each row has the same number of elements, so that the rows are
+#    accessed without the "indptr" indirection. The padded elements
+#    have the indices out of the range, and they are skipped.
+
+@ti.kernel
+def _event_ell_matvec_transpose_homo_cpu(values: ti.types.ndarray(ndim=1),
+                                         indices: ti.types.ndarray(ndim=2),
+                                         events: ti.types.ndarray(ndim=1),
+                                         out: ti.types.ndarray(ndim=1)):
+  value = values[0]
+  num_out = out.shape[0]
+  for i in range(num_out):
+    out[i] = 0.
+  ti.loop_config(serialize=True)
+  for row_i in range(indices.shape[0]):
+    if events[row_i] != 0:
+      for j in range(indices.shape[1]):
+        if indices[row_i, j] < num_out:
+          out[indices[row_i, j]] += value
+
+
+@ti.kernel
+def _event_ell_matvec_transpose_heter_cpu(values: ti.types.ndarray(ndim=2),
+                                          indices: ti.types.ndarray(ndim=2),
+                                          events: ti.types.ndarray(ndim=1),
+                                          out: ti.types.ndarray(ndim=1)):
+  num_out = out.shape[0]
+  for i in range(num_out):
+    out[i] = 0.
+  ti.loop_config(serialize=True)
+  for row_i in range(indices.shape[0]):
+    if events[row_i] != 0:
+      for j in range(indices.shape[1]):
+        if indices[row_i, j] < num_out:
+          out[indices[row_i, j]] += values[row_i, j]
+
+
+@ti.kernel
+def _event_ell_matvec_homo_cpu(values: ti.types.ndarray(ndim=1),
+                               indices: ti.types.ndarray(ndim=2),
+                               events: ti.types.ndarray(ndim=1),
+                               out: ti.types.ndarray(ndim=1)):
+  value = values[0]
+  num_in = events.shape[0]
+  for row_i in range(indices.shape[0]):
+    r = 0.
+    for j in range(indices.shape[1]):
+      if indices[row_i, j] < num_in:
+        if events[indices[row_i, j]] != 0:
+          r += value
+    out[row_i] = r
+
+
+@ti.kernel
+def _event_ell_matvec_heter_cpu(values: ti.types.ndarray(ndim=2),
+                                indices: ti.types.ndarray(ndim=2),
+                                events: ti.types.ndarray(ndim=1),
+                                out: ti.types.ndarray(ndim=1)):
+  num_in = events.shape[0]
+  for row_i in range(indices.shape[0]):
+    r = 0.
+    for j in range(indices.shape[1]):
+      if indices[row_i, j] < num_in:
+        if events[indices[row_i, j]] != 0:
+          r += values[row_i, j]
+    out[row_i] = r
+
+
+# -------------
+# GPU operators
+# -------------
+
+# 1. The transpose kernels are parallelized over all elements, since
+#    the rows have the same length.
+
+@ti.kernel
+def _event_ell_matvec_transpose_homo_gpu(values: ti.types.ndarray(ndim=1),
+                                         indices: ti.types.ndarray(ndim=2),
+                                         events: ti.types.ndarray(ndim=1),
+                                         out: ti.types.ndarray(ndim=1)):
+  value = values[0]
+  num_out = out.shape[0]
+  for i in range(num_out):
+    out[i] = 0.
+  for row_i, j in ti.ndrange(indices.shape[0], indices.shape[1]):
+    if events[row_i] != 0:
+      if indices[row_i, j] < num_out:
+        out[indices[row_i, j]] += value
+
+
+@ti.kernel
+def _event_ell_matvec_transpose_heter_gpu(values: ti.types.ndarray(ndim=2),
+                                          indices: ti.types.ndarray(ndim=2),
+                                          events: ti.types.ndarray(ndim=1),
+                                          out: ti.types.ndarray(ndim=1)):
+  num_out = out.shape[0]
+  for i in range(num_out):
+    out[i] = 0.
+  for row_i, j in ti.ndrange(indices.shape[0], indices.shape[1]):
+    if events[row_i] != 0:
+      if indices[row_i, j] < num_out:
+        out[indices[row_i, j]] += values[row_i, j]
+
+
+def _event_ell_matvec_jvp_values(val_dot, values, indices, events, *, outs, transpose, shape):
+  return raw_ellmv_taichi(val_dot, indices, events, shape=shape, transpose=transpose)
+
+
+def _event_ell_matvec_jvp_events(evt_dot, values, indices, events, *, outs, transpose, shape):
+  return [ell_matvec(values, indices, evt_dot, shape=shape, transpose=transpose)]
+
+
+def _event_ell_matvec_transpose(ct, values, indices, events, *, outs, transpose, shape):
+  if ad.is_undefined_primal(indices):
+    raise ValueError("Cannot transpose with respect to sparse indices.")
+  ct = ct[0]
+  if ad.is_undefined_primal(events):
+    if type(ct) is ad.Zero:
+      return values, indices, ad.Zero(events.aval)
+    # the product of the transposed matrix
+    if transpose:
+      ct_events = ell_matvec(values, indices, ct, shape=shape, transpose=False)
+    else:
+      ct_events = ell_matvec(values, indices, ct, shape=shape, transpose=True)
+    return values, indices, ct_events
+  else:
+    if type(ct) is ad.Zero:
+      return ad.Zero(values.aval), indices, events
+    num_in = shape[1]
+    mask = indices < num_in
+    if transpose:
+      ct_values = jnp.expand_dims(events, 1) * jnp.concatenate([ct, jnp.zeros(1, dtype=ct.dtype)])[
+        jnp.minimum(indices, num_in)]
+    else:
+      ct_values = (jnp.concatenate([events, jnp.zeros(1, dtype=events.dtype)])[jnp.minimum(indices, num_in)] *
+                   jnp.expand_dims(ct, 1))
+    ct_values = jnp.where(mask, ct_values, 0.)
+    if values.aval.ndim == 1:  # scalar
+      ct_values = jnp.sum(ct_values, keepdims=True)
+    return ct_values.astype(values.aval.dtype), indices, events
+
+
+def _define_op(cpu_kernel, gpu_kernel):
+  prim = XLACustomOp(cpu_kernel=cpu_kernel, gpu_kernel=gpu_kernel)
+  prim.defjvp(_event_ell_matvec_jvp_values, None, _event_ell_matvec_jvp_events)
+  prim.def_transpose_rule(_event_ell_matvec_transpose)
+  return prim
+
+
+# transpose homo
+_event_ellmv_transpose_homo_p = _define_op(_event_ell_matvec_transpose_homo_cpu,
+                                           _event_ell_matvec_transpose_homo_gpu)
+
+# transpose heter
+_event_ellmv_transpose_heter_p = _define_op(_event_ell_matvec_transpose_heter_cpu,
+                                            _event_ell_matvec_transpose_heter_gpu)
+
+# not transpose homo
+_event_ellmv_homo_p = _define_op(_event_ell_matvec_homo_cpu,
+                                 _event_ell_matvec_homo_cpu)
+
+# not transpose heter
+_event_ellmv_heter_p = _define_op(_event_ell_matvec_heter_cpu,
+                                  _event_ell_matvec_heter_cpu)
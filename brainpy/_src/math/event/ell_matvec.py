@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+
+from typing import Union, Tuple
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+from brainpy._src.dependency_check import import_taichi
+from brainpy._src.math.interoperability import as_jax
+from brainpy.errors import PackageMissingError
+
+__all__ = [
+  'ellmv'
+]
+
+
+def ellmv(
+    data: Union[float, jax.Array],
+    indices: jax.Array,
+    events: jax.Array,
+    *,
+    shape: Tuple[int, int],
+    transpose: bool = False,
+) -> jax.Array:
+  """Product of a sparse ELL matrix and a dense event vector.
+
+  The ELL matrix stores the column indices of each row in a 2D array
+  with the shape of ``(shape[0], num_col)``, which can be obtained by
+  ``connector.require('ell')``. Rows with less than ``num_col`` nonzero
+  elements are padded with the indices ``>= shape[1]``, which are ignored.
+  Compared with the CSR matrix, it does not need the ``indptr`` indirection,
+  and it is suitable for the connections with a fixed number of
+  post-synaptic targets (like :py:class:`~.FixedPostNum`).
+
+  This function supports JAX transformations, including `jit()`, `grad()`,
+  `vmap()` and `pmap()`.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  data: ndarray, float
+    A scalar, or an array of shape ``indices.shape``.
+  indices: ndarray
+    An array of shape ``(shape[0], num_col)``.
+  events: ndarray
+    An array of shape ``(shape[0] if transpose else shape[1],)``.
+  shape: tuple
+    A length-2 tuple representing the matrix shape.
+  transpose: bool
+    A boolean specifying whether to transpose the sparse matrix
+    before computing.
+    If ``transpose=True``, the operator will compute based on the
+    event-driven property of the ``events`` vector.
+
+  Returns
+  -------
+  y : Array
+    The array of shape ``(shape[1] if transpose else shape[0],)`` representing
+    the matrix vector product.
+  """
+  data = as_jax(data)
+  indices = as_jax(indices)
+  events = as_jax(events)
+
+  # checking
+  data = jnp.atleast_1d(data)
+  if np.ndim(data) == 1:
+    if data.shape[0] != 1:
+      raise ValueError(f'The data should be a scalar or have the same shape with indices. '
+                       f'But we got {data.shape} != {indices.shape}.')
+  elif data.shape != indices.shape:
+    raise ValueError(f'The data should be a scalar or have the same shape with indices. '
+                     f'But we got {data.shape} != {indices.shape}.')
+  if np.ndim(indices) != 2:
+    raise ValueError('indices should be a 2D array with integer type.')
+  if not jnp.issubdtype(indices.dtype, jnp.integer):
+    raise ValueError(f'indices should be a 2D array with integer type, but we got {indices.dtype}.')
+  if np.ndim(events) != 1:
+    raise ValueError('events should be a 1D vector.')
+  if len(shape) != 2:
+    raise ValueError('shape should be a length-2 tuple.')
+  if indices.shape[0] != shape[0]:
+    raise ValueError(f'The number of rows of indices should be {shape[0]}, but we got {indices.shape[0]}.')
+  if transpose:
+    if events.shape[0] != shape[0]:
+      raise ValueError(f'Shape mismatch, vec ({events.shape[0]},) @ mat {shape}.')
+  else:
+    if events.shape[0] != shape[1]:
+      raise ValueError(f'Shape mismatch, mat {shape} @ vec ({events.shape[0]},).')
+
+  # if there is no connection, then we return a zero vector
+  if indices.size == 0:
+    return jnp.zeros(shape[1] if transpose else shape[0], dtype=data.dtype)
+
+  return raw_ellmv_taichi(data, indices, events, shape=shape, transpose=transpose)[0]
+
+
+def raw_ellmv_taichi(
+    data: jax.Array,
+    indices: jax.Array,
+    events: jax.Array,
+    *,
+    shape: Tuple[int, int],
+    transpose: bool = False
+):
+  if import_taichi(error_if_not_found=False) is None:
+    raise PackageMissingError.by_purpose(name='taichi==1.7.0', purpose='customized operators')
+  from brainpy._src.math.event._ell_matvec_taichi import (_event_ellmv_homo_p,
+                                                          _event_ellmv_heter_p,
+                                                          _event_ellmv_transpose_homo_p,
+                                                          _event_ellmv_transpose_heter_p)
+
+  if transpose:
+    prim = _event_ellmv_transpose_homo_p if data.ndim == 1 else _event_ellmv_transpose_heter_p
+  else:
+    prim = _event_ellmv_homo_p if data.ndim == 1 else _event_ellmv_heter_p
+  return prim(data,
+              indices,
+              events,
+              outs=[jax.ShapeDtypeStruct(shape=(shape[1] if transpose else shape[0],), dtype=data.dtype)],
+              transpose=transpose,
+              shape=shape)
+
+
+def ell_matvec(data, indices, vector, *, shape, transpose=False):
+  """The (non-event) product of a ELL matrix and a dense vector with XLA operators.
+
+  It is used for the autodiff rules of :py:func:`ellmv`.
+  """
+  if data.ndim == 1:
+    data = jnp.broadcast_to(data, indices.shape)
+  data = data * (indices < shape[1])
+  if transpose:
+    return jax.ops.segment_sum((data * jnp.expand_dims(vector, 1)).ravel(),
+                               indices.ravel(),
+                               num_segments=shape[1])
+  else:
+    vector = jnp.concatenate([vector, jnp.zeros(1, dtype=vector.dtype)])
+    return jnp.sum(data * vector[jnp.minimum(indices, shape[1])], axis=1)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+import pytest
+from absl.testing import parameterized
+
+import brainpy as bp
+import brainpy.math as bm
+from brainpy._src.dependency_check import import_taichi
+
+if import_taichi(error_if_not_found=False) is None:
+  pytest.skip('no taichi', allow_module_level=True)
+
+import platform
+force_test = False  # turn on to force test on windows locally
+if platform.system() == 'Windows' and not force_test:
+  pytest.skip('skip windows', allow_module_level=True)
+
+
+seed = 1234
+
+
+def ell_to_dense(data, indices, shape):
+  data = jnp.broadcast_to(bm.as_jax(data), indices.shape)
+  dense = jnp.zeros((shape[0], shape[1] + 1), dtype=data.dtype)
+  dense = dense.at[jnp.repeat(jnp.arange(shape[0]), indices.shape[1]), indices.ravel()].add(data.ravel())
+  return dense[:, :shape[1]]
+
+
+def get_ell(shape, fixed=True):
+  if fixed:
+    return bp.conn.FixedPostNum(10, seed=seed)(*shape).require('ell')
+  return bp.conn.FixedProb(0.1, seed=seed)(*shape).require('ell')
+
+
+class Test_event_ell_matvec(parameterized.TestCase):
+  def __init__(self, *args, platform='cpu', **kwargs):
+    super(Test_event_ell_matvec, self).__init__(*args, **kwargs)
+
+    print()
+    bm.set_platform(platform)
+
+  @parameterized.product(
+    transpose=[True, False],
+    shape=[(100, 200), (200, 50)],
+    fixed=[True, False],
+    homo=[True, False],
+    bool_event=[True, False],
+  )
+  def test_ellmv(self, transpose, shape, fixed, homo, bool_event):
+    rng = bm.random.RandomState(seed)
+    indices = get_ell(shape, fixed)
+    data = 1.5 if homo else rng.rand(*indices.shape)
+    events = rng.random(shape[0] if transpose else shape[1]) < 0.1
+    if not bool_event:
+      events = events.astype(float)
+
+    dense = ell_to_dense(data, indices, shape)
+    events = bm.as_jax(events)
+    r1 = (events @ dense) if transpose else (dense @ events)
+    r2 = bm.event.ellmv(data, indices, events, shape=shape, transpose=transpose)
+    self.assertTrue(bm.allclose(r1, r2))
+
+    bm.clear_buffer_memory()
+
+  @parameterized.product(
+    transpose=[True, False],
+    homo=[True, False],
+  )
+  def test_vmap(self, transpose, homo):
+    shape = (100, 200)
+    rng = bm.random.RandomState(seed)
+    indices = get_ell(shape, fixed=False)
+    data = 1.5 if homo else bm.as_jax(rng.rand(*indices.shape))
+    events = bm.as_jax(rng.random((5, shape[0] if transpose else shape[1]))) < 0.1
+
+    dense = ell_to_dense(data, indices, shape)
+    r1 = jax.vmap(lambda e: (e @ dense) if transpose else (dense @ e))(events)
+    f = partial(bm.event.ellmv, data, indices, shape=shape, transpose=transpose)
+    r2 = jax.vmap(f)(events)
+    self.assertTrue(bm.allclose(r1, r2))
+
+    bm.clear_buffer_memory()
+
+  @parameterized.product(
+    transpose=[True, False],
+    homo=[True, False],
+  )
+  def test_grad(self, transpose, homo):
+    shape = (100, 200)
+    rng = bm.random.RandomState(seed)
+    indices = get_ell(shape, fixed=False)
+    data = bm.as_jax(rng.rand(1) if homo else rng.rand(*indices.shape))
+    events = bm.as_jax(rng.random(shape[0] if transpose else shape[1]) < 0.1).astype(float)
+
+    def f_dense(d, e):
+      dense = ell_to_dense(d, indices, shape)
+      return ((e @ dense) if transpose else (dense @ e)).sum()
+
+    def f_ell(d, e):
+      return bm.event.ellmv(d, indices, e, shape=shape, transpose=transpose).sum()
+
+    r1 = jax.grad(f_dense, argnums=(0, 1))(data, events)
+    r2 = jax.grad(f_ell, argnums=(0, 1))(data, events)
+    self.assertTrue(bm.allclose(r1[0], r2[0]))
+    self.assertTrue(bm.allclose(r1[1], r2[1]))
+
+    bm.clear_buffer_memory()
+
+  @parameterized.product(
+    transpose=[True, False],
+    homo=[True, False],
+  )
+  def test_jvp(self, transpose, homo):
+    shape = (100, 200)
+    rng = bm.random.RandomState(seed)
+    indices = get_ell(shape, fixed=False)
+    data = bm.as_jax(rng.rand(1) if homo else rng.rand(*indices.shape))
+    events = bm.as_jax(rng.random(shape[0] if transpose else shape[1]) < 0.1).astype(float)
+    data_dot = jnp.ones_like(data)
+    events_dot = jnp.ones_like(events)
+
+    def f_dense(d, e):
+      dense = ell_to_dense(d, indices, shape)
+      return (e @ dense) if transpose else (dense @ e)
+
+    def f_ell(d, e):
+      return bm.event.ellmv(d, indices, e, shape=shape, transpose=transpose)
+
+    o1, t1 = jax.jvp(f_dense, (data, events), (data_dot, events_dot))
+    o2, t2 = jax.jvp(f_ell, (data, events), (data_dot, events_dot))
+    self.assertTrue(bm.allclose(o1, o2))
+    self.assertTrue(bm.allclose(t1, t2))
+
+    bm.clear_buffer_memory()
+
+  def test_checking(self):
+    indices = get_ell((10, 20))
+    with self.assertRaises(ValueError):
+      bm.event.ellmv(1., indices, jnp.ones(10), shape=(10, 20))
+    with self.assertRaises(ValueError):
+      bm.event.ellmv(jnp.ones(3), indices, jnp.ones(20), shape=(10, 20))
+    with self.assertRaises(ValueError):
+      bm.event.ellmv(1., indices.astype(float), jnp.ones(20), shape=(10, 20))
+
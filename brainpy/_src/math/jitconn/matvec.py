@@ -11,11 +11,8 @@ from jax.interpreters import ad
 from brainpy._src.dependency_check import import_taichi
 from brainpy._src.math.interoperability import as_jax
 from brainpy._src.math.ndarray import Array, _get_dtype
-from brainpy._src.math.op_register import XLACustomOp
 from brainpy.errors import PackageMissingError
 
-ti = import_taichi(error_if_not_found=False)
-
 __all__ = [
   'mv_prob_homo',
   'mv_prob_uniform',
@@ -81,7 +78,7 @@ def mv_prob_homo(
   out: Array, ndarray
     The output of :math:`y = M @ v`.
   """
-  if ti is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', purpose='customized operators')
 
   vector = as_jax(vector)
@@ -160,7 +157,7 @@ def mv_prob_uniform(
   out: Array, ndarray
     The output of :math:`y = M @ v`.
   """
-  if ti is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', purpose='customized operators')
 
   vector = as_jax(vector)
@@ -239,7 +236,7 @@ def mv_prob_normal(
   out: Array, ndarray
     The output of :math:`y = M @ v`.
   """
-  if ti is None:
+  if import_taichi(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose('taichi', purpose='customized operators')
 
   vector = as_jax(vector)
@@ -267,6 +264,8 @@ def raw_mv_prob_homo(
     transpose: bool = False,
     outdim_parallel: bool = True,
 ) -> jax.Array:
+  from brainpy._src.math.jitconn._matvec_taichi import (_mv_prob_homo_outdim_parallel_p,
+                                                        _mv_prob_homo_p)
   mat_shape, out_shape = _non_event_checking(vector, clen, seed, shape, outdim_parallel, transpose, weight)
 
   if outdim_parallel:
@@ -295,6 +294,8 @@ def raw_mv_prob_uniform(
     transpose: bool = False,
     outdim_parallel: bool = True,
 ) -> jax.Array:
+  from brainpy._src.math.jitconn._matvec_taichi import (_mv_prob_uniform_outdim_parallel_p,
+                                                        _mv_prob_uniform_p)
   mat_shape, out_shape = _non_event_checking(vector, conn_len, seed, shape, outdim_parallel, transpose, w_low, w_high)
 
   if outdim_parallel:
@@ -324,6 +325,8 @@ def raw_mv_prob_normal(
     transpose: bool = False,
     outdim_parallel: bool = True,
 ) -> jax.Array:
+  from brainpy._src.math.jitconn._matvec_taichi import (_mv_prob_normal_outdim_parallel_p,
+                                                        _mv_prob_normal_p)
   mat_shape, out_shape = _non_event_checking(vector, conn_len, seed, shape, outdim_parallel, transpose, w_mu, w_sigma)
 
   if outdim_parallel:
@@ -445,476 +448,3 @@ def _mv_prob_normal_transpose(
 
 def _reverse(shape):
   return shape[::-1]
-
-
-if ti is not None:
-  from brainpy._src.math.tifunc import (lfsr88_key, lfsr88_random_integers, lfsr88_uniform, lfsr88_normal)
-
-
-  @ti.kernel
-  def _mv_prob_homo_cpu(
-      vector: ti.types.ndarray(ndim=1),
-      weight: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    weight0 = weight[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-
-    for i_col in range(num_col):
-      key = lfsr88_key(seed0 + i_col)
-      key, i_row = lfsr88_random_integers(key, 0, clen0 - 1)
-      v = vector[i_col] * weight0
-      while i_row < num_row:
-        out[i_row] += v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_row += inc
-
-
-  @ti.kernel
-  def _mv_prob_homo_outdim_parallel_cpu(
-      vector: ti.types.ndarray(ndim=1),
-      weight: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    weight0 = weight[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-
-    for i_row in range(num_row):
-      r = 0.
-      key = lfsr88_key(seed0 + i_row)
-      key, i_col = lfsr88_random_integers(key, 0, clen0 - 1)
-      while i_col < num_col:
-        r += vector[i_col]
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_col += inc
-      out[i_row] = r * weight0
-
-
-  @ti.kernel
-  def _mv_prob_homo_gpu(
-      vector: ti.types.ndarray(ndim=1),
-      weight: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    weight0 = weight[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-    step = ti.uint32(ti.max((num_row + 1) >> 5, 1))
-
-    for i in range(num_col * 32):
-      i_col = i >> 5
-      index = i & 31
-      col_v = vector[i_col]
-      i_row = step * index - 1
-      end = ti.min(i_row + step, num_row)
-      key = lfsr88_key(seed0 + i)
-      key, inc = lfsr88_random_integers(key, 1, clen0)
-      i_row += inc
-      while i_row < end:
-        out[i_row] += weight0 * col_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_row += inc
-
-
-  @ti.kernel
-  def _mv_prob_homo_outdim_parallel_gpu(
-      vector: ti.types.ndarray(ndim=1),
-      weight: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    weight0 = weight[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-    step = ti.u32(ti.max((num_row + 1) >> 5, 1))
-
-    for i in range(num_row * 32):
-      i_row = i >> 5
-      i_thread = i & 31
-      i_col = step * i_thread - 1
-      end_col = ti.min(i_col + step, num_col)
-      r = 0.
-      key = lfsr88_key(seed0 + i)
-      key, inc = lfsr88_random_integers(key, 1, clen0)
-      i_col += inc
-      while i_col < end_col:
-        r += vector[i_col]
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_col += inc
-      out[i_row] += weight0 * r  # TODO: warp-level reduction
-
-
-  def _mv_prob_homo_jvp_vector(v_dot, vector, weight, clen, seed, *, outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_homo(v_dot, weight, clen, seed, shape=shape, transpose=transpose,
-                            outdim_parallel=outdim_parallel)
-
-
-  def _mv_prob_homo_jvp_weight(w_dot, vector, weight, clen, seed, *, outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_homo(vector, w_dot, clen, seed, shape=shape, transpose=transpose,
-                            outdim_parallel=outdim_parallel)
-
-
-  def _define_mv_prob_homo_prim(cpu_kernel, gpu_kernel):
-    prim = XLACustomOp(cpu_kernel=cpu_kernel, gpu_kernel=gpu_kernel)
-    prim.defjvp(_mv_prob_homo_jvp_vector, _mv_prob_homo_jvp_weight, None, None)
-    prim.def_transpose_rule(_mv_prob_homo_transpose)
-    return prim
-
-
-  # outdim_parallel = True
-  _mv_prob_homo_outdim_parallel_p = _define_mv_prob_homo_prim(cpu_kernel=_mv_prob_homo_outdim_parallel_cpu,
-                                                              gpu_kernel=_mv_prob_homo_outdim_parallel_gpu)
-
-  # outdim_parallel = False
-  _mv_prob_homo_p = _define_mv_prob_homo_prim(cpu_kernel=_mv_prob_homo_cpu,
-                                              gpu_kernel=_mv_prob_homo_gpu)
-
-
-  @ti.kernel
-  def _mv_prob_uniform_cpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_min: ti.types.ndarray(ndim=1),
-      w_max: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-
-    for i_col in range(num_col):
-      col_v = vector[i_col]
-      key = lfsr88_key(seed0 + i_col)
-      key, i_row = lfsr88_random_integers(key, 0, clen0 - 1)
-      while i_row < num_row:
-        key, raw_v = lfsr88_uniform(key, w_min0, w_max0)
-        out[i_row] += col_v * raw_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_row += inc
-
-
-  @ti.kernel
-  def _mv_prob_uniform_outdim_parallel_cpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_min: ti.types.ndarray(ndim=1),
-      w_max: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-
-    for i_row in range(num_row):
-      r = 0.
-      key = lfsr88_key(seed0 + i_row)
-      key, i_col = lfsr88_random_integers(key, 0, clen0 - 1)
-      while i_col < num_col:
-        key, raw_v = lfsr88_uniform(key, w_min0, w_max0)
-        r += vector[i_col] * raw_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_col += inc
-      out[i_row] = r
-
-
-  @ti.kernel
-  def _mv_prob_uniform_gpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_min: ti.types.ndarray(ndim=1),
-      w_max: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-    step = ti.uint32(ti.max((num_row + 1) >> 5, 1))
-
-    for i in range(num_col * 32):
-      i_col = i >> 5
-      index = i & 31
-      col_v = vector[i_col]
-      i_row = step * index - 1
-      end = ti.min(i_row + step, num_row)
-      key = lfsr88_key(seed0 + i)
-      key, inc = lfsr88_random_integers(key, 1, clen0)
-      i_row += inc
-      while i_row < end:
-        key, row_v = lfsr88_uniform(key, w_min0, w_max0)
-        out[i_row] += row_v * col_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_row += inc
-
-
-  @ti.kernel
-  def _mv_prob_uniform_outdim_parallel_gpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_min: ti.types.ndarray(ndim=1),
-      w_max: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_min0 = w_min[0]
-    w_max0 = w_max[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-    step = ti.u32(ti.max((num_row + 1) >> 5, 1))
-
-    for i in range(num_row * 32):
-      i_row = i >> 5
-      i_thread = i & 31
-      i_col = step * i_thread - 1
-      end_col = ti.min(i_col + step, num_col)
-      r = 0.
-      key = lfsr88_key(seed0 + i)
-      key, inc = lfsr88_random_integers(key, 1, clen0)
-      i_col += inc
-      while i_col < end_col:
-        key, row_v = lfsr88_uniform(key, w_min0, w_max0)
-        r += vector[i_col] * row_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_col += inc
-      out[i_row] += r  # TODO: warp-level reduction
-
-
-  def _mv_prob_uniform_jvp_vector(v_dot, vector, w_low, w_high, clen, seed, *,
-                                  outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_uniform(v_dot, w_low, w_high, clen, seed, shape=shape,
-                               transpose=transpose, outdim_parallel=outdim_parallel)
-
-
-  def _mv_prob_uniform_jvp_wlow(w_dot, vector, w_low, w_high, clen, seed, *,
-                                outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_uniform(vector, w_dot, w_high, clen, seed, shape=shape,
-                               transpose=transpose, outdim_parallel=outdim_parallel)
-
-
-  def _mv_prob_uniform_jvp_whigh(w_dot, vector, w_low, w_high, clen, seed, *,
-                                 outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_uniform(vector, w_low, w_dot, clen, seed, shape=shape,
-                               transpose=transpose, outdim_parallel=outdim_parallel)
-
-
-  def _define_mv_prob_uniform_prim(cpu_kernel, gpu_kernel):
-    prim = XLACustomOp(cpu_kernel=cpu_kernel, gpu_kernel=gpu_kernel)
-    prim.defjvp(_mv_prob_uniform_jvp_vector,
-                _mv_prob_uniform_jvp_wlow,
-                _mv_prob_uniform_jvp_whigh,
-                None,
-                None)
-    prim.def_transpose_rule(_mv_prob_uniform_transpose)
-    return prim
-
-
-  # outdim_parallel = True
-  _mv_prob_uniform_outdim_parallel_p = _define_mv_prob_uniform_prim(
-    cpu_kernel=_mv_prob_uniform_outdim_parallel_cpu,
-    gpu_kernel=_mv_prob_uniform_outdim_parallel_gpu
-  )
-
-  # outdim_parallel = False
-  _mv_prob_uniform_p = _define_mv_prob_uniform_prim(
-    cpu_kernel=_mv_prob_uniform_cpu,
-    gpu_kernel=_mv_prob_uniform_gpu
-  )
-
-
-  @ti.kernel
-  def _mv_prob_normal_cpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_mu: ti.types.ndarray(ndim=1),
-      w_sigma: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_mu0 = w_mu[0]
-    w_sigma0 = w_sigma[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-
-    for i_col in range(num_col):
-      col_v = vector[i_col]
-      key = lfsr88_key(seed0 + i_col)
-      key, i_row = lfsr88_random_integers(key, 0, clen0 - 1)
-      while i_row < num_row:
-        key, raw_v = lfsr88_normal(key, w_mu0, w_sigma0)
-        out[i_row] += col_v * raw_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_row += inc
-
-
-  @ti.kernel
-  def _mv_prob_normal_outdim_parallel_cpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_mu: ti.types.ndarray(ndim=1),
-      w_sigma: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_mu0 = w_mu[0]
-    w_sigma0 = w_sigma[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-
-    for i_row in range(num_row):
-      r = 0.
-      key = lfsr88_key(seed0 + i_row)
-      key, i_col = lfsr88_random_integers(key, 0, clen0 - 1)
-      while i_col < num_col:
-        key, raw_v = lfsr88_normal(key, w_mu0, w_sigma0)
-        r += vector[i_col] * raw_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_col += inc
-      out[i_row] = r
-
-
-  @ti.kernel
-  def _mv_prob_normal_gpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_mu: ti.types.ndarray(ndim=1),
-      w_sigma: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_mu0 = w_mu[0]
-    w_sigma0 = w_sigma[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-    step = ti.uint32(ti.max((num_row + 1) >> 5, 1))
-
-    for i in range(num_col * 32):
-      i_col = i >> 5
-      index = i & 31
-      col_v = vector[i_col]
-      i_row = step * index - 1
-      end = ti.min(i_row + step, num_row)
-      key = lfsr88_key(seed0 + i)
-      key, inc = lfsr88_random_integers(key, 1, clen0)
-      i_row += inc
-      while i_row < end:
-        key, row_v = lfsr88_normal(key, w_mu0, w_sigma0)
-        out[i_row] += row_v * col_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_row += inc
-
-
-  @ti.kernel
-  def _mv_prob_normal_outdim_parallel_gpu(
-      vector: ti.types.ndarray(ndim=1),
-      w_mu: ti.types.ndarray(ndim=1),
-      w_sigma: ti.types.ndarray(ndim=1),
-      clen: ti.types.ndarray(ndim=1),
-      seed: ti.types.ndarray(ndim=1),
-      out: ti.types.ndarray(ndim=1)
-  ):
-    num_row = out.shape[0]
-    num_col = vector.shape[0]
-    w_mu0 = w_mu[0]
-    w_sigma0 = w_sigma[0]
-    clen0 = clen[0]
-    seed0 = seed[0]
-    step = ti.u32(ti.max((num_row + 1) >> 5, 1))
-
-    for i in range(num_row * 32):
-      i_row = i >> 5
-      i_thread = i & 31
-      i_col = step * i_thread - 1
-      end_col = ti.min(i_col + step, num_col)
-      r = 0.
-      key = lfsr88_key(seed0 + i)
-      key, inc = lfsr88_random_integers(key, 1, clen0)
-      i_col += inc
-      while i_col < end_col:
-        key, row_v = lfsr88_normal(key, w_mu0, w_sigma0)
-        r += vector[i_col] * row_v
-        key, inc = lfsr88_random_integers(key, 1, clen0)
-        i_col += inc
-      out[i_row] += r  # TODO: warp-level reduction
-
-
-  def _mv_prob_normal_jvp_vector(v_dot, vector, w_mu, w_sigma, clen, seed, *, outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_normal(v_dot, w_mu, w_sigma, clen, seed, shape=shape,
-                              transpose=transpose, outdim_parallel=outdim_parallel)
-
-
-  def _mv_prob_normal_jvp_w_mu(w_dot, vector, w_mu, w_sigma, clen, seed, *, outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_normal(vector, w_dot, w_sigma, clen, seed, shape=shape,
-                              transpose=transpose, outdim_parallel=outdim_parallel)
-
-
-  def _mv_prob_normal_jvp_w_sigma(w_dot, vector, w_mu, w_sigma, clen, seed, *, outs, shape, transpose, outdim_parallel):
-    shape = _reverse(shape) if transpose else shape
-    return raw_mv_prob_normal(vector, w_mu, w_dot, clen, seed, shape=shape,
-                              transpose=transpose, outdim_parallel=outdim_parallel)
-
-
-  def _define_mv_prob_normal_prim(cpu_kernel, gpu_kernel):
-    prim = XLACustomOp(cpu_kernel=cpu_kernel, gpu_kernel=gpu_kernel)
-    prim.defjvp(_mv_prob_normal_jvp_vector,
-                _mv_prob_normal_jvp_w_mu,
-                _mv_prob_normal_jvp_w_sigma,
-                None,
-                None)
-    prim.def_transpose_rule(_mv_prob_normal_transpose)
-    return prim
-
-
-  # outdim_parallel = True
-  _mv_prob_normal_outdim_parallel_p = _define_mv_prob_normal_prim(
-    cpu_kernel=_mv_prob_normal_outdim_parallel_cpu,
-    gpu_kernel=_mv_prob_normal_outdim_parallel_gpu
-  )
-
-  # outdim_parallel = False
-  _mv_prob_normal_p = _define_mv_prob_normal_prim(
-    cpu_kernel=_mv_prob_normal_cpu,
-    gpu_kernel=_mv_prob_normal_gpu
-  )
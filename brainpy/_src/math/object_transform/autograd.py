@@ -208,13 +208,16 @@ class GradientTransform(ObjectTransform):
                             *args,
                             **kwargs)
           cache_stack(self.target, stack)
+        new_stack = True
+      else:
+        new_stack = False
 
       self._dyn_vars = stack
       self._dyn_vars.remove_by_id(*[id(v) for v in self._grad_vars])
       self._eval_dyn_vars = True
 
       # if not the outermost transformation
-      if not stack.is_first_stack():
+      if new_stack and not stack.is_first_stack():
         return self._return(rets)
 
     rets = self._transform(
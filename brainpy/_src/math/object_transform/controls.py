@@ -12,6 +12,7 @@ from jax.tree_util import tree_flatten, tree_unflatten
 from tqdm.auto import tqdm
 
 from brainpy import errors, tools
+from brainpy._src.math import telemetry
 from brainpy._src.math.interoperability import as_jax
 from brainpy._src.math.ndarray import (Array, _as_jax_array_)
 from .base import BrainPyObject, ObjectTransform
@@ -465,6 +466,12 @@ def _get_cond_transform(dyn_vars, pred, true_fun, false_fun):
   return call_fun
 
 
+def _arg(args, kwargs, i, name):
+  return kwargs[name] if name in kwargs else (args[i] if len(args) > i else None)
+
+
+@telemetry.record_calls('cond', lambda *a, **k: telemetry.name_of((_arg(a, k, 1, 'true_fun'),
+                                                                   _arg(a, k, 2, 'false_fun'))))
 def cond(
     pred: bool,
     true_fun: Union[Callable, jnp.ndarray, Array, numbers.Number],
@@ -576,6 +583,7 @@ def _all_equal(iterator):
   return all(first == x for x in iterator)
 
 
+@telemetry.record_calls('ifelse', lambda *a, **k: telemetry.name_of(_arg(a, k, 1, 'branches')))
 def ifelse(
     conditions: Union[bool, Sequence[bool]],
     branches: Sequence[Any],
@@ -743,6 +751,7 @@ def _get_for_loop_transform(
   return call
 
 
+@telemetry.record_calls('for_loop', lambda *a, **k: telemetry.name_of(_arg(a, k, 0, 'body_fun')))
 def for_loop(
     body_fun: Callable,
     operands: Any,
@@ -934,6 +943,7 @@ def _get_scan_transform(
   return call
 
 
+@telemetry.record_calls('scan', lambda *a, **k: telemetry.name_of(_arg(a, k, 0, 'body_fun')))
 def scan(
     body_fun: Callable,
     init: Any,
@@ -1043,6 +1053,7 @@ def _get_while_transform(cond_fun, body_fun, dyn_vars):
                                              init_val=(dyn_vars.dict_data(), operands))
 
 
+@telemetry.record_calls('while_loop', lambda *a, **k: telemetry.name_of(_arg(a, k, 0, 'body_fun')))
 def while_loop(
     body_fun: Callable,
     cond_fun: Callable,
@@ -13,6 +13,7 @@ from typing import Callable, Union, Optional, Sequence, Dict, Any, Iterable
 import jax
 
 from brainpy import tools, check
+from brainpy._src.math import telemetry
 from .base import BrainPyObject, ObjectTransform
 from .naming import get_stack_cache, cache_stack
 from .tools import (dynvar_deprecation,
@@ -203,6 +204,14 @@ class JITTransform(ObjectTransform):
     if jax.config.jax_disable_jit:  # support to disable JIT for debugging
       return self.fun(*args, **kwargs)
 
+    if not telemetry.is_enabled():
+      return self._call(*args, **kwargs)
+    with telemetry.scope('jit',
+                         f'{self.name}({telemetry.name_of(self.fun)})',
+                         signature=lambda: telemetry.signature_of(*args, **kwargs)):
+      return self._call(*args, **kwargs)
+
+  def _call(self, *args, **kwargs):
     if self._transform is None:  # initialize the transformation
       rets = self._get_transform(*args, **kwargs)
       # if not the outermost transformation
@@ -466,6 +475,14 @@ def _make_jit_fun(
     if jax.config.jax_disable_jit:
       return fun(self, *args, **kwargs)
 
+    if not telemetry.is_enabled():
+      return _call_fun(self, *args, **kwargs)
+    with telemetry.scope('jit',
+                         f'{getattr(self, "name", type(self).__name__)}.{fun.__name__}',
+                         signature=lambda: telemetry.signature_of(*args, **kwargs)):
+      return _call_fun(self, *args, **kwargs)
+
+  def _call_fun(self, *args, **kwargs):
     hash_v = hash(fun) + hash(self)
     cache = get_stack_cache(hash_v)  # TODO: better cache mechanism
     if cache is None:
@@ -1,3 +1,4 @@
+import threading
 from typing import Optional, Any, List, Callable, Sequence, Union, Dict, Tuple
 
 import jax
@@ -191,19 +192,19 @@ class VariableStack(dict):
 
   @classmethod
   def num_of_stack(self):
-    return len(var_stack_list)
+    return len(_var_stack_list())
 
   @classmethod
   def is_first_stack(self):
-    return len(var_stack_list) == 0
+    return len(_var_stack_list()) == 0
 
   def __enter__(self) -> 'VariableStack':
     self.collect_values()  # recollect the original value of each variable
-    var_stack_list.append(self)
+    _var_stack_list().append(self)
     return self
 
   def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
-    var_stack_list.pop()
+    _var_stack_list().pop()
     self.assign_org_values()  # reassign the original value for each variable
     self._values.clear()
 
@@ -216,7 +217,22 @@ class VariableStack(dict):
     return new_dict
 
 
-var_stack_list: List[VariableStack] = []
+class _VarStackList(threading.local):
+  """The variable stacks of the current thread.
+
+  Each thread traces its own programs, so that the variables
+  collected by one thread are not added into the stacks of another.
+  """
+
+  def __init__(self):
+    self.stacks: List[VariableStack] = []
+
+
+_var_stack_local = _VarStackList()
+
+
+def _var_stack_list() -> List[VariableStack]:
+  return _var_stack_local.stacks
 
 
 @register_pytree_node_class
@@ -278,7 +294,7 @@ class Variable(Array):
 
     # ready to trace the variable
     if ready_to_trace is None:
-      if len(var_stack_list) == 0:
+      if len(_var_stack_list()) == 0:
         self.ready_to_trace = True
       else:
         self.ready_to_trace = False
@@ -352,7 +368,7 @@ class Variable(Array):
 
   def _append_to_stack(self):
     if self.ready_to_trace:
-      for stack in var_stack_list:
+      for stack in _var_stack_list():
         stack.add(self)
 
   def tree_flatten(self):
@@ -1,8 +1,19 @@
+"""
+The registration of the custom operators.
+
+The Taichi kernels of the operators in BrainPy are defined in the ``_*_taichi.py``
+modules, which are imported at the first call of the operators, so that
+``import brainpy`` does not need to import taichi and to define the kernels.
+"""
+
 from .numba_approach import (CustomOpByNumba,
                              register_op_with_numba,
                              compile_cpu_signature_with_numba)
 from .base import XLACustomOp
 from .utils import register_general_batching
-from .taichi_aot_based import clear_taichi_aot_caches, count_taichi_aot_kernels
+from .taichi_aot_based import (clear_taichi_aot_caches,
+                               count_taichi_aot_kernels,
+                               get_taichi_aot_cache_stats,
+                               set_taichi_aot_cache_budget)
 from .base import XLACustomOp
 from .utils import register_general_batching
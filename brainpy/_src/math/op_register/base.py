@@ -1,3 +1,4 @@
+import sys
 from functools import partial
 from typing import Callable, Sequence, Tuple, Protocol, Optional, Union
 
@@ -5,9 +6,10 @@ import jax
 import numpy as np
 from jax.interpreters import xla, batching, ad, mlir
 
-from brainpy._src.dependency_check import import_numba, import_cupy_jit
+from brainpy._src.dependency_check import import_cupy_jit
 from brainpy._src.math.ndarray import Array
 from brainpy._src.math.object_transform.base import BrainPyObject
+from brainpy._src.tools.package import _LazyNumbaJit
 
 if jax.__version__ >= '0.4.16':
   from .numba_based import register_numba_mlir_cpu_translation_rule as register_numba_cpu_translation_rule
@@ -24,7 +26,6 @@ else:
 from .utils import register_general_batching
 from brainpy._src.math.op_register.ad_support import defjvp
 
-numba = import_numba(error_if_not_found=False)
 cp_jit = import_cupy_jit(error_if_not_found=False)
 
 __all__ = [
@@ -90,7 +91,11 @@ class XLACustomOp(BrainPyObject):
     cpu_checked = False
     if cpu_kernel is None:
       cpu_checked = True
-    if numba is not None:  # numba
+    # the lazily jitted kernel is compiled now, so that it can be checked as a numba dispatcher
+    if isinstance(cpu_kernel, _LazyNumbaJit):
+      cpu_kernel = cpu_kernel.dispatcher
+    # a numba kernel can only be defined after numba has been imported
+    if sys.modules.get('numba') is not None:  # numba
       from numba.core.dispatcher import Dispatcher
       if isinstance(cpu_kernel, Dispatcher):
         register_numba_cpu_translation_rule(self.primitive, cpu_kernel)
@@ -14,9 +14,6 @@ from brainpy._src.math.object_transform.base import BrainPyObject
 from brainpy.errors import PackageMissingError
 from .cpu_translation import _cpu_translation, compile_cpu_signature_with_numba
 
-numba = import_numba(error_if_not_found=False)
-
-
 __all__ = [
   'CustomOpByNumba',
   'register_op_with_numba',
@@ -139,6 +136,7 @@ def register_op_with_numba(
                        f'For more information, please refer to the documentation: '
                        f'https://brainpy.readthedocs.io/en/latest/tutorial_advanced/operator_custom_with_taichi.html.')
 
+  numba = import_numba(error_if_not_found=False)
   if numba is None:
     raise PackageMissingError.by_purpose('numba', 'custom op with numba')
 
@@ -6,9 +6,6 @@ from jax import dtypes, numpy as jnp
 from jax.core import ShapedArray
 from jax.lib import xla_client
 
-from brainpy._src.dependency_check import import_numba
-
-numba = import_numba(error_if_not_found=False)
 ctypes.pythonapi.PyCapsule_New.argtypes = [
   ctypes.c_void_p,  # void* pointer
   ctypes.c_char_p,  # const char *name
@@ -21,10 +18,6 @@ __all__ = [
   'compile_cpu_signature_with_numba',
 ]
 
-if numba is not None:
-  from numba import types, carray, cfunc
-
-
 def _cpu_translation(func, abs_eval_fn, multiple_results, c, *inputs, **info):
   target_name, inputs, input_shapes, xla_output_shapes = \
     compile_cpu_signature_with_numba(c, func, abs_eval_fn, multiple_results, inputs, info)
@@ -46,6 +39,8 @@ def _cpu_signature(
     multiple_results: bool,
     debug: bool = False
 ):
+  from numba import types, carray, cfunc
+
   code_scope = dict(
     func_to_call=func,
     input_shapes=input_shapes,
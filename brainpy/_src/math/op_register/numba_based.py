@@ -11,10 +11,6 @@ from brainpy._src.dependency_check import import_numba
 from brainpy.errors import PackageMissingError
 from .utils import _shape_to_layout
 
-numba = import_numba(error_if_not_found=False)
-if numba is not None:
-  from numba import types, carray, cfunc
-
 __all__ = [
   'register_numba_xla_cpu_translation_rule',
   'register_numba_mlir_cpu_translation_rule',
@@ -35,6 +31,8 @@ def _cpu_signature(
     output_shapes,
     debug: bool = False
 ):
+  from numba import types, carray, cfunc
+
   code_scope = dict(
     func_to_call=kernel,
     input_shapes=input_shapes,
@@ -107,7 +105,7 @@ def _numba_xla_cpu_translation_rule(kernel, debug: bool, c, *ins, **kwargs):
 
 
 def register_numba_xla_cpu_translation_rule(primitive, cpu_kernel, debug=False):
-  if numba is None:
+  if import_numba(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose("numba", 'register numba xla cpu translation rule')
 
   # do not support after jax >= 0.4.24
@@ -117,6 +115,8 @@ def register_numba_xla_cpu_translation_rule(primitive, cpu_kernel, debug=False):
 
 
 def _numba_mlir_cpu_translation_rule(kernel, debug: bool, ctx, *ins, **kwargs):
+  from numba import types, carray, cfunc
+
   # output information
   outs = ctx.avals_out
   output_shapes = tuple([out.shape for out in outs])
@@ -174,7 +174,7 @@ def numba_cpu_custom_call_target(output_ptrs, input_ptrs):
 
 
 def register_numba_mlir_cpu_translation_rule(primitive, cpu_kernel, debug=False):
-  if numba is None:
+  if import_numba(error_if_not_found=False) is None:
     raise PackageMissingError.by_purpose("numba", 'register numba xla cpu translation rule')
 
   rule = partial(_numba_mlir_cpu_translation_rule, cpu_kernel, debug)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""Compile the Taichi AOT kernels required by a model ahead of time.
+
+Usage::
+
+  python -m brainpy.prewarm model.py [--function FUNC] [--budget BYTES] [-- script args]
+
+The model script is executed once (or only the function ``FUNC`` in it is called),
+so that all kernels it needs are built into the AOT kernel cache. Following jobs,
+for example the tasks of a job array, can then directly load the cached kernels.
+"""
+
+import argparse
+import json
+import os
+import runpy
+import sys
+import time
+from typing import Optional, Sequence
+
+from .taichi_aot_based import (get_taichi_aot_cache_stats,
+                               set_taichi_aot_cache_budget,
+                               kernels_aot_path)
+
+__all__ = [
+  'prewarm',
+  'main',
+]
+
+
+def prewarm(script: str, function: Optional[str] = None, args: Sequence[str] = ()):
+  """Run the model ``script`` to build all Taichi AOT kernels it needs.
+
+  Parameters
+  ----------
+  script: str
+    The path of the model script.
+  function: str, optional
+    The function in the script to call. If not provided, the script is executed
+    as the ``__main__`` module.
+  args: sequence of str
+    The command line arguments passed to the script.
+
+  Returns
+  -------
+  stats: dict
+    The cache statistics during the prewarm, along with the running ``time``.
+  """
+  before = get_taichi_aot_cache_stats()
+  old_argv = sys.argv
+  sys.argv = [script] + list(args)
+  sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+  t0 = time.time()
+  try:
+    if function is None:
+      runpy.run_path(script, run_name='__main__')
+    else:
+      namespace = runpy.run_path(script, run_name='__prewarm__')
+      if function not in namespace:
+        raise ValueError(f'Cannot find the function "{function}" in {script}.')
+      namespace[function]()
+  finally:
+    sys.argv = old_argv
+    sys.path.pop(0)
+  after = get_taichi_aot_cache_stats()
+  stats = {k: after[k] - before[k] for k in ('hit', 'miss', 'build', 'build_time', 'evict')}
+  stats.update(num_kernel=after['num_kernel'], size=after['size'], time=time.time() - t0)
+  return stats
+
+
+def main(argv: Optional[Sequence[str]] = None):
+  parser = argparse.ArgumentParser(prog='python -m brainpy.prewarm',
+                                   description='Build the Taichi AOT kernels required by a model.')
+  parser.add_argument('script', help='The model script.')
+  parser.add_argument('--function', default=None,
+                      help='The function in the script to call, instead of running the script as "__main__".')
+  parser.add_argument('--budget', type=int, default=None,
+                      help='The size budget (bytes) of the AOT kernel cache.')
+  parser.add_argument('--json', action='store_true', help='Print the statistics as JSON.')
+  parser.add_argument('args', nargs=argparse.REMAINDER, help='The arguments passed to the script.')
+  args = parser.parse_args(argv)
+
+  if args.budget is not None:
+    set_taichi_aot_cache_budget(args.budget)
+  script_args = args.args[1:] if args.args[:1] == ['--'] else args.args
+  stats = prewarm(args.script, function=args.function, args=script_args)
+  if args.json:
+    print(json.dumps(stats))
+  else:
+    print(f'Prewarmed {args.script} in {stats["time"]:.2f} s: '
+          f'{stats["build"]} kernels built ({stats["build_time"]:.2f} s), '
+          f'{stats["hit"]} cache hits, {stats["evict"]} evicted. '
+          f'Cache at {kernels_aot_path}: {stats["num_kernel"]} kernels, {stats["size"]} bytes.')
+  return stats
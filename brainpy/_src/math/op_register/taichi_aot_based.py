@@ -2,13 +2,16 @@ import contextlib
 import hashlib
 import inspect
 import io
+import json
 import os
 import pathlib
 import platform
 import re
 import shutil
+import time
+import uuid
 from functools import partial, reduce
-from typing import Any, Sequence, Union
+from typing import Any, Dict, Optional, Sequence, Union
 
 import jax.core
 import numpy as np
@@ -19,12 +22,31 @@ from jaxlib.hlo_helpers import custom_call
 from brainpy._src.dependency_check import (import_taichi,
                                            import_brainpylib_cpu_ops,
                                            import_brainpylib_gpu_ops)
+from brainpy._src.math import telemetry
 from brainpy.errors import PackageMissingError
 from .utils import _shape_to_layout
 
 
 taichi_cache_path = None
 
+# the file recording the usage information of one AOT kernel
+_meta_file_name = 'brainpy_kernel_meta.json'
+
+# the maximum size (bytes) of the AOT kernel cache, `None` means no limit
+_cache_budget: Optional[int] = None
+if os.environ.get('BRAINPY_TAICHI_AOT_CACHE_BUDGET', None):
+  _cache_budget = int(os.environ['BRAINPY_TAICHI_AOT_CACHE_BUDGET'])
+
+# the kernels used by the current process, which will never be evicted
+_used_kernels = set()
+
+# the kernels used within this period (seconds) will never be evicted,
+# since they may have been lowered but not loaded yet by other processes
+_evict_grace_period = 60.
+
+# the statistics of the AOT kernel cache
+_cache_stats = dict(hit=0, miss=0, build=0, build_time=0., evict=0)
+
 
 # --- UTILS ###
 
@@ -58,14 +80,7 @@ def count_taichi_aot_kernels() -> int:
     The number of AOT compiled kernels.
 
   """
-  if not os.path.exists(kernels_aot_path):
-    return 0
-  kernels_count = 0
-  dir1 = os.listdir(kernels_aot_path)
-  for i in dir1:
-    dir2 = os.listdir(os.path.join(kernels_aot_path, i))
-    kernels_count += len(dir2)
-  return kernels_count
+  return len(_list_cached_kernels())
 
 
 def clear_taichi_aot_caches(kernels: Union[str, Sequence[str]] = None):
@@ -88,6 +103,7 @@ def clear_taichi_aot_caches(kernels: Union[str, Sequence[str]] = None):
     # clean brainpy-taichi AOT cache
     if os.path.exists(kernels_aot_path):
       shutil.rmtree(kernels_aot_path)
+    _used_kernels.clear()
     return
   if isinstance(kernels, str):
     kernels = [kernels]
@@ -97,6 +113,188 @@ def clear_taichi_aot_caches(kernels: Union[str, Sequence[str]] = None):
   for kernel_name in kernels:
     if os.path.exists(os.path.join(kernels_aot_path, kernel_name)):
       shutil.rmtree(os.path.join(kernels_aot_path, kernel_name))
+    for key in tuple(_used_kernels):
+      if key.split(os.sep)[0] == kernel_name:
+        _used_kernels.remove(key)
+
+
+def set_taichi_aot_cache_budget(budget: Optional[int] = None):
+  """
+  Set the maximum size of the AOT compiled kernel cache.
+
+  When the cache exceeds the budget after a new kernel is built, the least
+  recently used kernels are evicted. Kernels used by the current process,
+  kernels used by any process within the last minute, and kernels being
+  built by other processes are never evicted. The budget can also be set
+  by the environment variable ``BRAINPY_TAICHI_AOT_CACHE_BUDGET``.
+
+  Parameters
+  ----------
+  budget: int, optional
+    The maximum number of bytes. ``None`` means no limit.
+  """
+  global _cache_budget
+  if budget is not None:
+    budget = int(budget)
+    if budget < 0:
+      raise ValueError(f'"budget" must be a non-negative integer, but got {budget}')
+  _cache_budget = budget
+  if budget is not None:
+    with _file_lock(os.path.join(kernels_aot_path, '.cache')):
+      _evict_kernels(budget)
+
+
+def get_taichi_aot_cache_stats() -> Dict[str, Any]:
+  """
+  Get the statistics of the AOT compiled kernel cache.
+
+  Returns
+  -------
+  stats: dict
+    The statistics in the current process, including the number of cache ``hit``,
+    cache ``miss``, kernel ``build``, the total ``build_time`` (seconds), the number of
+    evicted kernels (``evict``), along with the current number of cached kernels
+    (``num_kernel``), the cache ``size`` (bytes) and the cache ``budget``.
+  """
+  stats = dict(_cache_stats)
+  kernels = _list_cached_kernels()
+  stats['num_kernel'] = len(kernels)
+  stats['size'] = sum(meta['size'] for meta in kernels.values())
+  stats['budget'] = _cache_budget
+  return stats
+
+
+def _dir_size(path: str) -> int:
+  size = 0
+  for root, _, files in os.walk(path):
+    for f in files:
+      try:
+        size += os.path.getsize(os.path.join(root, f))
+      except OSError:
+        pass
+  return size
+
+
+def _read_meta(kernel_path: str) -> Dict:
+  try:
+    with open(os.path.join(kernel_path, _meta_file_name), 'r') as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    mtime = os.path.getmtime(kernel_path) if os.path.exists(kernel_path) else 0.
+    return dict(size=_dir_size(kernel_path), created=mtime, last_used=mtime, num_used=0)
+
+
+def _write_meta(kernel_path: str, meta: Dict):
+  tmp_file = os.path.join(kernel_path, f'.{_meta_file_name}.{uuid.uuid4().hex}')
+  with open(tmp_file, 'w') as f:
+    json.dump(meta, f)
+  os.replace(tmp_file, os.path.join(kernel_path, _meta_file_name))
+
+
+def _list_cached_kernels() -> Dict[str, Dict]:
+  """List all cached kernels as ``{"kernel_name/md5": meta}``."""
+  kernels = dict()
+  if not os.path.exists(kernels_aot_path):
+    return kernels
+  for name in os.listdir(kernels_aot_path):
+    dir1 = os.path.join(kernels_aot_path, name)
+    if name.startswith('.') or not os.path.isdir(dir1):
+      continue
+    for md5 in os.listdir(dir1):
+      dir2 = os.path.join(dir1, md5)
+      if md5.startswith('.') or not os.path.isdir(dir2):
+        continue
+      kernels[os.path.join(name, md5)] = _read_meta(dir2)
+  return kernels
+
+
+def _evict_kernels(budget: int):
+  """Evict the least recently used kernels until the cache size is within the budget.
+
+  The kernels used by the current process, the kernels used within the last
+  ``_evict_grace_period`` seconds, and the kernels whose locks are held by
+  other processes are skipped. The lock file is deleted along with the kernel.
+  """
+  kernels = _list_cached_kernels()
+  total = sum(meta['size'] for meta in kernels.values())
+  now = time.time()
+  for key, meta in sorted(kernels.items(), key=lambda a: a[1]['last_used']):
+    if total <= budget:
+      break
+    if key in _used_kernels or now - meta['last_used'] < _evict_grace_period:
+      continue
+    kernel_path = os.path.join(kernels_aot_path, key)
+    with _file_lock(kernel_path, blocking=False) as locked:
+      if not locked:
+        continue
+      shutil.rmtree(kernel_path, ignore_errors=True)
+      try:
+        os.remove(kernel_path + '.lock')
+      except OSError:
+        pass
+    total -= meta['size']
+    _cache_stats['evict'] += 1
+
+
+def _lock_file(f, blocking: bool = True) -> bool:
+  """Lock the opened file ``f``, and return whether the lock is acquired."""
+  try:
+    import fcntl
+  except ModuleNotFoundError:  # Windows
+    import msvcrt
+    while True:
+      try:
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        return True
+      except OSError:
+        if not blocking:
+          return False
+  else:
+    try:
+      fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else (fcntl.LOCK_EX | fcntl.LOCK_NB))
+      return True
+    except BlockingIOError:
+      return False
+
+
+def _unlock_file(f):
+  try:
+    import fcntl
+  except ModuleNotFoundError:  # Windows
+    import msvcrt
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+  else:
+    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _file_lock(path: str, blocking: bool = True):
+  """An inter-process exclusive lock based on the file ``path + '.lock'``.
+
+  It yields whether the lock is acquired, which is always ``True`` if ``blocking``.
+  """
+  lock_path = path + '.lock'
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  while True:
+    f = open(lock_path, 'a+')
+    if not _lock_file(f, blocking):
+      f.close()
+      yield False
+      return
+    # the lock file may have been deleted along with an evicted
+    # kernel when waiting for the lock, then the lock is retried
+    try:
+      if os.path.samestat(os.fstat(f.fileno()), os.stat(lock_path)):
+        break
+    except OSError:
+      pass
+    _unlock_file(f)
+    f.close()
+  try:
+    yield True
+  finally:
+    _unlock_file(f)
+    f.close()
 
 
 # TODO
@@ -149,6 +347,19 @@ def _check_kernel_exist(source_md5_encode: str) -> bool:
     return False
 
 
+def _mark_kernel_used(source_md5_encode: str):
+  """Update the usage information of a cached kernel."""
+  kernel_path = os.path.join(kernels_aot_path, source_md5_encode)
+  meta = _read_meta(kernel_path)
+  meta['last_used'] = time.time()
+  meta['num_used'] = meta.get('num_used', 0) + 1
+  try:
+    _write_meta(kernel_path, meta)
+  except OSError:  # the kernel may have been evicted by other processes
+    pass
+  _used_kernels.add(source_md5_encode)
+
+
 # --- KERNEL AOT BUILD ###
 
 
@@ -226,17 +437,29 @@ def _build_kernel(
   for key, value in outs.items():
     template_args_dict[key] = _array_to_field(value[0], value[1])
 
-  # make aot dir
+  # make a temporary aot dir, which will be renamed after the building,
+  # so that other processes never see an incomplete kernel
   kernel_path = os.path.join(kernels_aot_path, source_md5_encode)
-  os.makedirs(kernel_path, exist_ok=True)
-
-  # compile kernel
-  mod = ti.aot.Module(arch)
-  mod.add_kernel(kernel, template_args=template_args_dict)
-  mod.save(kernel_path)
-
-  # rename kernel name
-  kernel.__name__ = kernel_name
+  tmp_path = os.path.join(os.path.dirname(kernel_path),
+                          f'.{os.path.basename(kernel_path)}.tmp-{os.getpid()}-{uuid.uuid4().hex}')
+  os.makedirs(tmp_path, exist_ok=True)
+
+  try:
+    # compile kernel
+    mod = ti.aot.Module(arch)
+    mod.add_kernel(kernel, template_args=template_args_dict)
+    mod.save(tmp_path)
+    now = time.time()
+    _write_meta(tmp_path, dict(size=_dir_size(tmp_path), created=now, last_used=now, num_used=0))
+    try:
+      os.rename(tmp_path, kernel_path)
+    except OSError:
+      if not os.path.exists(kernel_path):
+        raise
+  finally:
+    # rename kernel name
+    kernel.__name__ = kernel_name
+    shutil.rmtree(tmp_path, ignore_errors=True)
 
 
 # --- KERNEL CALL PREPROCESS ###
@@ -394,15 +617,27 @@ def _compile_kernel(abs_ins, kernel, platform: str, **kwargs):
   outs_dict = {key: (abs_outs[i].dtype, abs_outs[i].shape) for i, key in enumerate(out_names)}
 
   # build kernels
-  if not _check_kernel_exist(source_md5_encode):  # TODO: more checking
-    try:
-      _build_kernel(source_md5_encode, kernel, ins_dict, outs_dict, platform)
-    except Exception as e:
-      try:
-        os.removedirs(os.path.join(kernels_aot_path, source_md5_encode))
-      except Exception:
-        raise RuntimeError(f'Failed to preprocess info to build kernel:\n\n {codes}') from e
-      raise RuntimeError(f'Failed to build kernel:\n\n {codes}') from e
+  if _check_kernel_exist(source_md5_encode):
+    _cache_stats['hit'] += 1
+    telemetry.add_event('taichi_kernel', kernel.__name__, 'cache_hit')
+  else:
+    _cache_stats['miss'] += 1
+    telemetry.add_event('taichi_kernel', kernel.__name__, 'cache_miss')
+    with _file_lock(os.path.join(kernels_aot_path, source_md5_encode)):
+      # the kernel may have been built by another process when waiting for the lock
+      if not _check_kernel_exist(source_md5_encode):  # TODO: more checking
+        t0 = time.time()
+        try:
+          _build_kernel(source_md5_encode, kernel, ins_dict, outs_dict, platform)
+        except Exception as e:
+          raise RuntimeError(f'Failed to build kernel:\n\n {codes}') from e
+        _cache_stats['build'] += 1
+        _cache_stats['build_time'] += time.time() - t0
+        telemetry.add_event('taichi_kernel', kernel.__name__, 'kernel_build', time.time() - t0)
+  _mark_kernel_used(source_md5_encode)
+  if _cache_budget is not None:
+    with _file_lock(os.path.join(kernels_aot_path, '.cache')):
+      _evict_kernels(_cache_budget)
 
   # returns
   if platform in ['gpu', 'cuda']:
@@ -35,3 +35,16 @@ def test_event_ELL():
   call(1000)
   call(100)
   bm.clear_buffer_memory()
+
+
+def test_tools_numba_jit():
+  import brainpy as bp
+
+  def add_one(x, outs):
+    outs[...] = x + 1
+
+  kernel = bp.tools.numba_jit(add_one)
+  assert isinstance(kernel, numba.core.dispatcher.Dispatcher)
+  op = bm.XLACustomOp(cpu_kernel=kernel)
+  out = op(bm.zeros(3), outs=[jax.ShapeDtypeStruct([3], dtype=bm.float32)])
+  assert bm.allclose(out[0], bm.ones(3))
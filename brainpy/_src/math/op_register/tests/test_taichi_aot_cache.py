@@ -0,0 +1,142 @@
+import os
+import time
+
+import jax
+import jax.numpy as jnp
+import pytest
+
+import brainpy.math as bm
+from brainpy._src.dependency_check import import_taichi
+from brainpy._src.math.op_register import taichi_aot_based
+from brainpy._src.math.op_register.prewarm import prewarm
+
+ti = import_taichi(error_if_not_found=False)
+if ti is None:
+  pytest.skip('no taichi', allow_module_level=True)
+
+
+@ti.kernel
+def add_one_cpu(x: ti.types.ndarray(ndim=1),
+                out: ti.types.ndarray(ndim=1)):
+  for i in x:
+    out[i] = x[i] + 1.
+
+
+prim = bm.XLACustomOp(cpu_kernel=add_one_cpu)
+
+
+def _call(n):
+  x = bm.ones(n)
+  out = prim(x, outs=[jax.ShapeDtypeStruct((n,), dtype=jnp.float32)])
+  return out[0]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+  monkeypatch.setattr(taichi_aot_based, 'kernels_aot_path', str(tmp_path / 'kernels'))
+  monkeypatch.setattr(taichi_aot_based, '_used_kernels', set())
+  monkeypatch.setattr(taichi_aot_based, '_cache_budget', None)
+  monkeypatch.setattr(taichi_aot_based, '_evict_grace_period', 0.)
+  # the kernels compiled in other tests are lowered again
+  jax.clear_caches()
+  yield tmp_path / 'kernels'
+  bm.clear_buffer_memory()
+
+
+def test_cache_hit_and_miss(cache_dir):
+  stats0 = bm.get_taichi_aot_cache_stats()
+  assert stats0['num_kernel'] == 0
+  assert jnp.allclose(_call(11), 2.)
+  stats1 = bm.get_taichi_aot_cache_stats()
+  assert stats1['miss'] == stats0['miss'] + 1
+  assert stats1['build'] == stats0['build'] + 1
+  assert stats1['num_kernel'] == 1
+  assert stats1['size'] > 0
+
+  # a new compilation would hit the cache
+  jax.clear_caches()
+  assert jnp.allclose(_call(11), 2.)
+  stats2 = bm.get_taichi_aot_cache_stats()
+  assert stats2['hit'] == stats1['hit'] + 1
+  assert stats2['build'] == stats1['build']
+
+  # no temporary directories are left
+  for name in os.listdir(cache_dir / 'add_one_cpu'):
+    assert '.tmp-' not in name
+
+
+def _build_kernels(sizes):
+  keys = []
+  for n in sizes:
+    used = set(taichi_aot_based._used_kernels)
+    _call(n)
+    keys.extend(taichi_aot_based._used_kernels - used)
+  return keys
+
+
+def _set_last_used(key, last_used):
+  path = os.path.join(taichi_aot_based.kernels_aot_path, key)
+  meta = taichi_aot_based._read_meta(path)
+  meta['last_used'] = last_used
+  taichi_aot_based._write_meta(path, meta)
+
+
+def test_cache_budget_eviction(cache_dir):
+  keys = _build_kernels([3, 4, 5])
+  assert len(keys) == 3
+  assert bm.count_taichi_aot_kernels() == 3
+
+  # kernels used by the current process are never evicted
+  bm.set_taichi_aot_cache_budget(0)
+  assert bm.count_taichi_aot_kernels() == 3
+
+  # kernels not used by the current process are evicted in the LRU order
+  taichi_aot_based._used_kernels.clear()
+  now = time.time()
+  for key, t in zip(keys, [now - 20., now - 30., now - 10.]):
+    _set_last_used(key, t)
+  kernels = taichi_aot_based._list_cached_kernels()
+  size = sum(meta['size'] for meta in kernels.values())
+  bm.set_taichi_aot_cache_budget(size - 1)
+  assert set(taichi_aot_based._list_cached_kernels()) == {keys[0], keys[2]}
+  bm.set_taichi_aot_cache_budget(kernels[keys[2]]['size'])
+  assert set(taichi_aot_based._list_cached_kernels()) == {keys[2]}
+
+  # the lock files are deleted along with the kernels
+  for key in keys[:2]:
+    assert not os.path.exists(os.path.join(cache_dir, key + '.lock'))
+  bm.set_taichi_aot_cache_budget(None)
+
+
+def test_cache_eviction_skips_busy_kernels(cache_dir, monkeypatch):
+  keys = _build_kernels([3, 4])
+  taichi_aot_based._used_kernels.clear()
+  now = time.time()
+  _set_last_used(keys[0], now - 100.)
+
+  # kernels used recently may have been lowered but not loaded by other processes
+  monkeypatch.setattr(taichi_aot_based, '_evict_grace_period', 60.)
+  bm.set_taichi_aot_cache_budget(0)
+  assert set(taichi_aot_based._list_cached_kernels()) == {keys[1]}
+
+  # kernels whose locks are held by other processes
+  monkeypatch.setattr(taichi_aot_based, '_evict_grace_period', 0.)
+  with taichi_aot_based._file_lock(os.path.join(taichi_aot_based.kernels_aot_path, keys[1])):
+    bm.set_taichi_aot_cache_budget(0)
+    assert set(taichi_aot_based._list_cached_kernels()) == {keys[1]}
+  bm.set_taichi_aot_cache_budget(0)
+  assert bm.count_taichi_aot_kernels() == 0
+  bm.set_taichi_aot_cache_budget(None)
+
+
+def test_prewarm(cache_dir, tmp_path):
+  script = tmp_path / 'model.py'
+  script.write_text(
+    'from brainpy._src.math.op_register.tests.test_taichi_aot_cache import _call\n'
+    'def run():\n'
+    '  _call(7)\n'
+    '  _call(8)\n'
+  )
+  stats = prewarm(str(script), function='run')
+  assert stats['build'] == 2
+  assert stats['num_kernel'] == 2
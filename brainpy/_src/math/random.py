@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import math
 import warnings
+import zlib
 from collections import namedtuple
 from functools import partial
 from operator import index
@@ -23,6 +25,7 @@ __all__ = [
   'RandomState', 'Generator', 'DEFAULT',
 
   'seed', 'default_rng', 'split_key', 'split_keys',
+  'set_counter_based', 'is_counter_based', 'module_key',
 
   # numpy compatibility
   'rand', 'randint', 'random_integers', 'randn', 'random',
@@ -279,6 +282,88 @@ def _binomial(key, p, n, shape):
   return jnp.reshape(ret, shape)
 
 
+def _concrete(x):
+  """The concrete numpy value of ``x``, or ``None`` if ``x`` is traced."""
+  x = x.value if isinstance(x, Array) else x
+  if isinstance(x, core.Tracer):
+    return None
+  return np.asarray(x)
+
+
+def _binomial_table_size(n, p):
+  """The number of terms of the inverse transform for the (reflected) binomial
+  distribution, or ``None`` if the inverse transform is not efficient."""
+  if n.ndim != 0 or p.ndim != 0 or not np.issubdtype(n.dtype, np.integer):
+    return None
+  mean = float(n) * min(float(p), 1. - float(p))
+  if mean > 64.:
+    return None
+  return int(min(float(n), np.ceil(mean + 10. * np.sqrt(mean) + 10.))) + 1
+
+
+def _binomial_table(key, n: int, p: float, shape, num_term: int):
+  """Sample the binomial distribution with the scalar ``n`` and ``p`` by the inverse
+  transform over the first ``num_term`` terms, i.e., one uniform number and
+  ``num_term`` comparisons per element. Compared with the per-element rejection loops, all
+  elements take the same amount of work, which suits to the vectorized hardware.
+  """
+  q = min(p, 1. - p)
+  if q == 0.:
+    pmf = [1.] + [0.] * (num_term - 1)
+  else:
+    pmf = [math.exp(math.lgamma(n + 1.) - math.lgamma(k + 1.) - math.lgamma(n - k + 1.) +
+                    k * math.log(q) + (n - k) * math.log1p(-q))
+           for k in range(num_term)]
+  cdf = np.cumsum(pmf)
+  u = jr.uniform(key, shape, dtype=jnp.float32) * np.float32(cdf[-1])
+  # the number of the cumulative probabilities not larger than "u", which
+  # is fused by XLA into one elementwise kernel
+  r = jnp.zeros(shape, dtype=get_int())
+  for c in cdf[:-1]:
+    r += (u >= np.float32(c)).astype(r.dtype)
+  return (n - r) if p > 0.5 else r
+
+
+def _bernoulli_gaps(key, p, p_max: float, shape, num_event: int):
+  """Sample the sparse Bernoulli events by the geometric gaps.
+
+  The gaps between the successive events of the Bernoulli trials with
+  the probability ``p_max`` follow the geometric distribution. Only ``num_event``
+  gaps are sampled and scattered into the flattened output. For the heterogeneous
+  ``p``, each candidate event is accepted with the probability ``p / p_max``.
+  If the sampled gaps do not cover the whole output, which is very unlikely for
+  the ``num_event`` given by :py:func:`_bernoulli_num_event`, the dense sampling
+  is used instead.
+  """
+  num = int(np.prod(shape))
+  key_gap, key_acc, key_dense = jr.split(key, 3)
+  u = jr.uniform(key_gap, (num_event,), minval=jnp.finfo(jnp.float32).tiny, maxval=1.)
+  gaps = jnp.floor(jnp.log(u) / np.log1p(-p_max)) + 1.
+  gaps = jnp.minimum(gaps, num + 1.).astype(jnp.int32)
+  # saturated cumulative sum, which never overflows
+  ends = lax.associative_scan(lambda a, b: jnp.minimum(a + b, num + 1), gaps)
+  positions = ends - 1
+  valid = positions < num
+  if jnp.ndim(p) > 0:
+    p_flat = jnp.reshape(jnp.broadcast_to(p, shape), -1)
+    prob = p_flat[jnp.minimum(positions, num - 1)] / p_max
+    valid = jnp.logical_and(valid, jr.uniform(key_acc, (num_event,)) < prob)
+  events = jnp.zeros(num, dtype=bool).at[positions].set(valid, mode='drop')
+  return lax.cond(positions[-1] >= num,
+                  lambda: jnp.reshape(events, shape),
+                  lambda: jr.bernoulli(key_dense, p, shape))
+
+
+def _bernoulli_num_event(p_max: float, num: int):
+  """The number of events for :py:func:`_bernoulli_gaps`, or ``None``
+  if the dense sampling is more efficient."""
+  if num < 1024 or p_max <= 0.:
+    return None
+  mean = num * p_max
+  num_event = int(np.ceil(mean + 8. * np.sqrt(mean) + 32.))
+  return num_event if num_event * 8 <= num else None
+
+
 @partial(jit, static_argnums=(2,))
 def _categorical(key, p, shape):
   # this implementation is fast when event shape is small, and slow otherwise
@@ -908,7 +993,17 @@ class RandomState(Variable):
     if size is None:
       size = jnp.shape(p)
     key = self.split_key() if key is None else _formalize_key(key)
-    r = jr.bernoulli(key, p=p, shape=_size2shape(size))
+    shape = _size2shape(size)
+    p_con = _concrete(p)
+    num_event = None
+    if p_con is not None and p_con.size > 0:
+      p_max = float(np.max(p_con))
+      num_event = _bernoulli_num_event(p_max, int(np.prod(shape)))
+    if num_event is None:
+      r = jr.bernoulli(key, p=p, shape=shape)
+    else:
+      # sparse events with the low probabilities
+      r = _bernoulli_gaps(key, p, p_max, shape, num_event)
     return _return(r)
 
   def lognormal(self, mean=None, sigma=None, size: Optional[Union[int, Sequence[int]]] = None,
@@ -932,7 +1027,15 @@ class RandomState(Variable):
     if size is None:
       size = jnp.broadcast_shapes(jnp.shape(n), jnp.shape(p))
     key = self.split_key() if key is None else _formalize_key(key)
-    r = _binomial(key, p, n, shape=_size2shape(size))
+    n_con, p_con = _concrete(n), _concrete(p)
+    num_term = None
+    if n_con is not None and p_con is not None:
+      num_term = _binomial_table_size(n_con, p_con)
+    if num_term is None:
+      r = _binomial(key, p, n, shape=_size2shape(size))
+    else:
+      # scalar parameters with the small mean
+      r = _binomial_table(key, int(n_con), float(p_con), _size2shape(size), num_term)
     return _return(r)
 
   def chisquare(self, df, size: Optional[Union[int, Sequence[int]]] = None,
@@ -1411,9 +1514,118 @@ def default_rng(seed_or_key=None, clone: bool = True) -> RandomState:
     return RandomState(seed_or_key)
 
 
+# the setting of the counter-based random streams
+_counter_rng = dict(enabled=False, seed=0)
+
+
+def set_counter_based(mode: bool = True, seed: int = None):
+  """Enable or disable the counter-based random streams.
+
+  By default, every stochastic module draws its random numbers from the
+  global :py:data:`DEFAULT` random state, each draw splitting and writing
+  back one key. All the draws thus form a sequential chain, and the
+  results depend on the order in which the modules are called.
+
+  In the counter-based mode, a module derives the key of each step as
+  ``fold_in(fold_in(fold_in(PRNGKey(seed), module_id), stream), i)``, where
+  ``module_id`` is the hash of the module name, ``i`` is the step index, and
+  ``stream`` is a counter advanced by the trainers at every batch
+  (see :py:func:`module_key`). No key state is carried, so the draws of
+  different modules are independent of each other and of the call order.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  mode: bool
+    Whether to use the counter-based random streams.
+  seed: int, optional
+    The seed of the counter-based random streams. Default is the seed
+    set by :py:func:`seed`.
+  """
+  _counter_rng['enabled'] = bool(mode)
+  if seed is not None:
+    _counter_rng['seed'] = int(seed)
+
+
+def is_counter_based() -> bool:
+  """Whether the counter-based random streams are enabled.
+
+  .. versionadded:: 2.6.1
+  """
+  return _counter_rng['enabled']
+
+
+def _module_id(module) -> int:
+  if isinstance(module, (int, np.integer)):
+    return int(module) & 0x7FFFFFFF
+  name = module if isinstance(module, str) else getattr(module, 'name', None)
+  if not isinstance(name, str):
+    raise TypeError(f'The module should be an object with the "name", a str or an int, but we got {module}.')
+  return zlib.crc32(name.encode()) & 0x7FFFFFFF
+
+
+def module_key(module, i=None, count: int = None) -> Optional[jax.Array]:
+  """Get the random key of a module at the current step.
+
+  In the counter-based mode (see :py:func:`set_counter_based`), the key is
+
+  .. code-block:: python
+
+     key = fold_in(fold_in(fold_in(PRNGKey(seed), module_id), stream), i)
+
+  and ``count`` is further folded in when a module draws several random
+  arrays in one step. ``stream`` is the shared data ``brainpy.share['rng_stream']``
+  (default 0), which is advanced by the trainers (like :py:class:`~.BPTT`) at every
+  batch, so that the batches and the epochs, whose step indices restart from the
+  same value, do not repeat the same random numbers. If the counter-based mode
+  is disabled, ``None`` is returned, so that the key can be directly passed to the
+  random functions (like ``brainpy.math.random.rand(..., key=key)``) to use the
+  global random state.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  module: BrainPyObject, str, int
+    The module, its unique name, or its integer identifier.
+  i: int, ArrayType, optional
+    The step index. Default is the shared step index ``brainpy.share['i']``.
+  count: int, optional
+    The index of the draw within one step.
+
+  Returns
+  -------
+  key: jax.Array, None
+    The random key, or ``None`` if the counter-based mode is disabled.
+  """
+  if not _counter_rng['enabled']:
+    return None
+  from brainpy._src.context import share
+  shared = share.get_shargs()
+  if i is None:
+    if 'i' not in shared:
+      raise ValueError('The counter-based random streams need the step index "i", but it is not '
+                       'found in the shared data. Please run the model with the runners or '
+                       'the trainers, save the step index by "brainpy.share.save(i=...)", or '
+                       'disable the counter-based mode by '
+                       '"brainpy.math.random.set_counter_based(False)".')
+    i = shared['i']
+  stream = shared.get('rng_stream', 0)
+  key = jr.fold_in(jr.PRNGKey(_counter_rng['seed']), _module_id(module))
+  key = jr.fold_in(key, jnp.asarray(_as_jax_array(stream), dtype=jnp.uint32))
+  key = jr.fold_in(key, jnp.asarray(_as_jax_array(i), dtype=jnp.uint32))
+  if count is not None:
+    key = jr.fold_in(key, count)
+  return key
+
+
 def seed(seed: int = None):
   """Sets a new random seed.
 
+  The seed is also used by the counter-based random streams
+  (see :py:func:`set_counter_based`).
+
   Parameters
   ----------
   seed: int, optional
@@ -1424,6 +1636,8 @@ def seed(seed: int = None):
       seed = np.random.randint(0, 100000)
     np.random.seed(seed)
   DEFAULT.seed(seed)
+  if isinstance(seed, (int, np.integer)):
+    _counter_rng['seed'] = int(seed)
 
 
 def rand(*dn, key: Optional[Union[int, JAX_RAND_KEY]] = None):
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Numba kernels of :py:func:`brainpy.math.sparse.bcsrmm`.
+
+This module is imported at the first compilation of the operator, so that
+``import brainpy`` does not need to import numba and to compile the kernels.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(fastmath=True, parallel=True, nogil=True)
+def _bcsrmm_cutlass_imp_transpose(outs, ins):  # dense(m, k) @ bcsr(n, k) -> dense(n, m)
+  res_val = outs[0]
+  # B_data: (num_block, block_size_k, block_size_n)
+  A_data, B_data, B_indices, B_inptr, m, k, n, block_size_k, block_size_n = ins
+  block_size_k = block_size_k[()]
+  block_size_n = block_size_n[()]
+  n_block = n // block_size_n
+
+  for ni in numba.prange(n_block):
+    C_tmp = np.zeros((block_size_n, m), dtype=A_data.dtype)
+    start, end = B_inptr[ni], B_inptr[ni + 1]
+    ns = ni * block_size_n
+    ne = ns + block_size_n
+    for i in range(start, end):
+      ki = B_indices[i, 0]
+      ks = ki * block_size_k
+      ke = ki + block_size_k
+      bi = B_indices[i, 1]
+      C_tmp += np.matmul(B_data[bi], A_data[:, ks: ke].T)
+    res_val[ns: ne] = C_tmp
+  return res_val
+
+
+@numba.njit(fastmath=True, parallel=True, nogil=True)
+def _bcsrmm_cutlass_imp2(outs, ins):  # dense(m, k) @ bcsr(k, n) -> dense(n, m)
+  res_val = outs[0]
+  # B_data: (num_block, block_size_n, block_size_k)
+  A_data, B_data, B_indices, B_inptr, m, k, n, block_size_k, block_size_n = ins
+  block_size_k = block_size_k[()]
+  block_size_n = block_size_n[()]
+  n_block = n // block_size_n
+
+  for ni in numba.prange(n_block):
+    C_tmp = np.zeros((block_size_n, m), dtype=A_data.dtype)
+    start, end = B_inptr[ni], B_inptr[ni + 1]
+    ns = ni * block_size_n
+    ne = ns + block_size_n
+    for i in range(start, end):
+      ki = B_indices[i, 0]
+      ks = ki * block_size_k
+      ke = ki + block_size_k
+      bi = B_indices[i, 1]
+      C_tmp += np.matmul(B_data[bi], A_data[:, ks: ke].T)
+    res_val[ns: ne] = C_tmp
+  return res_val
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+
+"""
+The telemetry of the tracing and the compilation.
+
+The telemetry records, for each object (like a :py:class:`~.JITTransform`, the body
+function of :py:func:`~.for_loop`, or a Taichi kernel), the counts and the durations
+of the tracing, lowering and compilation, the cache hits and misses, the kernel
+builds, and the recompilations caused by the changes of the argument shapes.
+
+The tracing, lowering and compilation time is reported by JAX, and is attributed
+to the innermost object being called. Therefore, the durations of an object include
+the durations of the objects called in it.
+
+>>> import brainpy.math as bm
+>>> bm.telemetry.enable()
+>>> f = bm.jit(lambda x: x + 1)
+>>> f(bm.ones(3))
+>>> bm.telemetry.get_records('jit')
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+__all__ = [
+  'enable',
+  'disable',
+  'is_enabled',
+  'reset',
+  'scope',
+  'add_event',
+  'get_records',
+  'summary',
+  'dump',
+]
+
+# the maximum number of argument signatures kept for each object
+MAX_SIGNATURES = 16
+
+# the JAX monitoring events
+_JAX_EVENTS = {
+  '/jax/core/compile/jaxpr_trace_duration': 'trace',
+  '/jax/core/compile/jaxpr_to_mlir_module_duration': 'lower',
+  '/jax/core/compile/backend_compile_duration': 'compile',
+}
+
+_enabled = os.environ.get('BRAINPY_TELEMETRY', '0').lower() in ('1', 'true', 'yes')
+_listener_registered = False
+_lock = threading.Lock()
+_records: Dict[str, Dict[str, Dict[str, Any]]] = dict()
+
+
+class _Scopes(threading.local):
+  """The objects being called in the current thread."""
+
+  def __init__(self):
+    self.stack = []
+
+
+_scopes = _Scopes()
+
+
+class _Frame(object):
+  __slots__ = ('category', 'name', 'num_trace')
+
+  def __init__(self, category: str, name: str):
+    self.category = category
+    self.name = name
+    self.num_trace = 0
+
+
+def _new_record() -> Dict[str, Any]:
+  return dict(call=0, cache_hit=0, cache_miss=0, recompile=0, signatures=[])
+
+
+def _get_record(category: str, name: str) -> Dict[str, Any]:
+  records = _records.setdefault(category, dict())
+  if name not in records:
+    records[name] = _new_record()
+  return records[name]
+
+
+def _add(record: Dict, event: str, duration: Optional[float]):
+  if duration is None:
+    record[event] = record.get(event, 0) + 1
+  else:
+    if event not in record:
+      record[event] = dict(count=0, time=0.)
+    record[event]['count'] += 1
+    record[event]['time'] += duration
+
+
+def _jax_duration_listener(event: str, duration: float, **kwargs):
+  if not _enabled or event not in _JAX_EVENTS:
+    return
+  if len(_scopes.stack):
+    frame = _scopes.stack[-1]
+    category, name = frame.category, frame.name
+    if _JAX_EVENTS[event] == 'trace':
+      frame.num_trace += 1
+  else:
+    category, name = 'other', 'jax'
+  with _lock:
+    _add(_get_record(category, name), _JAX_EVENTS[event], duration)
+
+
+def _register_listener():
+  global _listener_registered
+  if not _listener_registered:
+    from jax import monitoring
+    monitoring.register_event_duration_secs_listener(_jax_duration_listener)
+    _listener_registered = True
+
+
+def enable():
+  """Enable the telemetry.
+
+  The telemetry can also be enabled by setting the environment
+  variable ``BRAINPY_TELEMETRY=1`` before importing BrainPy.
+
+  .. versionadded:: 2.6.1
+  """
+  global _enabled
+  _enabled = True
+  _register_listener()
+
+
+def disable():
+  """Disable the telemetry. The recorded data are kept.
+
+  .. versionadded:: 2.6.1
+  """
+  global _enabled
+  _enabled = False
+
+
+def is_enabled() -> bool:
+  """Whether the telemetry is enabled.
+
+  .. versionadded:: 2.6.1
+  """
+  return _enabled
+
+
+def reset():
+  """Clear all recorded data.
+
+  .. versionadded:: 2.6.1
+  """
+  with _lock:
+    _records.clear()
+
+
+def add_event(category: str, name: str, event: str, duration: Optional[float] = None):
+  """Record an event of an object.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  category: str
+    The category of the object, like ``"jit"``, ``"for_loop"``, or ``"taichi_kernel"``.
+  name: str
+    The name of the object.
+  event: str
+    The event name. If ``duration`` is None, the event is counted.
+    Otherwise, both the count and the total duration of the event are recorded.
+  duration: float
+    The duration (seconds) of the event.
+  """
+  if not _enabled:
+    return
+  with _lock:
+    _add(_get_record(category, name), event, duration)
+
+
+@contextlib.contextmanager
+def scope(
+    category: str,
+    name: str,
+    signature: Optional[Callable[[], Any]] = None,
+    track_cache: bool = True,
+):
+  """Attribute the tracing and the compilation in this context to one object.
+
+  Each call is counted. If JAX traces the program in the call (not including
+  the objects called in it), the call is counted as a cache miss. Otherwise, it is
+  counted as a cache hit. A cache miss after the first one is a recompilation.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  category: str
+    The category of the object.
+  name: str
+    The name of the object.
+  signature: callable
+    The function to get the signature of the arguments, which is
+    only called when the cache misses, to tell why a recompilation happens.
+  track_cache: bool
+    Whether to count the cache hits and misses of the calls.
+  """
+  if not _enabled:
+    yield
+    return
+  _register_listener()
+  frame = _Frame(category, name)
+  _scopes.stack.append(frame)
+  try:
+    yield
+  finally:
+    _scopes.stack.pop()
+    sig = signature() if (frame.num_trace > 0 and signature is not None) else None
+    with _lock:
+      record = _get_record(category, name)
+      record['call'] += 1
+      if not track_cache:
+        pass
+      elif frame.num_trace > 0:
+        if record['cache_miss'] > 0:
+          record['recompile'] += 1
+        record['cache_miss'] += 1
+        if sig is not None and len(record['signatures']) < MAX_SIGNATURES:
+          record['signatures'].append(sig)
+      else:
+        record['cache_hit'] += 1
+
+
+def signature_of(*args, **kwargs) -> str:
+  """The abstract signature (the shapes and the dtypes) of the arguments."""
+  import jax
+  leaves, tree = jax.tree_util.tree_flatten((args, kwargs))
+  shapes = []
+  for leaf in leaves:
+    if hasattr(leaf, 'shape') and hasattr(leaf, 'dtype'):
+      shapes.append(f'{leaf.dtype}{list(leaf.shape)}')
+    elif callable(leaf):
+      shapes.append(name_of(leaf))
+    else:
+      shapes.append(repr(leaf))
+  return ', '.join(shapes)
+
+
+def name_of(fun) -> str:
+  """The name of a function used in the telemetry."""
+  if isinstance(fun, (tuple, list)):
+    return '|'.join(name_of(f) for f in fun)
+  if hasattr(fun, '__self__') and isinstance(getattr(fun.__self__, 'name', None), str):
+    return f'{fun.__self__.name}.{fun.__name__}'
+  return getattr(fun, '__qualname__', None) or getattr(fun, '__name__', None) or type(fun).__name__
+
+
+def record_calls(category: str, get_name: Callable[..., str]):
+  """Decorate a transformation function, so that its calls are recorded by :py:func:`scope`.
+
+  Parameters
+  ----------
+  category: str
+    The category of the transformation.
+  get_name: callable
+    The function to get the name of the object from the arguments of the call.
+  """
+
+  def decorator(fun):
+    @functools.wraps(fun)
+    def call(*args, **kwargs):
+      if not _enabled:
+        return fun(*args, **kwargs)
+      with scope(category, get_name(*args, **kwargs), signature=lambda: signature_of(*args, **kwargs)):
+        return fun(*args, **kwargs)
+
+    return call
+
+  return decorator
+
+
+def get_records(category: Optional[str] = None) -> Dict:
+  """Get the recorded data.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  category: str
+    The category of the objects. If None, the data of all categories are returned.
+
+  Returns
+  -------
+  res: dict
+    The data ``{category: {name: record}}``, or ``{name: record}`` if ``category``
+    is provided. Each record contains the number of ``call``, ``cache_hit``,
+    ``cache_miss`` and ``recompile``, the argument ``signatures`` of the cache
+    misses, and the ``{"count": ..., "time": ...}`` of the events like ``trace``,
+    ``lower``, ``compile``, and ``kernel_build``.
+  """
+  with _lock:
+    data = json.loads(json.dumps(_records))
+  if category is None:
+    return data
+  return data.get(category, dict())
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+  """Summarize the total time of each event in each category.
+
+  .. versionadded:: 2.6.1
+
+  Returns
+  -------
+  res: dict
+    The data ``{category: {"num_object": ..., "call": ..., "recompile": ...,
+    "<event>_time": ..., }}``.
+  """
+  res = dict()
+  for category, records in get_records().items():
+    total = dict(num_object=len(records))
+    for record in records.values():
+      for key, val in record.items():
+        if isinstance(val, dict):
+          total[f'{key}_count'] = total.get(f'{key}_count', 0) + val['count']
+          total[f'{key}_time'] = total.get(f'{key}_time', 0.) + val['time']
+        elif isinstance(val, int):
+          total[key] = total.get(key, 0) + val
+    res[category] = total
+  return res
+
+
+def dump(filename: str):
+  """Dump the recorded data and the summary to a JSON file.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  filename: str
+    The file name.
+  """
+  with open(filename, 'w') as f:
+    json.dump(dict(time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   summary=summary(),
+                   records=get_records()),
+              f, indent=2)
+
+
+if _enabled:
+  _register_listener()
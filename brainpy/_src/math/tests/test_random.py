@@ -310,6 +310,27 @@ class TestRandom(unittest.TestCase):
     a = bm.random.binomial(n=bm.asarray([2, 3, 4]), p=bm.asarray([[0.5, 0.5, 0.5], [0.6, 0.6, 0.6]]))
     self.assertTupleEqual(a.shape, (2, 3))
 
+  def test_binomial_small_mean(self):
+    br.seed(1)
+    for n, p in [(20, 0.1), (100, 0.97), (1, 0.3), (10, 0.)]:
+      a = np.asarray(bm.random.binomial(n, p, size=200000))
+      self.assertTrue((a >= 0).all() and (a <= n).all())
+      self.assertTrue(abs(a.mean() - n * p) < 5 * np.sqrt(n * p * (1 - p) / 2e5) + 1e-8)
+      self.assertTrue(abs(a.var() - n * p * (1 - p)) < 0.05 * n * p * (1 - p) + 1e-8)
+
+  def test_bernoulli_sparse(self):
+    br.seed(1)
+    a = np.asarray(bm.random.bernoulli(0.001, size=(20, 100000)))
+    self.assertTupleEqual(a.shape, (20, 100000))
+    self.assertTrue(abs(a.mean() - 0.001) < 5 * np.sqrt(0.001 / 2e6))
+
+    # heterogeneous probabilities
+    p = np.linspace(0., 0.002, 100000)
+    a = np.asarray(bm.jit(lambda: bm.random.bernoulli(p, size=(20, 100000)))())
+    self.assertEqual(a[:, 0].sum(), 0)
+    self.assertTrue(abs(a[:, :50000].mean() - p[:50000].mean()) < 5 * np.sqrt(0.0005 / 1e6))
+    self.assertTrue(abs(a[:, 50000:].mean() - p[50000:].mean()) < 5 * np.sqrt(0.0015 / 1e6))
+
   def test_chisquare1(self):
     br.seed()
     a = bm.random.chisquare(3)
@@ -559,3 +580,69 @@ class TestRandomKey(unittest.TestCase):
     bm.clear_buffer_memory()
     print(bm.random.DEFAULT.value)
     self.assertTrue(isinstance(bm.random.DEFAULT.value, np.ndarray))
+
+
+class TestCounterBased(unittest.TestCase):
+  def setUp(self):
+    br.set_counter_based(True, seed=2024)
+
+  def tearDown(self):
+    br.set_counter_based(False)
+
+  def test_module_key(self):
+    k1 = br.module_key('a', i=3)
+    self.assertTrue(bm.array_equal(k1, br.module_key('a', i=3)))
+    self.assertFalse(bm.array_equal(k1, br.module_key('a', i=4)))
+    self.assertFalse(bm.array_equal(k1, br.module_key('b', i=3)))
+    self.assertFalse(bm.array_equal(k1, br.module_key('a', i=3, count=1)))
+    br.set_counter_based(False)
+    self.assertIsNone(br.module_key('a', i=3))
+
+  def test_module_key_without_step_index(self):
+    import brainpy as bp
+    with bp.share.context():
+      # the step index may have been left by other tests
+      bp.share.clear()
+      with self.assertRaisesRegex(ValueError, 'step index'):
+        br.module_key('a')
+      bp.share.save(i=3)
+      k1 = br.module_key('a')
+      self.assertTrue(bm.array_equal(k1, br.module_key('a', i=3)))
+      bp.share.save(rng_stream=1)
+      self.assertFalse(bm.array_equal(k1, br.module_key('a')))
+
+  def test_order_independent(self):
+    import brainpy as bp
+
+    def run(reverse):
+      bm.clear_name_cache(ignore_warn=True)
+      br.seed(1)
+      g1 = bp.dyn.PoissonGroup(10, freqs=200., name='counter_poisson1')
+      g2 = bp.dyn.PoissonGroup(10, freqs=200., name='counter_poisson2')
+      groups = [g2, g1] if reverse else [g1, g2]
+
+      def step(i):
+        bp.share.save(i=i, t=i * bm.dt)
+        for g in groups:
+          g.update()
+        return g1.spike.value, g2.spike.value
+
+      return bm.for_loop(step, np.arange(100))
+
+    s1, s2 = run(False)
+    r1, r2 = run(True)
+    self.assertTrue(bm.array_equal(s1, r1))
+    self.assertTrue(bm.array_equal(s2, r2))
+    self.assertFalse(bm.array_equal(s1, s2))
+
+  def test_sde(self):
+    import brainpy as bp
+
+    def run():
+      bm.clear_name_cache(ignore_warn=True)
+      intg = bp.sdeint(lambda x, t: -x, lambda x, t: 1., name='counter_sde')
+      return bm.for_loop(lambda i: intg(bm.zeros(3), i * bm.dt, bm.dt), np.arange(10))
+
+    a = run()
+    br.DEFAULT.split_key()  # the global state does not change the results
+    self.assertTrue(bm.array_equal(a, run()))
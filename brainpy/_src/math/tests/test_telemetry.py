@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import unittest
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class TestTelemetry(unittest.TestCase):
+  def setUp(self):
+    bm.telemetry.reset()
+    bm.telemetry.enable()
+
+  def tearDown(self):
+    bm.telemetry.disable()
+    bm.telemetry.reset()
+
+  def test_jit_recompile(self):
+    f = bm.jit(lambda x: x + 1)
+    f(bm.ones(3))
+    f(bm.ones(3))
+    f(bm.ones(4))
+    records = bm.telemetry.get_records('jit')
+    self.assertEqual(len(records), 1)
+    record = list(records.values())[0]
+    self.assertEqual(record['call'], 3)
+    self.assertEqual(record['cache_hit'], 1)
+    self.assertEqual(record['cache_miss'], 2)
+    self.assertEqual(record['recompile'], 1)
+    dtype = bm.ones(1).dtype
+    self.assertEqual(record['signatures'], [f'{dtype}[3]', f'{dtype}[4]'])
+    for event in ['trace', 'lower', 'compile']:
+      self.assertGreater(record[event]['count'], 0)
+      self.assertGreater(record[event]['time'], 0.)
+
+  def test_cls_jit(self):
+    class Obj(bp.BrainPyObject):
+      def __init__(self):
+        super().__init__(name='telemetry_obj')
+        self.a = bm.Variable(bm.zeros(2))
+
+      @bm.cls_jit
+      def update(self, x):
+        self.a += x
+
+    obj = Obj()
+    obj.update(1.)
+    obj.update(1.)
+    record = bm.telemetry.get_records('jit')['telemetry_obj.update']
+    self.assertEqual(record['call'], 2)
+    self.assertEqual(record['cache_miss'], 1)
+    self.assertEqual(record['cache_hit'], 1)
+
+  def test_controls(self):
+    a = bm.Variable(bm.zeros(3))
+
+    def body(i):
+      a.value += i
+
+    def true_f():
+      return a.value
+
+    def false_f():
+      return -a.value
+
+    bm.for_loop(body, bm.arange(5))
+    bm.cond(True, true_f, false_f)
+    records = bm.telemetry.get_records()
+    self.assertIn(body.__qualname__, records['for_loop'])
+    self.assertEqual(records['for_loop'][body.__qualname__]['call'], 1)
+    self.assertIn(f'{true_f.__qualname__}|{false_f.__qualname__}', records['cond'])
+
+  def test_nested(self):
+    a = bm.Variable(bm.zeros(3))
+
+    def body(i):
+      a.value += i
+
+    f = bm.jit(lambda: bm.for_loop(body, bm.arange(5)))
+    f()
+    f()
+    records = bm.telemetry.get_records()
+    # the for_loop is only called in the first call of the outer jit, once for
+    # collecting the variables, and once for the tracing of "jax.jit"
+    self.assertEqual(records['for_loop'][body.__qualname__]['call'], 2)
+    jit_record = list(records['jit'].values())[0]
+    self.assertEqual(jit_record['cache_hit'], 1)
+    self.assertEqual(jit_record['compile']['count'], 1)
+
+  def test_connector(self):
+    bp.conn.FixedProb(0.1, seed=1)(20, 30).require('csr')
+    record = bm.telemetry.get_records('connector')['FixedProb']
+    self.assertEqual(record['build']['count'], 1)
+
+  def test_disabled(self):
+    bm.telemetry.disable()
+    f = bm.jit(lambda x: x + 1)
+    f(bm.ones(3))
+    self.assertEqual(bm.telemetry.get_records(), {})
+
+  def test_dump(self):
+    f = bm.jit(lambda x: x * 2)
+    f(bm.ones(3))
+    with tempfile.TemporaryDirectory() as folder:
+      filename = os.path.join(folder, 'telemetry.json')
+      bm.telemetry.dump(filename)
+      with open(filename) as file:
+        data = json.load(file)
+    self.assertEqual(data['summary']['jit']['num_object'], 1)
+    self.assertEqual(data['summary']['jit']['call'], 1)
+    self.assertEqual(data['records']['jit'], bm.telemetry.get_records('jit'))
@@ -2,6 +2,7 @@
 
 import functools
 import inspect
+import json
 import time
 import warnings
 from collections.abc import Iterable
@@ -17,8 +18,10 @@ from jax.tree_util import tree_map, tree_flatten
 from brainpy import math as bm, tools
 from brainpy._src.context import share
 from brainpy._src.deprecations import _input_deprecate_msg
-from brainpy._src.dynsys import DynamicalSystem
+from brainpy._src.dynsys import DynamicalSystem, DynSysGroup, DynView, Dynamic, Projection
 from brainpy._src.helpers import clear_input
+from brainpy._src.inputs.generators import InputGenerator
+from brainpy._src.running.profiler import profile_step_functions, save_chrome_trace
 from brainpy._src.running.runner import Runner
 from brainpy.errors import RunningError
 from brainpy.types import Output, Monitor
@@ -155,6 +158,7 @@ def check_and_format_inputs(host, inputs):
   next_inputs = {'=': [], '+': [], '-': [], '*': [], '/': []}
   func_inputs = {'=': [], '+': [], '-': [], '*': [], '/': []}
   array_inputs = {'=': [], '+': [], '-': [], '*': [], '/': []}
+  generator_inputs = {'=': [], '+': [], '-': [], '*': [], '/': []}
 
   for variable, value, type_, op in formatted_inputs:
     # variable
@@ -164,7 +168,9 @@ def check_and_format_inputs(host, inputs):
                          f'give its input.')
 
     # input data
-    if type_ == 'iter':
+    if isinstance(value, InputGenerator):
+      generator_inputs[op].append([variable, value])
+    elif type_ == 'iter':
       if isinstance(value, (bm.ndarray, np.ndarray, jnp.ndarray)):
         array_inputs[op].append([variable, bm.as_jax(value)])
       else:
@@ -177,7 +183,8 @@ def check_and_format_inputs(host, inputs):
   return {'fixed': fix_inputs,
           'iterated': next_inputs,
           'functional': func_inputs,
-          'array': array_inputs}
+          'array': array_inputs,
+          'generator': generator_inputs}
 
 
 def _f_ops(ops, var, data):
@@ -225,6 +232,8 @@ class DSRunner(Runner):
       - ``type``: should be a string. "fix" means the input `value`
         is a constant. "iter" means the input `value` can be changed
         over time. "func" mean the input is obtained through the functional call.
+        If ``value`` is an instance of :py:class:`~.InputGenerator`, the input of the
+        current step is computed on the fly, whatever the ``type`` is.
       - ``operation``: should be a string, support `+`, `-`, `*`, `/`, `=`.
       - Also, if you want to specify multiple inputs, just give multiple
         ``(target, value, [type, operation])``,
@@ -382,6 +391,7 @@ class DSRunner(Runner):
     """Reset state of the ``DSRunner``."""
     self.i0 = 0
 
+  @share.context()
   def predict(
       self,
       duration: float = None,
@@ -506,6 +516,110 @@ class DSRunner(Runner):
     self.i0 += num_step
     return outputs if not eval_time else (running_time, outputs)
 
+  @share.context()
+  def profile(
+      self,
+      duration: float = None,
+      inputs: Any = None,
+      shared_args: Dict = None,
+      repeat: int = 3,
+      peak_flops: Optional[float] = None,
+      peak_bandwidth: Optional[float] = None,
+      json_file: Optional[str] = None,
+      trace_file: Optional[str] = None,
+  ) -> Dict[str, Dict]:
+    """Profile the time and the memory of each module in one simulation step.
+
+    The step is split into the inputs, the top-level children of the target
+    (if it is a :py:class:`~.DynSysGroup`, in the same order as its ``update()``),
+    and the monitors. Each part, together with the whole step, is compiled as a
+    separate executable running ``duration`` steps, so that the time of each
+    part can be measured independently. The states of the model are not changed
+    by the profiling.
+
+    .. versionadded:: 2.6.1
+
+    Parameters
+    ----------
+    duration: float
+      The simulation time length to profile.
+    inputs: ArrayType, dict of ArrayType, sequence of ArrayType
+      The input data, the same as :py:func:`~.DSRunner.predict`.
+    shared_args: optional, dict
+      The shared arguments across different layers.
+    repeat: int
+      The number of times to measure the running time.
+    peak_flops: float
+      The peak FLOP/s of the device, used to estimate the time by the roofline model.
+    peak_bandwidth: float
+      The peak memory bandwidth (bytes/s) of the device.
+    json_file: str
+      The JSON file to save the profiling result.
+    trace_file: str
+      The file to save the profiling result as the Chrome trace format.
+
+    Returns
+    -------
+    res: dict
+      The profiling result of each module, and of the whole step (with the key ``"total"``).
+      See :py:func:`brainpy._src.running.profiler.profile_step_functions` for the details.
+    """
+    if duration is None and inputs is None:
+      raise ValueError('Please provide "duration" or "inputs".')
+    num_step = self._get_input_time_step(None if inputs is not None else duration, inputs)
+    indices = np.arange(self.i0, self.i0 + num_step, dtype=bm.int_)
+    if inputs is None:
+      inputs = tuple()
+    if isinstance(self.target.mode, bm.BatchingMode) and self.data_first_axis == 'B':
+      inputs = tree_map(lambda x: jnp.moveaxis(x, 0, 1), inputs)
+    if not isinstance(inputs, (tuple, list)):
+      inputs = (inputs,)
+    shared_args = dict() if shared_args is None else shared_args
+
+    def _step(f):
+      def step(i, *x):
+        share.save(**shared_args)
+        share.save(t=self.t0 + i * self.dt, i=i, dt=self.dt)
+        return f(*x)
+
+      return step
+
+    def _node_step(node):
+      def step():
+        node()
+        clear_input(node)
+
+      return step
+
+    funs = {'input': _step(lambda *x: self._step_func_input())}
+    if isinstance(self.target, DynSysGroup):
+      nodes = self.target.nodes(level=1, include_self=False).subset(DynamicalSystem).unique().not_subset(DynView)
+      for group in [nodes.subset(Projection),
+                    nodes.subset(Dynamic),
+                    nodes.not_subset(Dynamic).not_subset(Projection)]:
+        for node in group.values():
+          funs[node.name] = _step(lambda *x, node=node: _node_step(node)())
+    else:
+      funs[self.target.name] = _step(lambda *x: self.target(*x))
+    funs['monitor'] = _step(lambda *x: self._step_func_monitor())
+
+    def _total(*x):
+      self._step_func_input()
+      out = self.target(*x)
+      mon = self._step_func_monitor()
+      clear_input(self.target)
+      return out, mon
+
+    funs['total'] = _step(_total)
+    res = profile_step_functions(funs, indices, *inputs, repeat=repeat,
+                                 peak_flops=peak_flops, peak_bandwidth=peak_bandwidth)
+    if json_file is not None:
+      with open(json_file, 'w') as f:
+        json.dump({'num_step': num_step, 'dt': self.dt, 'modules': res}, f, indent=2)
+    if trace_file is not None:
+      save_chrome_trace(res, trace_file)
+    return res
+
   def run(self, *args, **kwargs) -> Union[Output, Tuple[float, Output]]:
     """Same as :py:func:`~.DSRunner.predict`.
     """
@@ -567,6 +681,9 @@ class DSRunner(Runner):
       for ops, values in self._inputs['array'].items():
         for var, data in values:
           _f_ops(ops, var, data[share['i']])
+      for ops, values in self._inputs['generator'].items():
+        for var, data in values:
+          _f_ops(ops, var, data(share['i']))
       for ops, values in self._inputs['functional'].items():
         for var, data in values:
           _f_ops(ops, var, _call_fun_with_share(data))
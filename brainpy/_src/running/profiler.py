@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+Profile the step functions of a simulation.
+"""
+
+import json
+import time
+from typing import Callable, Dict, Optional
+
+import jax
+import numpy as np
+from jax.tree_util import tree_map
+
+try:
+  from jax.lax import optimization_barrier
+except ImportError:
+  from jax._src.ad_checkpoint import _optimization_barrier as optimization_barrier
+
+import brainpy.math as bm
+from brainpy._src.math.object_transform.tools import eval_shape
+
+__all__ = [
+  'profile_step_functions',
+  'save_chrome_trace',
+]
+
+
+def _first_step(xs):
+  return tree_map(lambda a: a[0], xs)
+
+
+def _cost_of(compiled) -> Dict:
+  cost = compiled.cost_analysis()
+  if isinstance(cost, (tuple, list)):
+    cost = cost[0] if len(cost) else None
+  return dict() if cost is None else cost
+
+
+def _profile_one(
+    fun: Callable,
+    indices,
+    xs,
+    repeat: int,
+    peak_flops: Optional[float],
+    peak_bandwidth: Optional[float],
+) -> Dict:
+  # all variables read or written by the step function
+  stack, _ = eval_shape(fun, indices[0], *_first_step(xs), with_stack=True)
+  data = stack.dict_data()
+
+  def step(data, i, *x):
+    for k, v in stack.items():
+      v._value = data[k]
+    out = fun(i, *x)
+    return stack.dict_data(), out
+
+  def run(data, indices, *xs):
+    # The variables not changed by the function are loop invariants, so that the
+    # computation on them can be hoisted out of the loop by XLA. The optimization
+    # barrier prevents it, making each step be computed like in the full model.
+    body = lambda carry, x: step(optimization_barrier(carry), *x)
+    return jax.lax.scan(body, data, (indices,) + tuple(xs))
+
+  # The cost of one step. XLA counts the loop body only once,
+  # so that the cost analysis is applied on one single step.
+  with stack:
+    t0 = time.perf_counter()
+    lowered = jax.jit(step).lower(data, indices[0], *_first_step(xs))
+    t1 = time.perf_counter()
+    compiled = lowered.compile()
+    t2 = time.perf_counter()
+  cost = _cost_of(compiled)
+  memory = compiled.memory_analysis()
+
+  # the measured time of the steps running in a loop
+  with stack:
+    compiled_run = jax.jit(run).lower(data, indices, *xs).compile()
+  times = []
+  for _ in range(repeat):
+    t0_run = time.perf_counter()
+    jax.block_until_ready(compiled_run(data, indices, *xs))
+    times.append((time.perf_counter() - t0_run) / indices.shape[0])
+
+  flops = cost.get('flops', 0.)
+  bytes_accessed = cost.get('bytes accessed', 0.)
+  if 'optimal_seconds' in cost and cost['optimal_seconds'] > 0.:
+    estimated = cost['optimal_seconds']
+  elif peak_flops is not None and peak_bandwidth is not None:
+    # the roofline estimation
+    estimated = max(flops / peak_flops, bytes_accessed / peak_bandwidth)
+  else:
+    estimated = None
+  res = dict(flops=float(flops),
+             bytes_accessed=float(bytes_accessed),
+             estimated_time=estimated,
+             measured_time=float(np.median(times)),
+             measured_time_min=float(np.min(times)),
+             lower_time=t1 - t0,
+             compile_time=t2 - t1,
+             num_vars=len(stack))
+  if memory is not None:
+    res['argument_bytes'] = memory.argument_size_in_bytes
+    res['output_bytes'] = memory.output_size_in_bytes
+    res['temp_bytes'] = memory.temp_size_in_bytes
+    res['peak_bytes'] = (memory.argument_size_in_bytes +
+                         memory.output_size_in_bytes +
+                         memory.temp_size_in_bytes -
+                         memory.alias_size_in_bytes)
+  return res
+
+
+def profile_step_functions(
+    funs: Dict[str, Callable],
+    indices,
+    *xs,
+    repeat: int = 3,
+    peak_flops: Optional[float] = None,
+    peak_bandwidth: Optional[float] = None,
+) -> Dict[str, Dict]:
+  """Profile the step functions one by one.
+
+  Each step function ``f(i, *x)`` is compiled as a separate executable, in which
+  the function is called on every time step in ``indices``. Therefore, the
+  profiling result of one function does not depend on the other functions.
+  The values of the variables are not changed by the profiling.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  funs: dict
+    The step functions, which receive the time step index and the inputs
+    at the current time step.
+  indices: ArrayType
+    The time step indices.
+  *xs: ArrayType
+    The inputs, whose first dimension is the time.
+  repeat: int
+    The number of times to measure the running time.
+  peak_flops: float
+    The peak FLOP/s of the device. Used to estimate the time by
+    the roofline model when XLA does not provide the estimation.
+  peak_bandwidth: float
+    The peak memory bandwidth (bytes/s) of the device.
+
+  Returns
+  -------
+  res: dict
+    The profiling result of each function, including
+
+    - ``flops``: the FLOPs of one step, estimated by the XLA cost analysis,
+      which does not count the custom operators (like the Taichi kernels).
+    - ``bytes_accessed``: the bytes accessed in one step.
+    - ``estimated_time``: the estimated time (s) of one step. ``None`` if it is unknown.
+    - ``measured_time``: the median of the measured time (s) of one step.
+    - ``lower_time`` and ``compile_time``: the time (s) to lower and to compile one step.
+    - ``peak_bytes`` and ``temp_bytes``: the peak and the temporary buffer size of one step.
+  """
+  indices = bm.as_jax(indices)
+  xs = tree_map(bm.as_jax, xs, is_leaf=lambda a: isinstance(a, bm.Array))
+  return {name: _profile_one(f, indices, xs, repeat, peak_flops, peak_bandwidth)
+          for name, f in funs.items()}
+
+
+def save_chrome_trace(report: Dict, filename: str, total: str = 'total'):
+  """Save the profiling report as the Chrome trace format, which can be viewed in
+  ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_.
+
+  The modules are shown one after another in one time step with their measured time.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  report: dict
+    The profiling result of :py:func:`profile_step_functions`.
+  filename: str
+    The file name.
+  total: str
+    The name of the whole step in ``report``, which is shown in a separate row.
+  """
+  events = []
+  start = 0.
+  for name, res in report.items():
+    args = {k: v for k, v in res.items() if k != 'measured_time'}
+    if name == total:
+      events.append(dict(name=name, ph='X', pid=0, tid=0, ts=0., dur=res['measured_time'] * 1e6, args=args))
+    else:
+      events.append(dict(name=name, ph='X', pid=0, tid=1, ts=start, dur=res['measured_time'] * 1e6, args=args))
+      start += res['measured_time'] * 1e6
+  events.append(dict(name='thread_name', ph='M', pid=0, tid=0, args=dict(name='step')))
+  events.append(dict(name='thread_name', ph='M', pid=0, tid=1, args=dict(name='modules')))
+  with open(filename, 'w') as f:
+    json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, indent=2)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class TestShareContext(unittest.TestCase):
+  def test_scope(self):
+    bp.share.save(a=1)
+    with bp.share.context(b=2):
+      self.assertEqual(bp.share.load('a'), 1)
+      self.assertEqual(bp.share.load('b'), 2)
+      bp.share.save(a=10)
+      with bp.share.context():
+        self.assertEqual(bp.share.load('a'), 10)
+        bp.share.clear()
+        self.assertEqual(bp.share.load('a', 0), 0)
+      self.assertEqual(bp.share.load('a'), 10)
+    self.assertEqual(bp.share.load('a'), 1)
+    with self.assertRaises(KeyError):
+      bp.share.load('b')
+    bp.share.clear_shargs('a')
+
+  def test_threads(self):
+    barrier = threading.Barrier(4, timeout=10.)
+
+    def f(i):
+      with bp.share.context():
+        bp.share.save(i=i)
+        barrier.wait()
+        return bp.share.load('i')
+
+    with ThreadPoolExecutor(4) as pool:
+      self.assertEqual(list(pool.map(f, range(4))), [0, 1, 2, 3])
+
+  def test_asyncio(self):
+    async def f(i):
+      with bp.share.context(i=i):
+        await asyncio.sleep(0.01)
+        return bp.share.load('i')
+
+    async def main():
+      return await asyncio.gather(*[f(i) for i in range(4)])
+
+    self.assertEqual(asyncio.run(main()), [0, 1, 2, 3])
+
+  def test_concurrent_runners(self):
+    barrier = threading.Barrier(2, timeout=10.)
+
+    class Model(bp.DynamicalSystem):
+      def __init__(self):
+        super().__init__(mode=bm.nonbatching_mode)
+        self.x = bm.Variable(bm.zeros(1))
+
+      def update(self):
+        # both runners are tracing their models at this point
+        barrier.wait()
+        self.x += bp.share['dt']
+
+    def run(dt):
+      runner = bp.DSRunner(Model(), dt=dt, monitors=['x'], progress_bar=False)
+      runner.run(10.)
+      return runner.mon['x'][-1, 0]
+
+    with ThreadPoolExecutor(2) as pool:
+      res = list(pool.map(run, [0.1, 0.5]))
+    np.testing.assert_allclose(res, [10., 10.], rtol=1e-5)
@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 
-import pytest
+import json
+import os
+import tempfile
 import unittest
+
+import numpy as np
+import pytest
+
 import brainpy as bp
 import brainpy.math as bm
 
@@ -80,6 +86,36 @@ class TestDSRunner(unittest.TestCase):
     runner = bp.DSRunner(net, monitors={'E.spike': net.E.spike},
                          inputs=[(net.E.input, 20.), (net.I.input, 20.)], jit=False).run(0.2)
 
+  def test_profile(self):
+    class Net(bp.DynSysGroup):
+      def __init__(self):
+        super().__init__()
+        self.pre = bp.dyn.LifRef(100, V_initializer=bp.init.Uniform(-70., -50.))
+        self.post = bp.dyn.LifRef(50)
+        self.syn = bp.dyn.FullProjAlignPostMg(pre=self.pre, delay=None,
+                                              comm=bp.dnn.EventCSRLinear(bp.conn.FixedProb(0.1, pre=100, post=50), 0.1),
+                                              syn=bp.dyn.Expon.desc(50, tau=5.),
+                                              out=bp.dyn.CUBA.desc(),
+                                              post=self.post)
+
+    net = Net()
+    runner = bp.DSRunner(net, monitors={'spike': net.pre.spike}, progress_bar=False)
+    V = bm.as_numpy(net.pre.V).copy()
+    with tempfile.TemporaryDirectory() as folder:
+      res = runner.profile(5., json_file=os.path.join(folder, 'profile.json'),
+                           trace_file=os.path.join(folder, 'trace.json'))
+      with open(os.path.join(folder, 'trace.json')) as f:
+        trace = json.load(f)
+    self.assertEqual(list(res.keys()), ['input', net.syn.name, net.pre.name, net.post.name, 'monitor', 'total'])
+    for key in ['flops', 'bytes_accessed', 'measured_time', 'compile_time', 'peak_bytes']:
+      self.assertIn(key, res['total'])
+    self.assertGreater(res['total']['flops'], 0.)
+    self.assertGreater(res['total']['peak_bytes'], 0)
+    self.assertEqual(len([e for e in trace['traceEvents'] if e['ph'] == 'X']), len(res))
+    # the profiling does not change the states
+    np.testing.assert_array_equal(V, bm.as_numpy(net.pre.V))
+    self.assertEqual(runner.i0, 0)
+
 
 class TestMemoryEfficient(unittest.TestCase):
   pass
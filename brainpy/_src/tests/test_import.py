@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import json
+import subprocess
+import sys
+import unittest
+
+import brainpy as bp
+import brainpy.math as bm
+from brainpy._src.dependency_check import import_taichi
+
+
+def _run(code):
+  out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+  return out.stdout.strip().splitlines()[-1]
+
+
+class TestLazyImport(unittest.TestCase):
+  def test_optional_backends_not_imported(self):
+    # "import brainpy" should not pay for the optional backends, e.g., the
+    # taichi kernels are only defined at the first call of their operators
+    modules = ['taichi', 'numba', 'scipy.optimize', 'scipy.special', 'brainpy.analysis']
+    code = f'import sys, json, brainpy; print(json.dumps([m for m in {modules} if m in sys.modules]))'
+    self.assertEqual(json.loads(_run(code)), [])
+
+  def test_lazy_attributes(self):
+    self.assertTrue(hasattr(bp.analysis, 'PhasePlane2D'))
+    self.assertIn(bp.tools.numba_range, (range, getattr(sys.modules.get('numba'), 'prange', None)))
+    if import_taichi(error_if_not_found=False) is not None:
+      self.assertTrue(hasattr(bm.tifunc, 'lfsr88_key'))
+      self.assertIsNotNone(bm.ti_float)
+    with self.assertRaises(AttributeError):
+      bp.not_a_brainpy_attribute
+
+
+if __name__ == '__main__':
+  unittest.main()
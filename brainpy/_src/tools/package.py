@@ -1,43 +1,81 @@
 # -*- coding: utf-8 -*-
 
-import numpy as np
-
-try:
-  import numba
-except (ImportError, ModuleNotFoundError):
-  numba = None
+import functools
+import importlib.util
 
+import numpy as np
 
 __all__ = [
   'numba_jit',
   'numba_seed',
-  'numba_range',
   'SUPPORT_NUMBA',
 ]
 
 
+# numba is imported when the first function is jitted,
+# so that ``import brainpy`` does not need to import numba
+SUPPORT_NUMBA = importlib.util.find_spec('numba') is not None
+
+
+class _LazyNumbaJit(object):
+  """The function which is compiled by ``numba.njit`` at its first call.
+
+  It is only used for the functions defined at the module level of BrainPy,
+  so that importing these modules does not import numba. It can also be
+  called in other numba jitted functions, just like the ``numba.njit`` dispatcher.
+  """
 
-SUPPORT_NUMBA = numba is not None
+  def __init__(self, f, **kwargs):
+    functools.update_wrapper(self, f)
+    self.py_func = f
+    self.jit_kwargs = kwargs
+    self._dispatcher = None
+
+  @property
+  def dispatcher(self):
+    if self._dispatcher is None:
+      import numba
+      self._dispatcher = numba.njit(self.py_func, **self.jit_kwargs)
+    return self._dispatcher
+
+  @property
+  def _numba_type_(self):
+    import numba
+    return numba.typeof(self.dispatcher)
+
+  def __call__(self, *args, **kwargs):
+    return self.dispatcher(*args, **kwargs)
+
+
+def _lazy_numba_jit(f):
+  return _LazyNumbaJit(f) if SUPPORT_NUMBA else f
 
 
 def numba_jit(f=None, **kwargs):
   if f is None:
-    return lambda f: (f if (numba is None) else numba.njit(f, **kwargs))
-  else:
-    if numba is None:
-      return f
-    else:
-      return numba.njit(f)
+    return lambda f: numba_jit(f, **kwargs)
+  if not SUPPORT_NUMBA:
+    return f
+  import numba
+  return numba.njit(f, **kwargs)
 
 
-@numba_jit
+@_lazy_numba_jit
 def _seed(seed):
   np.random.seed(seed)
 
 
 def numba_seed(seed):
-  if numba is not None and seed is not None:
+  if SUPPORT_NUMBA and seed is not None:
     _seed(seed)
 
 
-numba_range = numba.prange if SUPPORT_NUMBA else range
+def __getattr__(name):
+  # "numba_range" is not listed in ``__all__``, because ``import *``
+  # would import numba to resolve it.
+  if name == 'numba_range':
+    if SUPPORT_NUMBA:
+      import numba
+      return numba.prange
+    return range
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
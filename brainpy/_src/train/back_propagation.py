@@ -4,14 +4,16 @@ import time
 from collections.abc import Iterable
 from typing import Union, Dict, Callable, Sequence, Optional
 
+import jax
 import jax.numpy as jnp
 import numpy as np
-from jax.tree_util import tree_map
+from jax.sharding import Mesh, NamedSharding, PartitionSpec
+from jax.tree_util import tree_map, tree_flatten
 from tqdm import tqdm
 
 import brainpy.losses as losses
 import brainpy.math as bm
-from brainpy import optim
+from brainpy import check, optim
 from brainpy import tools
 from brainpy._src.context import share
 from brainpy._src.helpers import clear_input
@@ -33,6 +35,40 @@ def _is_brainpy_array(s):
   return isinstance(s, bm.Array)
 
 
+def _tree_shapes(tree):
+  leaves, tree_def = tree_flatten(tree, is_leaf=_is_brainpy_array)
+  return tree_def, tuple(jnp.shape(leaf) for leaf in leaves)
+
+
+def _stack_batches(batches):
+  return tree_map(lambda *xs: bm.stack(xs), *batches, is_leaf=_is_brainpy_array)
+
+
+def _fuse_batches(data, num_fused_step):
+  """Group the ``(X, Y)`` batches in ``data`` into chunks of ``num_fused_step`` batches.
+
+  Yield ``(X, Y, n)``, where ``n`` is the number of stacked batches (``n > 1``) or
+  ``n = 1`` for a single un-stacked batch. Batches which can not be stacked
+  (different structures or shapes, or the remainder of the data) are yielded one by one.
+  """
+  buffer = []
+  for x, y in data:
+    if num_fused_step <= 1:
+      yield x, y, 1
+      continue
+    if len(buffer) and _tree_shapes((x, y)) != _tree_shapes(buffer[0]):
+      for bx, by in buffer:
+        yield bx, by, 1
+      buffer = []
+    buffer.append((x, y))
+    if len(buffer) == num_fused_step:
+      xs, ys = _stack_batches(buffer)
+      yield xs, ys, num_fused_step
+      buffer = []
+  for bx, by in buffer:
+    yield bx, by, 1
+
+
 class BPTrainer(DSTrainer):
   """Trainer implementing back-propagation algorithm for supervised trasks.
 
@@ -63,6 +99,15 @@ class BPTrainer(DSTrainer):
   seed: int
     .. deprecated:: 2.2.4.1
        Control the data shuffling by user self.
+  data_parallel: bool, sequence of Device
+    Train the model with the data parallelism. If ``True``, all local devices
+    are used. A sequence of ``jax.Device`` can also be provided. The batch axis of
+    the input data and the model states is partitioned across the devices,
+    while the trainable variables and the optimizer states are replicated.
+    Gradients are all-reduced across the devices by the compiler.
+    On CPU, multiple host devices can be set by :py:func:`brainpy.math.set_host_device_count`.
+
+    .. versionadded:: 2.6.1
 
   kwargs: Any
     Other general parameters please see :py:class:`~.DSRunner`.
@@ -75,6 +120,7 @@ class BPTrainer(DSTrainer):
       optimizer: optim.Optimizer = None,  # optimizer
       loss_has_aux: bool = False,  # loss auxiliary
       loss_auto_run: bool = True,  # loss auxiliary
+      data_parallel: Union[bool, Sequence[jax.Device]] = False,  # data parallelism
 
       # -------------
       # API deprecated
@@ -129,16 +175,33 @@ class BPTrainer(DSTrainer):
     self._loss_func = loss_fun
     self.loss_auto_run = loss_auto_run
 
+    # data parallelism
+    if isinstance(data_parallel, bool):
+      devices = jax.local_devices() if data_parallel else None
+    else:
+      devices = list(data_parallel)
+      if not all(isinstance(d, jax.Device) for d in devices):
+        raise TypeError(f'"data_parallel" must be a bool or a sequence of jax.Device. But we got {data_parallel}.')
+    self._data_mesh = None if devices is None else Mesh(np.asarray(devices), (bm.sharding.BATCH_AXIS,))
+
     # loss data
     self._report_train_metrics = dict()
     self._report_test_metrics = dict()
     self._detailed_train_metrics = dict()
     self._detailed_test_metrics = dict()
 
+    # the counter of the random streams, which is advanced at every batch,
+    # so that the batches draw different random numbers in the counter-based
+    # random mode (see ``brainpy.math.random.module_key``)
+    self._rng_stream = bm.Variable(jnp.zeros((), dtype=jnp.uint32))
+
     # functions
     self._jit_step_func_grad = bm.jit(self._step_func_grad, static_argnums=(0,))
-    self._jit_step_func_loss = bm.jit(self._step_func_loss, static_argnums=(0,))
+    self._jit_step_func_eval = bm.jit(self._step_func_eval, static_argnums=(0,))
     self._jit_step_func_fit = bm.jit(self._step_func_fit, static_argnums=(0,))
+    self._jit_step_func_fused_fit = bm.jit(self._step_func_fused_fit,
+                                           static_argnums=(0,),
+                                           static_argnames=('reset_state',))
 
   def __repr__(self):
     name = self.__class__.__name__
@@ -171,6 +234,7 @@ class BPTrainer(DSTrainer):
   def test_losses(self):
     return self.get_hist_metric(phase='test')
 
+  @share.context()
   def fit(
       self,
       train_data: Union[Callable, Iterable],
@@ -180,6 +244,7 @@ class BPTrainer(DSTrainer):
       reset_state: bool = True,
       shared_args: Optional[Dict] = None,
       fun_after_report: Optional[Callable] = None,
+      num_fused_step: int = 1,
 
       # ------
       # API deprecated
@@ -224,6 +289,14 @@ class BPTrainer(DSTrainer):
       - ``phase``: to indicate the phase of 'fit' or 'test'.
 
       .. versionadded:: 2.3.1
+    num_fused_step: int
+      The number of training steps fused into one compiled call. If ``num_fused_step > 1``,
+      every ``num_fused_step`` batches with the same shape are stacked and trained
+      within one ``bm.for_loop``, including the optimizer updates and the learning rate
+      scheduler progression. This amortizes the host dispatch overhead over many steps,
+      which is beneficial for small models. Default 1.
+
+      .. versionadded:: 2.6.1
     batch_size: int
 
       .. deprecated:: 2.2.4.1
@@ -248,6 +321,7 @@ class BPTrainer(DSTrainer):
                                           'Unknown "fun_after_report", '
                                           'it should be a callable function receiving '
                                           'three arguments: idx, metrics, phase')
+    check.is_integer(num_fused_step, 'num_fused_step', min_bound=1)
 
     if shared_args is None:
       shared_args = dict()
@@ -262,6 +336,9 @@ class BPTrainer(DSTrainer):
     detailed_test_metric = dict()
     report_test_metric = dict()
 
+    if not reset_state:
+      self._partition_states()
+
     fit_i, fit_t = 0, 0
     test_i, test_t = 0, 0
     for epoch_idx in range(num_epoch):
@@ -275,50 +352,60 @@ class BPTrainer(DSTrainer):
       else:
         bar = None
 
-      for x, y in _training_data:
+      for x, y, num_step in _fuse_batches(_training_data, num_fused_step):
+        x0 = tree_map(lambda a: a[0], x, is_leaf=_is_brainpy_array) if num_step > 1 else x
+        batch_size = self._get_input_batch_size(x0)
+
         # reset state
         if reset_state:
-          self.target.reset(self._get_input_batch_size(x))
+          self.target.reset(batch_size)
           self.reset_state()
+          self._partition_states()
+        x, y = self._partition_data((x, y), batch_size, stacked=num_step > 1)
 
         # training
-        res = self.f_train(shared_args, x, y)
-
-        # loss
-        fit_epoch_metric['loss'].append(res[0])
-        if self.loss_has_aux:
-          if not isinstance(res[1], dict):
-            raise TypeError(f'Auxiliary data in loss function should be a dict. But we got {type(res)}')
-          for k, v in res[1].items():
-            if k not in fit_epoch_metric:
-              fit_epoch_metric[k] = []
-            fit_epoch_metric[k].append(v)
-        if bar is not None:
-          bar.update(1)
+        if num_step > 1:
+          res = tree_map(np.asarray, self.f_fused_train(shared_args, x, y, reset_state=reset_state))
+          all_res = [tree_map(lambda a: a[i], res) for i in range(num_step)]
+        else:
+          all_res = [self.f_train(shared_args, x, y)]
 
-        # report
-        fit_i += 1
-        if num_report > 0 and fit_i % num_report == 0:
-          fit_t1 = time.time()
-          aux = {}
-          for k, v in fit_epoch_metric.items():
-            aux[k] = jnp.mean(bm.as_jax(bm.asarray(v)))
-            if k not in report_train_metric:
-              report_train_metric[k] = []
-              detailed_train_metric[k] = []
-            report_train_metric[k].append(aux[k])
-            detailed_train_metric[k].extend(v)
-            v.clear()
-          _report = (f'Train {fit_i} steps, use {fit_t + fit_t1 - fit_t0:.4f} s' +
-                     ', {}'.format(", ".join([f"{k} {v}" for k, v in aux.items()])))
+        for res in all_res:
+          # loss
+          fit_epoch_metric['loss'].append(res[0])
+          if self.loss_has_aux:
+            if not isinstance(res[1], dict):
+              raise TypeError(f'Auxiliary data in loss function should be a dict. But we got {type(res)}')
+            for k, v in res[1].items():
+              if k not in fit_epoch_metric:
+                fit_epoch_metric[k] = []
+              fit_epoch_metric[k].append(v)
           if bar is not None:
-            bar.set_description(_report, refresh=True)
-          else:
-            print(_report)
-          if fun_after_report is not None:
-            fun_after_report(fit_i, aux, 'fit')
-          fit_t0 = time.time()
-          fit_t = 0
+            bar.update(1)
+
+          # report
+          fit_i += 1
+          if num_report > 0 and fit_i % num_report == 0:
+            fit_t1 = time.time()
+            aux = {}
+            for k, v in fit_epoch_metric.items():
+              aux[k] = jnp.mean(bm.as_jax(bm.asarray(v)))
+              if k not in report_train_metric:
+                report_train_metric[k] = []
+                detailed_train_metric[k] = []
+              report_train_metric[k].append(aux[k])
+              detailed_train_metric[k].extend(v)
+              v.clear()
+            _report = (f'Train {fit_i} steps, use {fit_t + fit_t1 - fit_t0:.4f} s' +
+                       ', {}'.format(", ".join([f"{k} {v}" for k, v in aux.items()])))
+            if bar is not None:
+              bar.set_description(_report, refresh=True)
+            else:
+              print(_report)
+            if fun_after_report is not None:
+              fun_after_report(fit_i, aux, 'fit')
+            fit_t0 = time.time()
+            fit_t = 0
 
       if num_report <= 0:
         fit_t1 = time.time()
@@ -354,10 +441,14 @@ class BPTrainer(DSTrainer):
         else:
           bar = None
         for x, y in _testing_data:
+          batch_size = self._get_input_batch_size(x)
+
           # reset state
           if reset_state:
-            self.target.reset(self._get_input_batch_size(x))
+            self.target.reset(batch_size)
             self.reset_state()
+            self._partition_states()
+          x, y = self._partition_data((x, y), batch_size)
 
           # testing
           res = self.f_loss(shared_args, x, y)
@@ -431,6 +522,48 @@ class BPTrainer(DSTrainer):
     self._detailed_test_metrics = {k: np.asarray(v) for k, v in detailed_test_metric.items()}
     self.progress_bar = true_progress_bar
 
+  @property
+  def num_data_parallel(self) -> int:
+    """The number of devices used for the data parallelism."""
+    return 1 if self._data_mesh is None else self._data_mesh.size
+
+  def _sharding(self, ndim, batch_axis=None):
+    axis_names = [None] * ndim
+    if batch_axis is not None:
+      axis_names[batch_axis] = bm.sharding.BATCH_AXIS
+    return NamedSharding(self._data_mesh, PartitionSpec(*axis_names))
+
+  def _partition_states(self):
+    """Partition the batch axis of the model states across the data-parallel devices,
+    and replicate all other variables (including the trainable variables and the
+    optimizer states)."""
+    if self._data_mesh is None:
+      return
+    all_vars = self.target.vars(level=-1, include_self=True).unique()
+    all_vars.update(self.optimizer.vars().unique())
+    for var in all_vars.unique().values():
+      batch_axis = var.batch_axis
+      if batch_axis is not None and var.shape[batch_axis] % self.num_data_parallel != 0:
+        batch_axis = None
+      var.value = jax.device_put(var.value, self._sharding(var.ndim, batch_axis))
+
+  def _partition_data(self, data, batch_size: int, stacked: bool = False):
+    """Partition the batch axis of the input data across the data-parallel devices."""
+    if self._data_mesh is None:
+      return data
+    if batch_size % self.num_data_parallel != 0:
+      raise ValueError(f'The batch size {batch_size} can not be evenly divided by '
+                       f'the number of data-parallel devices {self.num_data_parallel}.')
+    batch_axis = (0 if self.data_first_axis == 'B' else 1) + int(stacked)
+
+    def _partition(x):
+      x = bm.as_jax(x)
+      if x.ndim > batch_axis and x.shape[batch_axis] == batch_size:
+        return jax.device_put(x, self._sharding(x.ndim, batch_axis))
+      return jax.device_put(x, self._sharding(x.ndim))
+
+    return tree_map(_partition, data, is_leaf=_is_brainpy_array)
+
   def _step_func_grad(self, shared_args, inputs, targets):
     tran_vars = self.target.train_vars().unique()
     grad_f = bm.grad(self._step_func_loss,
@@ -439,12 +572,20 @@ class BPTrainer(DSTrainer):
                      has_aux=self.loss_has_aux)
     return grad_f(shared_args, inputs, targets)
 
+  def _next_rng_stream(self):
+    share.save(rng_stream=self._rng_stream.value)
+    self._rng_stream.value += 1
+
   def _step_func_loss(self, shared_args, inputs, targets):
     raise NotImplementedError
 
+  def _step_func_eval(self, shared_args, inputs, targets):
+    self._next_rng_stream()
+    return self._step_func_loss(shared_args, inputs, targets)
+
   @property
   def f_loss(self):
-    return self._jit_step_func_loss if self.jit[c.LOSS_PHASE] else self._step_func_loss
+    return self._jit_step_func_eval if self.jit[c.LOSS_PHASE] else self._step_func_eval
 
   def _step_func_fit(self, shared_args, inputs, targets):
     raise NotImplementedError
@@ -453,6 +594,18 @@ class BPTrainer(DSTrainer):
   def f_train(self):
     return self._jit_step_func_fit if self.jit[c.FIT_PHASE] else self._step_func_fit
 
+  def _step_func_fused_fit(self, shared_args, inputs, targets, reset_state=True):
+    def _step(x, y):
+      if reset_state:
+        self.target.reset(self._get_input_batch_size(x))
+      return self._step_func_fit(shared_args, x, y)
+
+    return bm.for_loop(_step, (inputs, targets))
+
+  @property
+  def f_fused_train(self):
+    return self._jit_step_func_fused_fit if self.jit[c.FIT_PHASE] else self._step_func_fused_fit
+
   @property
   def f_grad(self):
     return self._jit_step_func_grad if self.jit[c.FIT_PHASE] else self._step_func_grad
@@ -514,6 +667,7 @@ class BPTT(BPTrainer):
     return self._loss_func(predicts, targets)
 
   def _step_func_fit(self, shared_args, inputs, targets):
+    self._next_rng_stream()
     res = self.f_grad(shared_args, inputs, targets)
     self.optimizer.update(res[0])
     return res[1:]
@@ -537,6 +691,7 @@ class BPFF(BPTrainer):
     return loss
 
   def _step_func_fit(self, shared_args, inputs, targets):
+    self._next_rng_stream()
     res = self.f_grad(shared_args, inputs, targets)
     self.optimizer.update(res[0])
     return res[1:]
@@ -544,6 +699,7 @@ class BPFF(BPTrainer):
   def _step_func_predict(self, *x, shared_args=None):
     assert self.data_first_axis == 'B', (f'There is no time dimension when '
                                          f'using the trainer {self.__class__.__name__}.')
+    share.save(i=self.i0, t=self.t0)
     if shared_args is not None:
       assert isinstance(shared_args, dict)
       share.save(**shared_args)
@@ -567,6 +723,7 @@ class BPFF(BPTrainer):
     else:
       return self._step_func_predict(*inputs, shared_args=shared_args)
 
+  @share.context()
   def predict(
       self,
       inputs: Union[ArrayType, Sequence[ArrayType], Dict[str, ArrayType]],
@@ -128,6 +128,7 @@ class OfflineTrainer(DSTrainer):
       node.fit_record.clear()
     return outs
 
+  @share.context()
   def fit(
       self,
       train_data: Sequence,
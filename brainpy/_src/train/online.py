@@ -137,6 +137,7 @@ class OnlineTrainer(DSTrainer):
       node.fit_record.clear()
     return outs
 
+  @share.context()
   def fit(
       self,
       train_data: Sequence,
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+import textwrap
+
+import jax
+import numpy as np
+from absl.testing import absltest
+from absl.testing import parameterized
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class RNN(bp.DynamicalSystem):
+  def __init__(self, num_in, num_hidden):
+    super().__init__()
+    self.rnn = bp.dnn.RNNCell(num_in, num_hidden, train_state=True)
+    self.out = bp.dnn.Dense(num_hidden, 1)
+
+  def update(self, x):
+    return self.out(self.rnn(x))
+
+
+def _train_data(num_batch=7, batch_size=4, num_step=10):
+  rng = np.random.RandomState(123)
+  xs = rng.normal(size=(num_batch, batch_size, num_step, 1)).astype(np.float32)
+  ys = np.cumsum(xs, axis=2)
+  return [(xs[i], ys[i]) for i in range(num_batch)]
+
+
+class TestFusedFit(parameterized.TestCase):
+  @parameterized.product(
+    num_fused_step=[2, 3, 7],
+  )
+  def test_bptt_fused_fit(self, num_fused_step):
+    data = _train_data()
+
+    losses = []
+    weights = []
+    lrs = []
+    for n in [1, num_fused_step]:
+      bm.random.seed(1)
+      with bm.training_environment():
+        model = RNN(1, 10)
+      opt = bp.optim.Adam(lr=bp.optim.ExponentialDecayLR(lr=0.01, decay_steps=1, decay_rate=0.99))
+      trainer = bp.BPTT(model, loss_fun=bp.losses.mean_squared_error, optimizer=opt)
+      trainer.fit(data, num_epoch=2, num_fused_step=n)
+      losses.append(trainer.get_hist_metric(which='detailed'))
+      weights.append(np.asarray(model.out.W.value))
+      lrs.append(float(opt.lr()))
+
+    self.assertEqual(losses[0].shape, (2 * len(data),))
+    self.assertTrue(np.allclose(losses[0], losses[1], rtol=1e-4, atol=1e-5))
+    self.assertTrue(np.allclose(weights[0], weights[1], rtol=1e-4, atol=1e-5))
+    self.assertAlmostEqual(lrs[0], lrs[1], places=6)
+    bm.clear_buffer_memory()
+
+  def test_bpff_fused_fit(self):
+    rng = np.random.RandomState(0)
+    data = [(rng.normal(size=(8, 3)).astype(np.float32),
+             rng.normal(size=(8, 2)).astype(np.float32)) for _ in range(6)]
+    losses = []
+    for n in [1, 3]:
+      bm.random.seed(1)
+      with bm.training_environment():
+        model = bp.dnn.Dense(3, 2)
+      trainer = bp.BPFF(model, loss_fun=bp.losses.mean_squared_error, optimizer=bp.optim.SGD(0.1))
+      trainer.fit(data, num_epoch=1, num_fused_step=n)
+      losses.append(trainer.get_hist_metric(which='detailed'))
+    self.assertTrue(np.allclose(losses[0], losses[1], rtol=1e-5, atol=1e-6))
+    bm.clear_buffer_memory()
+
+
+_DATA_PARALLEL_SCRIPT = """
+import os
+os.environ['XLA_FLAGS'] = '--xla_force_host_platform_device_count=4'
+import jax
+import numpy as np
+import brainpy as bp
+import brainpy.math as bm
+
+assert jax.local_device_count() == 4
+
+
+class RNN(bp.DynamicalSystem):
+  def __init__(self):
+    super().__init__()
+    self.rnn = bp.dyn.RNNCell(1, 10, train_state=True)
+    self.out = bp.dnn.Dense(10, 1)
+
+  def update(self, x):
+    return self.out(self.rnn(x))
+
+
+rng = np.random.RandomState(123)
+xs = rng.normal(size=(4, 8, 10, 1)).astype(np.float32)
+data = [(xs[i], np.cumsum(xs[i], axis=1)) for i in range(4)]
+
+for num_fused_step in [1, 2]:
+  results = []
+  for data_parallel in [False, True]:
+    bm.random.seed(1)
+    bm.clear_name_cache(ignore_warn=True)
+    with bm.training_environment():
+      model = RNN()
+    trainer = bp.BPTT(model,
+                      loss_fun=bp.losses.mean_squared_error,
+                      optimizer=bp.optim.Adam(lr=0.01),
+                      data_parallel=data_parallel,
+                      progress_bar=False)
+    assert trainer.num_data_parallel == (4 if data_parallel else 1)
+
+    # the gradients of the first batch
+    with bp.share.context():
+      model.reset(8)
+      trainer.reset_state()
+      trainer._partition_states()
+      x, y = trainer._partition_data(data[0], 8)
+      grads, loss = trainer.f_grad(bp.tools.DotDict(fit=True), x, y)
+    if data_parallel:
+      assert len(x.sharding.device_set) == 4
+    grads = {k: np.asarray(v) for k, v in grads.items()}
+
+    trainer.fit(data, num_epoch=2, num_fused_step=num_fused_step)
+    losses = trainer.get_hist_metric(which='detailed')
+    weights = {k: np.asarray(v.value) for k, v in model.train_vars().unique().items()}
+    results.append((float(loss), grads, losses, weights))
+    bm.clear_buffer_memory()
+
+  (loss1, grads1, losses1, weights1), (loss2, grads2, losses2, weights2) = results
+  assert np.allclose(loss1, loss2, rtol=1e-5, atol=1e-6)
+  assert grads1.keys() == grads2.keys()
+  for k in grads1:
+    assert np.allclose(grads1[k], grads2[k], rtol=1e-4, atol=1e-5), k
+  assert np.allclose(losses1, losses2, rtol=1e-4, atol=1e-5)
+  for k in weights1:
+    assert np.allclose(weights1[k], weights2[k], rtol=1e-4, atol=1e-5), k
+print('OK')
+"""
+
+
+class TestDataParallel(parameterized.TestCase):
+  @parameterized.product(
+    num_fused_step=[1, 2],
+  )
+  def test_bptt_data_parallel(self, num_fused_step):
+    data = _train_data(num_batch=4, batch_size=jax.local_device_count() * 2)
+
+    losses = []
+    for data_parallel in [False, True]:
+      bm.random.seed(1)
+      with bm.training_environment():
+        model = RNN(1, 10)
+      trainer = bp.BPTT(model,
+                        loss_fun=bp.losses.mean_squared_error,
+                        optimizer=bp.optim.Adam(lr=0.01),
+                        data_parallel=data_parallel)
+      trainer.fit(data, num_epoch=2, num_fused_step=num_fused_step)
+      losses.append(trainer.get_hist_metric(which='detailed'))
+    self.assertEqual(trainer.num_data_parallel, jax.local_device_count())
+    self.assertTrue(np.allclose(losses[0], losses[1], rtol=1e-4, atol=1e-5))
+    bm.clear_buffer_memory()
+
+  def test_multiple_devices(self):
+    out = subprocess.run([sys.executable, '-c', textwrap.dedent(_DATA_PARALLEL_SCRIPT)],
+                         capture_output=True, text=True)
+    self.assertEqual(out.returncode, 0, out.stderr[-2000:])
+    self.assertEqual(out.stdout.strip().splitlines()[-1], 'OK')
+
+  def test_wrong_data_parallel(self):
+    with bm.training_environment():
+      model = RNN(1, 10)
+    with self.assertRaises(TypeError):
+      bp.BPTT(model, loss_fun=bp.losses.mean_squared_error, data_parallel=['cpu'])
+
+
+class DropoutNet(bp.DynamicalSystem):
+  def __init__(self):
+    super().__init__()
+    self.drop = bp.dnn.Dropout(0.5, name='counter_dropout')
+    self.w = bm.TrainVar(bm.ones(1))
+
+  def update(self, x):
+    return self.drop(x) * self.w
+
+
+def _dropout_loss(predicts, targets):
+  # encode the dropout mask of the first 16 features as an integer
+  mask = bm.as_jax(predicts).reshape(-1)[:16] != 0.
+  code = jax.numpy.sum(mask * 2 ** jax.numpy.arange(16))
+  return bp.losses.mean_squared_error(predicts, targets), {'code': code}
+
+
+class TestCounterBasedRandom(parameterized.TestCase):
+  def setUp(self):
+    bm.random.set_counter_based(True, seed=1)
+
+  def tearDown(self):
+    bm.random.set_counter_based(False)
+    bm.clear_buffer_memory()
+
+  def _fit(self, trainer_cls, shape):
+    rng = np.random.RandomState(0)
+    data = [(np.ones(shape, dtype=np.float32), rng.normal(size=shape).astype(np.float32))
+            for _ in range(4)]
+    bm.clear_name_cache(ignore_warn=True)
+    with bm.training_environment():
+      model = DropoutNet()
+    trainer = trainer_cls(model, loss_fun=_dropout_loss, loss_has_aux=True, optimizer=bp.optim.SGD(0.01))
+    trainer.fit(data, num_epoch=2)
+    return trainer.get_hist_metric(metric='code', which='detailed')
+
+  @parameterized.named_parameters(
+    ('bptt', bp.BPTT, (2, 5, 16)),
+    ('bpff', bp.BPFF, (2, 16)),
+  )
+  def test_dropout_masks_differ_across_batches(self, trainer_cls, shape):
+    codes = self._fit(trainer_cls, shape)
+    self.assertEqual(codes.shape, (8,))
+    # the masks of all batches in all epochs are different
+    self.assertEqual(len(set(codes.tolist())), 8)
+    # and they are reproducible
+    np.testing.assert_array_equal(codes, self._fit(trainer_cls, shape))
+
+
+if __name__ == '__main__':
+  absltest.main()
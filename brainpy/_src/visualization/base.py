@@ -27,10 +27,12 @@ class visualize(object):
                 legend=None,
                 title=None,
                 show=False,
+                max_points=None,
                 **kwargs):
     from .plots import line_plot
     line_plot(ts, val_matrix, plot_ids=plot_ids, ax=ax, xlim=xlim, ylim=ylim,
-              xlabel=xlabel, ylabel=ylabel, legend=legend, title=title, show=show, **kwargs)
+              xlabel=xlabel, ylabel=ylabel, legend=legend, title=title, show=show,
+              max_points=max_points, **kwargs)
 
   @staticmethod
   def raster_plot(ts,
@@ -45,10 +47,27 @@ class visualize(object):
                   ylim=None,
                   title=None,
                   show=False,
+                  mode='marker',
+                  num_time_bin=1000,
+                  num_neuron_bin=None,
+                  chunk_size=10000,
+                  cmap='Greys',
                   **kwargs):
     from .plots import raster_plot
     raster_plot(ts, sp_matrix, ax=ax, marker=marker, markersize=markersize, color=color,
-                xlabel=xlabel, ylabel=ylabel, xlim=xlim, ylim=ylim, title=title, show=show, **kwargs)
+                xlabel=xlabel, ylabel=ylabel, xlim=xlim, ylim=ylim, title=title, show=show,
+                mode=mode, num_time_bin=num_time_bin, num_neuron_bin=num_neuron_bin,
+                chunk_size=chunk_size, cmap=cmap, **kwargs)
+
+  @staticmethod
+  def minmax_decimate(ts, values, max_points):
+    from .plots import minmax_decimate
+    return minmax_decimate(ts, values, max_points)
+
+  @staticmethod
+  def spike_density(t_range, num_neuron, num_time_bin=1000, num_neuron_bin=None):
+    from .plots import SpikeDensity
+    return SpikeDensity(t_range, num_neuron, num_time_bin=num_time_bin, num_neuron_bin=num_neuron_bin)
 
   @staticmethod
   def animate_1D(dynamical_vars,
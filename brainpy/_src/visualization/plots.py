@@ -15,6 +15,8 @@ logger = logging.getLogger('brainpy.visualization')
 __all__ = [
   'line_plot',
   'raster_plot',
+  'minmax_decimate',
+  'SpikeDensity',
   'animate_2D',
   'animate_1D',
   'remove_axis',
@@ -32,6 +34,7 @@ def line_plot(ts,
               legend=None,
               title=None,
               show=False,
+              max_points=None,
               **kwargs):
   """Show the specified value in the given object (Neurons or Synapses.)
 
@@ -60,6 +63,13 @@ def line_plot(ts,
       The prefix of legend for plot.
   show : bool
       Whether show the figure.
+  max_points : int, optional
+      The maximal number of points of each line. If the recording is longer,
+      it is decimated by :py:func:`minmax_decimate`, which keeps the minimum
+      and the maximum of each time bin, so that the envelope of the line
+      (spikes, bursts) is preserved on the screen.
+
+      .. versionadded:: 2.6.1
   """
   # get plot_ids
   if plot_ids is None:
@@ -77,17 +87,25 @@ def line_plot(ts,
 
   val_matrix = val_matrix.reshape((val_matrix.shape[0], -1))
   # change data
-  val_matrix = np.asarray(val_matrix)
+  if max_points is None:
+    val_matrix = np.asarray(val_matrix)
+    columns = plot_ids
+  else:
+    # only the plotted columns are transferred
+    val_matrix = np.asarray(val_matrix[:, np.asarray(plot_ids)])
+    columns = range(len(plot_ids))
   ts = np.asarray(ts)
 
   # plot
-  if legend:
-    for idx in plot_ids:
+  for idx, col in zip(plot_ids, columns):
+    times, values = ts, val_matrix[:, col]
+    if max_points is not None:
+      times, values = minmax_decimate(times, values, max_points)
+    if legend:
       label = legend if len(plot_ids) == 1 else f'{legend}-{idx}'
-      ax.plot(ts, val_matrix[:, idx], label=label, **kwargs)
-  else:
-    for idx in plot_ids:
-      ax.plot(ts, val_matrix[:, idx], **kwargs)
+      ax.plot(times, values, label=label, **kwargs)
+    else:
+      ax.plot(times, values, **kwargs)
 
   # legend
   if legend:
@@ -130,6 +148,11 @@ def raster_plot(ts,
                 ylim=None,
                 title=None,
                 show=False,
+                mode='marker',
+                num_time_bin=1000,
+                num_neuron_bin=None,
+                chunk_size=10000,
+                cmap='Greys',
                 **kwargs):
   """Show the rater plot of the spikes.
 
@@ -157,22 +180,52 @@ def raster_plot(ts,
       The ylabel.
   show : bool
       Show the figure.
+  mode : str
+      The plotting mode. It can be:
+
+      - ``'marker'``: plot each spike as a marker.
+      - ``'density'``: bin the spikes into a ``(num_neuron_bin, num_time_bin)``
+        image with :py:class:`SpikeDensity`, and show the spike counts. The spike
+        matrix is converted ``chunk_size`` time steps at a time, so that the long
+        recordings can be plotted with a bounded memory and time.
+
+      .. versionadded:: 2.6.1
+  num_time_bin : int
+      The number of time bins in the ``'density'`` mode.
+  num_neuron_bin : int, optional
+      The number of neuron bins in the ``'density'`` mode. Default is
+      ``min(num_neuron, 1000)``.
+  chunk_size : int
+      The number of time steps to bin at once in the ``'density'`` mode.
+  cmap : str
+      The colormap in the ``'density'`` mode.
   """
 
-  sp_matrix = np.asarray(sp_matrix)
   if ts is None:
     raise errors.BrainPyError('Must provide "ts".')
   ts = np.asarray(ts)
-
-  # get index and time
-  elements = np.where(sp_matrix > 0.)
-  index = elements[1]
-  time = ts[elements[0]]
-
-  # plot rater
   if ax is None:
     ax = plt
-  ax.plot(time, index, marker + color, markersize=markersize, **kwargs)
+
+  if mode == 'density':
+    density = SpikeDensity((ts[0], ts[-1]), sp_matrix.shape[1],
+                           num_time_bin=num_time_bin,
+                           num_neuron_bin=num_neuron_bin)
+    for i in range(0, ts.shape[0], chunk_size):
+      density.update(ts[i: i + chunk_size], sp_matrix[i: i + chunk_size])
+    density.plot(ax=ax, cmap=cmap, **kwargs)
+  elif mode == 'marker':
+    sp_matrix = np.asarray(sp_matrix)
+
+    # get index and time
+    elements = np.where(sp_matrix > 0.)
+    index = elements[1]
+    time = ts[elements[0]]
+
+    # plot rater
+    ax.plot(time, index, marker + color, markersize=markersize, **kwargs)
+  else:
+    raise errors.BrainPyError(f'Unknown raster plot mode "{mode}", only supports "marker" and "density".')
 
   # xlable
   if xlabel:
@@ -195,6 +248,123 @@ def raster_plot(ts,
     plt.show()
 
 
+def minmax_decimate(ts, values, max_points):
+  """Decimate a long line by keeping the minimum and the maximum of each bin.
+
+  The samples are divided into ``max_points // 2`` bins. In each bin, the
+  minimum and the maximum are kept in their original order, so that the
+  decimated line has the same envelope as the original one.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  ts : np.ndarray
+      The time steps with the shape of ``(num_step,)``.
+  values : np.ndarray
+      The values with the shape of ``(num_step,)``.
+  max_points : int
+      The maximal number of the returned points.
+
+  Returns
+  -------
+  res : tuple
+      The decimated ``(ts, values)``.
+  """
+  ts = np.asarray(ts)
+  values = np.asarray(values)
+  num = values.shape[0]
+  num_bin = max_points // 2
+  if num_bin < 1:
+    raise ValueError(f'"max_points" must be >= 2, but we got {max_points}.')
+  if num <= max_points:
+    return ts, values
+  bin_size = int(np.ceil(num / num_bin))
+  num_bin = int(np.ceil(num / bin_size))
+  # pad the last bin with its last value
+  padded = np.concatenate([values, np.full(num_bin * bin_size - num, values[-1], dtype=values.dtype)])
+  padded = padded.reshape(num_bin, bin_size)
+  starts = np.arange(num_bin) * bin_size
+  i_min = np.minimum(starts + np.argmin(padded, axis=1), num - 1)
+  i_max = np.minimum(starts + np.argmax(padded, axis=1), num - 1)
+  ids = np.stack([np.minimum(i_min, i_max), np.maximum(i_min, i_max)], axis=1).flatten()
+  return ts[ids], values[ids]
+
+
+class SpikeDensity(object):
+  """The spike counts binned into a ``(num_neuron_bin, num_time_bin)`` pixel grid.
+
+  The spikes can be accumulated chunk by chunk with :py:meth:`update`, for example,
+  after each ``runner.run()`` of a long simulation, so that the full spike matrix
+  never needs to be kept in the memory.
+
+  .. versionadded:: 2.6.1
+
+  Parameters
+  ----------
+  t_range : tuple
+      The ``(start, end)`` time of the recording.
+  num_neuron : int
+      The number of neurons.
+  num_time_bin : int
+      The number of time bins.
+  num_neuron_bin : int, optional
+      The number of neuron bins. Default is ``min(num_neuron, 1000)``.
+  """
+
+  def __init__(self, t_range, num_neuron, num_time_bin=1000, num_neuron_bin=None):
+    self.t_start, self.t_end = float(t_range[0]), float(t_range[1])
+    if self.t_end <= self.t_start:
+      raise ValueError(f'"t_range" must be (start, end) with start < end, but we got {t_range}.')
+    self.num_neuron = int(num_neuron)
+    self.num_time_bin = int(num_time_bin)
+    self.num_neuron_bin = min(self.num_neuron, 1000) if num_neuron_bin is None else int(num_neuron_bin)
+    self.counts = np.zeros((self.num_neuron_bin, self.num_time_bin), dtype=np.int64)
+
+  def update(self, ts, sp_matrix):
+    """Accumulate a chunk of spikes.
+
+    Parameters
+    ----------
+    ts : np.ndarray
+        The time steps of the chunk with the shape of ``(num_step,)``.
+    sp_matrix : np.ndarray
+        The spikes of the chunk with the shape of ``(num_step, num_neuron)``.
+    """
+    ts = np.asarray(ts)
+    sp_matrix = np.asarray(sp_matrix).reshape((ts.shape[0], -1))
+    if sp_matrix.shape[1] != self.num_neuron:
+      raise ValueError(f'The spike matrix should have {self.num_neuron} neurons, '
+                       f'but we got {sp_matrix.shape[1]}.')
+    time_ids, neuron_ids = np.nonzero(sp_matrix > 0.)
+    t_bins = ((ts[time_ids] - self.t_start) / (self.t_end - self.t_start) * self.num_time_bin).astype(np.int64)
+    t_bins = np.clip(t_bins, 0, self.num_time_bin - 1)
+    n_bins = neuron_ids * self.num_neuron_bin // self.num_neuron
+    self.counts += np.bincount(n_bins * self.num_time_bin + t_bins,
+                               minlength=self.counts.size).reshape(self.counts.shape)
+    return self
+
+  def plot(self, ax=None, cmap='Greys', **kwargs):
+    """Show the spike counts as an image.
+
+    Parameters
+    ----------
+    ax : Axes
+        The figure.
+    cmap : str
+        The colormap.
+    """
+    if ax is None:
+      ax = plt
+    kwargs.setdefault('aspect', 'auto')
+    kwargs.setdefault('interpolation', 'nearest')
+    return ax.imshow(self.counts,
+                     origin='lower',
+                     extent=(self.t_start, self.t_end, 0, self.num_neuron),
+                     cmap=cmap,
+                     **kwargs)
+
+
 def animate_2D(values,
                net_size,
                dt=None,
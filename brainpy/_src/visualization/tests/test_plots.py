@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+from brainpy._src.visualization import plots
+
+show = False
+
+
+class TestMinMaxDecimate(unittest.TestCase):
+  def test_envelope(self):
+    rng = np.random.RandomState(0)
+    ts = np.arange(100000) * 0.1
+    values = rng.normal(size=ts.size)
+    values[12345] = 100.
+    values[54321] = -100.
+    ts2, values2 = plots.minmax_decimate(ts, values, 1000)
+    self.assertLessEqual(values2.size, 1000)
+    self.assertEqual(values2.max(), 100.)
+    self.assertEqual(values2.min(), -100.)
+    self.assertTrue(np.all(np.diff(ts2) >= 0.))
+    self.assertTrue(np.all(values[np.round(ts2 / 0.1).astype(int)] == values2))
+
+  def test_short(self):
+    ts = np.arange(10)
+    ts2, values2 = plots.minmax_decimate(ts, ts * 2., 100)
+    np.testing.assert_array_equal(ts2, ts)
+
+  def test_line_plot(self):
+    ts = np.arange(10000) * 0.1
+    values = bm.random.rand(10000, 3)
+    bp.visualize.line_plot(ts, values, plot_ids=[0, 2], max_points=500, legend='V', show=show)
+    plt.close()
+
+
+class TestSpikeDensity(unittest.TestCase):
+  def test_update_by_chunks(self):
+    rng = np.random.RandomState(0)
+    ts = np.arange(1000) * 0.1
+    spikes = rng.random_sample((1000, 200)) < 0.05
+
+    density = plots.SpikeDensity((ts[0], ts[-1]), 200, num_time_bin=50, num_neuron_bin=20)
+    for i in range(0, 1000, 128):
+      density.update(ts[i: i + 128], spikes[i: i + 128])
+    self.assertEqual(density.counts.sum(), spikes.sum())
+    # each neuron bin contains 10 neurons
+    np.testing.assert_array_equal(density.counts.sum(axis=1),
+                                  spikes.sum(axis=0).reshape(20, 10).sum(axis=1))
+
+  def test_raster_plot(self):
+    ts = np.arange(1000) * 0.1
+    spikes = bm.random.rand(1000, 100) < 0.05
+    bp.visualize.raster_plot(ts, spikes, mode='density', num_time_bin=100, chunk_size=300, show=show)
+    plt.close()
+    with self.assertRaises(bp.errors.BrainPyError):
+      bp.visualize.raster_plot(ts, spikes, mode='unknown')
@@ -10,6 +10,7 @@ from brainpy._src.connect.base import (
   csr2csc as csr2csc,
   csr2mat as csr2mat,
   csr2coo as csr2coo,
+  csr2ell as csr2ell,
   coo2csr as coo2csr,
   coo2csc as coo2csc,
   coo2mat as coo2mat,
@@ -23,7 +24,7 @@ from brainpy._src.connect.base import (
   PRE2POST, POST2PRE,
   PRE2SYN, POST2SYN,
   PRE_SLICE, POST_SLICE,
-  COO, CSR, CSC
+  COO, CSR, CSC, ELL
 )
 
 from brainpy._src.connect.custom_conn import (
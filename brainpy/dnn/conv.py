@@ -6,6 +6,9 @@ from brainpy._src.dnn.conv import (
   Conv1D as Conv1D,
   Conv2D as Conv2D,
   Conv3D as Conv3D,
+  EventConv1d as EventConv1d,
+  EventConv2d as EventConv2d,
+  EventConv3d as EventConv3d,
   ConvTranspose1d as ConvTranspose1d,
   ConvTranspose2d as ConvTranspose2d,
   ConvTranspose3d as ConvTranspose3d,
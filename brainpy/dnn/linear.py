@@ -8,6 +8,9 @@ from brainpy._src.dnn.linear import (
   MaskedLinear as MaskedLinear,
   CSRLinear as CSRLinear,
   EventCSRLinear as EventCSRLinear,
+  ELLLinear as ELLLinear,
+  EventELLLinear as EventELLLinear,
+  GridLinear as GridLinear,
   JitFPHomoLinear as JitFPHomoLinear,
   JitFPUniformLinear as JitFPUniformLinear,
   JitFPNormalLinear as JitFPNormalLinear,
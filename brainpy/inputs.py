@@ -11,3 +11,14 @@ from brainpy._src.inputs.currents import (
   sinusoidal_input as sinusoidal_input,
   square_input as square_input,
 )
+
+from brainpy._src.inputs.generators import (
+  InputGenerator as InputGenerator,
+  SectionInput as SectionInput,
+  SpikeInput as SpikeInput,
+  RampInput as RampInput,
+  WienerProcess as WienerProcess,
+  OUProcess as OUProcess,
+  SinusoidalInput as SinusoidalInput,
+  SquareInput as SquareInput,
+)
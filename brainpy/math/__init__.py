@@ -33,11 +33,9 @@ from . import fft
 from . import linalg
 from . import random
 
-# taichi operations
-from . import tifunc
-
 # others
 from . import sharding
+from . import telemetry
 
 import jax.numpy as jnp
 from jax import config
@@ -46,10 +44,6 @@ del jnp, config
 
 from brainpy._src.math import defaults
 from brainpy._src.deprecations import deprecation_getattr
-from brainpy._src.dependency_check import import_taichi, import_numba
-
-import_taichi(error_if_not_found=False)
-import_numba(error_if_not_found=False)
 
 __deprecations = {
   "sparse_matmul": ("brainpy.math.sparse_matmul is deprecated. Use brainpy.math.sparse.seg_matmul instead.",
@@ -91,5 +85,15 @@ __deprecations = {
                        event.csrmv),
 }
 
-__getattr__ = deprecation_getattr(__name__, __deprecations, redirects=defaults.__all__, redirect_module=defaults)
+__deprecation_getattr = deprecation_getattr(__name__, __deprecations, redirects=defaults.__all__,
+                                           redirect_module=defaults)
 del deprecation_getattr, defaults
+
+
+def __getattr__(name):
+  # taichi operations, which are imported at the first access
+  # so that ``import brainpy`` does not need to import taichi
+  if name == 'tifunc':
+    import importlib
+    return importlib.import_module(f'{__name__}.tifunc')
+  return __deprecation_getattr(name)
@@ -1,3 +1,4 @@
 from brainpy._src.math.event import (
   csrmv as csrmv,
+  ellmv as ellmv,
 )
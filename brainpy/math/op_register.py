@@ -4,6 +4,8 @@ from brainpy._src.math.op_register import (
   compile_cpu_signature_with_numba,
   clear_taichi_aot_caches,
   count_taichi_aot_kernels,
+  get_taichi_aot_cache_stats,
+  set_taichi_aot_cache_budget,
 )
 
 from brainpy._src.math.op_register.base import XLACustomOp
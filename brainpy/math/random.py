@@ -9,6 +9,9 @@ from brainpy._src.math.random import (
   split_key as split_key,
   split_keys as split_keys,
   default_rng as default_rng,
+  set_counter_based as set_counter_based,
+  is_counter_based as is_counter_based,
+  module_key as module_key,
 
   # numpy compatibility
   rand as rand,
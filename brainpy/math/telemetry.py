@@ -0,0 +1,12 @@
+
+from brainpy._src.math.telemetry import (
+  enable,
+  disable,
+  is_enabled,
+  reset,
+  scope,
+  add_event,
+  get_records,
+  summary,
+  dump,
+)
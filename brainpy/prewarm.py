@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+
+"""Compile the Taichi AOT kernels required by a model ahead of time.
+
+Usage::
+
+  python -m brainpy.prewarm model.py [--function FUNC] [--budget BYTES] [-- script args]
+"""
+
+from brainpy._src.math.op_register.prewarm import (
+  prewarm as prewarm,
+  main as main,
+)
+
+if __name__ == '__main__':
+  main()
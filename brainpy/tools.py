@@ -28,7 +28,6 @@ from brainpy._src.tools.math_util import (
 from brainpy._src.tools.package import (
   numba_jit as numba_jit,
   numba_seed as numba_seed,
-  numba_range as numba_range,
 )
 
 from brainpy._src.tools.others import (
@@ -49,4 +48,10 @@ from brainpy._src.tools.functions import (
 )
 
 
-
+def __getattr__(name):
+  # "numba_range" is ``numba.prange``, which is resolved at the first
+  # access so that ``import brainpy`` does not need to import numba
+  if name == 'numba_range':
+    from brainpy._src.tools import package
+    return package.numba_range
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
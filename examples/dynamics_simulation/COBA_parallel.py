@@ -2,7 +2,6 @@ import jax
 
 import brainpy as bp
 import brainpy.math as bm
-from jax.experimental.maps import xmap
 
 
 # bm.set_host_device_count(4)
@@ -67,52 +66,12 @@ class EINet2(bp.DynSysGroup):
     return self.N.spike.value
 
 
-class PCSR(bp.dnn.Layer):
-  def __init__(self, conn, weight, num_shard, transpose=True):
-    super().__init__()
-
-    self.conn = conn
-    self.transpose = transpose
-    self.num_shard = num_shard
-
-    # connection
-    self.indices = []
-    self.inptr = []
-    for _ in range(num_shard):
-      indices, inptr = self.conn.require('csr')
-      self.indices.append(indices)
-      self.inptr.append(inptr)
-    self.indices = bm.asarray(self.indices)
-    self.inptr = bm.asarray(self.inptr)
-
-    # weight
-    weight = bp.init.parameter(weight, (self.indices.size,))
-    if isinstance(self.mode, bm.TrainingMode):
-      weight = bm.TrainVar(weight)
-    self.weight = weight
-
-  def update(self, v):
-    # ax1 = None if bm.size(self.weight) > 1 else (None, bm.sharding.NEU_AXIS)
-    mapped = xmap(
-      self._f,
-      in_axes=((bm.sharding.NEU_AXIS, None), (bm.sharding.NEU_AXIS, None), (None, )),
-      out_axes=(bm.sharding.NEU_AXIS, None),
-      # axis_resources={bm.sharding.NEU_AXIS: bm.sharding.NEU_AXIS},
-    )
-    r = mapped(self.indices, self.inptr, v)
-    return r.flatten()
-
-  def _f(self, indices, indptr, x):
-    return bm.event.csrmv(self.weight, indices, indptr, x,
-                          shape=(self.conn.pre_num, self.conn.post_num // self.num_shard),
-                          transpose=self.transpose)
-
-
-class ExpMasked2(bp.Projection):
+class ExpCSR(bp.Projection):
   def __init__(self, pre_num, post, prob, g_max, tau=5., E=0.):
     super().__init__()
     self.proj = bp.dyn.HalfProjAlignPostMg(
-      comm=PCSR(bp.conn.FixedProb(prob, pre=pre_num, post=post.num), weight=g_max, num_shard=4),
+      comm=bp.dnn.EventCSRLinear(bp.conn.FixedProb(prob, pre=pre_num, post=post.num), weight=g_max,
+                                 sharding=[None, bm.sharding.NEU_AXIS]),
       syn=bp.dyn.Expon.desc(size=post.num, tau=tau, sharding=[bm.sharding.NEU_AXIS]),
       out=bp.dyn.COBA.desc(E=E),
       post=post
@@ -126,8 +85,8 @@ class EINet3(bp.DynSysGroup):
                               V_initializer=bp.init.Normal(-55., 2.),
                               sharding=[bm.sharding.NEU_AXIS])
     self.delay = bp.VarDelay(self.N.spike, entries={'I': None})
-    self.E = ExpMasked2(3200, self.N, 0.02, 0.6)
-    self.I = ExpMasked2(800, self.N, 0.02, 6.7, E=-80., tau=10.)
+    self.E = ExpCSR(3200, self.N, 0.02, 0.6)
+    self.I = ExpCSR(800, self.N, 0.02, 6.7, E=-80., tau=10.)
 
   def update(self, input):
     spk = self.delay.at('I')
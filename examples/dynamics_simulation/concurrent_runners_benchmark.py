@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the throughput of running several independent models concurrently
+with a thread pool.
+
+Each ``DSRunner`` traces its model inside its own ``brainpy.share`` scope,
+so the runners do not see the shared arguments (``t``, ``i``, ``dt``) of
+each other. The compiled XLA computation releases the GIL, so that the
+runners overlap on a multi-core machine.
+
+Usage::
+
+  python concurrent_runners_benchmark.py                  # scan 1, 2, 4, 8 runners
+  python concurrent_runners_benchmark.py --runners 4      # one setting
+
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class Net(bp.DynSysGroup):
+  def __init__(self, num=1000, seed=0):
+    super().__init__()
+    rng = np.random.RandomState(seed)
+    self.lif = bp.dyn.LifRef(num, V_rest=-60., V_th=-50., V_reset=-60., tau=20., tau_ref=5.,
+                             V_initializer=bp.init.Normal(-55., 2.))
+    self.w = bm.asarray(rng.normal(0., 2. / np.sqrt(num), (num, num)), dtype=bm.float_)
+
+  def update(self, inp):
+    spk = self.lif.spike.value
+    self.lif(inp + bm.as_jax(spk, dtype=bm.float_) @ self.w)
+    return self.lif.spike.value
+
+
+def run(num_runner, num_neuron=1000, duration=1000., dt=0.1):
+  runners = [bp.DSRunner(Net(num_neuron, seed=i), dt=dt, progress_bar=False)
+             for i in range(num_runner)]
+  inputs = bm.ones(int(duration / dt)) * 12.
+
+  # compilation, the models are traced concurrently
+  with ThreadPoolExecutor(num_runner) as pool:
+    list(pool.map(lambda r: r.run(inputs=inputs), runners))
+
+  # serial
+  t0 = time.time()
+  for runner in runners:
+    bm.as_numpy(runner.run(inputs=inputs))
+  t_serial = time.time() - t0
+
+  # concurrent
+  with ThreadPoolExecutor(num_runner) as pool:
+    t0 = time.time()
+    list(pool.map(lambda r: bm.as_numpy(r.run(inputs=inputs)), runners))
+    t_concurrent = time.time() - t0
+
+  num_step = num_runner * int(duration / dt)
+  return dict(num_runner=num_runner,
+              serial_steps_per_second=num_step / t_serial,
+              concurrent_steps_per_second=num_step / t_concurrent,
+              speedup=t_serial / t_concurrent)
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--runners', type=int, default=None)
+  parser.add_argument('--neurons', type=int, default=1000)
+  args = parser.parse_args()
+
+  bm.set_platform('cpu')
+  for n in ([args.runners] if args.runners else [1, 2, 4, 8]):
+    print(json.dumps(run(n, num_neuron=args.neurons)))
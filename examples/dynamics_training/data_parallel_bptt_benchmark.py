@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the data-parallel training of ``brainpy.BPTT`` on host CPU devices.
+
+Usage::
+
+  python data_parallel_bptt_benchmark.py           # scan 1, 2, 4, 8 devices
+  python data_parallel_bptt_benchmark.py --devices 4  # one setting
+
+Each device count runs in a new process, because the number of host
+devices must be set before JAX is initialized.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+def run(num_device, num_batch=256, num_hidden=512, num_step=50, num_train=20):
+  import brainpy as bp
+  import brainpy.math as bm
+  bm.set_host_device_count(num_device)
+  bm.set_platform('cpu')
+
+  class RNN(bp.DynamicalSystem):
+    def __init__(self, num_in, num_hidden):
+      super().__init__()
+      self.rnn = bp.dnn.GRUCell(num_in, num_hidden)
+      self.out = bp.dnn.Dense(num_hidden, 1)
+
+    def update(self, x):
+      return self.out(self.rnn(x))
+
+  inputs = bm.random.normal(size=(num_batch, num_step, 10))
+  targets = bm.cumsum(inputs.sum(-1, keepdims=True), axis=1)
+  data = [(inputs, targets)] * num_train
+
+  with bm.training_environment():
+    model = RNN(10, num_hidden)
+  trainer = bp.BPTT(model,
+                    loss_fun=bp.losses.mean_squared_error,
+                    optimizer=bp.optim.Adam(lr=1e-3),
+                    data_parallel=num_device > 1,
+                    progress_bar=False)
+  trainer.fit(data[:1], num_epoch=1)  # compilation
+  t0 = time.time()
+  trainer.fit(data, num_epoch=1)
+  t1 = time.time()
+  return dict(num_device=trainer.num_data_parallel,
+              time_per_step=(t1 - t0) / num_train)
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--devices', type=int, default=None)
+  args = parser.parse_args()
+
+  if args.devices is not None:
+    print(json.dumps(run(args.devices)))
+  else:
+    results = []
+    for n in [1, 2, 4, 8]:
+      out = subprocess.run([sys.executable, __file__, '--devices', str(n)],
+                           capture_output=True, text=True, check=True)
+      results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    base = results[0]['time_per_step']
+    for res in results:
+      print(f"{res['num_device']} device(s): {res['time_per_step'] * 1e3:.2f} ms/step, "
+            f"speedup {base / res['time_per_step']:.2f}x")
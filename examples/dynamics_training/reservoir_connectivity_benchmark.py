@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the recurrent computation of ``brainpy.dyn.Reservoir`` with
+different connectivity types.
+
+- ``dense``: the dense recurrent matrix.
+- ``seg_matmul``: the nonzero weights computed with ``brainpy.math.sparse.seg_matmul``.
+- ``sparse``: the CSR weights computed with ``brainpy.math.sparse.csrmv``.
+- ``jit``: the just-in-time connectivity, which never stores the weights.
+
+The just-in-time connectivity is a memory saving, not a speed-up: it regenerates
+the random weights at every step, so on CPU it is several times slower than
+``sparse`` and only comparable to ``dense`` for networks of about ten thousand
+units (e.g., 0.12, 1.9 and 0.72 ms/step for ``sparse``, ``jit`` and ``dense``
+with 2000 units, and 2.2, 29 and 35 ms/step with 10000 units). Use it when the
+recurrent weights do not fit into the memory. The last column reports the memory
+of the stored recurrent weights of the ``sparse`` model.
+
+Usage::
+
+  python reservoir_connectivity_benchmark.py
+  python reservoir_connectivity_benchmark.py --sizes 5000 50000 --batch 8
+"""
+
+import argparse
+import time
+
+import jax
+import numpy as np
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+def run_reservoir(model, x, num_step):
+  def step(i):
+    return model(x)
+
+  @bm.jit
+  def run():
+    return bm.for_loop(step, np.arange(num_step), progress_bar=False)
+
+  jax.block_until_ready(run())  # compilation
+  t0 = time.time()
+  jax.block_until_ready(run())
+  return (time.time() - t0) / num_step
+
+
+def run_seg_matmul(model, x, num_step):
+  # the same nonzero weights as the "sparse" model, in the COO format
+  rows = np.repeat(np.arange(model.num_unit), np.diff(np.asarray(model.rec_indptr)))
+  sparse = {'data': bm.as_jax(model.Wrec),
+            'index': (jax.numpy.asarray(rows), model.rec_indices),
+            'shape': (model.num_unit, model.num_unit)}
+  state = bm.Variable(bm.zeros(x.shape[:-1] + (model.num_unit,)))
+
+  def step(i):
+    state.value = bm.tanh(bm.sparse.seg_matmul(state.value, sparse) + x[..., :1])
+    return state.value
+
+  @bm.jit
+  def run():
+    return bm.for_loop(step, np.arange(num_step), progress_bar=False)
+
+  jax.block_until_ready(run())
+  t0 = time.time()
+  jax.block_until_ready(run())
+  return (time.time() - t0) / num_step
+
+
+def recurrent_bytes(model):
+  # the memory of the stored recurrent weights and connectivity
+  arrays = [getattr(model, k) for k in ['Wrec', 'rec_indices', 'rec_indptr'] if hasattr(model, k)]
+  return sum(bm.as_jax(a).nbytes for a in arrays)
+
+
+def main(sizes, prob, batch, num_step, max_dense):
+  mode = bm.NonBatchingMode() if batch is None else bm.BatchingMode(batch)
+  x = bm.random.rand(10) if batch is None else bm.random.rand(batch, 10)
+  print(f'{"size":>8s} {"dense":>12s} {"seg_matmul":>12s} {"sparse":>12s} {"jit":>12s}   (ms/step) {"sparse mem":>12s}')
+  for size in sizes:
+    res = dict()
+    for comp_type in ['dense', 'sparse', 'jit']:
+      if comp_type == 'dense' and size > max_dense:
+        res[comp_type] = float('nan')
+        continue
+      model = bp.dyn.Reservoir(10, size, comp_type=comp_type, rec_connectivity=prob,
+                               in_connectivity=1., mode=mode)
+      res[comp_type] = run_reservoir(model, x, num_step)
+      if comp_type == 'sparse':
+        res['seg_matmul'] = run_seg_matmul(model, x, num_step)
+        res['memory'] = recurrent_bytes(model)
+    print(f'{size:8d} ' + ' '.join(f'{res[k] * 1e3:12.3f}' for k in ['dense', 'seg_matmul', 'sparse', 'jit'])
+          + f'{" " * 13}{res["memory"] / 2 ** 20:9.1f} MB')
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000, 50000])
+  parser.add_argument('--prob', type=float, default=0.01)
+  parser.add_argument('--batch', type=int, default=None)
+  parser.add_argument('--steps', type=int, default=100)
+  parser.add_argument('--max-dense', type=int, default=10000)
+  args = parser.parse_args()
+  main(args.sizes, args.prob, args.batch, args.steps, args.max_dense)